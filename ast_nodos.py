@@ -0,0 +1,317 @@
+# ast_nodos.py
+"""
+Nodos del árbol sintáctico abstracto (AST).
+
+Cada nodo es un objeto compacto con __slots__ cuyo atributo 'tipo' es un entero (Tipo)
+en lugar de una etiqueta de texto, de modo que los recorridos (semantico, generador_codigo,
+diagram) comparan enteros en vez de cadenas. Los nombres de identificadores se internan
+(sys.intern) al construir el nodo, así todas las apariciones de una variable comparten
+la misma cadena.
+
+Para mostrar el árbol (GUI, diagrama) cada tipo conserva la etiqueta histórica del AST de
+tuplas ('program', 'declaracion, =', 'operation', ...): repr(nodo) y nodo.como_tupla()
+reproducen exactamente la representación anterior.
+
+Este módulo es también la fábrica por defecto del parser (sintactico): las acciones llaman
+a los constructores, a secuencia() y a crudo() a través de p.parser.fabrica.
+"""
+import sys
+
+_intern = sys.intern
+
+
+class Tipo:
+    """
+    Tipos de nodo. Son enteros simples (no un Enum): leer Tipo.X es un acceso a atributo
+    de clase normal y comparar es una comparación de enteros, ambas cosas baratas en los
+    recorridos.
+    """
+    PROGRAMA = 0
+    DECLARACION = 1               # int x;
+    DECLARACION_ASIGNACION = 2    # int x = expr;
+    DECLARACION_FOR = 3           # for (int i = 0; ...)
+    ASIGNACION = 4                # x = expr;  (sentencia)
+    ASIGNACION_EXPR = 5           # x = expr   (expresión, o inicialización del for)
+    INCREMENTO_STMT = 6
+    DECREMENTO_STMT = 7
+    INCREMENTO = 8                # i++ como expresión
+    DECREMENTO = 9                # i-- como expresión
+    INCREMENTO_POR = 10           # i += n
+    INCREMENTO_ASIGNADO = 11      # i = i + n
+    PARA = 12
+    MIENTRAS = 13
+    BLOQUE = 14
+    SI = 15
+    SI_SINO = 16
+    EXPR = 17
+    OPERACION = 18
+    COMPARACION = 19
+    NUMERO = 20
+    CADENA = 21
+    ID = 22
+    VERDADERO = 23
+    FALSO = 24
+    LISTA = 25
+    NOT = 26
+    TERNARIO = 27
+    IMPRIMIR = 28
+
+
+# Etiqueta de cada tipo en la representación de tuplas original
+ETIQUETAS = {
+    Tipo.PROGRAMA: 'program',
+    Tipo.DECLARACION: 'declaracion, =',
+    Tipo.DECLARACION_ASIGNACION: 'declaracion_asignacion, =',
+    Tipo.DECLARACION_FOR: 'declaration',
+    Tipo.ASIGNACION: 'assignment, =',
+    Tipo.ASIGNACION_EXPR: 'assignment',
+    Tipo.INCREMENTO_STMT: 'increment_stmt',
+    Tipo.DECREMENTO_STMT: 'decrement_stmt',
+    Tipo.INCREMENTO: 'increment',
+    Tipo.DECREMENTO: 'decrement',
+    Tipo.INCREMENTO_POR: 'increment_by',
+    Tipo.INCREMENTO_ASIGNADO: 'increment_assign',
+    Tipo.PARA: 'for',
+    Tipo.MIENTRAS: 'while',
+    Tipo.BLOQUE: 'block',
+    Tipo.SI: 'if',
+    Tipo.SI_SINO: 'if-else',
+    Tipo.EXPR: 'expr',
+    Tipo.OPERACION: 'operation',
+    Tipo.COMPARACION: 'comparison',
+    Tipo.NUMERO: 'number',
+    Tipo.CADENA: 'string',
+    Tipo.ID: 'id',
+    Tipo.VERDADERO: 'bool_true',
+    Tipo.FALSO: 'bool_false',
+    Tipo.LISTA: 'list',
+    Tipo.NOT: 'not',
+    Tipo.TERNARIO: 'ternary',
+    Tipo.IMPRIMIR: 'print',
+}
+
+
+class Nodo:
+    """Clase base de los nodos del AST."""
+    __slots__ = ('tipo',)
+
+    def hijos(self):
+        """Hijos del nodo en el mismo orden que la tupla original (sin la etiqueta)."""
+        return tuple(getattr(self, campo) for campo in self.__slots__)
+
+    @property
+    def etiqueta(self):
+        return ETIQUETAS[self.tipo]
+
+    def como_tupla(self):
+        """Convierte el subárbol a la representación original de tuplas y listas."""
+        return (ETIQUETAS[self.tipo],) + tuple(_como_tupla(h) for h in self.hijos())
+
+    def __eq__(self, otro):
+        """Igualdad estructural; recorre con una pila explícita, así que no depende de la profundidad."""
+        pendientes = [(self, otro)]
+        while pendientes:
+            a, b = pendientes.pop()
+            if a is b:
+                continue
+            if isinstance(a, Nodo):
+                if not isinstance(b, Nodo) or a.tipo != b.tipo:
+                    return False
+                a, b = a.hijos(), b.hijos()
+            elif isinstance(a, list):
+                if not isinstance(b, list):
+                    return False
+            elif a != b:
+                return False
+            else:
+                continue
+            if len(a) != len(b):
+                return False
+            pendientes.extend(zip(a, b))
+        return True
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.como_tupla())
+
+
+def secuencia(*elementos):
+    """Lista de nodos (sentencias de un programa o bloque, elementos de una lista, argumentos)."""
+    return list(elementos)
+
+
+def crudo(valor):
+    """Valor de un token usado directamente como campo de un nodo (sin nodo Literal)."""
+    return valor
+
+
+def _como_tupla(valor):
+    if isinstance(valor, Nodo):
+        return valor.como_tupla()
+    if isinstance(valor, list):
+        return [_como_tupla(v) for v in valor]
+    return valor
+
+
+class Programa(Nodo):
+    __slots__ = ('sentencias',)
+
+    def __init__(self, sentencias):
+        self.tipo = Tipo.PROGRAMA
+        self.sentencias = sentencias
+
+
+class Declaracion(Nodo):
+    """DECLARACION (sin valor), DECLARACION_ASIGNACION o DECLARACION_FOR."""
+    __slots__ = ('tipo_dato', 'nombre', 'valor')
+
+    def __init__(self, tipo, tipo_dato, nombre, valor=None):
+        self.tipo = tipo
+        self.tipo_dato = tipo_dato
+        self.nombre = _intern(nombre)
+        self.valor = valor
+
+    def hijos(self):
+        if self.tipo == Tipo.DECLARACION:
+            return (self.tipo_dato, self.nombre)
+        return (self.tipo_dato, self.nombre, self.valor)
+
+
+class Asignacion(Nodo):
+    """ASIGNACION (sentencia) o ASIGNACION_EXPR."""
+    __slots__ = ('nombre', 'valor')
+
+    def __init__(self, tipo, nombre, valor):
+        self.tipo = tipo
+        self.nombre = _intern(nombre)
+        self.valor = valor
+
+
+class Variable(Nodo):
+    """ID, INCREMENTO_STMT, DECREMENTO_STMT, INCREMENTO o DECREMENTO sobre la variable 'nombre'."""
+    __slots__ = ('nombre',)
+
+    def __init__(self, tipo, nombre):
+        self.tipo = tipo
+        self.nombre = _intern(nombre)
+
+    def hijos(self):
+        if self.tipo == Tipo.INCREMENTO:
+            return (self.nombre, '++')
+        if self.tipo == Tipo.DECREMENTO:
+            return (self.nombre, '--')
+        return (self.nombre,)
+
+
+class IncrementoPor(Nodo):
+    """INCREMENTO_POR: nombre += cantidad."""
+    __slots__ = ('nombre', 'cantidad')
+
+    def __init__(self, nombre, cantidad):
+        self.tipo = Tipo.INCREMENTO_POR
+        self.nombre = _intern(nombre)
+        self.cantidad = cantidad
+
+
+class IncrementoAsignado(Nodo):
+    """INCREMENTO_ASIGNADO: nombre = origen + cantidad."""
+    __slots__ = ('nombre', 'origen', 'cantidad')
+
+    def __init__(self, nombre, origen, cantidad):
+        self.tipo = Tipo.INCREMENTO_ASIGNADO
+        self.nombre = _intern(nombre)
+        self.origen = _intern(origen)
+        self.cantidad = cantidad
+
+
+class Literal(Nodo):
+    """NUMERO, CADENA, VERDADERO o FALSO."""
+    __slots__ = ('valor',)
+
+    def __init__(self, tipo, valor):
+        self.tipo = tipo
+        self.valor = valor
+
+
+class Binaria(Nodo):
+    """OPERACION o COMPARACION: izq op der."""
+    __slots__ = ('op', 'izq', 'der')
+
+    def __init__(self, tipo, op, izq, der):
+        self.tipo = tipo
+        self.op = op
+        self.izq = izq
+        self.der = der
+
+
+class Not(Nodo):
+    __slots__ = ('expr',)
+
+    def __init__(self, expr):
+        self.tipo = Tipo.NOT
+        self.expr = expr
+
+
+class Ternario(Nodo):
+    __slots__ = ('condicion', 'si_verdadero', 'si_falso')
+
+    def __init__(self, condicion, si_verdadero, si_falso):
+        self.tipo = Tipo.TERNARIO
+        self.condicion = condicion
+        self.si_verdadero = si_verdadero
+        self.si_falso = si_falso
+
+
+class Lista(Nodo):
+    """LISTA (literal [a, b, ...]), BLOQUE ({ ... }) o IMPRIMIR (print(a, b, ...))."""
+    __slots__ = ('elementos',)
+
+    def __init__(self, tipo, elementos):
+        self.tipo = tipo
+        self.elementos = elementos
+
+
+class Expr(Nodo):
+    """EXPR: expresión usada como sentencia."""
+    __slots__ = ('expr',)
+
+    def __init__(self, expr):
+        self.tipo = Tipo.EXPR
+        self.expr = expr
+
+
+class Si(Nodo):
+    """SI o SI_SINO."""
+    __slots__ = ('condicion', 'entonces', 'sino')
+
+    def __init__(self, condicion, entonces, sino=None):
+        self.tipo = Tipo.SI if sino is None else Tipo.SI_SINO
+        self.condicion = condicion
+        self.entonces = entonces
+        self.sino = sino
+
+    def hijos(self):
+        if self.tipo == Tipo.SI:
+            return (self.condicion, self.entonces)
+        return (self.condicion, self.entonces, self.sino)
+
+
+class Mientras(Nodo):
+    __slots__ = ('condicion', 'cuerpo')
+
+    def __init__(self, condicion, cuerpo):
+        self.tipo = Tipo.MIENTRAS
+        self.condicion = condicion
+        self.cuerpo = cuerpo
+
+
+class Para(Nodo):
+    __slots__ = ('inicio', 'condicion', 'actualizacion', 'cuerpo')
+
+    def __init__(self, inicio, condicion, actualizacion, cuerpo):
+        self.tipo = Tipo.PARA
+        self.inicio = inicio
+        self.condicion = condicion
+        self.actualizacion = actualizacion
+        self.cuerpo = cuerpo
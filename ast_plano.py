@@ -0,0 +1,230 @@
+# ast_plano.py
+"""
+AST plano: representación opcional del árbol sintáctico en arreglos paralelos, pensada para
+programas generados automáticamente con millones de nodos.
+
+Cada nodo i ocupa:
+    tipos[i]      -> Tipo del nodo (array('b'))
+    inicio[i]     -> posición de sus operandos en 'operandos' (array('i'))
+    operandos[..] -> un entero por campo, en el orden de CAMPOS[tipo]:
+                     >= 0 es el índice de un nodo hijo, < 0 es ~k con k índice en 'constantes'
+                     (tabla única de identificadores, operadores y literales).
+                     Un campo lista se guarda como [cantidad, elemento_1, ..., elemento_n].
+
+ArbolPlano tiene los mismos constructores que ast_nodos (Programa, Binaria, Si, ...), así que
+el parser lo usa como fábrica sin cambiar sus acciones (ver compilador.parsear_plano). Para
+recorrerlo, Cursor es una vista de un nodo con los mismos atributos que las clases de
+ast_nodos (tipo, nombre, izq, der, hijos(), ...): semantico y generador_codigo lo aceptan
+tal cual.
+"""
+from array import array
+
+from ast_nodos import Tipo, Nodo
+
+# Campos de cada tipo de nodo, en el orden de ast_nodos, con su clase:
+#   'c' constante (identificador, operador o literal), 'm' nodo o valor crudo, 'l' lista de nodos
+_DECLARACION = (('tipo_dato', 'c'), ('nombre', 'c'), ('valor', 'm'))
+_ASIGNACION = (('nombre', 'c'), ('valor', 'm'))
+_VARIABLE = (('nombre', 'c'),)
+_BINARIA = (('op', 'c'), ('izq', 'm'), ('der', 'm'))
+_LITERAL = (('valor', 'c'),)
+_LISTA = (('elementos', 'l'),)
+
+CAMPOS = {
+    Tipo.PROGRAMA: (('sentencias', 'l'),),
+    Tipo.DECLARACION: _DECLARACION[:2],
+    Tipo.DECLARACION_ASIGNACION: _DECLARACION,
+    Tipo.DECLARACION_FOR: _DECLARACION,
+    Tipo.ASIGNACION: _ASIGNACION,
+    Tipo.ASIGNACION_EXPR: _ASIGNACION,
+    Tipo.INCREMENTO_STMT: _VARIABLE,
+    Tipo.DECREMENTO_STMT: _VARIABLE,
+    Tipo.INCREMENTO: _VARIABLE,
+    Tipo.DECREMENTO: _VARIABLE,
+    Tipo.ID: _VARIABLE,
+    Tipo.INCREMENTO_POR: (('nombre', 'c'), ('cantidad', 'c')),
+    Tipo.INCREMENTO_ASIGNADO: (('nombre', 'c'), ('origen', 'c'), ('cantidad', 'c')),
+    Tipo.PARA: (('inicio', 'm'), ('condicion', 'm'), ('actualizacion', 'm'), ('cuerpo', 'm')),
+    Tipo.MIENTRAS: (('condicion', 'm'), ('cuerpo', 'm')),
+    Tipo.BLOQUE: _LISTA,
+    Tipo.LISTA: _LISTA,
+    Tipo.IMPRIMIR: _LISTA,
+    Tipo.SI: (('condicion', 'm'), ('entonces', 'm')),
+    Tipo.SI_SINO: (('condicion', 'm'), ('entonces', 'm'), ('sino', 'm')),
+    Tipo.EXPR: (('expr', 'm'),),
+    Tipo.NOT: (('expr', 'm'),),
+    Tipo.OPERACION: _BINARIA,
+    Tipo.COMPARACION: _BINARIA,
+    Tipo.NUMERO: _LITERAL,
+    Tipo.CADENA: _LITERAL,
+    Tipo.VERDADERO: _LITERAL,
+    Tipo.FALSO: _LITERAL,
+    Tipo.TERNARIO: (('condicion', 'm'), ('si_verdadero', 'm'), ('si_falso', 'm')),
+}
+
+# nombre de campo -> (posición, es_lista) para cada tipo
+_POSICIONES = {tipo: {nombre: (i, clase == 'l') for i, (nombre, clase) in enumerate(campos)}
+               for tipo, campos in CAMPOS.items()}
+
+# Atributos que existen en algún nodo: en un tipo que no los tiene valen None (como en ast_nodos)
+_TODOS_LOS_CAMPOS = frozenset(nombre for campos in CAMPOS.values() for nombre, _ in campos)
+
+# Elementos extra de hijos() que no se guardan (ver ast_nodos.Variable)
+_SUFIJOS = {Tipo.INCREMENTO: ('++',), Tipo.DECREMENTO: ('--',)}
+
+
+class ArbolPlano:
+    """AST en arreglos paralelos. Se construye con los mismos constructores que ast_nodos."""
+
+    def __init__(self):
+        self.tipos = array('b')
+        self.inicio = array('i')
+        self.operandos = array('i')
+        self.constantes = []
+        self._indices_constantes = {}
+        self.raiz = None
+
+    # --- Construcción ---
+
+    def _constante(self, valor):
+        """Operando (negativo) de 'valor' en la tabla de constantes, sin repetir valores."""
+        # La clave incluye el tipo: True, 1 y 1.0 son claves iguales en un diccionario
+        clave = (type(valor), valor)
+        k = self._indices_constantes.get(clave)
+        if k is None:
+            k = self._indices_constantes[clave] = len(self.constantes)
+            self.constantes.append(valor)
+        return ~k
+
+    def _nodo(self, tipo, *valores):
+        """Agrega un nodo de 'tipo' con los campos 'valores' y retorna su índice."""
+        indice = len(self.tipos)
+        self.tipos.append(tipo)
+        self.inicio.append(len(self.operandos))
+        operandos = self.operandos
+        for (_, clase), valor in zip(CAMPOS[tipo], valores):
+            if clase == 'l':
+                operandos.append(len(valor))
+                operandos.extend(valor)
+            elif clase == 'c' or not isinstance(valor, int):
+                operandos.append(self._constante(valor))
+            else:
+                # Índice de un nodo, o constante ya codificada por crudo()
+                operandos.append(valor)
+        return indice
+
+    def secuencia(self, *elementos):
+        return array('i', elementos)
+
+    def crudo(self, valor):
+        """Valor de un token usado directamente como campo (sin nodo Literal)."""
+        return self._constante(valor)
+
+    def Programa(self, sentencias):
+        return self._nodo(Tipo.PROGRAMA, sentencias)
+
+    def Declaracion(self, tipo, tipo_dato, nombre, valor=None):
+        return self._nodo(tipo, tipo_dato, nombre, valor)
+
+    def Asignacion(self, tipo, nombre, valor):
+        return self._nodo(tipo, nombre, valor)
+
+    def Variable(self, tipo, nombre):
+        return self._nodo(tipo, nombre)
+
+    def IncrementoPor(self, nombre, cantidad):
+        return self._nodo(Tipo.INCREMENTO_POR, nombre, cantidad)
+
+    def IncrementoAsignado(self, nombre, origen, cantidad):
+        return self._nodo(Tipo.INCREMENTO_ASIGNADO, nombre, origen, cantidad)
+
+    def Literal(self, tipo, valor):
+        return self._nodo(tipo, valor)
+
+    def Binaria(self, tipo, op, izq, der):
+        return self._nodo(tipo, op, izq, der)
+
+    def Not(self, expr):
+        return self._nodo(Tipo.NOT, expr)
+
+    def Ternario(self, condicion, si_verdadero, si_falso):
+        return self._nodo(Tipo.TERNARIO, condicion, si_verdadero, si_falso)
+
+    def Lista(self, tipo, elementos):
+        return self._nodo(tipo, elementos)
+
+    def Expr(self, expr):
+        return self._nodo(Tipo.EXPR, expr)
+
+    def Si(self, condicion, entonces, sino=None):
+        if sino is None:
+            return self._nodo(Tipo.SI, condicion, entonces)
+        return self._nodo(Tipo.SI_SINO, condicion, entonces, sino)
+
+    def Mientras(self, condicion, cuerpo):
+        return self._nodo(Tipo.MIENTRAS, condicion, cuerpo)
+
+    def Para(self, inicio, condicion, actualizacion, cuerpo):
+        return self._nodo(Tipo.PARA, inicio, condicion, actualizacion, cuerpo)
+
+    # --- Recorrido ---
+
+    def __len__(self):
+        return len(self.tipos)
+
+    def cursor(self, indice=None):
+        """Cursor sobre el nodo 'indice' (por defecto, la raíz). None si no hay árbol."""
+        if indice is None:
+            indice = self.raiz
+        return None if indice is None else Cursor(self, indice)
+
+    def _valor(self, operando):
+        return Cursor(self, operando) if operando >= 0 else self.constantes[~operando]
+
+    def campo(self, indice, nombre):
+        """Valor del campo 'nombre' del nodo 'indice' (Cursor, constante o lista)."""
+        posicion = _POSICIONES[self.tipos[indice]].get(nombre)
+        if posicion is None:
+            return None
+        pos, es_lista = posicion
+        inicio = self.inicio[indice] + pos
+        if es_lista:
+            n = self.operandos[inicio]
+            return [self._valor(op) for op in self.operandos[inicio + 1:inicio + 1 + n]]
+        return self._valor(self.operandos[inicio])
+
+    def memoria(self):
+        """Bytes ocupados por los arreglos (sin contar la tabla de constantes)."""
+        return sum(a.itemsize * len(a) for a in (self.tipos, self.inicio, self.operandos))
+
+
+class Cursor(Nodo):
+    """
+    Vista de un nodo de ArbolPlano con la interfaz de ast_nodos: atributo 'tipo', campos
+    por nombre (node.izq, node.nombre, ...), hijos(), etiqueta, como_tupla() y repr.
+    Los cursores no guardan datos: se crean al acceder a un campo y se pueden descartar.
+    """
+    __slots__ = ('arbol', 'indice')
+
+    def __init__(self, arbol, indice):
+        self.arbol = arbol
+        self.indice = indice
+
+    @property
+    def tipo(self):
+        return self.arbol.tipos[self.indice]
+
+    def __reduce__(self):
+        # Se serializa como (árbol, índice): 'tipo' es una propiedad, no un atributo guardado
+        return Cursor, (self.arbol, self.indice)
+
+    def __getattr__(self, nombre):
+        if nombre not in _TODOS_LOS_CAMPOS:
+            raise AttributeError(nombre)
+        return self.arbol.campo(self.indice, nombre)
+
+    def hijos(self):
+        tipo = self.tipo
+        valores = tuple(self.arbol.campo(self.indice, nombre) for nombre, _ in CAMPOS[tipo])
+        return valores + _SUFIJOS.get(tipo, ())
+
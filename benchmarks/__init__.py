@@ -0,0 +1,2 @@
+# benchmarks: scripts de medición de rendimiento del compilador.
+# Se ejecutan desde la raíz del proyecto, p.ej.: python -m benchmarks.paralelo
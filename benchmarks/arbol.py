@@ -0,0 +1,198 @@
+# benchmarks/arbol.py
+"""
+Compara, sobre un programa grande, tres representaciones del AST: tuplas con etiquetas de
+texto (la que producía antes el parser), nodos con __slots__ (ast_nodos) y arreglos
+paralelos (ast_plano):
+
+- memoria: bytes totales (objetos únicos alcanzables) y bytes por nodo;
+- pico: memoria máxima asignada durante el análisis sintáctico (tracemalloc);
+- recorrido: tiempo de una visita completa que despacha por tipo de nodo, comparando
+  enteros (nodo.tipo) frente a nodo[0].split(',')[0] y comparación de cadenas. El AST
+  plano se recorre con ast_plano.Cursor.
+
+El árbol de tuplas se obtiene con Nodo.como_tupla() copiando cada identificador, como
+ocurría cuando cada aparición venía de un token distinto del lexer.
+
+Uso:
+    python -m benchmarks.arbol [--sentencias 20000]
+"""
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+
+from ast_nodos import Nodo, Tipo, ETIQUETAS
+from compilador import parsear, parsear_plano
+
+
+def programa(n):
+    """Programa con 'n' bloques de sentencias variadas."""
+    partes = ["int contador = 0;", "int total = 0;", "bool activo = true;"]
+    for i in range(n):
+        partes.append(f"total = total + contador * {i} - (contador / 2);")
+        partes.append("if (contador < total) { contador = contador + 1; } else { print(total, contador); }")
+    return "\n".join(partes)
+
+
+def a_tuplas(valor):
+    """Convierte el AST de nodos al formato de tuplas con una cadena nueva por identificador."""
+    if isinstance(valor, Nodo):
+        return (ETIQUETAS[valor.tipo],) + tuple(a_tuplas(h) for h in valor.hijos())
+    if isinstance(valor, list):
+        return [a_tuplas(v) for v in valor]
+    if isinstance(valor, str) and len(valor) > 1:
+        return "".join(list(valor))
+    return valor
+
+
+def memoria(raiz):
+    """Retorna (bytes, cantidad_de_nodos) de todos los objetos únicos alcanzables desde 'raiz'."""
+    vistos = set()
+    total = 0
+    nodos = 0
+    pila = [raiz]
+    while pila:
+        obj = pila.pop()
+        if id(obj) in vistos:
+            continue
+        vistos.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, Nodo):
+            nodos += 1
+            pila.extend(obj.hijos())
+        elif isinstance(obj, tuple):
+            nodos += 1
+            pila.extend(obj)
+        elif isinstance(obj, list):
+            pila.extend(obj)
+    return total, nodos
+
+
+def memoria_plano(arbol):
+    """Retorna (bytes, cantidad_de_nodos) de un ArbolPlano: arreglos más tabla de constantes."""
+    total = sum(sys.getsizeof(a) for a in (arbol.tipos, arbol.inicio, arbol.operandos))
+    total += sys.getsizeof(arbol.constantes) + sum(sys.getsizeof(c) for c in arbol.constantes)
+    return total, len(arbol)
+
+
+def pico_memoria(funcion, argumento):
+    """Memoria máxima (bytes) asignada mientras se ejecuta funcion(argumento)."""
+    tracemalloc.start()
+    try:
+        funcion(argumento)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def recorrer_nodos(raiz):
+    """Visita todo el árbol de nodos despachando por nodo.tipo (comparación de enteros)."""
+    cuenta = 0
+    pila = [raiz]
+    while pila:
+        nodo = pila.pop()
+        if isinstance(nodo, list):
+            pila.extend(nodo)
+            continue
+        if not isinstance(nodo, Nodo):
+            continue
+        cuenta += 1
+        tipo = nodo.tipo
+        if tipo == Tipo.OPERACION or tipo == Tipo.COMPARACION:
+            pila.append(nodo.izq)
+            pila.append(nodo.der)
+        elif tipo == Tipo.ID or tipo == Tipo.NUMERO:
+            pass
+        elif tipo == Tipo.ASIGNACION:
+            pila.append(nodo.valor)
+        elif tipo == Tipo.SI_SINO:
+            pila.append(nodo.condicion)
+            pila.append(nodo.entonces)
+            pila.append(nodo.sino)
+        elif tipo == Tipo.BLOQUE or tipo == Tipo.IMPRIMIR:
+            pila.append(nodo.elementos)
+        elif tipo == Tipo.PROGRAMA:
+            pila.append(nodo.sentencias)
+        else:
+            pila.extend(nodo.hijos())
+    return cuenta
+
+
+def recorrer_tuplas(raiz):
+    """Visita todo el árbol de tuplas despachando por etiqueta de texto, como antes."""
+    cuenta = 0
+    pila = [raiz]
+    while pila:
+        nodo = pila.pop()
+        if isinstance(nodo, list):
+            pila.extend(nodo)
+            continue
+        if not isinstance(nodo, tuple):
+            continue
+        cuenta += 1
+        etiqueta = nodo[0].split(',')[0]
+        if etiqueta == "operation" or etiqueta == "comparison":
+            pila.append(nodo[2])
+            pila.append(nodo[3])
+        elif etiqueta == "id" or etiqueta == "number":
+            pass
+        elif etiqueta == "assignment":
+            pila.append(nodo[2])
+        elif etiqueta == "if-else":
+            pila.append(nodo[1])
+            pila.append(nodo[2])
+            pila.append(nodo[3])
+        elif etiqueta == "block" or etiqueta == "print":
+            pila.append(nodo[1])
+        elif etiqueta == "program":
+            pila.append(nodo[1])
+        else:
+            pila.extend(nodo[1:])
+    return cuenta
+
+
+def mejor_tiempo(funcion, argumento, repeticiones=7):
+    """Mejor tiempo de funcion(argumento), sin recolector de basura durante la medición."""
+    mejor = float("inf")
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeticiones):
+            t0 = time.perf_counter()
+            funcion(argumento)
+            mejor = min(mejor, time.perf_counter() - t0)
+    finally:
+        gc.enable()
+    return mejor
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Memoria y recorrido: AST de tuplas, nodos y plano")
+    arg_parser.add_argument("--sentencias", type=int, default=20000)
+    args = arg_parser.parse_args(argv)
+
+    codigo = programa(args.sentencias)
+    arbol_nodos = parsear(codigo)
+    arbol_tuplas = a_tuplas(arbol_nodos)
+    arbol_plano = parsear_plano(codigo)
+
+    filas = [
+        ("tuplas", memoria(arbol_tuplas), None, mejor_tiempo(recorrer_tuplas, arbol_tuplas)),
+        ("nodos", memoria(arbol_nodos), pico_memoria(parsear, codigo),
+         mejor_tiempo(recorrer_nodos, arbol_nodos)),
+        ("plano", memoria_plano(arbol_plano), pico_memoria(parsear_plano, codigo),
+         mejor_tiempo(recorrer_nodos, arbol_plano.cursor())),
+    ]
+
+    print(f"{'AST':>8} {'nodos':>9} {'MB':>8} {'bytes/nodo':>11} {'pico (MB)':>10} {'recorrido (s)':>14}")
+    for nombre, (total, n), pico, t in filas:
+        pico_texto = f"{pico / 1e6:.2f}" if pico is not None else "-"
+        print(f"{nombre:>8} {n:>9} {total / 1e6:>8.2f} {total / n:>11.1f} {pico_texto:>10} {t:>14.4f}")
+    (_, (b_tuplas, _), _, t_tuplas), (_, (b_nodos, _), p_nodos, t_nodos), (_, (b_plano, _), p_plano, _) = filas
+    print(f"Nodos vs. tuplas: {1 - b_nodos / b_tuplas:.0%} menos memoria; recorrido {t_tuplas / t_nodos:.2f}x más rápido")
+    print(f"Plano vs. nodos: {1 - b_plano / b_nodos:.0%} menos memoria; pico de análisis {1 - p_plano / p_nodos:.0%} menor")
+
+
+if __name__ == "__main__":
+    main()
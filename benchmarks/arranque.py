@@ -0,0 +1,118 @@
+# benchmarks/arranque.py
+"""
+Mide el arranque de la interfaz (main.py):
+
+1. importaciones: las sentencias import del nivel superior de main.py (leídas con ast, así
+   que sigue a main.py sin mantener una lista aparte) se ejecutan en un proceso nuevo con
+   'python -X importtime'; se informa el total y los módulos más caros;
+2. diferidos: comprueba que esas importaciones no carguen módulos que main.py solo necesita
+   al usar una función (el pipeline, graphviz, PIL, asyncio, subprocess...), y mide cuánto
+   cuesta cargarlos (lo que hace la precarga después de mostrar la ventana);
+3. primer dibujado: si hay tkinter y pantalla, 'python main.py --medir-arranque' informa el
+   tiempo hasta que la ventana está dibujada (mediana de varias ejecuciones).
+
+Uso:
+    python -m benchmarks.arranque [--repeticiones 5] [--mostrar 10]
+Retorna 1 si al arrancar se carga algún módulo diferido.
+"""
+import argparse
+import ast
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+_RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Módulos que main.py no debe cargar antes de mostrar la ventana
+DIFERIDOS = ("sesion", "compilador", "lexico", "sintactico", "ply", "diagram", "graphviz", "generador_codigo",
+             "PIL", "generador_nasm", "optimizador", "ejecucion", "asyncio", "subprocess", "perfil")
+
+# Lo que carga la precarga (y los botones) la primera vez
+_PRECARGA = "import sesion, compilador, ejecucion, perfil, generador_codigo, generador_nasm"
+
+_LINEA_IMPORTTIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def importaciones_main():
+    """Código fuente de las sentencias import del nivel superior de main.py."""
+    with open(os.path.join(_RAIZ, "main.py"), encoding="utf-8") as f:
+        arbol = ast.parse(f.read())
+    return [ast.unparse(nodo) for nodo in arbol.body if isinstance(nodo, (ast.Import, ast.ImportFrom))]
+
+
+def medir_importaciones(sentencias, base=()):
+    """
+    Ejecuta 'sentencias' en un proceso nuevo con -X importtime. Retorna (total en segundos,
+    lista de (módulo, segundos acumulados) de nivel superior, módulos cargados, faltantes).
+    Los módulos de 'base' (los que carga el intérprete al iniciar) no se cuentan.
+    """
+    codigo = "import json, sys\nfaltantes = []\n"
+    for sentencia in sentencias:
+        codigo += f"try:\n    {sentencia}\nexcept ImportError as e:\n    faltantes.append(str(e))\n"
+    codigo += "print(json.dumps({'modulos': sorted(sys.modules), 'faltantes': faltantes}))\n"
+    proceso = subprocess.run([sys.executable, "-X", "importtime", "-c", codigo], cwd=_RAIZ,
+                             capture_output=True, text=True, check=True)
+    superiores = []
+    for linea in proceso.stderr.splitlines():
+        coincidencia = _LINEA_IMPORTTIME.match(linea)
+        # Las importaciones de nivel superior tienen un solo espacio de sangría
+        if coincidencia and len(coincidencia.group(3)) == 1:
+            superiores.append((coincidencia.group(4), int(coincidencia.group(2)) / 1e6))
+    datos = json.loads(proceso.stdout)
+    # 'json' es del propio script de medición
+    superiores = [(modulo, t) for modulo, t in superiores if modulo != "json" and modulo not in base]
+    return sum(t for _, t in superiores), superiores, set(datos["modulos"]), datos["faltantes"]
+
+
+def primer_dibujado():
+    """Milisegundos hasta el primer dibujado informados por main.py, o None si no se puede abrir."""
+    try:
+        proceso = subprocess.run([sys.executable, "main.py", "--medir-arranque"], cwd=_RAIZ,
+                                 capture_output=True, text=True, timeout=60)
+    except subprocess.TimeoutExpired:
+        return None
+    coincidencia = re.search(r"Primer dibujado en ([\d.]+) ms", proceso.stdout)
+    return float(coincidencia.group(1)) if coincidencia else None
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Tiempo de arranque de la interfaz")
+    arg_parser.add_argument("--repeticiones", type=int, default=5)
+    arg_parser.add_argument("--mostrar", type=int, default=10, help="módulos más caros a mostrar")
+    args = arg_parser.parse_args(argv)
+
+    sentencias = importaciones_main()
+    base = {modulo for modulo, _ in medir_importaciones([])[1]}
+    mediciones = [medir_importaciones(sentencias, base) for _ in range(args.repeticiones)]
+    total, superiores, modulos, faltantes = min(mediciones, key=lambda m: m[0])
+    print(f"Importaciones de main.py al arrancar: {total * 1000:.1f} ms")
+    for modulo, segundos in sorted(superiores, key=lambda m: -m[1])[:args.mostrar]:
+        print(f"  {modulo:<30} {segundos * 1000:>8.2f} ms")
+    for faltante in faltantes:
+        print(f"  (no disponible aquí: {faltante})")
+
+    cargados = sorted(m for m in DIFERIDOS if m in modulos)
+    precarga = min(medir_importaciones([_PRECARGA], base)[0] for _ in range(args.repeticiones))
+    print(f"Diferidos (precarga después del primer dibujado): {precarga * 1000:.1f} ms")
+
+    sin_pantalla = sys.platform.startswith("linux") and not (os.environ.get("DISPLAY")
+                                                            or os.environ.get("WAYLAND_DISPLAY"))
+    if "tkinter" in "".join(faltantes) or sin_pantalla:
+        print("Primer dibujado: sin tkinter o sin pantalla, no se mide")
+    else:
+        tiempos = [t for t in (primer_dibujado() for _ in range(args.repeticiones)) if t is not None]
+        if tiempos:
+            print(f"Primer dibujado: mediana {statistics.median(tiempos):.1f} ms, mínimo {min(tiempos):.1f} ms")
+        else:
+            print("Primer dibujado: main.py no informó el tiempo")
+
+    if cargados:
+        print("ERROR: main.py carga al arrancar módulos que deberían diferirse:", ", ".join(cargados))
+    return 1 if cargados else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
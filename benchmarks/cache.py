@@ -0,0 +1,105 @@
+# benchmarks/cache.py
+"""
+Mide la caché de artefactos (cache_artefactos.py) recompilando un corpus sintético:
+
+1. en frío: caché vacía, se compila todo y se llena la caché;
+2. en caliente: el mismo corpus sin cambios, solo se lee la caché (ms por archivo);
+3. en caliente con N procesos compartiendo la misma caché.
+
+Comprueba que los artefactos escritos con caché (en frío y en caliente) sean idénticos a los
+de una compilación sin caché, que compilar_codigo con caché retorne el mismo AST y que el
+desalojo LRU deje la caché por debajo de su tamaño máximo conservando las entradas usadas
+más recientemente.
+
+Uso:
+    python -m benchmarks.cache [--archivos 200] [--sentencias 300] [-j 2]
+Retorna 1 si algo no coincide.
+"""
+import argparse
+import filecmp
+import os
+import sys
+import tempfile
+import time
+
+import cache_artefactos
+import compilador
+from benchmarks.paralelo import crear_corpus
+
+
+def _compilar(rutas, salida, trabajadores, carpeta_cache):
+    t0 = time.perf_counter()
+    resultados = compilador.compilar_lote(rutas, salida, trabajadores, carpeta_cache=carpeta_cache)
+    return time.perf_counter() - t0, resultados
+
+
+def _artefactos_iguales(carpeta_a, carpeta_b):
+    nombres = sorted(os.listdir(carpeta_a))
+    _, distintos, errores = filecmp.cmpfiles(carpeta_a, carpeta_b, nombres, shallow=False)
+    return nombres == sorted(os.listdir(carpeta_b)) and not distintos and not errores
+
+
+def comprobar_desalojo(carpeta, rutas):
+    """Llena una caché pequeña y comprueba el tamaño final y que sobreviva la entrada más reciente."""
+    cache = cache_artefactos.CacheArtefactos(carpeta, tamano_maximo=float("inf"))
+    claves = []
+    for ruta in rutas:
+        with open(ruta, encoding="utf-8") as f:
+            codigo = f.read()
+        claves.append(compilador.clave_cache(codigo, False))
+        compilador.compilar_codigo(codigo, cache=cache)
+        if len(claves) == 1:
+            # El límite permite guardar unas 5 entradas como la primera
+            cache.tamano_maximo = cache.tamano() * 5
+    return cache.tamano() <= cache.tamano_maximo and cache.obtener(claves[-1]) is not None
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Compilación en frío y en caliente con la caché de artefactos")
+    arg_parser.add_argument("--archivos", type=int, default=200)
+    arg_parser.add_argument("--sentencias", type=int, default=300)
+    arg_parser.add_argument("-j", "--trabajadores", type=int, default=2)
+    args = arg_parser.parse_args(argv)
+
+    problemas = []
+    with tempfile.TemporaryDirectory() as carpeta:
+        rutas = crear_corpus(carpeta, args.archivos, args.sentencias)
+        carpeta_cache = os.path.join(carpeta, "cache")
+        salidas = {}
+        for nombre in ("sin_cache", "frio", "caliente", "caliente_j"):
+            salidas[nombre] = os.path.join(carpeta, nombre)
+            os.makedirs(salidas[nombre])
+
+        t_sin, _ = _compilar(rutas, salidas["sin_cache"], 1, None)
+        t_frio, _ = _compilar(rutas, salidas["frio"], 1, carpeta_cache)
+        t_caliente, resultados = _compilar(rutas, salidas["caliente"], 1, carpeta_cache)
+        t_caliente_j, _ = _compilar(rutas, salidas["caliente_j"], args.trabajadores, carpeta_cache)
+
+        for nombre in ("frio", "caliente", "caliente_j"):
+            if not _artefactos_iguales(salidas["sin_cache"], salidas[nombre]):
+                problemas.append(f"los artefactos '{nombre}' difieren de la compilación sin caché")
+        if any(errores for _, errores in resultados):
+            problemas.append("la compilación en caliente informó errores")
+
+        with open(rutas[0], encoding="utf-8") as f:
+            codigo = f.read()
+        con_cache = compilador.compilar_codigo(codigo, cache=cache_artefactos.abrir(carpeta_cache))
+        if repr(con_cache["ast"]) != repr(compilador.parsear(codigo)):
+            problemas.append("el AST leído de la caché difiere del análisis")
+        if not comprobar_desalojo(os.path.join(carpeta, "cache_pequena"), rutas[:20]):
+            problemas.append("el desalojo LRU no respetó el tamaño máximo o borró la entrada más reciente")
+
+        mb = cache_artefactos.CacheArtefactos(carpeta_cache).tamano() / 1e6
+    n = len(rutas)
+    print(f"{n} archivos de {args.sentencias} sentencias (caché: {mb:.1f} MB)")
+    print(f"{'compilación':>22} {'segundos':>9} {'ms/archivo':>11}")
+    for nombre, t in (("sin caché", t_sin), ("en frío", t_frio), ("en caliente", t_caliente),
+                      (f"en caliente (-j {args.trabajadores})", t_caliente_j)):
+        print(f"{nombre:>22} {t:>9.3f} {t / n * 1000:>11.2f}")
+    for problema in problemas:
+        print("ERROR:", problema)
+    return 1 if problemas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
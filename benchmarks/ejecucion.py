@@ -0,0 +1,98 @@
+# benchmarks/ejecucion.py
+"""
+Comprueba el ejecutor asíncrono (ejecucion.py) con programas de prueba en Python:
+
+1. salida en vivo: el primer bloque llega antes de que el programa termine, y el código
+   de salida y el tiempo se informan;
+2. límite de tiempo: un programa dormido se detiene al superar el límite de reloj;
+3. límite de CPU: un bucle infinito se detiene al superar el límite de CPU (solo POSIX);
+4. cancelación: cancelar una Tarea (como el botón "Cancelar" de main.py) mata el proceso;
+5. salida truncada: un programa que imprime sin parar no entrega más de limite_salida bytes.
+
+Uso:
+    python -m benchmarks.ejecucion
+Retorna 1 si alguna comprobación falla.
+"""
+import asyncio
+import sys
+import time
+
+import ejecucion
+from tareas import Despachador
+
+_PASOS = "import time\nprint('inicio', flush=True)\ntime.sleep(1)\nprint('fin')\nraise SystemExit(3)\n"
+_DORMIDO = "import time\ntime.sleep(60)\n"
+_BUCLE = "while True:\n    pass\n"
+_IMPRIME = "while True:\n    print('x' * 1000)\n"
+
+
+def _python(codigo):
+    return [sys.executable, "-c", codigo]
+
+
+def _salida_en_vivo(problemas):
+    llegadas = []
+    t0 = time.perf_counter()
+    resultado = asyncio.run(ejecucion.ejecutar(_python(_PASOS),
+                                               lambda texto, flujo: llegadas.append((time.perf_counter() - t0, texto))))
+    if not llegadas or llegadas[0][0] > 0.8 or "inicio" not in llegadas[0][1]:
+        problemas.append(f"la primera salida no llegó antes del final: {llegadas}")
+    if resultado.codigo != 3 or resultado.motivo != "terminado":
+        problemas.append(f"se esperaba código 3, se obtuvo {resultado.codigo} ({resultado.motivo})")
+    return f"primera salida a los {llegadas[0][0] * 1000:.0f} ms; {resultado.describir()}"
+
+
+def _limite(problemas, codigo, motivo, **limites):
+    resultado = asyncio.run(ejecucion.ejecutar(_python(codigo), **limites))
+    if resultado.motivo != motivo or resultado.segundos > 5:
+        problemas.append(f"se esperaba motivo {motivo!r}, se obtuvo {resultado.motivo!r} en {resultado.segundos:.2f} s")
+    return resultado.describir(limites.get("limite_tiempo"), limites.get("limite_cpu"))
+
+
+def _cancelacion(problemas):
+    despachador = Despachador()
+    resultados = []
+    despachador.enviar("ejecutable", lambda tarea: tarea.esperar(ejecucion.ejecutar(_python(_DORMIDO))),
+                       resultados.append)
+    time.sleep(0.5)
+    t0 = time.perf_counter()
+    despachador.cancelar()
+    despachador.cerrar()  # espera a que el trabajo termine
+    segundos = time.perf_counter() - t0
+    despachador.sondear()
+    if segundos > 1 or resultados:
+        problemas.append(f"el programa cancelado siguió corriendo ({segundos:.2f} s, resultados {resultados})")
+    return f"detenido en {segundos * 1000:.0f} ms"
+
+
+def _truncada(problemas):
+    recibidos = []
+    resultado = asyncio.run(ejecucion.ejecutar(_python(_IMPRIME), lambda texto, flujo: recibidos.append(len(texto)),
+                                               limite_tiempo=1, limite_salida=100000))
+    if not resultado.truncada or sum(recibidos) > 100000:
+        problemas.append(f"se entregaron {sum(recibidos)} bytes con limite_salida=100000")
+    return f"{sum(recibidos)} bytes entregados; {resultado.describir(1)}"
+
+
+def main(argv=None):
+    problemas = []
+    print("salida en vivo:  ", _salida_en_vivo(problemas))
+    print("límite de tiempo:", _limite(problemas, _DORMIDO, "tiempo", limite_tiempo=0.5))
+    if ejecucion.resource is not None:
+        print("límite de CPU:   ", _limite(problemas, _BUCLE, "cpu", limite_tiempo=10, limite_cpu=1))
+    else:
+        print("límite de CPU:    no disponible en esta plataforma")
+    print("cancelación:     ", _cancelacion(problemas))
+    print("salida truncada: ", _truncada(problemas))
+    try:
+        asyncio.run(ejecucion.ejecutar(["programa-que-no-existe"]))
+        problemas.append("lanzar un programa inexistente no dio OSError")
+    except OSError:
+        pass
+    for problema in problemas:
+        print("ERROR:", problema)
+    return 1 if problemas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
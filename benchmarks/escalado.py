@@ -0,0 +1,153 @@
+# benchmarks/escalado.py
+"""
+Guardas de complejidad: comprueba que cada fase del compilador (lexico, sintactico,
+semantico, tac, ssa, optimizador, nasm) crece como máximo según su cota al duplicar la
+entrada, para detectar comportamientos cuadráticos antes de que aparezcan con programas
+de producción.
+
+Cada caso genera programas (benchmarks/generador.py) de tamaño N, 2N, 4N, ... y mide todas
+las fases con un perfil.Perfil (mejor de varias repeticiones, sin recolector cíclico). Los
+casos crecen en número de sentencias de cada forma y, en 'ancho', en operandos de una sola
+expresión (instrucciones cada vez más largas).
+
+Para cada fase se ajusta una recta a log(tiempo) frente a log(N): su pendiente es el
+exponente de crecimiento (1 lineal, 2 cuadrático). Falla si supera 1 + holgura (cota
+lineal) o 1 + holgura + 1 / ln(N) (cota n·log n, COTAS). Ajustar todos los tamaños a la vez
+tolera mejor el ruido de la máquina que comparar cada par de tamaños; además, si una fase
+falla se vuelven a medir todos los tamaños antes de darla por fallada. Los cocientes de
+tiempo entre tamaños consecutivos se muestran como referencia. Las fases que tardan menos
+que --minimo-ms en el tamaño más chico no se comprueban: su tiempo es sobre todo ruido.
+
+Uso:
+    python -m benchmarks.escalado [--casos lineal anidado ...] [--pasos 4] [--holgura 0.3]
+Retorna 1 si alguna fase supera su cota.
+"""
+import argparse
+import gc
+import math
+import sys
+
+import compilador
+from benchmarks.generador import generar_programa
+from perfil import FASES, Perfil
+
+# Cota de crecimiento de cada fase: "lineal" o "nlogn"
+COTAS = dict.fromkeys(FASES, "lineal")
+
+# caso -> (generador de programa de tamaño n, tamaño inicial)
+CASOS = {
+    "lineal": (lambda n: generar_programa("lineal", n), 2000),
+    "anidado": (lambda n: generar_programa("anidado", n), 1000),
+    "bucles": (lambda n: generar_programa("bucles", n), 1000),
+    "variables": (lambda n: generar_programa("variables", n), 2000),
+    "expresiones": (lambda n: generar_programa("expresiones", n), 125),
+    "ancho": (lambda n: generar_programa("expresiones", 16, ancho=n), 125),
+}
+
+
+def medir(codigo, repeticiones=3):
+    """Diccionario fase -> mejor tiempo (segundos) de compilar 'codigo'."""
+    mejores = {}
+    for _ in range(repeticiones):
+        perfil = Perfil(memoria=False)
+        # Igual que timeit: sin recolector cíclico para que sus pausas no distorsionen el cociente
+        gc.collect()
+        gc.disable()
+        try:
+            compilador.compilar_codigo(codigo, perfil=perfil)
+        finally:
+            gc.enable()
+        for m in perfil.resumen():
+            mejores[m.fase] = min(mejores.get(m.fase, float("inf")), m.segundos)
+    return mejores
+
+
+def cota(fase, n, holgura):
+    """Exponente de crecimiento máximo permitido para 'fase' a partir del tamaño n."""
+    if COTAS[fase] == "nlogn":
+        return 1 + holgura + 1 / math.log(n)
+    return 1 + holgura
+
+
+def exponente(tamanos, tiempos):
+    """Pendiente de la recta de mínimos cuadrados de log(tiempo) frente a log(tamaño)."""
+    xs = [math.log(n) for n in tamanos]
+    ys = [math.log(t) for t in tiempos]
+    mx = sum(xs) / len(xs)
+    my = sum(ys) / len(ys)
+    return (sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+            / sum((x - mx) ** 2 for x in xs))
+
+
+def _excedidas(tamanos, mediciones, holgura, minimo):
+    """Diccionario fase -> exponente de las fases que superan su cota."""
+    excedidas = {}
+    for fase in FASES:
+        tiempos = [m.get(fase, 0.0) for m in mediciones]
+        if tiempos[0] * 1000 < minimo:
+            continue
+        e = exponente(tamanos, tiempos)
+        if e > cota(fase, tamanos[0], holgura):
+            excedidas[fase] = e
+    return excedidas
+
+
+def comprobar(nombre, generador, inicial, pasos, holgura, minimo):
+    """Imprime la tabla de tiempos del caso y retorna la lista de fases que superan su cota."""
+    tamanos = [inicial * 2 ** i for i in range(pasos)]
+    mediciones = [medir(generador(n)) for n in tamanos]
+    if _excedidas(tamanos, mediciones, holgura, minimo):
+        # Puede ser ruido de la máquina: se mide otra vez cada tamaño y se toma el mejor
+        for n, mejores in zip(tamanos, mediciones):
+            for fase, t in medir(generador(n)).items():
+                mejores[fase] = min(mejores.get(fase, float("inf")), t)
+    excedidas = _excedidas(tamanos, mediciones, holgura, minimo)
+
+    print(f"--- {nombre} ---")
+    print(f"{'N':>10}" + "".join(f"{fase:>12}" for fase in FASES) + "   (ms; cociente)")
+    for i, n in enumerate(tamanos):
+        celdas = []
+        for fase in FASES:
+            t = mediciones[i].get(fase, 0.0)
+            texto = f"{t * 1000:.1f}"
+            if i:
+                texto += f";{t / mediciones[i - 1].get(fase, t):.2f}"
+            celdas.append(f"{texto:>12}")
+        print(f"{n:>10}" + "".join(celdas))
+    exponentes = []
+    for fase in FASES:
+        if mediciones[0].get(fase, 0.0) * 1000 < minimo:
+            texto = "-"
+        else:
+            texto = f"{exponente(tamanos, [m.get(fase, 0.0) for m in mediciones]):.2f}"
+            if fase in excedidas:
+                texto += "!"
+        exponentes.append(f"{texto:>12}")
+    print(f"{'exponente':>10}" + "".join(exponentes))
+    return [f"{nombre} {fase}: el tiempo crece como N^{e:.2f} (cota N^{cota(fase, tamanos[0], holgura):.2f})"
+            for fase, e in excedidas.items()]
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Guardas de complejidad de cada fase del compilador")
+    arg_parser.add_argument("--casos", nargs="+", choices=CASOS, default=list(CASOS))
+    arg_parser.add_argument("--pasos", type=int, default=4, help="cantidad de tamaños (cada uno el doble)")
+    arg_parser.add_argument("--holgura", type=float, default=0.3,
+                            help="exceso permitido sobre el exponente de la cota (1 para lineal)")
+    arg_parser.add_argument("--minimo-ms", type=float, default=5.0,
+                            help="no comparar fases que tardan menos que esto en el tamaño anterior")
+    args = arg_parser.parse_args(argv)
+
+    fallas = []
+    for nombre in args.casos:
+        generador, inicial = CASOS[nombre]
+        fallas.extend(comprobar(nombre, generador, inicial, args.pasos, args.holgura, args.minimo_ms))
+    for falla in fallas:
+        print("FALLA:", falla)
+    if not fallas:
+        print("Todas las fases crecen dentro de su cota")
+    return 1 if fallas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+# benchmarks/escalado_parser.py
+"""
+Comprueba que el tiempo de parser.parse crece linealmente con el número de sentencias.
+
+Parsea programas de N, 2N, 4N, ... sentencias (y listas/argumentos de print de tamaño
+creciente) y falla (código de salida 1) si al duplicar el tamaño el tiempo crece más
+que el factor permitido.
+
+Uso:
+    python -m benchmarks.escalado_parser [--inicial 12500] [--pasos 4] [--factor 2.6]
+"""
+import argparse
+import gc
+import sys
+import time
+
+from compilador import parsear
+
+
+def programa_sentencias(n):
+    """Programa con 'n' sentencias de asignación."""
+    return "int x = 0;\n" + "x = x + 1;\n" * n
+
+
+def programa_argumentos(n):
+    """Programa con un print de 'n' argumentos y una lista literal de 'n' elementos."""
+    args = ", ".join("x" for _ in range(n))
+    return f"int x = 0;\nprint({args});\n[{args}];\n"
+
+
+def medir(generador, n, repeticiones=3):
+    """Mejor tiempo de parseo (segundos) del programa generado con tamaño 'n'."""
+    codigo = generador(n)
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        # Igual que timeit: sin recolector cíclico para que sus pausas no distorsionen el cociente
+        gc.collect()
+        gc.disable()
+        try:
+            t0 = time.perf_counter()
+            parsear(codigo)
+            mejor = min(mejor, time.perf_counter() - t0)
+        finally:
+            gc.enable()
+    return mejor
+
+
+def comprobar(nombre, generador, inicial, pasos, factor):
+    """Imprime la tabla de tiempos y retorna False si algún cociente supera 'factor'."""
+    print(f"--- {nombre} ---")
+    print(f"{'N':>10} {'segundos':>10} {'cociente':>9}")
+    ok = True
+    anterior = None
+    n = inicial
+    for _ in range(pasos):
+        t = medir(generador, n)
+        cociente = t / anterior if anterior else None
+        texto = f"{cociente:>9.2f}" if cociente else f"{'-':>9}"
+        print(f"{n:>10} {t:>10.4f} {texto}")
+        if cociente and cociente > factor:
+            ok = False
+        anterior = t
+        n *= 2
+    return ok
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Escalado del parser con el tamaño del programa")
+    arg_parser.add_argument("--inicial", type=int, default=12500)
+    arg_parser.add_argument("--pasos", type=int, default=4)
+    arg_parser.add_argument("--factor", type=float, default=2.6,
+                            help="cociente máximo permitido al duplicar N (lineal = 2)")
+    args = arg_parser.parse_args(argv)
+
+    ok = comprobar("sentencias", programa_sentencias, args.inicial, args.pasos, args.factor)
+    ok = comprobar("argumentos/elementos", programa_argumentos, args.inicial, args.pasos, args.factor) and ok
+    if not ok:
+        print(f"FALLO: el tiempo de parseo crece más que {args.factor}x al duplicar N")
+        return 1
+    print("OK: crecimiento lineal")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+# benchmarks/fases.py
+"""
+Mide cada fase del compilador (lexico, sintactico, semantico, tac, ssa, optimizador, nasm)
+sobre programas sintéticos de cada forma de benchmarks/generador.py y de varios tamaños,
+y compara los tiempos con una línea base guardada.
+
+Cada medición es el mejor tiempo de varias repeticiones de compilador.compilar_codigo con
+un perfil.Perfil (sin tracemalloc). Con --guardar los resultados pasan a ser la línea base
+(benchmarks/linea_base.json por defecto; no se versiona porque depende de la máquina).
+Sin --guardar, si existe una línea base, una fase es una regresión cuando tarda más que
+la base multiplicada por (1 + tolerancia) y además la diferencia supera --minimo-ms
+(para no fallar por ruido en fases de pocos milisegundos). Antes de comparar, los tiempos
+se escalan por una calibración (tiempo de un cálculo fijo en Python puro, guardado con la
+línea base) para descontar que la máquina esté más rápida o más lenta que al guardarla.
+
+Uso:
+    python -m benchmarks.fases [--formas lineal anidado ...] [--tamanos 250 1000 4000]
+                               [--repeticiones 5] [--guardar] [--linea-base RUTA]
+                               [--tolerancia 0.25] [--minimo-ms 2]
+Retorna 1 si hay alguna regresión.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+
+import compilador
+from benchmarks.generador import FORMAS, generar_programa
+from perfil import FASES, Perfil
+
+LINEA_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "linea_base.json")
+
+
+def calibrar(repeticiones=5):
+    """Mejor tiempo (segundos) de un cálculo fijo que no usa el compilador."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        tabla = {}
+        for i in range(200000):
+            clave = str(i % 997)
+            tabla[clave] = tabla.get(clave, 0) + i * 3
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor
+
+
+def medir(codigo, repeticiones=5):
+    """Diccionario fase -> mejor tiempo (segundos) de compilar 'codigo'."""
+    mejores = {}
+    for _ in range(repeticiones):
+        perfil = Perfil(memoria=False)
+        gc.collect()
+        resultado = compilador.compilar_codigo(codigo, perfil=perfil)
+        if resultado["errores"]:
+            raise ValueError(f"el programa generado tiene errores: {resultado['errores'][:3]}")
+        for m in perfil.resumen():
+            mejores[m.fase] = min(mejores.get(m.fase, float("inf")), m.segundos)
+    return mejores
+
+
+def comparar(resultados, base, tolerancia, minimo):
+    """Lista de regresiones (texto) de 'resultados' frente a 'base' (mismo formato)."""
+    regresiones = []
+    for caso, fases in resultados.items():
+        for fase, segundos in fases.items():
+            anterior = base.get(caso, {}).get(fase)
+            if anterior is None:
+                continue
+            if segundos > anterior * (1 + tolerancia) and segundos - anterior > minimo:
+                regresiones.append(f"{caso} {fase}: {anterior * 1000:.2f} ms -> {segundos * 1000:.2f} ms "
+                                   f"({segundos / anterior:.2f}x)")
+    return regresiones
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Tiempo por fase sobre programas sintéticos")
+    arg_parser.add_argument("--formas", nargs="+", choices=FORMAS, default=list(FORMAS))
+    arg_parser.add_argument("--tamanos", nargs="+", type=int, default=[250, 1000, 4000],
+                            help="sentencias de cada programa")
+    arg_parser.add_argument("--repeticiones", type=int, default=5)
+    arg_parser.add_argument("--linea-base", default=LINEA_BASE, metavar="RUTA")
+    arg_parser.add_argument("--guardar", action="store_true", help="guardar los resultados como línea base")
+    arg_parser.add_argument("--tolerancia", type=float, default=0.25,
+                            help="aumento relativo permitido frente a la línea base")
+    arg_parser.add_argument("--minimo-ms", type=float, default=2.0,
+                            help="diferencia mínima (ms) para considerar una regresión")
+    args = arg_parser.parse_args(argv)
+
+    calibracion = calibrar()
+    resultados = {}
+    print(f"{'caso':<18}" + "".join(f"{fase:>12}" for fase in FASES) + f"{'total':>12}   (ms)")
+    for forma in args.formas:
+        for tamano in args.tamanos:
+            caso = f"{forma}/{tamano}"
+            fases = medir(generar_programa(forma, tamano), args.repeticiones)
+            resultados[caso] = fases
+            print(f"{caso:<18}" + "".join(f"{fases.get(fase, 0) * 1000:>12.2f}" for fase in FASES)
+                  + f"{sum(fases.values()) * 1000:>12.2f}")
+
+    maquina = {"python": platform.python_version(), "plataforma": platform.platform(),
+               "procesador": platform.machine()}
+    if args.guardar:
+        with open(args.linea_base, "w", encoding="utf-8") as f:
+            json.dump({"maquina": maquina, "calibracion": calibracion, "resultados": resultados}, f, indent=2)
+        print(f"Línea base guardada en {args.linea_base}")
+        return 0
+    if not os.path.exists(args.linea_base):
+        print(f"Sin línea base ({args.linea_base}): ejecutar con --guardar para crearla")
+        return 0
+    with open(args.linea_base, encoding="utf-8") as f:
+        base = json.load(f)
+    if base.get("maquina") != maquina:
+        print(f"Aviso: la línea base se midió en otra configuración ({base.get('maquina')})")
+    escala = base["calibracion"] / calibracion
+    print(f"Calibración: {calibracion * 1000:.1f} ms (línea base: {base['calibracion'] * 1000:.1f} ms)")
+    escalados = {caso: {fase: t * escala for fase, t in fases.items()} for caso, fases in resultados.items()}
+    regresiones = comparar(escalados, base["resultados"], args.tolerancia, args.minimo_ms / 1000)
+    for regresion in regresiones:
+        print("REGRESIÓN:", regresion)
+    if not regresiones:
+        print(f"Sin regresiones frente a {args.linea_base} (tolerancia {args.tolerancia:.0%})")
+    return 1 if regresiones else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
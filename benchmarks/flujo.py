@@ -0,0 +1,122 @@
+# benchmarks/flujo.py
+"""
+Comprueba y mide el modo en flujo del compilador (compilador.compilar_en_flujo, --flujo):
+
+1. equivalencia: para cada forma de benchmarks/generador.py, con y sin --ast-plano, los
+   archivos _tac.txt, _opt.txt y .asm escritos en flujo son idénticos byte a byte a los
+   del pipeline con listas (compilador.compilar_archivo sin caché);
+2. memoria: con tracemalloc, el pico de memoria de las fases TAC -> optimizador -> NASM
+   (incluida la escritura de los archivos) con listas y en flujo, sobre programas en línea
+   recta de varios tamaños. El AST y la tabla de símbolos (comunes a ambos modos) se
+   construyen antes de empezar a medir. En flujo lo único que crece con el programa es la
+   tabla de variables de .bss (una entrada por temporal).
+
+Uso:
+    python -m benchmarks.flujo [--tamano 300] [--tamanos 5000 20000 80000]
+Retorna 1 si algún archivo difiere.
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import tracemalloc
+
+import compilador
+import generador_codigo as gc
+import generador_nasm
+import optimizador
+from benchmarks.generador import FORMAS, generar_programa
+from contexto import ContextoCompilacion
+
+
+def _leer(rutas):
+    contenido = {}
+    for clave, ruta in rutas.items():
+        with open(ruta, "rb") as f:
+            contenido[clave] = f.read()
+    return contenido
+
+
+def _equivalencia(problemas, tamano):
+    """Compara los artefactos de ambos modos para cada forma; retorna las líneas a mostrar."""
+    informe = []
+    with tempfile.TemporaryDirectory() as carpeta:
+        for forma in FORMAS:
+            for ast_plano in (False, True):
+                fuente = os.path.join(carpeta, f"{forma}.txt")
+                with open(fuente, "w", encoding="utf-8") as f:
+                    f.write(generar_programa(forma, tamano))
+                artefactos = []
+                for en_flujo, salida in ((False, "listas"), (True, "flujo")):
+                    os.makedirs(os.path.join(carpeta, salida), exist_ok=True)
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        errores = compilador.compilar_archivo(fuente, os.path.join(carpeta, salida), ast_plano,
+                                                              en_flujo=en_flujo)
+                    if errores:
+                        problemas.append(f"{forma}: errores al compilar: {errores[:3]}")
+                    artefactos.append(_leer(compilador.rutas_salida(fuente, os.path.join(carpeta, salida))))
+                distintos = [clave for clave in artefactos[0] if artefactos[0][clave] != artefactos[1][clave]]
+                nombre = f"{forma}{' (ast plano)' if ast_plano else ''}"
+                if distintos:
+                    problemas.append(f"{nombre}: difieren {', '.join(distintos)}")
+                lineas = artefactos[0]["asm"].count(b"\n")
+                informe.append(f"  {nombre:<26} {lineas:>7} líneas de ASM  "
+                               f"{'distintos: ' + ', '.join(distintos) if distintos else 'idénticos'}")
+    return informe
+
+
+def _con_listas(ast, ctx, rutas):
+    """El final de compilar_archivo sin caché: listas completas y luego los archivos."""
+    tac = gc._generar_TAC_desde_AST(ast, ctx)
+    tac_opt = optimizador.optimizar_tac(tac, ctx)
+    asm = generador_nasm.generar_codigo_maquina(tac_opt, ruta_asm=None)
+    for clave, lineas in (("tac", tac), ("tac_opt", tac_opt), ("asm", asm)):
+        compilador._escribir_lineas(rutas[clave], lineas)
+
+
+def _pico(funcion, codigo, rutas):
+    """Pico de memoria (bytes) de funcion(ast, ctx, rutas), sin contar el análisis de 'codigo'."""
+    ctx = ContextoCompilacion()
+    with contextlib.redirect_stdout(io.StringIO()):
+        ast, correcto = compilador._analizar(codigo, ctx, False)
+    if not correcto:
+        raise ValueError(f"el programa generado tiene errores: {ctx.errores[:3]}")
+    tracemalloc.start()
+    try:
+        funcion(ast, ctx, rutas)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Equivalencia y memoria del modo en flujo")
+    arg_parser.add_argument("--tamano", type=int, default=300, help="sentencias por forma en la equivalencia")
+    arg_parser.add_argument("--tamanos", type=int, nargs="+", default=[5000, 20000, 80000],
+                            help="sentencias de los programas en línea recta para medir la memoria")
+    args = arg_parser.parse_args(argv)
+
+    problemas = []
+    print("Equivalencia con el pipeline de listas:")
+    for linea in _equivalencia(problemas, args.tamano):
+        print(linea)
+
+    print("Pico de memoria de TAC -> optimizador -> NASM (programas en línea recta):")
+    with tempfile.TemporaryDirectory() as carpeta:
+        rutas = compilador.rutas_salida(os.path.join(carpeta, "programa.txt"))
+        for tamano in args.tamanos:
+            codigo = generar_programa("lineal", tamano)
+            listas = _pico(_con_listas, codigo, rutas)
+            flujo = _pico(compilador._escribir_en_flujo, codigo, rutas)
+            print(f"  {tamano:>7} sentencias: listas {listas / 2**20:8.2f} MiB, "
+                  f"flujo {flujo / 2**20:8.2f} MiB ({listas / max(flujo, 1):.0f}x menos)")
+
+    for problema in problemas:
+        print("ERROR:", problema)
+    return 1 if problemas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+# benchmarks/generador.py
+"""
+Generador de programas sintéticos válidos (sin errores léxicos, sintácticos ni semánticos)
+con forma configurable, para medir cada fase del compilador sobre entradas de distinto tipo.
+
+Formas (FORMAS) y qué ejercitan:
+    lineal       asignaciones en línea recta sobre pocas variables
+    anidado      bloques if/while anidados 'profundidad' niveles
+    bucles       muchos for, cada uno con su variable de control
+    expresiones  expresiones anchas de 'ancho' operandos con paréntesis
+    variables    muchas variables distintas (tabla de símbolos grande)
+    mixto        las formas anteriores intercaladas
+
+'tamano' es la cantidad aproximada de sentencias del programa, en todas las formas.
+
+Uso:
+    python -m benchmarks.generador anidado 1000 [--profundidad 20] [--ancho 32] [--semilla 0] > programa.txt
+"""
+import argparse
+import random
+import sys
+
+_OPERADORES = ["+", "-", "*"]
+_COMPARACIONES = ["<", ">", "<=", ">=", "!=", "=="]
+_VARIABLES = ["a", "b", "c", "d"]
+_DECLARACIONES = [f"int {v} = {i + 1};" for i, v in enumerate(_VARIABLES)]
+
+
+def _asignacion(azar):
+    destino = azar.choice(_VARIABLES)
+    return (f"{destino} = {azar.choice(_VARIABLES)} {azar.choice(_OPERADORES)} "
+            f"{azar.randrange(1, 10)} {azar.choice(_OPERADORES)} {azar.choice(_VARIABLES)};")
+
+
+def _condicion(azar):
+    return f"{azar.choice(_VARIABLES)} {azar.choice(_COMPARACIONES)} {azar.randrange(100)}"
+
+
+def lineal(tamano, azar, **_):
+    return [_asignacion(azar) for _ in range(tamano)]
+
+
+def anidado(tamano, azar, profundidad=20, **_):
+    """Nidos de 'profundidad' niveles (if y while alternados), cada nivel con una asignación."""
+    lineas = []
+    restantes = tamano
+    while restantes > 0:
+        niveles = min(profundidad, restantes)
+        for nivel in range(niveles):
+            palabra = "if" if nivel % 2 == 0 else "while"
+            lineas.append("    " * nivel + f"{palabra} ({_condicion(azar)}) {{")
+            lineas.append("    " * (nivel + 1) + _asignacion(azar))
+        for nivel in reversed(range(niveles)):
+            lineas.append("    " * nivel + "}")
+        restantes -= niveles
+    return lineas
+
+
+def bucles(tamano, azar, prefijo="i", **_):
+    """Un for por sentencia; las variables de control se llaman <prefijo><n>."""
+    lineas = []
+    for n in range(tamano):
+        i = f"{prefijo}{n}"
+        limite = azar.randrange(2, 50)
+        lineas.append(f"for (int {i} = 0; {i} < {limite}; {i}++) {{ "
+                      f"{azar.choice(_VARIABLES)} = {azar.choice(_VARIABLES)} + {i}; }}")
+    return lineas
+
+
+def _expresion_ancha(azar, ancho):
+    partes = []
+    for i in range(ancho):
+        if i:
+            partes.append(azar.choice(_OPERADORES))
+        atomo = azar.choice(_VARIABLES) if azar.random() < 0.6 else str(azar.randrange(1, 100))
+        if i % 4 == 0 and i + 1 < ancho:
+            atomo = "(" + atomo + " " + azar.choice(_OPERADORES) + " " + str(azar.randrange(1, 10)) + ")"
+        partes.append(atomo)
+    return " ".join(partes)
+
+
+def expresiones(tamano, azar, ancho=32, **_):
+    return [f"{azar.choice(_VARIABLES)} = {_expresion_ancha(azar, ancho)};" for _ in range(tamano)]
+
+
+def variables(tamano, azar, **_):
+    lineas = []
+    for i in range(tamano):
+        if i % 2 == 0 or i < 2:
+            lineas.append(f"int v{i} = {azar.randrange(100)};")
+        else:
+            otra = azar.randrange(0, i - 1, 2)  # solo variables ya declaradas (índices pares)
+            lineas.append(f"v{i - 1} = v{otra} + {azar.randrange(1, 10)};")
+    return lineas
+
+
+def mixto(tamano, azar, profundidad=20, ancho=32, **_):
+    """Grupos de 'profundidad' sentencias de cada forma, por turnos."""
+    lineas = []
+    formas = [lineal, anidado, bucles, expresiones]
+    grupo = hechas = 0
+    while hechas < tamano:
+        forma = formas[grupo % len(formas)]
+        n = min(profundidad, tamano - hechas)
+        # Cada grupo de bucles usa variables de control distintas
+        lineas.extend(forma(n, azar, profundidad=profundidad, ancho=ancho, prefijo=f"g{grupo}_"))
+        grupo += 1
+        hechas += n
+    return lineas
+
+
+FORMAS = {
+    "lineal": lineal,
+    "anidado": anidado,
+    "bucles": bucles,
+    "expresiones": expresiones,
+    "variables": variables,
+    "mixto": mixto,
+}
+
+
+def generar_programa(forma, tamano, semilla=0, profundidad=20, ancho=32):
+    """Código fuente de un programa válido con la forma y el tamaño (sentencias) indicados."""
+    azar = random.Random(semilla)
+    lineas = list(_DECLARACIONES)
+    lineas.extend(FORMAS[forma](tamano, azar, profundidad=profundidad, ancho=ancho))
+    lineas.append("print(a, b, c, d);")
+    return "\n".join(lineas) + "\n"
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Genera un programa sintético válido")
+    arg_parser.add_argument("forma", choices=FORMAS)
+    arg_parser.add_argument("tamano", type=int, help="cantidad aproximada de sentencias")
+    arg_parser.add_argument("--profundidad", type=int, default=20, help="niveles de anidamiento (forma anidado)")
+    arg_parser.add_argument("--ancho", type=int, default=32, help="operandos por expresión (forma expresiones)")
+    arg_parser.add_argument("--semilla", type=int, default=0)
+    args = arg_parser.parse_args(argv)
+    sys.stdout.write(generar_programa(args.forma, args.tamano, args.semilla, args.profundidad, args.ancho))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# benchmarks/incremental.py
+"""
+Mide el análisis incremental del editor (incremental.AnalisisIncremental) frente a volver a
+analizar todo el archivo en cada edición, sobre un programa grande y una secuencia de
+ediciones pequeñas al azar (cambiar un número, escribir una sentencia, borrar una, dejar
+una llave o un punto y coma a medias y luego corregirlo).
+
+Después de cada edición se comprueba que el AST incremental sea idéntico al de un análisis
+completo con el mismo motor sintáctico (compilador.parsear con el parser 'descendente', que
+como el incremental retorna None ante un error en vez de recuperarse como PLY) y que los
+errores sean los de un AnalisisIncremental nuevo sobre el mismo texto.
+
+Además, --al-azar ediciones de caracteres sueltos (insertar, borrar, invertir un trozo de
+línea) sobre un programa chico, sin corregir los errores que dejan, comprueban que AST y
+errores no dependan del orden de las ediciones.
+
+Uso:
+    python -m benchmarks.incremental [--repeticiones 500] [--ediciones 300] [--al-azar 300] [--semilla 0]
+Retorna 1 si encuentra alguna diferencia.
+"""
+import argparse
+import contextlib
+import io
+import random
+import statistics
+import sys
+import time
+
+from benchmarks.parser import _BLOQUE, programas_aleatorios
+from compilador import parsear
+from incremental import AnalisisIncremental
+
+
+def _parsear_completo(codigo):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return parsear(codigo, motor_parser="descendente")
+
+
+def ediciones(codigo, n, semilla=0):
+    """Genera 'n' versiones sucesivas de 'codigo', cada una con una edición pequeña."""
+    azar = random.Random(semilla)
+    sentencias = [p for p in programas_aleatorios(200, semilla) if _parsear_completo(p) is not None]
+    pendiente = None  # (posición, texto) que corrige una edición que dejó un error
+    for _ in range(n):
+        if pendiente is not None:
+            pos, texto = pendiente
+            codigo = codigo[:pos] + texto + codigo[pos:]
+            pendiente = None
+            yield codigo
+            continue
+        opcion = azar.randrange(5)
+        # Las ediciones se hacen al principio de una línea (o dentro de un número)
+        linea = azar.randrange(codigo.count('\n'))
+        pos = 0
+        for _ in range(linea):
+            pos = codigo.index('\n', pos) + 1
+        if opcion == 0:
+            digito = codigo.find('0', pos)
+            if digito != -1:
+                pos = digito
+            codigo = codigo[:pos] + str(azar.randrange(1, 10)) + codigo[pos:]
+        elif opcion == 1:
+            codigo = codigo[:pos] + azar.choice(sentencias) + '\n' + codigo[pos:]
+        elif opcion == 2:
+            fin = codigo.find('\n', pos)
+            if codigo[pos:fin].endswith(';') and codigo[pos:fin].count('{') == codigo[pos:fin].count('}'):
+                codigo = codigo[:pos] + codigo[fin + 1:]
+        else:
+            # Error temporal: una sentencia a la que le falta el final
+            texto, resto = azar.choice([("x = (a + ", "1);"), ("if (a) {", "a++; }"), ("print(a, ", "b);")])
+            codigo = codigo[:pos] + texto + '\n' + codigo[pos:]
+            pendiente = (pos + len(texto), resto)
+        yield codigo
+
+
+def ediciones_al_azar(codigo, n, semilla=0):
+    """Genera 'n' versiones sucesivas de 'codigo' con ediciones de caracteres sueltos, sin corregir errores."""
+    azar = random.Random(semilla)
+    piezas = ["{", "}", ";", "@", "(", ")", "x", " ", "\n", "if", "else", "1", "=", "int y = 2;\n", "#"]
+    for _ in range(n):
+        pos = azar.randrange(len(codigo) + 1)
+        opcion = azar.randrange(3)
+        if opcion == 0:
+            codigo = codigo[:pos] + azar.choice(piezas) + codigo[pos:]
+        elif opcion == 1:
+            codigo = codigo[:pos] + codigo[pos + azar.randrange(1, 6):]
+        else:
+            fin = codigo.find('\n', pos)
+            fin = len(codigo) if fin == -1 else fin
+            codigo = codigo[:pos] + codigo[pos:fin][::-1] + codigo[fin:]
+        yield codigo
+
+
+def _analisis_nuevo(codigo):
+    """AST y errores de un AnalisisIncremental sin historia."""
+    frente = AnalisisIncremental()
+    with contextlib.redirect_stdout(io.StringIO()):
+        ast = frente.actualizar(codigo)
+    return ast, frente.errores
+
+
+def diferencias_al_azar(n, semilla=0):
+    """Cantidad de ediciones de ediciones_al_azar tras las que AST o errores difieren de un análisis nuevo."""
+    codigo = _BLOQUE * 3
+    frente = AnalisisIncremental()
+    diferencias = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        frente.actualizar(codigo)
+        for version in ediciones_al_azar(codigo, n, semilla):
+            ast = frente.actualizar(version)
+            ast_nuevo, errores_nuevos = _analisis_nuevo(version)
+            diferencias += repr(ast) != repr(ast_nuevo) or frente.errores != errores_nuevos
+    return diferencias
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Análisis incremental frente a análisis completo")
+    arg_parser.add_argument("--repeticiones", type=int, default=500,
+                            help="veces que se repite el bloque de código del programa inicial")
+    arg_parser.add_argument("--ediciones", type=int, default=300)
+    arg_parser.add_argument("--al-azar", type=int, default=300,
+                            help="ediciones de caracteres sueltos sin corregir (comprobación de errores)")
+    arg_parser.add_argument("--semilla", type=int, default=0)
+    args = arg_parser.parse_args(argv)
+
+    codigo = _BLOQUE * args.repeticiones
+    frente = AnalisisIncremental()
+    t0 = time.perf_counter()
+    ast = frente.actualizar(codigo)
+    t_inicial = time.perf_counter() - t0
+    print(f"Programa de {len(codigo)} caracteres y {len(ast.sentencias)} "
+          f"sentencias de primer nivel (análisis inicial: {t_inicial:.3f} s)")
+
+    t_incremental, t_completo = [], []
+    diferencias = diferencias_errores = con_errores = 0
+    for version in ediciones(codigo, args.ediciones, args.semilla):
+        t0 = time.perf_counter()
+        ast = frente.actualizar(version)
+        t1 = time.perf_counter()
+        completo = _parsear_completo(version)
+        t2 = time.perf_counter()
+        t_incremental.append(t1 - t0)
+        t_completo.append(t2 - t1)
+        con_errores += ast is None
+        if repr(ast) != repr(completo):
+            diferencias += 1
+        if frente.errores != _analisis_nuevo(version)[1]:
+            diferencias_errores += 1
+    print(f"{args.ediciones} ediciones ({con_errores} con errores de sintaxis), "
+          f"{diferencias} diferencias con el análisis completo, {diferencias_errores} en los errores")
+    al_azar = diferencias_al_azar(args.al_azar, args.semilla)
+    print(f"{args.al_azar} ediciones al azar sin corregir: {al_azar} diferencias con un análisis nuevo")
+    diferencias += diferencias_errores + al_azar
+    # La mediana refleja una edición típica; el promedio incluye las que abren una llave sin
+    # cerrarla, que obligan a reanalizar hasta el final del archivo
+    print(f"{'análisis':>12} {'mediana (ms)':>13} {'promedio (ms)':>14}")
+    for nombre, tiempos in (("completo", t_completo), ("incremental", t_incremental)):
+        print(f"{nombre:>12} {statistics.median(tiempos) * 1000:>13.2f} {statistics.mean(tiempos) * 1000:>14.2f}")
+    print(f"Aceleración: {statistics.median(t_completo) / statistics.median(t_incremental):.0f}x en la mediana, "
+          f"{sum(t_completo) / sum(t_incremental):.1f}x en el total")
+    return 1 if diferencias else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
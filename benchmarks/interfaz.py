@@ -0,0 +1,163 @@
+# benchmarks/interfaz.py
+"""
+Mide si la interfaz (main.py) sigue respondiendo mientras compila, sin abrir una ventana:
+simula el bucle de eventos de Tk con un bucle de cuadros de 16 ms (60 cuadros por segundo)
+que entrega resultados con tareas.Despachador.sondear(), igual que sondear_trabajos().
+
+1. sincrónico: la compilación corre dentro de un cuadro, como antes del despachador;
+2. despachador: la compilación corre en el hilo trabajador y los cuadros siguen su ritmo;
+3. cancelación: de varios envíos seguidos con la misma clave solo se entrega el último, y
+   un proceso externo lanzado con Tarea.ejecutar() termina en cuanto se cancela;
+4. recolección: un ciclo de referencias que deja un trabajo no se recolecta mientras la
+   interfaz avisa actividad (Despachador.actividad(), como al escribir) y se libera cuando
+   la interfaz queda inactiva; la generación permanente (gc.freeze) vuelve a quedar vacía.
+
+Uso:
+    python -m benchmarks.interfaz [--sentencias 20000] [--compilaciones 3]
+Retorna 1 si con el despachador el percentil 99 de los cuadros supera dos cuadros (32 ms),
+algún cuadro supera 100 ms, la cancelación falla o el ciclo no se libera.
+"""
+import argparse
+import contextlib
+import gc
+import io
+import statistics
+import sys
+import time
+import weakref
+
+import compilador
+from benchmarks.generador import generar_programa
+from tareas import INTERVALO_GIL, Despachador
+
+CUADRO = 0.016  # segundos entre cuadros (INTERVALO_SONDEO de main.py)
+
+
+def _cuadros(hasta, despachador=None, trabajo_en_cuadro=None):
+    """Simula el bucle de eventos hasta que hasta() sea verdadero; retorna la duración de cada cuadro."""
+    duraciones = []
+    anterior = time.perf_counter()
+    while not hasta():
+        if trabajo_en_cuadro is not None:
+            trabajo_en_cuadro()
+        if despachador is not None:
+            despachador.sondear()
+        time.sleep(max(0.0, CUADRO - (time.perf_counter() - anterior)))
+        ahora = time.perf_counter()
+        duraciones.append(ahora - anterior)
+        anterior = ahora
+    return duraciones
+
+
+def _compilar(codigo):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return compilador.compilar_codigo(codigo)
+
+
+class _Nodo:
+    """Objeto que forma un ciclo consigo mismo (solo lo libera el recolector cíclico)."""
+
+    def __init__(self):
+        self.yo = self
+
+
+def _recoleccion(problemas):
+    """
+    Segundos hasta que se libera un ciclo creado por un trabajo, desde que la interfaz deja de
+    avisar actividad, con un despachador que recolecta tras 0.2 s de inactividad.
+    """
+    despachador = Despachador(espera_recoleccion=0.2)
+    referencias = []
+
+    def trabajo(tarea):
+        referencias.append(weakref.ref(_Nodo()))
+
+    # Escribiendo: cada cuadro avisa actividad durante 0.6 s, así que no se recolecta
+    t0 = time.perf_counter()
+    despachador.enviar("ciclo", trabajo, lambda _: None)
+    _cuadros(lambda: time.perf_counter() - t0 > 0.6, despachador, despachador.actividad)
+    if not referencias or referencias[0]() is None:
+        problemas.append("se recolectó mientras la interfaz avisaba actividad")
+    t0 = time.perf_counter()
+    _cuadros(lambda: (referencias and referencias[0]() is None) or time.perf_counter() - t0 > 5, despachador)
+    segundos = time.perf_counter() - t0
+    despachador.cerrar()
+    if not referencias or referencias[0]() is not None or gc.get_freeze_count():
+        problemas.append(f"el ciclo del trabajo no se liberó (congelados: {gc.get_freeze_count()})")
+    return segundos
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Respuesta de la interfaz mientras se compila")
+    arg_parser.add_argument("--sentencias", type=int, default=20000)
+    arg_parser.add_argument("--compilaciones", type=int, default=3)
+    args = arg_parser.parse_args(argv)
+
+    codigo = generar_programa("mixto", args.sentencias)
+    problemas = []
+
+    # 1. Sincrónico: cada compilación bloquea un cuadro entero
+    pendientes = [args.compilaciones]
+
+    def compilar_en_cuadro():
+        _compilar(codigo)
+        pendientes[0] -= 1
+
+    sincronico = _cuadros(lambda: pendientes[0] == 0, trabajo_en_cuadro=compilar_en_cuadro)
+
+    # 2. Despachador: las compilaciones corren en el hilo trabajador, una tras otra (como en main.py)
+    sys.setswitchinterval(INTERVALO_GIL)
+    despachador = Despachador()
+    entregadas = []
+    t0 = time.perf_counter()
+    for i in range(args.compilaciones):
+        # Como en main.py, la respuesta muestra el resultado y no lo conserva
+        despachador.enviar(f"compilacion {i}", lambda tarea: _compilar(codigo),
+                           lambda resultado: entregadas.append(len(resultado["asm"])))
+    con_despachador = _cuadros(lambda: len(entregadas) == args.compilaciones, despachador)
+    t_despachador = time.perf_counter() - t0
+
+    # 3. Cancelación: solo se entrega el último envío de una clave
+    resultados = []
+    for i in range(5):
+        despachador.enviar("editor", lambda tarea, i=i: (time.sleep(0.05), tarea.comprobar(), i)[2],
+                           resultados.append)
+    _cuadros(lambda: not despachador.ocupado, despachador)
+    if resultados != [4]:
+        problemas.append(f"se entregaron {resultados} en lugar de solo el último envío [4]")
+
+    proceso = despachador.enviar("proceso", lambda tarea: tarea.ejecutar([sys.executable, "-c",
+                                                                            "import time; time.sleep(30)"]),
+                                 resultados.append)
+    time.sleep(0.5)
+    t0 = time.perf_counter()
+    despachador.cancelar("proceso")
+    _cuadros(lambda: proceso.cancelada and despachador._pendientes.empty(), despachador)
+    despachador.cerrar()
+    t_cancelar = time.perf_counter() - t0
+    if t_cancelar > 1.0 or len(resultados) != 1:
+        problemas.append(f"el proceso cancelado siguió corriendo ({t_cancelar:.2f} s)")
+
+    t_recoleccion = _recoleccion(problemas)
+
+    def ms(segundos):
+        return f"{segundos * 1000:.1f} ms"
+
+    print(f"{args.compilaciones} compilaciones de {args.sentencias} sentencias (cuadros de {ms(CUADRO)})")
+    for nombre, duraciones in (("sincrónico", sincronico), ("despachador", con_despachador)):
+        duraciones = sorted(duraciones)
+        print(f"  {nombre:<12} {len(duraciones):>5} cuadros, mediana {ms(statistics.median(duraciones))}, "
+              f"p99 {ms(duraciones[int(len(duraciones) * 0.99)])}, máximo {ms(duraciones[-1])}")
+    print(f"  compilaciones con despachador: {t_despachador:.2f} s")
+    print(f"  cancelar un proceso externo:   {ms(t_cancelar)}")
+    print(f"  ciclo liberado al quedar inactiva la interfaz: {ms(t_recoleccion)}")
+    con_despachador.sort()
+    if con_despachador[int(len(con_despachador) * 0.99)] > 2 * CUADRO or con_despachador[-1] > 0.1:
+        problemas.append(f"con el despachador hubo cuadros de hasta {ms(con_despachador[-1])}")
+    for problema in problemas:
+        print("ERROR:", problema)
+    return 1 if problemas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+# benchmarks/lexer.py
+"""
+Compara el rendimiento de los motores léxicos ('ply' = lexico.lexer y 'regex' = LexerRegex)
+sobre un programa sintético, en tokens/segundo y MB/segundo, y verifica que ambos
+producen exactamente los mismos tokens (tipo, valor, posición, línea y columna).
+
+Uso:
+    python -m benchmarks.lexer [--repeticiones 2000]
+"""
+import argparse
+import sys
+import time
+
+import lexico
+
+_BLOQUE = """int contador = 0;
+float promedio = 3.14;
+string nombre = "Hola mundo";
+bool activo = true;
+for (int i = 0; i < 10; i++) {
+    contador = contador + i * 2 - (i / 3);
+    if (contador >= 100 && activo || !activo) { print(contador, "mayor"); } else { contador--; }
+}
+while (contador != 0) { contador = contador > 5 ? contador - 5 : 0; }
+lista = [1, 2, 3];
+"""
+
+
+def tokens_de(motor, codigo):
+    """Lista de (tipo, valor, lexpos, línea, columna) producida por el motor indicado."""
+    lx = lexico.nuevo_lexer(motor)
+    lx.input(codigo)
+    return [(t.type, t.value, t.lexpos, t.lineno, t.columna) for t in lx]
+
+
+def medir(motor, codigo, repeticiones=3):
+    """Mejor tiempo (segundos) para tokenizar 'codigo' completo con el motor indicado."""
+    mejor = float("inf")
+    n_tokens = 0
+    for _ in range(repeticiones):
+        lx = lexico.nuevo_lexer(motor)
+        t0 = time.perf_counter()
+        lx.input(codigo)
+        n_tokens = sum(1 for _ in lx)
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor, n_tokens
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Benchmark de motores léxicos")
+    arg_parser.add_argument("--repeticiones", type=int, default=2000,
+                            help="veces que se repite el bloque de código de ejemplo")
+    args = arg_parser.parse_args(argv)
+
+    codigo = _BLOQUE * args.repeticiones
+    megabytes = len(codigo.encode("utf-8")) / 1e6
+
+    if tokens_de("ply", codigo) != tokens_de("regex", codigo):
+        print("FALLO: los motores producen tokens distintos")
+        return 1
+
+    print(f"Entrada: {megabytes:.2f} MB")
+    print(f"{'motor':>6} {'segundos':>10} {'tokens/s':>12} {'MB/s':>8}")
+    tiempos = {}
+    for motor in lexico.MOTORES_LEXER:
+        t, n_tokens = medir(motor, codigo)
+        tiempos[motor] = t
+        print(f"{motor:>6} {t:>10.3f} {n_tokens / t:>12.0f} {megabytes / t:>8.2f}")
+    print(f"Aceleración regex/ply: {tiempos['ply'] / tiempos['regex']:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
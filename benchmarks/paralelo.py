@@ -0,0 +1,68 @@
+# benchmarks/paralelo.py
+"""
+Mide el rendimiento (archivos/segundo) de compilador.compilar_lote con 1, 2, 4, ...
+procesos sobre un corpus sintético, para comprobar que escala con los núcleos.
+
+Uso:
+    python -m benchmarks.paralelo [--archivos 200] [--sentencias 300]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import compilador
+
+
+def _programa(n_sentencias, semilla):
+    """Genera un programa válido con 'n_sentencias' asignaciones y un bucle."""
+    lineas = ["int x = %d;" % semilla, "int y = 0;"]
+    for i in range(n_sentencias):
+        lineas.append(f"y = x + {i} * 2;")
+        if i % 10 == 0:
+            lineas.append("while (y > 0) { y = y - 1; }")
+    lineas.append("print(y);")
+    return "\n".join(lineas)
+
+
+def crear_corpus(carpeta, n_archivos, n_sentencias):
+    """Escribe 'n_archivos' programas en 'carpeta' y retorna sus rutas."""
+    rutas = []
+    for i in range(n_archivos):
+        ruta = os.path.join(carpeta, f"prog_{i}.txt")
+        with open(ruta, "w", encoding="utf-8") as f:
+            f.write(_programa(n_sentencias, i))
+        rutas.append(ruta)
+    return rutas
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Benchmark de compilación en paralelo")
+    arg_parser.add_argument("--archivos", type=int, default=200)
+    arg_parser.add_argument("--sentencias", type=int, default=300)
+    args = arg_parser.parse_args(argv)
+
+    nucleos = os.cpu_count() or 1
+    niveles = [1]
+    while niveles[-1] * 2 <= nucleos:
+        niveles.append(niveles[-1] * 2)
+    if niveles[-1] != nucleos:
+        niveles.append(nucleos)
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        rutas = crear_corpus(carpeta, args.archivos, args.sentencias)
+        salida = os.path.join(carpeta, "salida")
+        os.makedirs(salida)
+        base = None
+        print(f"{'procesos':>8} {'segundos':>10} {'archivos/s':>12} {'aceleración':>12} {'eficiencia':>11}")
+        for n in niveles:
+            t0 = time.perf_counter()
+            compilador.compilar_lote(rutas, salida, n)
+            t = time.perf_counter() - t0
+            base = base or t
+            aceleracion = base / t
+            print(f"{n:>8} {t:>10.3f} {len(rutas) / t:>12.1f} {aceleracion:>12.2f} {aceleracion / n:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
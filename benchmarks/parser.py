@@ -0,0 +1,215 @@
+# benchmarks/parser.py
+"""
+Compara los motores sintácticos ('ply' = tablas LALR de sintactico.py y 'descendente' =
+sintactico_descendente.ParserDescendente):
+
+1. Paridad: ambos deben producir el mismo AST (repr idéntico) para test.txt, un conjunto de
+   casos de precedencia y miles de programas aleatorios. En los programas con errores de
+   sintaxis solo se exige que ambos los informen (PLY además intenta recuperarse).
+2. Rendimiento: sentencias/segundo analizando un programa grande con cada motor
+   (mismo lexer en ambos casos).
+
+Uso:
+    python -m benchmarks.parser [--aleatorios 2000] [--repeticiones 2000] [--semilla 0]
+Retorna 1 si encuentra alguna diferencia.
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+import lexico
+import sintactico
+from compilador import parsear
+
+_RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Casos donde el árbol depende de cómo PLY resuelve los conflictos de la gramática
+_CASOS = [
+    "x = a + b * c - d / e;",
+    "x = a || b + c;",
+    "x = a + b || c + d;",
+    "x = a == b + c;",
+    "x = a < b + c == d;",
+    "x = a + !b == c;",
+    "x = a + b ? c : d;",
+    "x = a < b ? c : d + e;",
+    "x = c ? a : b == 1;",
+    "x = a ? b ? c : d : e ? f : g;",
+    "x = !a * b < c;",
+    "x = a + (y = b + c);",
+    "x = y = 3;",
+    "a + y = b - c;",
+    "x = \"texto\";",
+    "x = \"texto\" + 1;",
+    "x = true;",
+    "x = false && y;",
+    "a++; b--; x = a++ + 1;",
+    "float f = 2.5; 2.5 + f; float;",
+    "string s = \"hola\"; bool b = false; int i; float g;",
+    "l = [, 1, 2]; m = []; n = [a = 1, [b], !c];",
+    "for (int i = 0; i < 10; i++) for (j = 1; j < i; j--) { print(i, j); }",
+    "if (a) if (b) x = 1; else x = 2;",
+    "while (!(a >= b)) { a = a + 1; if (a <= 3) { print(a); } }",
+]
+
+# Bloque repetido para medir el rendimiento (solo construcciones válidas)
+_BLOQUE = """int contador = 0;
+float promedio = 3.14;
+string nombre = "Hola mundo";
+bool activo = true;
+for (int i = 0; i < 10; i++) {
+    contador = contador + i * 2 - (i / 3);
+    if (contador >= 100 && activo || contador < 0) { print(contador, "mayor"); } else { contador--; }
+}
+while (contador != 0) { contador = contador > 5 ? contador - 5 : 0; }
+lista = [1, 2, !activo];
+"""
+
+_OPERADORES = ['+', '-', '*', '/', '||', '&&', '==', '!=', '<', '>', '<=', '>=']
+
+
+def _expresion(azar, profundidad):
+    partes = [_atomo(azar, profundidad)]
+    for _ in range(azar.randrange(4)):
+        partes.append(azar.choice(_OPERADORES))
+        partes.append(_atomo(azar, profundidad))
+    return " ".join(partes)
+
+
+def _atomo(azar, profundidad):
+    opcion = azar.randrange(11 if profundidad > 0 else 6)
+    if opcion == 0:
+        return str(azar.randrange(100))
+    if opcion == 1:
+        return azar.choice(["2.5", '"s"', "true", "false"])
+    if opcion in (2, 3):
+        return azar.choice(["a", "b", "c"])
+    if opcion == 4:
+        return azar.choice(["a++", "b--"])
+    if opcion == 5:
+        return "(" + azar.choice(["a", "1"]) + ")"
+    if opcion == 6:
+        return "!" + _atomo(azar, profundidad - 1)
+    if opcion == 7:
+        return "(" + _expresion(azar, profundidad - 1) + ")"
+    if opcion == 8:
+        return azar.choice(["a", "b"]) + " = " + _expresion(azar, profundidad - 1)
+    if opcion == 9:
+        return "[" + ", ".join(_expresion(azar, profundidad - 1) for _ in range(azar.randrange(3))) + "]"
+    return (_expresion(azar, profundidad - 1) + " ? " + _expresion(azar, profundidad - 1)
+            + " : " + _expresion(azar, profundidad - 1))
+
+
+def _sentencia(azar, profundidad):
+    opcion = azar.randrange(10 if profundidad > 0 else 6)
+    if opcion == 0:
+        return azar.choice(["int", "float"]) + " x = " + _expresion(azar, 2) + ";"
+    if opcion == 1:
+        return azar.choice(["a = ", "x = "]) + _expresion(azar, 2) + ";"
+    if opcion == 2:
+        return azar.choice(['a = "t";', "a = true;", "a++;", "string s;", 'string s = "h";', "bool b = false;"])
+    if opcion in (3, 4):
+        return _expresion(azar, 2) + ";"
+    if opcion == 5:
+        return "print(" + ", ".join(_expresion(azar, 1) for _ in range(1 + azar.randrange(3))) + ");"
+    if opcion == 6:
+        otro = " else " + _sentencia(azar, profundidad - 1) if azar.random() < 0.5 else ""
+        return "if (" + _expresion(azar, 1) + ") " + _sentencia(azar, profundidad - 1) + otro
+    if opcion == 7:
+        return "while (" + _expresion(azar, 1) + ") " + _sentencia(azar, profundidad - 1)
+    if opcion == 8:
+        return ("for (" + azar.choice(["int i = 0", "i = 1"]) + "; " + _expresion(azar, 1) + "; "
+                + _expresion(azar, 1) + ") " + _sentencia(azar, profundidad - 1))
+    return "{ " + " ".join(_sentencia(azar, profundidad - 1) for _ in range(1 + azar.randrange(3))) + " }"
+
+
+def programas_aleatorios(n, semilla=0):
+    """'n' programas aleatorios (válidos o no) con todas las construcciones del lenguaje."""
+    azar = random.Random(semilla)
+    return ["\n".join(_sentencia(azar, 2) for _ in range(1 + azar.randrange(4))) for _ in range(n)]
+
+
+def _analizar(codigo, motor):
+    """Retorna (repr del AST, hubo_error) analizando 'codigo' con el motor indicado."""
+    salida = io.StringIO()
+    with contextlib.redirect_stdout(salida):
+        ast = parsear(codigo, motor_parser=motor)
+    return repr(ast), "Error" in salida.getvalue()
+
+
+def comprobar_paridad(programas):
+    """Retorna (diferencias, validos): programas en que los motores difieren y programas sin errores."""
+    diferencias = []
+    validos = 0
+    for codigo in programas:
+        ast_ply, error_ply = _analizar(codigo, "ply")
+        ast_desc, error_desc = _analizar(codigo, "descendente")
+        if error_ply:
+            if not error_desc:
+                diferencias.append(codigo)
+            continue
+        validos += 1
+        if error_desc or ast_ply != ast_desc:
+            diferencias.append(codigo)
+    return diferencias, validos
+
+
+def medir(motor, codigo, repeticiones=3):
+    """
+    Mejores tiempos (segundos) para analizar 'codigo' con el motor indicado:
+    (lexer + parser, solo parser con los tokens ya leídos).
+    """
+    lx = lexico.nuevo_lexer()
+    lx.input(codigo)
+    tokens = list(lx)
+    total = solo_parser = float("inf")
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        parsear(codigo, motor_parser=motor)
+        t1 = time.perf_counter()
+        sintactico.nuevo_parser(motor).parse(lexer=lexico.LexerGrabado(tokens))
+        t2 = time.perf_counter()
+        total = min(total, t1 - t0)
+        solo_parser = min(solo_parser, t2 - t1)
+    return total, solo_parser
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Paridad y rendimiento de los motores sintácticos")
+    arg_parser.add_argument("--aleatorios", type=int, default=2000,
+                            help="cantidad de programas aleatorios para la comprobación de paridad")
+    arg_parser.add_argument("--repeticiones", type=int, default=2000,
+                            help="veces que se repite el bloque de código del benchmark")
+    arg_parser.add_argument("--semilla", type=int, default=0)
+    args = arg_parser.parse_args(argv)
+
+    with open(os.path.join(_RAIZ, "test.txt"), encoding="utf-8") as f:
+        corpus = [f.read()] + _CASOS + programas_aleatorios(args.aleatorios, args.semilla)
+    diferencias, validos = comprobar_paridad(corpus)
+    print(f"Paridad: {len(corpus)} programas ({validos} válidos), {len(diferencias)} diferencias")
+    for codigo in diferencias[:5]:
+        print("---\n" + codigo)
+    if diferencias:
+        return 1
+
+    codigo = _BLOQUE * args.repeticiones
+    n_sentencias = len(parsear(codigo).sentencias)
+    print(f"Programa de {n_sentencias} sentencias de primer nivel (lexer '{lexico.MOTOR_LEXER}')")
+    print(f"{'motor':>12} {'total (s)':>10} {'sentencias/s':>13} {'solo parser (s)':>16} {'sentencias/s':>13}")
+    tiempos = {}
+    for motor in sintactico.MOTORES_PARSER:
+        total, solo_parser = tiempos[motor] = medir(motor, codigo)
+        print(f"{motor:>12} {total:>10.4f} {n_sentencias / total:>13.0f} "
+              f"{solo_parser:>16.4f} {n_sentencias / solo_parser:>13.0f}")
+    (total_ply, parser_ply), (total_desc, parser_desc) = tiempos["ply"], tiempos["descendente"]
+    print(f"Aceleración del parser descendente: {total_ply / total_desc:.2f}x en total, "
+          f"{parser_ply / parser_desc:.2f}x solo en el análisis sintáctico")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
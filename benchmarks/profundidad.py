@@ -0,0 +1,126 @@
+# benchmarks/profundidad.py
+"""
+Comprueba que el pipeline compila programas muy anidados sin RecursionError (los recorridos
+de semantico.py y generador_codigo.py usan recorrido.ejecutar en lugar de recursión):
+
+1. profundidad: bloques '{ }' anidados, if/while anidados, una cadena de sumas y una suma
+   con paréntesis anidados, todos a --profundidad niveles (100000 por defecto, muy por
+   encima de sys.getrecursionlimit()), pasan por el análisis semántico, el TAC, el
+   optimizador y NASM sin errores;
+2. errores: una variable no declarada en el nivel más interno da exactamente un error;
+3. AST plano: a --comparar niveles, compilar con el AST de objetos y con el AST plano da
+   la misma tabla de símbolos, TAC y ASM;
+4. sesión: a --comparar niveles, sesion.SesionCompilacion (la de main.py) da el mismo ASM
+   que compilar_codigo(), también tras editar el código (compara el AST nuevo con el previo).
+
+Uso:
+    python -m benchmarks.profundidad [--profundidad 100000] [--comparar 2000] [--plano]
+Con --plano la comprobación 1 también se hace con el AST plano. Retorna 1 si alguna
+comprobación falla.
+"""
+import argparse
+import sys
+import time
+
+import compilador
+from contexto import ContextoCompilacion
+from sesion import SesionCompilacion
+
+
+def programas(n):
+    """Programas válidos con 'n' niveles de anidamiento, por nombre."""
+    return {
+        "bloques": "int a = 0;\n" + "{\n" * n + "a = a + 1;\n" + "}\n" * n,
+        "if/while": "int a = 0;\n" + "".join("if (a < 1) {\n" if i % 2 else "while (a < 1) {\n" for i in range(n))
+                    + "a = a + 1;\n" + "}\n" * n,
+        "cadena": "int a = 1;\nint b = a" + " + a" * n + ";\nprint(b);\n",
+        "paréntesis": "int a = 1;\nint b = " + "(" * n + "a" + " + a)" * n + ";\nprint(b);\n",
+    }
+
+
+def compilar(codigo, ast_plano=False):
+    """Resultado de compilar_codigo() y los segundos que tardó."""
+    t0 = time.perf_counter()
+    resultado = compilador.compilar_codigo(codigo, ContextoCompilacion(), ast_plano=ast_plano)
+    return resultado, time.perf_counter() - t0
+
+
+def comprobar_profundidad(problemas, n, ast_plano):
+    """Comprobación 1: agrega a 'problemas' los programas de 'n' niveles que no compilan."""
+    for nombre, codigo in programas(n).items():
+        try:
+            resultado, segundos = compilar(codigo, ast_plano)
+        except RecursionError:
+            problemas.append(f"{nombre}: RecursionError a {n} niveles")
+            continue
+        if resultado["errores"] or not resultado["asm"]:
+            problemas.append(f"{nombre}: errores {resultado['errores'][:3]}")
+        print(f"  {nombre:<11} {len(resultado['tac']):>8} TAC {len(resultado['asm']):>8} ASM {segundos:7.2f} s")
+
+
+def comprobar_errores(problemas, n):
+    """Comprobación 2: agrega a 'problemas' si el error del nivel más interno no es el esperado."""
+    codigo = "int a = 0;\n" + "{\n" * n + "a = z + 1;\n" + "}\n" * n
+    errores = compilar(codigo)[0]["errores"]
+    if errores != ["La variable 'z' no ha sido declarada"]:
+        problemas.append(f"errores: se esperaba un error por 'z', se obtuvo {errores[:3]}")
+    return errores[:1]
+
+
+def comprobar_plano(problemas, n):
+    """Comprobación 3: agrega a 'problemas' las diferencias del AST plano; retorna los iguales."""
+    iguales = []
+    for nombre, codigo in programas(n).items():
+        objetos, plano = compilar(codigo)[0], compilar(codigo, ast_plano=True)[0]
+        claves = [clave for clave in ("tabla_simbolos", "errores", "tac", "tac_opt", "asm")
+                  if objetos[clave] != plano[clave]]
+        if claves:
+            problemas.append(f"{nombre}: el AST plano difiere en {', '.join(claves)}")
+        else:
+            iguales.append(nombre)
+    return ", ".join(iguales)
+
+
+def comprobar_sesion(problemas, n):
+    """Comprobación 4: agrega a 'problemas' las diferencias de la sesión; retorna los iguales."""
+    iguales = []
+    for nombre, codigo in programas(n).items():
+        sesion = SesionCompilacion()
+        asm = compilar(codigo)[0]["asm"]
+        try:
+            for editado in (codigo, codigo + "\n"):
+                sesion.actualizar(editado)
+                if sesion.errores_sintacticos or sesion.asm() != asm:
+                    problemas.append(f"{nombre}: la sesión difiere de compilar_codigo()")
+                    break
+            else:
+                iguales.append(nombre)
+        except RecursionError:
+            problemas.append(f"{nombre}: RecursionError en la sesión a {n} niveles")
+    return ", ".join(iguales)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Compilación de programas muy anidados")
+    arg_parser.add_argument("--profundidad", type=int, default=100000)
+    arg_parser.add_argument("--comparar", type=int, default=2000, help="niveles de la comparación con el AST plano")
+    arg_parser.add_argument("--plano", action="store_true", help="compilar también con el AST plano")
+    args = arg_parser.parse_args(argv)
+
+    problemas = []
+    print(f"{args.profundidad} niveles (límite de recursión de Python: {sys.getrecursionlimit()}):")
+    comprobar_profundidad(problemas, args.profundidad, False)
+    if args.plano:
+        print(f"{args.profundidad} niveles con el AST plano:")
+        comprobar_profundidad(problemas, args.profundidad, True)
+    print("errores:", comprobar_errores(problemas, args.profundidad))
+    print(f"AST plano a {args.comparar} niveles, iguales:", comprobar_plano(problemas, args.comparar))
+    print(f"sesión a {args.comparar} niveles, iguales:", comprobar_sesion(problemas, args.comparar))
+
+    for problema in problemas:
+        print("ERROR:", problema)
+    return 1 if problemas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
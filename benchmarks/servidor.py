@@ -0,0 +1,133 @@
+# benchmarks/servidor.py
+"""
+Mide la latencia del servidor de compilación (servidor.py) frente a lanzar un proceso
+'python compilador.py' por programa:
+
+1. en frío: un proceso nuevo por compilación (importaciones + tablas de PLY + compilación);
+2. servidor: mediana y p95 de solicitudes por socket Unix con el servidor ya cargado;
+3. concurrencia: varios clientes a la vez, cada uno con su propia conexión; con --procesos N
+   el servidor compila en un grupo de N procesos (por defecto, uno por núcleo: ver servidor.py).
+
+Comprueba que cada respuesta del servidor coincida con compilador.compilar_codigo.
+
+Uso:
+    python -m benchmarks.servidor [--solicitudes 200] [--clientes 4] [--sentencias 50] [--procesos 0]
+Retorna 1 si alguna respuesta no coincide.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import compilador
+import servidor
+from benchmarks.generador import generar_programa
+
+_RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _esperado(codigo):
+    with contextlib.redirect_stdout(io.StringIO()):
+        resultado = compilador.compilar_codigo(codigo)
+    return resultado["tac"], resultado["tac_opt"], resultado["asm"]
+
+
+def _en_frio(ruta, carpeta, repeticiones=3):
+    """Mejor tiempo (segundos) de compilar 'ruta' con un proceso nuevo."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, os.path.join(_RAIZ, "compilador.py"), ruta, "-o", carpeta, "--sin-cache"],
+                       check=True, cwd=_RAIZ)
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor
+
+
+def _cliente(ruta_socket, programas, esperados, latencias, problemas):
+    """Envía los programas por una conexión propia y registra la latencia de cada respuesta."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(ruta_socket)
+        with s.makefile("rwb") as f:
+            for i, codigo in enumerate(programas):
+                t0 = time.perf_counter()
+                f.write((json.dumps({"id": i, "codigo": codigo}) + "\n").encode("utf-8"))
+                f.flush()
+                respuesta = json.loads(f.readline())
+                latencias.append(time.perf_counter() - t0)
+                if (respuesta["tac"], respuesta["tac_opt"], respuesta["asm"]) != esperados[i]:
+                    problemas.append(f"la respuesta {i} difiere de compilar_codigo")
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Latencia del servidor de compilación")
+    arg_parser.add_argument("--solicitudes", type=int, default=200)
+    arg_parser.add_argument("--clientes", type=int, default=4)
+    arg_parser.add_argument("--sentencias", type=int, default=50)
+    arg_parser.add_argument("--procesos", type=int, default=0,
+                            help="procesos de compilación del servidor (0 = uno por núcleo)")
+    args = arg_parser.parse_args(argv)
+
+    # Programas distintos (sin caché, para medir la compilación y no solo la lectura)
+    programas = [generar_programa("mixto", args.sentencias, semilla=i) for i in range(args.solicitudes)]
+    esperados = [_esperado(codigo) for codigo in programas]
+    problemas = []
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "programa.txt")
+        with open(ruta, "w", encoding="utf-8") as f:
+            f.write(programas[0])
+        t_frio = _en_frio(ruta, carpeta)
+
+        ruta_socket = os.path.join(carpeta, "servidor.sock")
+        proceso = subprocess.Popen([sys.executable, os.path.join(_RAIZ, "servidor.py"), "--socket", ruta_socket,
+                                    "--sin-cache", "-p", str(args.procesos)], cwd=_RAIZ, stderr=subprocess.DEVNULL)
+        try:
+            while not os.path.exists(ruta_socket):
+                time.sleep(0.01)
+            secuencial = []
+            _cliente(ruta_socket, programas, esperados, secuencial, problemas)
+
+            concurrentes = []
+            hilos = [threading.Thread(target=_cliente, args=(ruta_socket, programas[i::args.clientes],
+                                                             esperados[i::args.clientes], concurrentes, problemas))
+                     for i in range(args.clientes)]
+            t0 = time.perf_counter()
+            for hilo in hilos:
+                hilo.start()
+            for hilo in hilos:
+                hilo.join()
+            t_concurrente = time.perf_counter() - t0
+            servidor.consultar(ruta_socket, {"comando": "cerrar"})
+            proceso.wait(timeout=10)
+        finally:
+            if proceso.poll() is None:
+                proceso.kill()
+
+    def ms(segundos):
+        return f"{segundos * 1000:.2f} ms"
+
+    secuencial.sort()
+    concurrentes.sort()
+    procesos = args.procesos if args.procesos > 0 else (os.cpu_count() or 1)
+    print(f"Programas de {args.sentencias} sentencias ({len(programas[0])} caracteres), "
+          f"servidor con {procesos} procesos de compilación ({os.cpu_count()} núcleos)")
+    print(f"  proceso nuevo por compilación: {ms(t_frio)}")
+    print(f"  servidor (1 cliente):          mediana {ms(statistics.median(secuencial))}, "
+          f"p95 {ms(secuencial[int(len(secuencial) * 0.95)])}")
+    print(f"  servidor ({args.clientes} clientes):         mediana {ms(statistics.median(concurrentes))}, "
+          f"p95 {ms(concurrentes[int(len(concurrentes) * 0.95)])}, "
+          f"{len(programas) / t_concurrente:.0f} solicitudes/s")
+    for problema in problemas:
+        print("ERROR:", problema)
+    return 1 if problemas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+# benchmarks/sesion.py
+"""
+Simula el recorrido de los botones de main.py (análisis sintáctico, código intermedio,
+optimización, código de máquina, compilar) sobre un programa grande y compara:
+
+- sin sesión: cada botón vuelve a analizar el código y a generar las fases que necesita,
+  como hacía main.py;
+- con sesion.SesionCompilacion: cada fase se calcula una sola vez.
+
+Además comprueba que los resultados de la sesión coincidan con llamar a cada fase
+directamente, que cada fase se calcule solo cuando cambia su entrada (un cambio de
+espacios no repite la semántica ni el TAC; cambiar un número sí) y que, con errores
+léxicos o de sintaxis, el AST y los errores de la sesión sean los de PLY.
+
+Uso:
+    python -m benchmarks.sesion [--repeticiones 200]
+Retorna 1 si algo no coincide.
+"""
+import argparse
+import contextlib
+import io
+import sys
+import time
+
+import generador_codigo as gc
+import generador_nasm
+import optimizador
+import semantico
+from benchmarks.parser import _BLOQUE
+from compilador import parsear
+from contexto import registrar_diagnosticos
+from sesion import SesionCompilacion
+
+# Programas con errores: PLY se recupera de algunos (da un AST), el parser descendente no
+CON_ERRORES = [
+    "int a = ;\nint b = 2;\nprint(b);\n",
+    "int a = 1;\nint b = 2 +;\nint c = 3;\nc = ;\n",
+    "int a = 1 $ 2;\nprint(a);\n",
+    "int a = 1;\nif (a < 2) {\nprint(a);\n",
+    "print(;\n",
+]
+
+
+def botones_sin_sesion(codigo):
+    """Lo que hacían los botones de main.py: cada uno parte del código fuente."""
+    semantico.analizar_semantica(parsear(codigo), {})
+    tac = gc._generar_TAC_desde_AST(parsear(codigo))
+    gc._convertir_TAC_a_SSA(tac)
+    optimizador.optimizar_tac(gc._generar_TAC_desde_AST(parsear(codigo)))
+    for _ in range(2):  # generar código de máquina y compilar
+        opt = optimizador.optimizar_tac(gc._generar_TAC_desde_AST(parsear(codigo)))
+        generador_nasm.generar_codigo_maquina(opt, ruta_asm=None)
+
+
+def botones_con_sesion(sesion, codigo):
+    for fase in ("semantica", "ssa", "tac_opt", "asm", "asm"):
+        sesion.actualizar(codigo)
+        sesion.ast()
+        getattr(sesion, fase)()
+
+
+def comprobar(codigo):
+    """Retorna la lista de problemas encontrados (vacía si todo coincide)."""
+    problemas = []
+    sesion = SesionCompilacion()
+    botones_con_sesion(sesion, codigo)
+    ast = parsear(codigo)
+    tac = gc._generar_TAC_desde_AST(ast)
+    tac_opt = optimizador.optimizar_tac(tac)
+    if repr(sesion.ast()) != repr(ast) or sesion.semantica()[1] != semantico.analizar_semantica(ast, {}):
+        problemas.append("el AST o los errores semánticos difieren del análisis directo")
+    if (sesion.tac(), sesion.ssa(), sesion.tac_opt()) != (tac, gc._convertir_TAC_a_SSA(tac), tac_opt):
+        problemas.append("el TAC, el SSA o el TAC optimizado difieren de la generación directa")
+    if sesion.asm() != generador_nasm.generar_codigo_maquina(tac_opt, ruta_asm=None):
+        problemas.append("el ASM difiere de la generación directa")
+
+    def recalculadas(nuevo_codigo):
+        antes = dict(sesion.calculos)
+        botones_con_sesion(sesion, nuevo_codigo)
+        return {fase for fase, n in sesion.calculos.items() if n != antes[fase]}
+
+    if any(n != 1 for fase, n in sesion.calculos.items() if fase != "tokens"):
+        problemas.append(f"alguna fase se calculó más de una vez: {sesion.calculos}")
+    cambio = recalculadas("\n\n" + codigo.replace(";", " ;"))
+    if cambio != {"ast"}:
+        problemas.append(f"un cambio de espacios recalculó {sorted(cambio)}")
+    cambio = recalculadas(codigo.replace("contador = 0;", "contador = 7;", 1))
+    if cambio != {"ast", "semantica", "tac", "ssa", "tac_opt", "asm"}:
+        problemas.append(f"cambiar un número recalculó {sorted(cambio)}")
+
+    for con_errores in CON_ERRORES:
+        mensajes = []
+        with registrar_diagnosticos(mensajes):
+            ast = parsear(con_errores)
+        sesion.actualizar(con_errores)
+        if repr(sesion.ast()) != repr(ast) or sesion.errores_sintacticos != mensajes:
+            problemas.append(f"con errores, el AST o los errores difieren de PLY: {con_errores!r}")
+    return problemas
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Recorrido de los botones con y sin sesión")
+    arg_parser.add_argument("--repeticiones", type=int, default=200,
+                            help="veces que se repite el bloque de código del programa")
+    args = arg_parser.parse_args(argv)
+    codigo = _BLOQUE * args.repeticiones
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        problemas = comprobar(_BLOQUE * 3)
+        t0 = time.perf_counter()
+        botones_sin_sesion(codigo)
+        t1 = time.perf_counter()
+        botones_con_sesion(SesionCompilacion(), codigo)
+        t2 = time.perf_counter()
+    for problema in problemas:
+        print("ERROR:", problema)
+    print(f"Programa de {len(codigo)} caracteres, recorrido de 5 botones:")
+    print(f"  sin sesión: {t1 - t0:.3f} s")
+    print(f"  con sesión: {t2 - t1:.3f} s ({(t1 - t0) / (t2 - t1):.1f}x)")
+    return 1 if problemas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
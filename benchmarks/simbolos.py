@@ -0,0 +1,112 @@
+# benchmarks/simbolos.py
+"""
+Comprueba la tabla de símbolos con ámbitos (simbolos.py) usada por el análisis semántico:
+
+1. ocultamiento: en un programa donde 'x' se declara en bloques anidados y hermanos con
+   tipos distintos, cada declaración tiene su propia entrada (con id único) en la tabla de
+   símbolos, cada asignación actualiza la declaración visible y no hay errores;
+2. profundidad: el tiempo del análisis semántico de un programa con --usos asignaciones a
+   una variable global dentro de bloques anidados a distintas profundidades. Con la pila de
+   ámbitos anterior cada búsqueda recorría todos los ámbitos abiertos; ahora el tiempo por
+   uso no debe crecer con la profundidad.
+
+Uso:
+    python -m benchmarks.simbolos [--usos 20000] [--profundidades 1 50 200] [--repeticiones 5]
+Retorna 1 si alguna comprobación falla o si el tiempo por uso en la profundidad mayor supera
+1.5 veces el de la menor.
+"""
+import argparse
+import gc
+import sys
+import time
+
+import compilador
+import semantico
+from contexto import ContextoCompilacion
+
+_OCULTAMIENTO = """
+int x = 1;
+{
+    string x = "a";
+    {
+        float x = 2.5;
+        x = 3.5;
+    }
+    x = "b";
+}
+{
+    bool x = true;
+}
+x = 5;
+"""
+
+# nombre en la tabla -> (tipo, valor constante esperado)
+_ESPERADO = {"x": ("INT", 5), "x#2": ("STRING", None), "x#3": ("FLOAT", 3.5), "x#4": ("BOOL", None)}
+
+
+def programa_profundo(usos, profundidad):
+    """'usos' asignaciones a la variable global 'a' dentro de 'profundidad' bloques anidados."""
+    lineas = ["int a = 0;", "int b = 1;"]
+    lineas.extend("{" for _ in range(profundidad))
+    lineas.extend("a = a + b;" for _ in range(usos))
+    lineas.extend("}" for _ in range(profundidad))
+    return "\n".join(lineas)
+
+
+def _ocultamiento(problemas):
+    ctx = ContextoCompilacion()
+    semantico.analizar_semantica(compilador.parsear(_OCULTAMIENTO), ctx=ctx)
+    tabla = ctx.tabla_simbolos
+    obtenido = {nombre: (datos["tipo"], datos.get("valor")) for nombre, datos in tabla.items()}
+    if ctx.errores or obtenido != _ESPERADO:
+        problemas.append(f"ocultamiento: se esperaba {_ESPERADO}, se obtuvo {obtenido} (errores {ctx.errores})")
+    ids = [datos["id"] for datos in tabla.values()]
+    if ids != [simbolo.id for simbolo in ctx.simbolos] or len(set(ids)) != len(ids):
+        problemas.append(f"ocultamiento: ids repetidos o fuera de orden {ids}")
+    return ", ".join(f"{nombre}: {tipo}" for nombre, (tipo, _) in obtenido.items())
+
+
+def medir_semantico(codigo, repeticiones):
+    """Mejor tiempo (segundos) del análisis semántico de 'codigo'."""
+    ast = compilador.parsear(codigo)
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        gc.collect()
+        gc.disable()
+        try:
+            t0 = time.perf_counter()
+            errores = semantico.analizar_semantica(ast, ctx=ContextoCompilacion())
+            mejor = min(mejor, time.perf_counter() - t0)
+        finally:
+            gc.enable()
+        if errores:
+            raise ValueError(f"el programa generado tiene errores: {errores[:3]}")
+    return mejor
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Tabla de símbolos con ámbitos")
+    arg_parser.add_argument("--usos", type=int, default=20000)
+    arg_parser.add_argument("--profundidades", type=int, nargs="+", default=[1, 50, 200])
+    arg_parser.add_argument("--repeticiones", type=int, default=5)
+    args = arg_parser.parse_args(argv)
+
+    problemas = []
+    print("ocultamiento:", _ocultamiento(problemas))
+
+    print(f"Análisis semántico de {args.usos} usos de una variable global:")
+    por_uso = []
+    for profundidad in args.profundidades:
+        segundos = medir_semantico(programa_profundo(args.usos, profundidad), args.repeticiones)
+        por_uso.append(segundos / args.usos)
+        print(f"  profundidad {profundidad:>5}: {segundos * 1000:8.2f} ms ({por_uso[-1] * 1e6:.2f} µs por uso)")
+    if por_uso[-1] > 1.5 * por_uso[0]:
+        problemas.append(f"el tiempo por uso crece con la profundidad ({por_uso[-1] / por_uso[0]:.1f}x)")
+
+    for problema in problemas:
+        print("ERROR:", problema)
+    return 1 if problemas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+# benchmarks/vigilancia.py
+"""
+Mide la latencia de edición a artefacto del modo vigilancia (vigilancia.py) sobre un árbol
+grande de fuentes:
+
+1. escaneo: tiempo de un sondeo completo del árbol (lo que cuesta cada 'intervalo');
+2. edición: desde que se guarda un fuente con código nuevo (sin entrada en la caché) hasta
+   que su .asm está reescrito; mediana y máximo de varias ediciones;
+3. ráfaga: varios guardados seguidos del mismo archivo deben compilarse una sola vez.
+
+Uso:
+    python -m benchmarks.vigilancia [--archivos 2000] [--carpetas 20] [--sentencias 50]
+                                    [--ediciones 10] [--intervalo 0.1] [--espera 0.05]
+Retorna 1 si alguna latencia supera un segundo o la ráfaga no se agrupa.
+"""
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+import cache_artefactos
+import compilador
+import vigilancia
+from benchmarks.generador import generar_programa
+
+
+def _crear_arbol(carpeta, archivos, carpetas, sentencias):
+    """Crea 'archivos' fuentes repartidos en 'carpetas' subcarpetas y retorna sus rutas."""
+    rutas = []
+    for i in range(archivos):
+        subcarpeta = os.path.join(carpeta, f"modulo{i % carpetas}")
+        os.makedirs(subcarpeta, exist_ok=True)
+        ruta = os.path.join(subcarpeta, f"programa{i}.txt")
+        with open(ruta, "w", encoding="utf-8") as f:
+            f.write(generar_programa("mixto", sentencias, semilla=i))
+        rutas.append(ruta)
+    return rutas
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Latencia de edición a artefacto del modo vigilancia")
+    arg_parser.add_argument("--archivos", type=int, default=2000)
+    arg_parser.add_argument("--carpetas", type=int, default=20)
+    arg_parser.add_argument("--sentencias", type=int, default=50)
+    arg_parser.add_argument("--ediciones", type=int, default=10)
+    arg_parser.add_argument("--intervalo", type=float, default=0.1)
+    arg_parser.add_argument("--espera", type=float, default=0.05)
+    args = arg_parser.parse_args(argv)
+
+    problemas = []
+    with tempfile.TemporaryDirectory() as carpeta:
+        fuentes = os.path.join(carpeta, "fuentes")
+        rutas = _crear_arbol(fuentes, args.archivos, args.carpetas, args.sentencias)
+        cache = cache_artefactos.abrir(os.path.join(carpeta, "cache"))
+
+        escaneos = []
+        for _ in range(5):
+            t0 = time.perf_counter()
+            vigilancia.Vigilante(fuentes).escanear()
+            escaneos.append(time.perf_counter() - t0)
+
+        compilados = {}  # ruta -> (cantidad de compilaciones, instante de la última)
+        hecho = threading.Condition()
+
+        def al_compilar(ruta, errores, segundos):
+            if errores:
+                problemas.append(f"{ruta}: {errores[:1]}")
+            with hecho:
+                cantidad, _ = compilados.get(ruta, (0, 0.0))
+                compilados[ruta] = (cantidad + 1, time.perf_counter())
+                hecho.notify_all()
+
+        def esperar(ruta, cantidad, limite=10.0):
+            with hecho:
+                if not hecho.wait_for(lambda: compilados.get(ruta, (0, 0.0))[0] >= cantidad, limite):
+                    problemas.append(f"{ruta} no se recompiló en {limite:.0f} s")
+                return compilados.get(ruta, (0, 0.0))[1]
+
+        detener = threading.Event()
+        hilo = threading.Thread(target=vigilancia.vigilar, args=(fuentes,),
+                                kwargs=dict(intervalo=args.intervalo, espera=args.espera, cache=cache,
+                                            al_compilar=al_compilar, detener=detener))
+        t0 = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            hilo.start()
+            with hecho:
+                hecho.wait_for(lambda: len(compilados) == len(rutas), 600)
+            t_inicial = time.perf_counter() - t0
+
+            latencias = []
+            for i in range(args.ediciones):
+                ruta = rutas[(i * 7919) % len(rutas)]
+                anteriores = compilados[ruta][0]
+                time.sleep(args.intervalo)  # que la edición no caiga en el mismo sondeo que la anterior
+                t0 = time.perf_counter()
+                with open(ruta, "w", encoding="utf-8") as f:
+                    f.write(generar_programa("mixto", args.sentencias, semilla=args.archivos + i))
+                latencias.append(esperar(ruta, anteriores + 1) - t0)
+                asm = compilador.rutas_salida(ruta)["asm"]
+                if os.path.getmtime(asm) < os.path.getmtime(ruta):
+                    problemas.append(f"{asm} no se reescribió")
+
+            # Ráfaga: varios guardados más rápidos que 'espera' se compilan una vez
+            ruta = rutas[0]
+            anteriores = compilados[ruta][0]
+            time.sleep(args.intervalo)
+            for i in range(5):
+                with open(ruta, "w", encoding="utf-8") as f:
+                    f.write(generar_programa("mixto", args.sentencias, semilla=10 * args.archivos + i))
+                time.sleep(args.intervalo / 2)
+            esperar(ruta, anteriores + 1)
+            time.sleep(args.espera + 3 * args.intervalo)
+            rafaga = compilados[ruta][0] - anteriores
+
+            detener.set()
+            hilo.join()
+
+    def ms(segundos):
+        return f"{segundos * 1000:.1f} ms"
+
+    print(f"Árbol de {args.archivos} fuentes en {args.carpetas} carpetas ({args.sentencias} sentencias cada uno)")
+    print(f"  escaneo completo:      {ms(min(escaneos))}")
+    print(f"  compilación inicial:   {t_inicial:.2f} s")
+    print(f"  edición -> .asm:       mediana {ms(statistics.median(latencias))}, máximo {ms(max(latencias))} "
+          f"(intervalo {ms(args.intervalo)}, espera {ms(args.espera)})")
+    print(f"  ráfaga de 5 guardados: {rafaga} compilación(es)")
+    if max(latencias) >= 1.0:
+        problemas.append(f"latencia máxima de {ms(max(latencias))}")
+    if rafaga != 1:
+        problemas.append(f"la ráfaga se compiló {rafaga} veces")
+    for problema in problemas:
+        print("ERROR:", problema)
+    return 1 if problemas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
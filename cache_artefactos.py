@@ -0,0 +1,175 @@
+# cache_artefactos.py
+"""
+Caché en disco de los artefactos de compilación, direccionada por contenido.
+
+La clave de cada entrada es un hash de: el código fuente, la versión del compilador (hash
+del código de los módulos del pipeline, así que cualquier cambio en el compilador invalida
+la caché) y las opciones de compilación. Cada entrada guarda lo que produce
+compilador.compilar_codigo: AST serializado, tabla de símbolos, errores, TAC
+(_generar_TAC_desde_AST), TAC optimizado (optimizar_tac) y líneas ASM (generar_codigo_maquina).
+
+- Carpeta: variable de entorno COMPILADOR_CACHE o, por defecto, 'cache_artefactos/' junto a
+  este archivo. Las entradas se reparten en subcarpetas por los dos primeros caracteres de
+  la clave.
+- Escrituras atómicas (archivo temporal único + os.replace, como cache_tablas): varios
+  procesos pueden compilar a la vez con la misma caché y nunca leen una entrada a medias.
+- Desalojo LRU acotado por tamaño (COMPILADOR_CACHE_MB, 256 MB por defecto): cada lectura
+  actualiza la fecha de modificación de la entrada y, al superar el tamaño, se borran las
+  entradas usadas hace más tiempo.
+"""
+import hashlib
+import importlib.util
+import os
+import pickle
+import tempfile
+
+DIR_CACHE = os.environ.get("COMPILADOR_CACHE") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "cache_artefactos")
+TAMANO_MAXIMO = int(os.environ.get("COMPILADOR_CACHE_MB", "256")) * 1024 * 1024
+
+# Módulos cuyo código determina los artefactos (incluidos los motores alternativos y los nombres
+# de temporales y etiquetas de contexto.py)
+_MODULOS_PIPELINE = ("lexico", "lexico_regex", "sintactico", "sintactico_descendente", "ast_nodos", "ast_plano",
+                     "contexto", "simbolos", "recorrido", "semantico", "generador_codigo", "optimizador",
+                     "generador_nasm", "compilador", "cache_artefactos")
+
+_EXTENSION = ".pickle"
+_version = None
+
+
+def version_compilador():
+    """
+    Hash del código fuente de los módulos del pipeline (se calcula una vez por proceso). Los
+    archivos se buscan sin importarlos: los motores alternativos se cargan solo si se usan.
+    """
+    global _version
+    if _version is None:
+        h = hashlib.sha256()
+        for nombre in _MODULOS_PIPELINE:
+            with open(importlib.util.find_spec(nombre).origin, "rb") as f:
+                h.update(f.read())
+        _version = h.hexdigest()[:16]
+    return _version
+
+
+def clave(codigo, opciones=None):
+    """Clave de la entrada para 'codigo' compilado con el diccionario 'opciones'."""
+    h = hashlib.sha256(codigo.encode("utf-8"))
+    h.update(repr((version_compilador(), sorted((opciones or {}).items()))).encode("utf-8"))
+    return h.hexdigest()
+
+
+def serializar_ast(ast):
+    """AST serializado (bytes), o None si no se puede (por ejemplo, anidamiento demasiado profundo)."""
+    try:
+        return pickle.dumps(ast, protocol=pickle.HIGHEST_PROTOCOL)
+    except (RecursionError, pickle.PicklingError):
+        return None
+
+
+def cargar_ast(entrada):
+    """AST de una entrada de la caché (None si no se guardó)."""
+    datos = entrada.get("ast")
+    return pickle.loads(datos) if datos is not None else None
+
+
+class CacheArtefactos:
+    """Caché de artefactos en 'carpeta', con un tamaño máximo en bytes."""
+
+    def __init__(self, carpeta=DIR_CACHE, tamano_maximo=TAMANO_MAXIMO):
+        self.carpeta = carpeta
+        self.tamano_maximo = tamano_maximo
+        self._tamano = None  # tamaño total estimado (se calcula al primer guardado)
+
+    def _ruta(self, clave_entrada):
+        return os.path.join(self.carpeta, clave_entrada[:2], clave_entrada + _EXTENSION)
+
+    def obtener(self, clave_entrada):
+        """
+        Entrada guardada para la clave (diccionario con "ast" serializado, "tabla_simbolos",
+        "errores", "tac", "tac_opt" y "asm"), o None si no está o no se puede leer.
+        """
+        ruta = self._ruta(clave_entrada)
+        try:
+            with open(ruta, "rb") as f:
+                entrada = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+            return None
+        try:
+            os.utime(ruta)  # marca de uso reciente para el desalojo LRU
+        except OSError:
+            pass
+        return entrada
+
+    def guardar(self, clave_entrada, entrada):
+        """Guarda 'entrada' de forma atómica. Si la carpeta no admite escritura, no hace nada."""
+        ruta = self._ruta(clave_entrada)
+        datos = pickle.dumps(entrada, protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            os.makedirs(os.path.dirname(ruta), exist_ok=True)
+            fd, ruta_tmp = tempfile.mkstemp(dir=os.path.dirname(ruta), suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(datos)
+            os.replace(ruta_tmp, ruta)
+        except OSError:
+            if os.path.exists(ruta_tmp):
+                os.remove(ruta_tmp)
+            return
+        if self._tamano is None:
+            self._tamano = self.tamano()
+        else:
+            self._tamano += len(datos)
+        if self._tamano > self.tamano_maximo:
+            self.desalojar()
+
+    def _entradas(self):
+        """Lista de (última_uso, bytes, ruta) de todas las entradas."""
+        entradas = []
+        try:
+            subcarpetas = list(os.scandir(self.carpeta))
+        except OSError:
+            return entradas
+        for sub in subcarpetas:
+            if not sub.is_dir():
+                continue
+            for archivo in os.scandir(sub.path):
+                if archivo.name.endswith(_EXTENSION):
+                    try:
+                        info = archivo.stat()
+                    except OSError:
+                        continue  # borrada por otro proceso
+                    entradas.append((info.st_mtime, info.st_size, archivo.path))
+        return entradas
+
+    def tamano(self):
+        """Bytes ocupados por todas las entradas."""
+        return sum(tamano for _, tamano, _ in self._entradas())
+
+    def desalojar(self):
+        """Borra las entradas usadas hace más tiempo hasta quedar en el 90% del tamaño máximo."""
+        entradas = sorted(self._entradas())
+        total = sum(tamano for _, tamano, _ in entradas)
+        limite = self.tamano_maximo * 0.9
+        for _, tamano, ruta in entradas:
+            if total <= limite:
+                break
+            try:
+                os.remove(ruta)
+            except OSError:
+                continue  # ya la borró otro proceso
+            total -= tamano
+        self._tamano = total
+
+
+_abiertas = {}
+
+
+def abrir(carpeta=None):
+    """CacheArtefactos de 'carpeta' (DIR_CACHE por defecto), una sola instancia por proceso."""
+    carpeta = carpeta or DIR_CACHE
+    if carpeta not in _abiertas:
+        _abiertas[carpeta] = CacheArtefactos(carpeta)
+    return _abiertas[carpeta]
@@ -0,0 +1,59 @@
+# cache_tablas.py
+"""
+Caché versionada de las tablas de PLY (lexer y parser LALR).
+
+Las tablas se guardan en una carpeta conocida (variable de entorno COMPILADOR_TABLAS o,
+por defecto, 'tablas_ply/' junto a este archivo) con un nombre que incluye un hash de la
+gramática. Solo se regeneran cuando la gramática cambia; las escrituras son atómicas
+(archivo temporal + os.replace) para que varios procesos puedan arrancar a la vez, y las
+tablas de versiones anteriores de la gramática se eliminan al escribir una nueva.
+"""
+import hashlib
+import os
+
+DIR_TABLAS = os.environ.get("COMPILADOR_TABLAS") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "tablas_ply")
+
+
+def firma(*partes):
+    """Hash corto (hex) de las partes que definen una gramática."""
+    return hashlib.sha256(repr(partes).encode("utf-8")).hexdigest()[:16]
+
+
+def ruta_tabla(prefijo, firma_gramatica, extension):
+    """Ruta del archivo de tablas '<prefijo>_<firma><extension>' dentro de DIR_TABLAS."""
+    return os.path.join(DIR_TABLAS, f"{prefijo}_{firma_gramatica}{extension}")
+
+
+def ruta_temporal(ruta):
+    """Ruta temporal única (por proceso) para escribir 'ruta' antes de publicarla."""
+    return f"{ruta}.{os.getpid()}.tmp"
+
+
+def publicar(ruta_tmp, ruta, prefijo):
+    """
+    Mueve atómicamente 'ruta_tmp' a 'ruta' y borra las tablas obsoletas con el mismo prefijo.
+    Si la carpeta no admite escritura, simplemente no se guarda la caché.
+    """
+    try:
+        os.replace(ruta_tmp, ruta)
+    except OSError:
+        if os.path.exists(ruta_tmp):
+            os.remove(ruta_tmp)
+        return
+    nombre = os.path.basename(ruta)
+    for otro in os.listdir(DIR_TABLAS):
+        if otro.startswith(prefijo + "_") and otro != nombre and not otro.endswith(".tmp"):
+            try:
+                os.remove(os.path.join(DIR_TABLAS, otro))
+            except OSError:
+                pass
+
+
+def preparar_directorio():
+    """Crea DIR_TABLAS si no existe. Retorna False si no se puede escribir en él."""
+    try:
+        os.makedirs(DIR_TABLAS, exist_ok=True)
+    except OSError:
+        return False
+    return os.access(DIR_TABLAS, os.W_OK)
@@ -0,0 +1,439 @@
+# compilador.py
+"""
+Compilador en línea de comandos (sin interfaz gráfica).
+
+Ejecuta el mismo pipeline que main.py (léxico -> sintáctico -> semántico -> TAC ->
+optimizador -> NASM) sobre uno o varios archivos fuente y escribe los artefactos.
+Solo importa los módulos que necesita la compilación: nunca carga tkinter, PIL ni graphviz.
+
+Uso:
+    python compilador.py programa.txt [otro.txt ...] [-o carpeta_salida] [-j N] [--lexer M] [--parser M] [--ast-plano]
+                         [--cache CARPETA | --sin-cache | --flujo] [--tiempos] [--perfil [tabla|json]] [--traza ARCHIVO]
+
+Con -j/--trabajadores N > 1 los archivos se reparten entre N procesos
+(concurrent.futures.ProcessPoolExecutor), cada uno con su propio lexer/parser ya cargado.
+Los artefactos se guardan en la caché de cache_artefactos.py: recompilar un archivo que no
+cambió (con el mismo compilador y opciones) solo lee la caché y escribe los artefactos.
+Con --perfil se compila sin caché midiendo tiempo, memoria pico y cantidades de cada fase
+(ver perfil.py) y al final se muestra el informe como tabla o JSON. Con --traza se escribe la
+línea de tiempo de archivos, fases y pasadas del optimizador en formato Chrome/Perfetto (traza.py).
+Con --flujo el TAC, el TAC optimizado y el ensamblador se generan y escriben sentencia por
+sentencia (sin caché), sin tener en memoria las listas completas de instrucciones.
+"""
+import time
+
+# Marca de tiempo tomada antes de importar el pipeline, para medir el arranque en frío
+_T_INICIO = time.perf_counter()
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import semantico
+import cache_artefactos
+import lexico
+import sintactico
+import generador_codigo as gc
+import optimizador
+import generador_nasm
+from contexto import ContextoCompilacion, informar, registrar_diagnosticos
+from ast_plano import ArbolPlano
+from perfil import Perfil, contar_nodos
+from traza import Traza, tramo
+
+# Tiempo (en segundos) que tardó la importación del pipeline
+TIEMPO_ARRANQUE = time.perf_counter() - _T_INICIO
+
+# Tamaño del búfer de escritura de los artefactos en el modo en flujo
+TAMANO_BUFFER = 1 << 16
+
+
+def parsear(codigo, motor_lexer=None, motor_parser=None):
+    """
+    Analiza 'codigo' con un lexer y un parser propios de esta llamada.
+    Comparten las tablas (solo lectura) con lexico.lexer/sintactico.parser pero no su
+    estado de análisis, así que varias llamadas pueden ejecutarse a la vez en distintos hilos.
+    'motor_lexer' elige el motor léxico ('ply' o 'regex'; por defecto lexico.MOTOR_LEXER) y
+    'motor_parser' el sintáctico ('ply' o 'descendente'; por defecto sintactico.MOTOR_PARSER).
+    """
+    return sintactico.nuevo_parser(motor_parser).parse(codigo, lexer=lexico.nuevo_lexer(motor_lexer))
+
+
+def parsear_plano(codigo, motor_lexer=None, motor_parser=None):
+    """
+    Como parsear(), pero construye el AST en arreglos (ast_plano.ArbolPlano) en lugar de
+    objetos. Retorna el ArbolPlano (su atributo 'raiz' es None si hubo error de sintaxis).
+    """
+    arbol = ArbolPlano()
+    parser_plano = sintactico.nuevo_parser(motor_parser)
+    parser_plano.fabrica = arbol
+    arbol.raiz = parser_plano.parse(codigo, lexer=lexico.nuevo_lexer(motor_lexer))
+    return arbol
+
+
+def compilar_codigo(codigo, ctx=None, ast_plano=False, cache=None, perfil=None):
+    """
+    Ejecuta el pipeline completo sobre el texto 'codigo' usando el ContextoCompilacion 'ctx'
+    (uno nuevo si no se indica). Con 'ast_plano' el AST se guarda en arreglos y las fases
+    siguientes lo recorren con ast_plano.Cursor. Con 'cache' (cache_artefactos.CacheArtefactos)
+    el resultado se toma de la caché si ya estaba y se guarda en ella si no.
+    Con 'perfil' (perfil.Perfil) se registra cada fase; la caché no se usa y, además, se
+    genera el SSA (clave "ssa" del resultado) para medirlo.
+    Retorna un diccionario con el AST, la tabla de símbolos, los errores semánticos, los
+    diagnósticos impresos ("mensajes", ver contexto.informar) y las listas de instrucciones
+    TAC, TAC optimizado y ASM (vacías si hubo errores).
+    """
+    if ctx is None:
+        ctx = ContextoCompilacion()
+    if perfil is not None:
+        return _compilar_perfilado(codigo, ctx, ast_plano, perfil)
+    if cache is not None:
+        entrada = entrada_cache(codigo, ast_plano, cache, ctx.traza)
+        ctx.tabla_simbolos.update(entrada["tabla_simbolos"])
+        ctx.errores.extend(entrada["errores"])
+        ctx.mensajes.extend(entrada["mensajes"])
+        ctx.tac = entrada["tac"]
+        ctx.tac_opt = entrada["tac_opt"]
+        return dict(entrada, ast=cache_artefactos.cargar_ast(entrada),
+                    tabla_simbolos=ctx.tabla_simbolos, errores=ctx.errores, mensajes=ctx.mensajes)
+    resultado = {"ast": None, "tabla_simbolos": ctx.tabla_simbolos, "errores": ctx.errores,
+                 "mensajes": ctx.mensajes, "tac": [], "tac_opt": [], "asm": []}
+    ast, correcto = _analizar(codigo, ctx, ast_plano)
+    resultado["ast"] = ast
+    if not correcto:
+        return resultado
+    with tramo(ctx, "tac"):
+        resultado["tac"] = gc._generar_TAC_desde_AST(ast, ctx)
+    with tramo(ctx, "optimizador"):
+        resultado["tac_opt"] = optimizador.optimizar_tac(resultado["tac"], ctx)
+    with tramo(ctx, "nasm"):
+        resultado["asm"] = generador_nasm.generar_codigo_maquina(resultado["tac_opt"], ruta_asm=None)
+    return resultado
+
+
+def _analizar(codigo, ctx, ast_plano):
+    """
+    Análisis léxico, sintáctico y semántico de 'codigo'. Retorna (ast, correcto); los
+    errores quedan en ctx.errores, los diagnósticos impresos en ctx.mensajes y 'ast' es
+    None si hubo error de sintaxis.
+    """
+    with registrar_diagnosticos(ctx.mensajes):
+        # El lexer avanza a pedido del parser: en la traza ambos forman un solo tramo
+        with tramo(ctx, "lexico+sintactico"):
+            ast = parsear_plano(codigo).cursor() if ast_plano else parsear(codigo)
+        if ast is None:
+            ctx.errores.append("Error en análisis sintáctico")
+            return None, False
+        with tramo(ctx, "semantico"):
+            if semantico.analizar_semantica(ast, ctx=ctx):
+                return ast, False
+        return ast, True
+
+
+def _compilar_perfilado(codigo, ctx, ast_plano, perfil):
+    """compilar_codigo() midiendo cada fase en 'perfil'; el lexer corre completo antes del parser."""
+    perfil.compilaciones += 1
+    resultado = {"ast": None, "tabla_simbolos": ctx.tabla_simbolos, "errores": ctx.errores,
+                 "mensajes": ctx.mensajes, "tac": [], "ssa": [], "tac_opt": [], "asm": []}
+    with registrar_diagnosticos(ctx.mensajes):
+        lx = lexico.nuevo_lexer()
+        lx.input(codigo)
+        tokens = _medir(ctx, perfil, "lexico", list, lx)
+        ast = _medir(ctx, perfil, "sintactico", _parsear_tokens, tokens, ast_plano, contar=contar_nodos)
+        resultado["ast"] = ast
+        if ast is None:
+            ctx.errores.append("Error en análisis sintáctico")
+            return resultado
+        if _medir(ctx, perfil, "semantico", semantico.analizar_semantica, ast, None, ctx,
+                  contar=lambda _: len(ctx.tabla_simbolos)):
+            return resultado
+        resultado["tac"] = _medir(ctx, perfil, "tac", gc._generar_TAC_desde_AST, ast, ctx)
+        resultado["ssa"] = _medir(ctx, perfil, "ssa", gc._convertir_TAC_a_SSA, resultado["tac"])
+        resultado["tac_opt"] = _medir(ctx, perfil, "optimizador", optimizador.optimizar_tac,
+                                      resultado["tac"], ctx)
+        resultado["asm"] = _medir(ctx, perfil, "nasm", generador_nasm.generar_codigo_maquina,
+                                  resultado["tac_opt"], None)
+        return resultado
+
+
+def _medir(ctx, perfil, fase, funcion, *args, contar=len):
+    """perfil.medir() dentro de un tramo de la traza de 'ctx'."""
+    with tramo(ctx, fase):
+        return perfil.medir(fase, funcion, *args, contar=contar)
+
+
+def _parsear_tokens(tokens, ast_plano):
+    """AST (o Cursor del ArbolPlano) de una lista de tokens ya leídos."""
+    parser_tokens = sintactico.nuevo_parser()
+    if not ast_plano:
+        return parser_tokens.parse(lexer=lexico.LexerGrabado(tokens))
+    arbol = ArbolPlano()
+    parser_tokens.fabrica = arbol
+    arbol.raiz = parser_tokens.parse(lexer=lexico.LexerGrabado(tokens))
+    return arbol.cursor()
+
+
+def clave_cache(codigo, ast_plano):
+    """
+    Clave de la caché de artefactos para 'codigo': incluye los motores léxico y sintáctico
+    en uso, porque con un error de sintaxis cada motor da resultados distintos.
+    """
+    return cache_artefactos.clave(codigo, {"ast_plano": ast_plano, "lexer": lexico.MOTOR_LEXER,
+                                           "parser": sintactico.MOTOR_PARSER})
+
+
+def entrada_cache(codigo, ast_plano, cache, traza=None):
+    """
+    Entrada de 'cache' para 'codigo'; si no estaba, compila (registrando las fases en
+    'traza', si se indica) y la guarda. Es el resultado de compilar_codigo con el AST
+    serializado: quien solo necesita los artefactos (compilar_archivo, servidor.py) evita
+    reconstruirlo. Si la entrada ya estaba, vuelve a informar sus diagnósticos ("mensajes",
+    ver contexto.informar), así que la salida es la misma que al compilar.
+    """
+    clave = clave_cache(codigo, ast_plano)
+    entrada = cache.obtener(clave)
+    if entrada is None:
+        resultado = compilar_codigo(codigo, ContextoCompilacion(traza=traza), ast_plano=ast_plano)
+        entrada = dict(resultado, ast=cache_artefactos.serializar_ast(resultado["ast"]))
+        cache.guardar(clave, entrada)
+    else:
+        for mensaje in entrada["mensajes"]:
+            informar(mensaje)
+    return entrada
+
+
+def raiz_comun(rutas):
+    """Carpeta más profunda que contiene a todos los fuentes de 'rutas'."""
+    return os.path.commonpath([os.path.dirname(os.path.abspath(ruta)) for ruta in rutas])
+
+
+def rutas_salida(ruta_fuente, carpeta_salida=None, raiz=None):
+    """
+    Calcula las rutas de los artefactos para 'ruta_fuente':
+    <nombre>_tac.txt, <nombre>_opt.txt y <nombre>.asm junto al fuente o en 'carpeta_salida'.
+    En 'carpeta_salida' se conserva la subcarpeta del fuente relativa a 'raiz' (por defecto,
+    la carpeta del fuente), así que fuentes con el mismo nombre en distintas carpetas no se pisan.
+    """
+    carpeta = os.path.dirname(ruta_fuente)
+    if carpeta_salida:
+        relativa = os.path.relpath(os.path.abspath(carpeta), os.path.abspath(raiz)) if raiz else os.curdir
+        carpeta = os.path.normpath(os.path.join(carpeta_salida, relativa))
+    base = os.path.splitext(os.path.basename(ruta_fuente))[0]
+    return {
+        "tac": os.path.join(carpeta, f"{base}_tac.txt"),
+        "tac_opt": os.path.join(carpeta, f"{base}_opt.txt"),
+        "asm": os.path.join(carpeta, f"{base}.asm"),
+    }
+
+
+def _escribir_lineas(ruta, lineas):
+    """Escribe una instrucción por línea en 'ruta'."""
+    with open(ruta, "w", encoding="utf-8") as f:
+        for linea in lineas:
+            f.write(linea + "\n")
+
+
+def _escribir_tramos(tramos_tac, archivo):
+    """Escribe en 'archivo' cada tramo (lista de instrucciones) de 'tramos_tac' y lo vuelve a entregar."""
+    for tramo_tac in tramos_tac:
+        archivo.writelines(instr + "\n" for instr in tramo_tac)
+        yield tramo_tac
+
+
+def _escribir_instrucciones(instrucciones, archivo):
+    """Escribe en 'archivo' cada instrucción de 'instrucciones' y la vuelve a entregar."""
+    for instr in instrucciones:
+        archivo.write(instr + "\n")
+        yield instr
+
+
+def compilar_en_flujo(codigo, rutas, ctx=None, ast_plano=False):
+    """
+    Compila 'codigo' escribiendo los artefactos en las rutas de 'rutas' (ver rutas_salida)
+    a medida que se generan: el TAC sale de generador_codigo.generar_TAC_en_flujo una
+    sentencia de primer nivel por vez, pasa por optimizador.optimizar_tac_en_flujo y por
+    generador_nasm.escribir_codigo_maquina_en_flujo, y cada etapa escribe su archivo al
+    paso. Los archivos son idénticos a los de compilar_codigo. No escribe nada si hay
+    errores. Retorna la lista de errores.
+    """
+    if ctx is None:
+        ctx = ContextoCompilacion()
+    ast, correcto = _analizar(codigo, ctx, ast_plano)
+    if correcto:
+        _escribir_en_flujo(ast, ctx, rutas)
+    return ctx.errores
+
+
+def _escribir_en_flujo(ast, ctx, rutas):
+    """TAC, optimización y NASM de compilar_en_flujo sobre el 'ast' ya analizado."""
+    # Las tres fases avanzan juntas: en la traza forman un solo tramo
+    with tramo(ctx, "tac+optimizador+nasm"), \
+            open(rutas["tac"], "w", encoding="utf-8", buffering=TAMANO_BUFFER) as f_tac, \
+            open(rutas["tac_opt"], "w", encoding="utf-8", buffering=TAMANO_BUFFER) as f_opt, \
+            open(rutas["asm"], "w", encoding="utf-8", buffering=TAMANO_BUFFER) as f_asm:
+        tramos_tac = _escribir_tramos(gc.generar_TAC_en_flujo(ast, ctx), f_tac)
+        tac_opt = _escribir_instrucciones(optimizador.optimizar_tac_en_flujo(tramos_tac), f_opt)
+        generador_nasm.escribir_codigo_maquina_en_flujo(tac_opt, f_asm)
+
+
+def compilar_archivo(ruta_fuente, carpeta_salida=None, ast_plano=False, cache=None, perfil=None, traza=None,
+                     en_flujo=False, raiz=None):
+    """
+    Compila el archivo 'ruta_fuente' y escribe sus artefactos (en 'carpeta_salida', bajo su
+    subcarpeta relativa a 'raiz', ver rutas_salida). Con 'cache'
+    (cache_artefactos.CacheArtefactos) los artefactos de un fuente ya compilado se leen de
+    la caché, sin reconstruir el AST. Con 'perfil' se miden las fases y no se usa la caché.
+    Con 'en_flujo' (y sin 'perfil') los artefactos se escriben con compilar_en_flujo, sin caché.
+    Con 'traza' (traza.Traza) el archivo se registra como un tramo que contiene los de sus fases.
+    Retorna la lista de errores (vacía si la compilación fue exitosa).
+    """
+    ctx = ContextoCompilacion(traza=traza)
+    with tramo(ctx, os.path.basename(ruta_fuente), "archivo", ruta=ruta_fuente):
+        with open(ruta_fuente, encoding="utf-8") as f:
+            codigo = f.read()
+        rutas = rutas_salida(ruta_fuente, carpeta_salida, raiz)
+        if carpeta_salida:
+            os.makedirs(os.path.dirname(rutas["asm"]), exist_ok=True)
+        if perfil is not None:
+            resultado = compilar_codigo(codigo, ctx, ast_plano=ast_plano, perfil=perfil)
+        elif en_flujo:
+            return compilar_en_flujo(codigo, rutas, ctx, ast_plano)
+        elif cache is not None:
+            resultado = entrada_cache(codigo, ast_plano, cache, traza)
+        else:
+            resultado = compilar_codigo(codigo, ctx, ast_plano=ast_plano)
+        if resultado["errores"]:
+            return resultado["errores"]
+        for clave, ruta in rutas.items():
+            _escribir_lineas(ruta, resultado[clave])
+    return []
+
+
+def _inicializar_trabajador():
+    """
+    Inicializador de cada proceso trabajador: compila un programa mínimo para que el
+    lexer y el parser del proceso queden cargados antes de recibir archivos.
+    """
+    compilar_codigo("int x = 0;")
+
+
+def _compilar_archivo_trabajador(args):
+    """
+    Adaptador para el pool: recibe (ruta_fuente, carpeta_salida, ast_plano, carpeta_cache,
+    memoria_perfil, trazar, en_flujo, raiz) y retorna (ruta, errores, mediciones, eventos). Sin carpeta_cache
+    no se usa la caché; memoria_perfil es None sin perfil, o el argumento 'memoria' del
+    perfil.Perfil del proceso principal, y entonces 'mediciones' es la lista de
+    perfil.Medicion del archivo. Con 'trazar', 'eventos' son los tramos de traza del archivo.
+    """
+    ruta_fuente, carpeta_salida, ast_plano, carpeta_cache, memoria_perfil, trazar, en_flujo, raiz = args
+    cache = cache_artefactos.abrir(carpeta_cache) if carpeta_cache else None
+    perfil = Perfil(memoria_perfil) if memoria_perfil is not None else None
+    traza = Traza() if trazar else None
+    errores = compilar_archivo(ruta_fuente, carpeta_salida, ast_plano, cache, perfil, traza, en_flujo, raiz)
+    return (ruta_fuente, errores, perfil.mediciones if perfil is not None else None,
+            traza.eventos if traza is not None else None)
+
+
+def compilar_lote(rutas, carpeta_salida=None, trabajadores=1, ast_plano=False, carpeta_cache=None,
+                  perfil=None, traza=None, en_flujo=False):
+    """
+    Compila todos los archivos de 'rutas'. Con trabajadores > 1 reparte los archivos
+    entre procesos de un ProcessPoolExecutor. Con 'carpeta_cache' los artefactos se
+    comparten a través de la caché en disco de esa carpeta (ver cache_artefactos.py).
+    Con 'perfil' (perfil.Perfil) se suman en él las mediciones de todos los archivos y con
+    'traza' (traza.Traza) se juntan en ella los tramos de cada archivo, con el pid del
+    proceso que lo compiló. Con 'en_flujo' cada archivo se compila con compilar_en_flujo.
+    En 'carpeta_salida' los artefactos conservan las subcarpetas de los fuentes a partir de
+    su carpeta común (raiz_comun), así que fuentes con el mismo nombre no se pisan.
+    Retorna una lista de tuplas (ruta, errores) en el mismo orden que 'rutas'.
+    """
+    memoria_perfil = perfil.memoria if perfil is not None else None
+    raiz = raiz_comun(rutas) if carpeta_salida and rutas else None
+    tareas = [(ruta, carpeta_salida, ast_plano, carpeta_cache, memoria_perfil, traza is not None, en_flujo, raiz)
+              for ruta in rutas]
+    if trabajadores <= 1 or len(tareas) <= 1:
+        salidas = [_compilar_archivo_trabajador(t) for t in tareas]
+    else:
+        # Agrupar archivos por tarea reduce el costo de comunicación entre procesos
+        chunksize = max(1, len(tareas) // (trabajadores * 4))
+        with ProcessPoolExecutor(max_workers=trabajadores, initializer=_inicializar_trabajador) as pool:
+            salidas = list(pool.map(_compilar_archivo_trabajador, tareas, chunksize=chunksize))
+    if perfil is not None:
+        for _, _, mediciones, _ in salidas:
+            perfil.agregar(mediciones)
+            perfil.compilaciones += 1
+    if traza is not None:
+        for _, _, _, eventos in salidas:
+            traza.agregar(eventos)
+        traza.nombrar_procesos()
+    return [(ruta, errores) for ruta, errores, _, _ in salidas]
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Compilador sin interfaz gráfica")
+    arg_parser.add_argument("fuentes", nargs="+", help="archivos de código fuente a compilar")
+    arg_parser.add_argument("-o", "--salida", default=None,
+                            help="carpeta donde escribir los artefactos (por defecto, junto a cada fuente)")
+    arg_parser.add_argument("-j", "--trabajadores", type=int, default=1,
+                            help="número de procesos para compilar en paralelo (0 = todos los núcleos)")
+    arg_parser.add_argument("--lexer", choices=lexico.MOTORES_LEXER, default=None,
+                            help="motor léxico a usar (por defecto, $COMPILADOR_LEXER o 'ply')")
+    arg_parser.add_argument("--parser", choices=sintactico.MOTORES_PARSER, default=None,
+                            help="motor sintáctico a usar (por defecto, $COMPILADOR_PARSER o 'ply')")
+    arg_parser.add_argument("--ast-plano", action="store_true",
+                            help="guardar el AST en arreglos (menos memoria en programas muy grandes)")
+    arg_parser.add_argument("--cache", default=cache_artefactos.DIR_CACHE, metavar="CARPETA",
+                            help="carpeta de la caché de artefactos (por defecto, $COMPILADOR_CACHE o cache_artefactos/)")
+    arg_parser.add_argument("--sin-cache", action="store_true",
+                            help="compilar todo sin leer ni escribir la caché de artefactos")
+    arg_parser.add_argument("--flujo", action="store_true",
+                            help="generar y escribir el TAC, el TAC optimizado y el ensamblador sentencia por "
+                                 "sentencia, sin caché (menos memoria en programas muy grandes)")
+    arg_parser.add_argument("--tiempos", action="store_true",
+                            help="mostrar el tiempo de arranque y de compilación")
+    arg_parser.add_argument("--traza", default=None, metavar="ARCHIVO",
+                            help="escribir una traza Chrome/Perfetto (JSON) con un tramo por archivo, fase "
+                                 "y pasada del optimizador")
+    arg_parser.add_argument("--perfil", nargs="?", const="tabla", choices=("tabla", "json"), default=None,
+                            help="medir tiempo, memoria y cantidades de cada fase (sin caché) y mostrar "
+                                 "el informe como tabla o JSON")
+    args = arg_parser.parse_args(argv)
+
+    if args.salida:
+        os.makedirs(args.salida, exist_ok=True)
+    if args.lexer:
+        # Los procesos trabajadores heredan la elección a través del entorno
+        os.environ["COMPILADOR_LEXER"] = lexico.MOTOR_LEXER = args.lexer
+    if args.parser:
+        os.environ["COMPILADOR_PARSER"] = sintactico.MOTOR_PARSER = args.parser
+
+    trabajadores = args.trabajadores if args.trabajadores > 0 else (os.cpu_count() or 1)
+
+    t0 = time.perf_counter()
+    fallidos = 0
+    carpeta_cache = None if args.sin_cache or args.flujo else args.cache
+    perfil = Perfil() if args.perfil else None
+    traza = Traza() if args.traza else None
+    for ruta, errores in compilar_lote(args.fuentes, args.salida, trabajadores, args.ast_plano, carpeta_cache,
+                                       perfil, traza, args.flujo):
+        if errores:
+            fallidos += 1
+            for err in errores:
+                print(f"{ruta}: {err}", file=sys.stderr)
+    t_total = time.perf_counter() - t0
+
+    if args.tiempos:
+        print(f"Arranque (importaciones): {TIEMPO_ARRANQUE * 1000:.1f} ms "
+              f"(lexer listo en {lexico.TIEMPO_CARGA * 1000:.1f} ms, "
+              f"parser listo en {sintactico.TIEMPO_CARGA * 1000:.1f} ms)")
+        print(f"Compilación de {len(args.fuentes)} archivo(s): {t_total * 1000:.1f} ms")
+    if traza is not None:
+        traza.escribir(args.traza)
+    if perfil is not None:
+        print(perfil.a_json() if args.perfil == "json" else perfil.tabla())
+    return 1 if fallidos else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+# contexto.py
+"""
+Contexto de una compilación.
+
+Agrupa el estado que antes vivía en variables globales de los módulos del pipeline
+(contadores de temporales y etiquetas, buffer de TAC, tabla de símbolos) para que
+cada compilación sea independiente: dos compilaciones simultáneas (hilos, servidor)
+no comparten nada y el mismo programa produce siempre la misma salida.
+
+Los diagnósticos que imprimen las fases (caracteres ilegales, errores sintácticos y
+semánticos) pasan por informar(): dentro de registrar_diagnosticos(lista) también se
+agregan a 'lista' (por hilo), así que quedan en ContextoCompilacion.mensajes y la caché de
+artefactos puede guardarlos y volver a mostrarlos. Con imprimir=False solo se agregan: la
+interfaz gráfica los muestra ella misma, y así no hace falta redirigir sys.stdout (que es de
+todo el proceso) desde el hilo de trabajo.
+"""
+import contextlib
+import threading
+
+_diagnosticos = threading.local()
+
+
+def informar(mensaje):
+    """Imprime un diagnóstico y lo agrega a la lista de registrar_diagnosticos() activa en este hilo."""
+    lista, imprimir = getattr(_diagnosticos, "registro", (None, True))
+    if imprimir:
+        print(mensaje)
+    if lista is not None:
+        lista.append(mensaje)
+
+
+@contextlib.contextmanager
+def registrar_diagnosticos(lista, imprimir=True):
+    """
+    Dentro del bloque 'with', los diagnósticos de informar() en este hilo se agregan a 'lista'
+    (y, si 'imprimir' es False, no se imprimen).
+    """
+    anterior = getattr(_diagnosticos, "registro", (None, True))
+    _diagnosticos.registro = (lista, imprimir)
+    try:
+        yield lista
+    finally:
+        _diagnosticos.registro = anterior
+
+
+class ContextoCompilacion:
+    """Estado propio de una compilación; se crea uno nuevo por cada programa."""
+
+    def __init__(self, tabla_simbolos=None, traza=None):
+        self.temp_counter = 0
+        self.label_counter = 0
+        # Buffer de instrucciones TAC generadas y resultado optimizado
+        self.tac = []
+        self.tac_opt = []
+        # Tabla de símbolos {nombre: {"id": ..., "tipo": ..., "valor": ...}} y errores semánticos
+        self.tabla_simbolos = tabla_simbolos if tabla_simbolos is not None else {}
+        # Declaraciones (simbolos.Simbolo) del análisis semántico; la de id N es simbolos[N - 1]
+        self.simbolos = []
+        self.errores = []
+        # Diagnósticos impresos por las fases, en orden (ver informar())
+        self.mensajes = []
+        # traza.Traza donde se registran los tramos de cada fase (None = sin traza)
+        self.traza = traza
+
+    def nueva_temporal(self):
+        """Genera un nuevo nombre de variable temporal único dentro de esta compilación."""
+        self.temp_counter += 1
+        return f"t{self.temp_counter}"
+
+    def nueva_etiqueta(self):
+        """Genera una nueva etiqueta (label) única dentro de esta compilación."""
+        self.label_counter += 1
+        return f"L{self.label_counter}"
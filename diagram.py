@@ -1,40 +1,49 @@
 from graphviz import Digraph
 
-def dibujar_arbol_completo(arbol, dot=None, parent=None):
+from ast_nodos import Nodo
 
+def dibujar_arbol_completo(arbol, dot=None, parent=None):
+    """
+    Agrega a 'dot' los nodos y aristas del árbol 'arbol' (colgando de 'parent', si se da).
+    Recorre el árbol en preorden con una pila explícita en lugar de recursión, así que un
+    programa muy anidado no alcanza el límite de recursión de Python.
+    """
     if dot is None:
         dot = Digraph(format='png')
         dot.attr(rankdir="TB")  # Dirección del árbol (de arriba hacia abajo)
 
-    # Generar un identificador único para cada nodo
-    current_node = f"{id(arbol)}_{len(dot.body)}"
+    pendientes = [(arbol, parent)]  # (elemento, nodo padre) por dibujar
+    while pendientes:
+        arbol, parent = pendientes.pop()
+
+        # Generar un identificador único para cada nodo
+        current_node = f"{id(arbol)}_{len(dot.body)}"
 
-    if isinstance(arbol, tuple):
-        label = arbol[0]  # Primera parte de la tupla es la etiqueta
-        dot.node(current_node, label)  # Crear nodo con la etiqueta principal
+        if isinstance(arbol, Nodo):
+            label = arbol.etiqueta  # Etiqueta del tipo de nodo ('program', 'operation', ...)
+            dot.node(current_node, label)  # Crear nodo con la etiqueta principal
 
-        if parent:
-            dot.edge(parent, current_node)  # Conectar con el nodo padre
+            if parent:
+                dot.edge(parent, current_node)  # Conectar con el nodo padre
 
-        for hijo in arbol[1:]:
-            dibujar_arbol_completo(hijo, dot, current_node)  # Llamada recursiva para hijos
+            # Los hijos se apilan al revés para dibujarlos en orden
+            pendientes.extend((hijo, current_node) for hijo in reversed(arbol.hijos()))
 
-    elif isinstance(arbol, list):
-        for elem in arbol:
-            dibujar_arbol_completo(elem, dot, parent)
+        elif isinstance(arbol, list):
+            pendientes.extend((elem, parent) for elem in reversed(arbol))
 
-    elif isinstance(arbol, str):
-        # Crear un nodo único para cada cadena
-        node = f"{current_node}_{arbol}"  # Nodo único con identificador + valor
-        dot.node(node, arbol)  # Crear nodo con el valor de la cadena completa
-        if parent:
-            dot.edge(parent, node)  # Conectar con el nodo padre
+        elif isinstance(arbol, str):
+            # Crear un nodo único para cada cadena
+            node = f"{current_node}_{arbol}"  # Nodo único con identificador + valor
+            dot.node(node, arbol)  # Crear nodo con el valor de la cadena completa
+            if parent:
+                dot.edge(parent, node)  # Conectar con el nodo padre
 
-    else:
-        # Crear nodos para valores atómicos (números, identificadores, etc.)
-        dot.node(current_node, str(arbol))
-        if parent:
-            dot.edge(parent, current_node)
+        else:
+            # Crear nodos para valores atómicos (números, identificadores, etc.)
+            dot.node(current_node, str(arbol))
+            if parent:
+                dot.edge(parent, current_node)
 
     return dot
 
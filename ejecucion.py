@@ -0,0 +1,135 @@
+# ejecucion.py
+"""
+Ejecución asíncrona de programas externos (nasm, gcc y el programa compilado) con
+asyncio.create_subprocess_exec.
+
+ejecutar() entrega la salida del programa a medida que llega (stdout y stderr, en bloques
+ya decodificados), impone un límite de tiempo de reloj y otro de CPU, y retorna un
+Resultado con el código de salida, el tiempo transcurrido y el motivo por el que terminó.
+Si la corrutina se cancela (asyncio.CancelledError), el proceso se termina antes de
+propagar la cancelación: un bucle infinito se detiene sin afectar a quien lo lanzó.
+
+El límite de CPU es RLIMIT_CPU del proceso hijo, así que solo se aplica en sistemas POSIX;
+en Windows queda el límite de tiempo de reloj. ejecutar() corre en el hilo trabajador de la
+interfaz y preexec_fn no es seguro con varios hilos, así que el límite se pone desde afuera:
+en Linux con resource.prlimit sobre el pid recién lanzado (RLIMIT_CPU cuenta también la CPU
+que usó antes, así que no se escapa nada), y en el resto con 'ulimit -t' en un shell que
+luego hace exec del programa (ahí un programa inexistente termina con código 127 en lugar
+de lanzar OSError).
+"""
+import asyncio
+import codecs
+import locale
+import math
+import signal
+import time
+
+try:
+    import resource  # solo en sistemas POSIX
+except ImportError:
+    resource = None
+
+# Bytes leídos de cada flujo por vez (menos bloques que entregar si el programa imprime mucho)
+TAMANO_BLOQUE = 65536
+
+# Códigos de salida de un proceso terminado por superar RLIMIT_CPU (SIGXCPU, o SIGKILL en el límite duro)
+_SENALES_CPU = {-signal.SIGXCPU, -signal.SIGKILL} if hasattr(signal, "SIGXCPU") else set()
+
+
+class Resultado:
+    """Cómo terminó un proceso: código de salida, segundos de reloj y motivo."""
+
+    __slots__ = ("args", "codigo", "segundos", "motivo", "truncada")
+
+    # Motivos: "terminado" (terminó solo), "tiempo" o "cpu" (se detuvo al superar un límite)
+    def __init__(self, args, codigo, segundos, motivo="terminado", truncada=False):
+        self.args = args
+        self.codigo = codigo
+        self.segundos = segundos
+        self.motivo = motivo
+        self.truncada = truncada
+
+    @property
+    def exitoso(self):
+        return self.motivo == "terminado" and self.codigo == 0
+
+    def describir(self, limite_tiempo=None, limite_cpu=None):
+        """Texto para el usuario, por ejemplo 'código de salida 0 en 0.12 s'."""
+        if self.motivo == "tiempo":
+            return f"detenido al superar el límite de {limite_tiempo} s de tiempo ({self.segundos:.2f} s)"
+        if self.motivo == "cpu":
+            return f"detenido al superar el límite de {limite_cpu} s de CPU ({self.segundos:.2f} s)"
+        return f"código de salida {self.codigo} en {self.segundos:.2f} s"
+
+
+async def _leer(flujo, nombre, al_recibir, restante):
+    """Entrega el contenido de 'flujo' a al_recibir(texto, nombre) hasta el fin de archivo."""
+    decodificador = codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors="replace")
+    while True:
+        bloque = await flujo.read(TAMANO_BLOQUE)
+        if restante is not None:
+            # Pasado el límite se sigue leyendo (para que el programa no se bloquee al escribir)
+            # pero no se entrega nada más
+            permitido = bloque[:max(restante[0], 0)]
+            restante[0] -= len(bloque)
+        else:
+            permitido = bloque
+        texto = decodificador.decode(permitido, final=not bloque)
+        if texto and al_recibir is not None:
+            al_recibir(texto, nombre)
+        if not bloque:
+            return
+
+
+async def _terminar(proceso):
+    """Mata el proceso (si sigue vivo) y espera a que termine."""
+    try:
+        proceso.kill()
+    except ProcessLookupError:
+        pass
+    await proceso.wait()
+
+
+async def ejecutar(args, al_recibir=None, limite_tiempo=None, limite_cpu=None, limite_salida=None, cwd=None):
+    """
+    Ejecuta 'args' y retorna su Resultado. Cada bloque de salida se entrega a
+    al_recibir(texto, flujo), con flujo "stdout" o "stderr". 'limite_tiempo' (segundos de
+    reloj) y 'limite_cpu' (segundos de CPU) detienen el proceso; 'limite_salida' es la
+    cantidad máxima de bytes de cada flujo que se entregan (el resto se descarta y el
+    Resultado queda con truncada=True). Lanza OSError si el programa no se puede lanzar.
+    """
+    segundos_cpu = max(1, math.ceil(limite_cpu)) if limite_cpu is not None and resource is not None else None
+    lanzar = args
+    if segundos_cpu is not None and not hasattr(resource, "prlimit"):
+        lanzar = ["/bin/sh", "-c", f'ulimit -t {segundos_cpu} && exec "$@"', "sh", *args]
+
+    t0 = time.perf_counter()
+    proceso = await asyncio.create_subprocess_exec(*lanzar, stdin=asyncio.subprocess.DEVNULL,
+                                                   stdout=asyncio.subprocess.PIPE,
+                                                   stderr=asyncio.subprocess.PIPE,
+                                                   cwd=cwd)
+    if segundos_cpu is not None and lanzar is args:
+        try:
+            resource.prlimit(proceso.pid, resource.RLIMIT_CPU, (segundos_cpu, segundos_cpu + 1))
+        except ProcessLookupError:
+            pass  # ya terminó
+    restantes = [[limite_salida], [limite_salida]] if limite_salida is not None else [None, None]
+
+    async def esperar():
+        await asyncio.gather(_leer(proceso.stdout, "stdout", al_recibir, restantes[0]),
+                             _leer(proceso.stderr, "stderr", al_recibir, restantes[1]))
+        await proceso.wait()
+
+    motivo = "terminado"
+    try:
+        await asyncio.wait_for(esperar(), limite_tiempo)
+    except asyncio.TimeoutError:
+        motivo = "tiempo"
+        await _terminar(proceso)
+    except asyncio.CancelledError:
+        await _terminar(proceso)
+        raise
+    if motivo == "terminado" and limite_cpu is not None and proceso.returncode in _SENALES_CPU:
+        motivo = "cpu"
+    truncada = any(restante is not None and restante[0] < 0 for restante in restantes)
+    return Resultado(list(args), proceso.returncode, time.perf_counter() - t0, motivo, truncada)
@@ -1,177 +1,113 @@
 # generador_codigo.py
 
-import tkinter as tk
-from tkinter import scrolledtext
-from PIL import Image, ImageTk  # Se utiliza PIL para manejar la imagen del AST
-import diagram  # Módulo de visualización de AST (diagram.py)
-
-# Estructuras globales para contar temporales y etiquetas (usadas en generación TAC)
-_temp_counter = 0
-_label_counter = 0
-
-def _nueva_temporal():
-    """Genera un nuevo nombre de variable temporal único."""
-    global _temp_counter
-    _temp_counter += 1
-    return f"t{_temp_counter}"
-
-def _nueva_etiqueta():
-    """Genera una nueva etiqueta (label) única para código de salto."""
-    global _label_counter
-    _label_counter += 1
-    return f"L{_label_counter}"
-
-def _generar_TAC_desde_AST(ast):
+# Nota: tkinter y PIL se importan dentro de generar_codigo_intermedio para que la
+# generación de TAC/SSA pueda usarse sin interfaz gráfica (ver compilador.py).
+
+from types import GeneratorType
+
+from ast_nodos import Tipo, Nodo
+from contexto import ContextoCompilacion
+from recorrido import ejecutar
+
+# Nodos de expresión que gen_operadores recorre con su pila explícita
+_OPERADORES = frozenset((Tipo.OPERACION, Tipo.COMPARACION, Tipo.NOT))
+# Marca de la pila de gen_operadores: el operador de debajo ya tiene sus operandos generados
+_COMBINAR = object()
+
+def _nueva_temporal(ctx):
+    """Genera un nuevo nombre de variable temporal único dentro del contexto 'ctx'."""
+    return ctx.nueva_temporal()
+
+def _nueva_etiqueta(ctx):
+    """Genera una nueva etiqueta (label) única para código de salto dentro del contexto 'ctx'."""
+    return ctx.nueva_etiqueta()
+
+def _generar_TAC_desde_AST(ast, ctx=None):
     """
-    Recorre recursivamente el AST y genera la lista de instrucciones en
+    Recorre el AST (con una pila explícita, ver recorrido.py) y genera la lista de instrucciones en
     Código de Tres Direcciones (TAC). Cada instrucción se representa como una cadena.
+    Los contadores de temporales/etiquetas y el buffer TAC pertenecen a 'ctx'
+    (ContextoCompilacion); si no se indica, se usa un contexto nuevo.
+    """
+    if ctx is None:
+        ctx = ContextoCompilacion()
+    # Iniciar la generación de TAC recorriendo el AST completo
+    ejecutar(_emisor_TAC(ctx, ctx.tac)(ast))
+    return ctx.tac
+
+def generar_TAC_en_flujo(ast, ctx=None):
+    """
+    Generador con las mismas instrucciones TAC que _generar_TAC_desde_AST, entregadas
+    sentencia por sentencia de primer nivel (los bloques de primer nivel se recorren
+    sentencia por sentencia): en memoria solo está el TAC de la sentencia actual.
+    Cada salto que se genera queda dentro de su sentencia de primer nivel, así que cada
+    tramo entregado es una lista de instrucciones que se puede optimizar por separado
+    (ver optimizador.optimizar_tac_en_flujo).
+    """
+    if ctx is None:
+        ctx = ContextoCompilacion()
+    tac = []
+    gen_stmt = _emisor_TAC(ctx, tac)
+    pendientes = [ast]
+    while pendientes:
+        node = pendientes.pop()
+        if isinstance(node, list):
+            pendientes.extend(reversed(node))
+        elif isinstance(node, Nodo) and node.tipo == Tipo.PROGRAMA:
+            pendientes.append(node.sentencias)
+        elif isinstance(node, Nodo) and node.tipo == Tipo.BLOQUE:
+            pendientes.append(node.elementos)
+        else:
+            ejecutar(gen_stmt(node))
+            if tac:
+                yield tac[:]
+                tac.clear()
+
+def _emisor_TAC(ctx, tac):
+    """
+    Retorna la función gen_stmt(nodo), que agrega a la lista 'tac' las instrucciones de
+    una sentencia (o lista de sentencias) usando los contadores de 'ctx'. gen_stmt y
+    gen_expr son generadores: piden la generación de cada hijo con 'yield' y se ejecutan
+    con recorrido.ejecutar(gen_stmt(nodo)), sin recursión de Python.
     """
-    tac = []  # Lista resultante de instrucciones TAC
 
     def gen_expr(node):
         """
         Genera TAC para una expresión y retorna el nombre del temporal o variable
         que contiene el resultado de evaluar dicha expresión.
         Al generar el código, las instrucciones necesarias se agregan a 'tac'.
+        Las variables y los literales se resuelven aquí mismo; para el resto de los nodos
+        retorna el generador de gen_expr_compuesta (se usa con 'yield gen_expr(nodo)').
         """
-        # Si el nodo es una tupla, identifica el tipo de expresión por el primer elemento.
-        if isinstance(node, tuple):
-            nodo_tipo = node[0]
-            # Normalizar etiqueta de tipo eliminando detalles adicionales (p.ej., ", =" en asignaciones).
-            etiqueta = nodo_tipo.split(',')[0]
-
-            # Operaciones aritméticas y lógicas binarias (+, -, *, /, ||, &&, ==, !=, etc.)
-            if etiqueta == "operation":
-                # node = ('operation', operador, operando_izq, operando_der)
-                op = node[1]
-                izq = node[2]
-                der = node[3]
-                # Generar código para operandos
-                res_izq = gen_expr(izq)
-                res_der = gen_expr(der)
-                # Asignar resultado de la operación a un nuevo temporal
-                temp_res = _nueva_temporal()
-                tac.append(f"{temp_res} = {res_izq} {op} {res_der}")
-                return temp_res
-
-            elif etiqueta == "comparison":
-                # node = ('comparison', operador, operando_izq, operando_der)
-                op = node[1]
-                izq = node[2]
-                der = node[3]
-                res_izq = gen_expr(izq)
-                res_der = gen_expr(der)
-                temp_res = _nueva_temporal()
-                tac.append(f"{temp_res} = {res_izq} {op} {res_der}")
-                return temp_res
-
-            elif etiqueta == "not":
-                # node = ('not', expresion)
-                expr = node[1]
-                res_expr = gen_expr(expr)
-                temp_res = _nueva_temporal()
-                # Operador lógico NOT unario. Se representa con '!' en TAC.
-                tac.append(f"{temp_res} = ! {res_expr}")
-                return temp_res
-
-            elif etiqueta == "ternary":
-                # node = ('ternary', condicion, expr_true, expr_false)
-                condicion = node[1]
-                expr_true = node[2]
-                expr_false = node[3]
-                # Generar código para la condición
-                cond_res = gen_expr(condicion)
-                # Crear temporales y etiquetas para el resultado y los saltos
-                resultado_temp = _nueva_temporal()
-                etiqueta_false = _nueva_etiqueta()
-                etiqueta_fin = _nueva_etiqueta()
-                # Instrucción condicional: si la condición es falsa, saltar a rama false
-                tac.append(f"ifFalse {cond_res} goto {etiqueta_false}")
-                # Rama true: evaluar expresión verdadera y asignar a resultado_temp
-                valor_true = gen_expr(expr_true)
-                tac.append(f"{resultado_temp} = {valor_true}")
-                tac.append(f"goto {etiqueta_fin}")
-                # Rama false: etiqueta de inicio
-                tac.append(f"{etiqueta_false}:")
-                valor_false = gen_expr(expr_false)
-                tac.append(f"{resultado_temp} = {valor_false}")
-                # Etiqueta fin
-                tac.append(f"{etiqueta_fin}:")
-                return resultado_temp
+        # Si el nodo es un nodo del AST, identifica el tipo de expresión por su atributo 'tipo'.
+        if isinstance(node, Nodo):
+            etiqueta = node.tipo
 
-            elif etiqueta in ("assignment", "assignment"):  # Asignación en expresión (ID = expr)
-                # node = ('assignment', var, expr)
-                var = node[1]
-                expr = node[2]
-                valor = gen_expr(expr)
-                tac.append(f"{var} = {valor}")
-                # El valor de una expresión de asignación es el valor asignado (ubicado en la variable)
-                return var
-
-            elif etiqueta == "increment":
-                # node = ('increment', var)  -> i++ (post-incremento como expresión)
-                var = node[1]
-                # Guardar valor actual en un temporal (para valor de la expresión)
-                temp_valor = _nueva_temporal()
-                tac.append(f"{temp_valor} = {var}")
-                # Incrementar la variable en 1
-                tac.append(f"{var} = {var} + 1")
-                # Retornar el valor original (post-incremento produce el valor antes de incrementar)
-                return temp_valor
-
-            elif etiqueta == "increment_by":
-                # node = ('increment_by', var, cantidad)  -> i += n
-                var = node[1]
-                cantidad = node[2]
-                valor_cant = gen_expr(cantidad)
-                tac.append(f"{var} = {var} + {valor_cant}")
-                # En este caso, la expresión i += n produce el nuevo valor de var
-                return var
-
-            elif etiqueta == "increment_assign":
-                # node = ('increment_assign', var, var, cantidad)  -> i = i + n
-                var = node[1]
-                cantidad = node[3]
-                valor_cant = gen_expr(cantidad)
-                tac.append(f"{var} = {var} + {valor_cant}")
-                return var
-
-            elif etiqueta == "id":
-                # node = ('id', nombre_var)
-                return node[1]  # devuelve el nombre de la variable para usarla en TAC
-
-            elif etiqueta == "number":
-                # node = ('number', valor_numerico)
-                return str(node[1])  # devuelve el número como texto
-
-            elif etiqueta == "string":
-                # node = ('string', valor_cadena_sin_comillas)
+            if etiqueta == Tipo.ID:
+                # node = ID (nombre_var)
+                return node.nombre  # devuelve el nombre de la variable para usarla en TAC
+
+            elif etiqueta == Tipo.NUMERO:
+                # node = NUMERO (valor_numerico)
+                return str(node.valor)  # devuelve el número como texto
+
+            elif etiqueta == Tipo.CADENA:
+                # node = CADENA (valor_cadena_sin_comillas)
                 # Agregar comillas para representarlo como literal de cadena
-                return f"\"{node[1]}\""
+                return f"\"{node.valor}\""
 
-            elif etiqueta == "bool_true":
+            elif etiqueta == Tipo.VERDADERO:
                 return "true"
 
-            elif etiqueta == "bool_false":
+            elif etiqueta == Tipo.FALSO:
                 return "false"
 
-            elif etiqueta == "declaracion_asignacion" or etiqueta == "declaration":
-                # Declaración con asignación (tipo, id, expr) – se maneja al nivel de statement.
-                # Si aparece aquí, procesarla como asignación normal.
-                tipo = node[1]
-                var = node[2]
-                expr = node[3]
-                valor = gen_expr(expr)
-                # Incluir instrucción de declaración explícita antes de la asignación
-                tac.append(f"DECL {tipo} {var}")
-                tac.append(f"{var} = {valor}")
-                return var
-
-            # Cualquier otro tipo de nodo en expresión (no previsto explícitamente)
-            # se retorna como cadena para su uso directo.
-            return str(node)
+            # Operaciones binarias, comparaciones y '!': se recorren con una pila explícita
+            if etiqueta in _OPERADORES:
+                return gen_operadores(node)
+            return gen_expr_compuesta(node)
         else:
-            # Si el nodo no es tupla (puede ser lista u atómico):
+            # Si el nodo no es un nodo del AST (puede ser lista u atómico):
             if isinstance(node, list):
                 # Si se recibe una lista en contexto de expresión, procesar elemento único (caso particular).
                 if len(node) == 1:
@@ -179,9 +115,136 @@ def _generar_TAC_desde_AST(ast):
                 # Lista no esperada en expresión (podría ser error de AST); devolver cadena representativa.
                 return str(node)
             else:
-                # Caso de valor atómico (p.ej., un tipo o identificador fuera de tupla).
+                # Caso de valor atómico (p.ej., un tipo o identificador fuera de un nodo).
                 return str(node)
 
+    def gen_operadores(node):
+        """
+        Generador de gen_expr para un árbol de operaciones aritméticas, lógicas y
+        comparaciones binarias (OPERACION, COMPARACION: operador, operando_izq, operando_der)
+        y NOT unario. Lo recorre en postorden con una pila explícita, así que una cadena
+        larga de operaciones no crea un generador por nodo; las subexpresiones de otro tipo
+        se piden con 'yield'. Las instrucciones y temporales salen en el mismo orden que al
+        generar cada operación por separado: operandos primero, luego el resultado.
+        """
+        # Nodos por visitar; un operador se apila seguido de _COMBINAR y de sus operandos
+        pendientes = [node]
+        resultados = []  # temporales o variables con el valor de cada subexpresión
+        sacar, apilar, agregar = pendientes.pop, pendientes.append, resultados.append
+        while pendientes:
+            actual = sacar()
+            if actual is _COMBINAR:
+                actual = sacar()
+                # Asignar resultado de la operación a un nuevo temporal
+                temp_res = _nueva_temporal(ctx)
+                if actual.tipo == Tipo.NOT:
+                    # Operador lógico NOT unario. Se representa con '!' en TAC.
+                    tac.append(f"{temp_res} = ! {resultados.pop()}")
+                else:
+                    res_der = resultados.pop()
+                    res_izq = resultados.pop()
+                    tac.append(f"{temp_res} = {res_izq} {actual.op} {res_der}")
+                agregar(temp_res)
+            elif isinstance(actual, Nodo) and actual.tipo in _OPERADORES:
+                apilar(actual)
+                apilar(_COMBINAR)
+                if actual.tipo == Tipo.NOT:
+                    apilar(actual.expr)
+                else:
+                    apilar(actual.der)
+                    apilar(actual.izq)
+            else:
+                resultado = gen_expr(actual)
+                if type(resultado) is GeneratorType:
+                    resultado = yield resultado
+                agregar(resultado)
+        return resultados[0]
+
+    def gen_expr_compuesta(node):
+        """
+        Generador de gen_expr para los nodos con subexpresiones: pide el TAC de cada hijo
+        con 'yield gen_expr(hijo)' y retorna el temporal o variable con el resultado.
+        """
+        etiqueta = node.tipo
+
+        if etiqueta == Tipo.TERNARIO:
+            # node = TERNARIO (condicion, expr_true, expr_false)
+            condicion = node.condicion
+            expr_true = node.si_verdadero
+            expr_false = node.si_falso
+            # Generar código para la condición
+            cond_res = yield gen_expr(condicion)
+            # Crear temporales y etiquetas para el resultado y los saltos
+            resultado_temp = _nueva_temporal(ctx)
+            etiqueta_false = _nueva_etiqueta(ctx)
+            etiqueta_fin = _nueva_etiqueta(ctx)
+            # Instrucción condicional: si la condición es falsa, saltar a rama false
+            tac.append(f"ifFalse {cond_res} goto {etiqueta_false}")
+            # Rama true: evaluar expresión verdadera y asignar a resultado_temp
+            valor_true = yield gen_expr(expr_true)
+            tac.append(f"{resultado_temp} = {valor_true}")
+            tac.append(f"goto {etiqueta_fin}")
+            # Rama false: etiqueta de inicio
+            tac.append(f"{etiqueta_false}:")
+            valor_false = yield gen_expr(expr_false)
+            tac.append(f"{resultado_temp} = {valor_false}")
+            # Etiqueta fin
+            tac.append(f"{etiqueta_fin}:")
+            return resultado_temp
+
+        elif etiqueta == Tipo.ASIGNACION_EXPR or etiqueta == Tipo.ASIGNACION:  # Asignación en expresión (ID = expr)
+            # node = ASIGNACION_EXPR (var, expr)
+            var = node.nombre
+            expr = node.valor
+            valor = yield gen_expr(expr)
+            tac.append(f"{var} = {valor}")
+            # El valor de una expresión de asignación es el valor asignado (ubicado en la variable)
+            return var
+
+        elif etiqueta == Tipo.INCREMENTO:
+            # node = INCREMENTO (var)  -> i++ (post-incremento como expresión)
+            var = node.nombre
+            # Guardar valor actual en un temporal (para valor de la expresión)
+            temp_valor = _nueva_temporal(ctx)
+            tac.append(f"{temp_valor} = {var}")
+            # Incrementar la variable en 1
+            tac.append(f"{var} = {var} + 1")
+            # Retornar el valor original (post-incremento produce el valor antes de incrementar)
+            return temp_valor
+
+        elif etiqueta == Tipo.INCREMENTO_POR:
+            # node = INCREMENTO_POR (var, cantidad)  -> i += n
+            var = node.nombre
+            cantidad = node.cantidad
+            valor_cant = yield gen_expr(cantidad)
+            tac.append(f"{var} = {var} + {valor_cant}")
+            # En este caso, la expresión i += n produce el nuevo valor de var
+            return var
+
+        elif etiqueta == Tipo.INCREMENTO_ASIGNADO:
+            # node = INCREMENTO_ASIGNADO (var, var, cantidad)  -> i = i + n
+            var = node.nombre
+            cantidad = node.cantidad
+            valor_cant = yield gen_expr(cantidad)
+            tac.append(f"{var} = {var} + {valor_cant}")
+            return var
+
+        elif etiqueta == Tipo.DECLARACION_ASIGNACION or etiqueta == Tipo.DECLARACION_FOR:
+            # Declaración con asignación (tipo, id, expr) – se maneja al nivel de statement.
+            # Si aparece aquí, procesarla como asignación normal.
+            tipo = node.tipo_dato
+            var = node.nombre
+            expr = node.valor
+            valor = yield gen_expr(expr)
+            # Incluir instrucción de declaración explícita antes de la asignación
+            tac.append(f"DECL {tipo} {var}")
+            tac.append(f"{var} = {valor}")
+            return var
+
+        # Cualquier otro tipo de nodo en expresión (no previsto explícitamente)
+        # se retorna como cadena para su uso directo.
+        return str(node)
+
     def gen_stmt(node):
         """
         Genera TAC para un nodo de tipo sentencia (statement).
@@ -192,124 +255,121 @@ def _generar_TAC_desde_AST(ast):
         if isinstance(node, list):
             # Lista de sentencias: procesar secuencialmente
             for stmt in node:
-                gen_stmt(stmt)
-        elif isinstance(node, tuple):
-            nodo_tipo = node[0]
-            etiqueta = nodo_tipo.split(',')[0]
+                yield gen_stmt(stmt)
+        elif isinstance(node, Nodo):
+            etiqueta = node.tipo
 
-            if etiqueta == "program":
+            if etiqueta == Tipo.PROGRAMA:
                 # Programa completo: su hijo es la lista de sentencias
-                gen_stmt(node[1])
+                yield gen_stmt(node.sentencias)
 
-            elif etiqueta == "declaracion_asignacion":
+            elif etiqueta == Tipo.DECLARACION_ASIGNACION:
                 # Declaración con asignación (tipo, id, expr)
-                tipo = node[1]; var = node[2]; expr = node[3]
-                valor = gen_expr(expr)
+                tipo = node.tipo_dato; var = node.nombre; expr = node.valor
+                valor = yield gen_expr(expr)
                 tac.append(f"DECL {tipo} {var}")
                 tac.append(f"{var} = {valor}")
 
-            elif etiqueta == "declaracion":
+            elif etiqueta == Tipo.DECLARACION:
                 # Declaración simple (tipo, id) sin asignación inicial
-                tipo = node[1]; var = node[2]
+                tipo = node.tipo_dato; var = node.nombre
                 tac.append(f"DECL {tipo} {var}")
                 # Sin valor asignado, se declara la variable (podría asumir valor por defecto aparte, no representado en TAC)
 
-            elif etiqueta == "assignment":
+            elif etiqueta == Tipo.ASIGNACION or etiqueta == Tipo.ASIGNACION_EXPR:
                 # Asignación de valor a variable (id = expr)
-                var = node[1]; expr = node[2]
-                valor = gen_expr(expr)
+                var = node.nombre; expr = node.valor
+                valor = yield gen_expr(expr)
                 tac.append(f"{var} = {valor}")
 
-            elif etiqueta == "increment_stmt":
+            elif etiqueta == Tipo.INCREMENTO_STMT:
                 # Sentencia de incremento (ID++)
-                var = node[1]
+                var = node.nombre
                 tac.append(f"{var} = {var} + 1")
 
-            elif etiqueta == "expr":
+            elif etiqueta == Tipo.EXPR:
                 # Sentencia expuesta (expresión seguida de ';'). Procesar la expresión y descartar el resultado.
-                expr = node[1]
-                gen_expr(expr)
+                expr = node.expr
+                yield gen_expr(expr)
                 # (El resultado de la expresión, si lo hay, no se almacena porque es una sentencia aislada)
 
-            elif etiqueta == "if":
+            elif etiqueta == Tipo.SI:
                 # Sentencia if (sin else)
-                condicion = node[1]; bloque_then = node[2]
-                cond_res = gen_expr(condicion)
-                etiqueta_fin = _nueva_etiqueta()
+                condicion = node.condicion; bloque_then = node.entonces
+                cond_res = yield gen_expr(condicion)
+                etiqueta_fin = _nueva_etiqueta(ctx)
                 tac.append(f"ifFalse {cond_res} goto {etiqueta_fin}")
-                gen_stmt(bloque_then)
+                yield gen_stmt(bloque_then)
                 tac.append(f"{etiqueta_fin}:")
 
-            elif etiqueta == "if-else":
+            elif etiqueta == Tipo.SI_SINO:
                 # Sentencia if-else
-                condicion = node[1]; bloque_then = node[2]; bloque_else = node[3]
-                cond_res = gen_expr(condicion)
-                etiqueta_else = _nueva_etiqueta()
-                etiqueta_fin = _nueva_etiqueta()
+                condicion = node.condicion; bloque_then = node.entonces; bloque_else = node.sino
+                cond_res = yield gen_expr(condicion)
+                etiqueta_else = _nueva_etiqueta(ctx)
+                etiqueta_fin = _nueva_etiqueta(ctx)
                 tac.append(f"ifFalse {cond_res} goto {etiqueta_else}")
-                gen_stmt(bloque_then)
+                yield gen_stmt(bloque_then)
                 tac.append(f"goto {etiqueta_fin}")
                 tac.append(f"{etiqueta_else}:")
-                gen_stmt(bloque_else)
+                yield gen_stmt(bloque_else)
                 tac.append(f"{etiqueta_fin}:")
 
-            elif etiqueta == "while":
+            elif etiqueta == Tipo.MIENTRAS:
                 # Sentencia while
-                condicion = node[1]; cuerpo = node[2]
-                etiqueta_inicio = _nueva_etiqueta()
-                etiqueta_fin = _nueva_etiqueta()
+                condicion = node.condicion; cuerpo = node.cuerpo
+                etiqueta_inicio = _nueva_etiqueta(ctx)
+                etiqueta_fin = _nueva_etiqueta(ctx)
                 tac.append(f"{etiqueta_inicio}:")
-                cond_res = gen_expr(condicion)
+                cond_res = yield gen_expr(condicion)
                 tac.append(f"ifFalse {cond_res} goto {etiqueta_fin}")
-                gen_stmt(cuerpo)
+                yield gen_stmt(cuerpo)
                 tac.append(f"goto {etiqueta_inicio}")
                 tac.append(f"{etiqueta_fin}:")
 
-            elif etiqueta == "for":
+            elif etiqueta == Tipo.PARA:
                 # Sentencia for (init; cond; update) { cuerpo }
-                init = node[1]; condicion = node[2]; actualizacion = node[3]; cuerpo = node[4]
+                init = node.inicio; condicion = node.condicion; actualizacion = node.actualizacion; cuerpo = node.cuerpo
                 # Inicialización (puede ser declaración o asignación)
-                gen_stmt(init)
-                etiqueta_inicio = _nueva_etiqueta()
-                etiqueta_fin = _nueva_etiqueta()
+                yield gen_stmt(init)
+                etiqueta_inicio = _nueva_etiqueta(ctx)
+                etiqueta_fin = _nueva_etiqueta(ctx)
                 tac.append(f"{etiqueta_inicio}:")
                 # Condición de continuidad del for
                 if condicion is not None:
-                    cond_res = gen_expr(condicion)
+                    cond_res = yield gen_expr(condicion)
                     tac.append(f"ifFalse {cond_res} goto {etiqueta_fin}")
                 else:
                     # Si la condición es None (bucle for sin condición explícita), asumir siempre verdadero
                     pass
                 # Cuerpo del for
-                gen_stmt(cuerpo)
+                yield gen_stmt(cuerpo)
                 # Actualización (ejecutada al final de cada iteración)
                 if actualizacion is not None:
-                    gen_expr(actualizacion)
+                    yield gen_expr(actualizacion)
                 tac.append(f"goto {etiqueta_inicio}")
                 tac.append(f"{etiqueta_fin}:")
 
-            elif etiqueta == "block":
+            elif etiqueta == Tipo.BLOQUE:
                 # Bloque de código (agrupación de sentencias entre llaves)
-                bloque = node[1]
-                gen_stmt(bloque)
+                bloque = node.elementos
+                yield gen_stmt(bloque)
 
-            elif etiqueta == "print":
-                # node = ('print', [expr1, expr2, ...])
-                for arg in node[1]:
-                    valor = gen_expr(arg)  # genera el valor (p.ej. "\"texto\"" o "c")
+            elif etiqueta == Tipo.IMPRIMIR:
+                # node = IMPRIMIR [expr1, expr2, ...]
+                for arg in node.elementos:
+                    valor = yield gen_expr(arg)  # genera el valor (p.ej. "\"texto\"" o "c")
                     tac.append(f"PRINT {valor}")
 
             else:
                 # Cualquier otro tipo de nodo de sentencia no contemplado explícitamente
                 # (Incluyendo casos como 'increment', 'increment_by' en contexto de sentencia)
-                gen_expr(node)
+                yield gen_expr(node)
         else:
             # Nodo que no es lista ni tupla (posible caso atípico)
             return
 
-    # Iniciar la generación de TAC recorriendo el AST completo
-    gen_stmt(ast)
-    return tac
+    return gen_stmt
 
 def _convertir_TAC_a_SSA(tac_instructions):
     """
@@ -400,24 +460,31 @@ def _convertir_TAC_a_SSA(tac_instructions):
             ssa.append(f"{nuevo_destino} = {expr_ssa}")
     return ssa
 
-def generar_codigo_intermedio(ast):
+def generar_codigo_intermedio(ast, lista_TAC=None, lista_SSA=None):
     """
     Función principal para generar las representaciones intermedias (AST visual, TAC, SSA)
-    a partir de un AST dado.
+    a partir de un AST dado. Si ya se tienen el TAC y el SSA del AST (por ejemplo, de una
+    sesion.SesionCompilacion) se pueden pasar en 'lista_TAC' y 'lista_SSA' para no generarlos de nuevo.
     - Genera el AST visual usando diagram.py (Graphviz).
     - Genera las listas de instrucciones TAC y SSA.
     - Guarda TAC y SSA en archivos de texto.
     - Muestra los resultados en una ventana independiente con capacidad de scroll.
     """
+    import tkinter as tk
+    from tkinter import scrolledtext
+    from PIL import Image, ImageTk  # Se utiliza PIL para manejar la imagen del AST
+
     # Generar AST visual con graphviz (diagram.py)
 
     ruta_imagen = r"C:\Users\monje\PycharmProjects\p1-copiler\Arbol_Sintactico.png"
 
 
     # Generar código de tres direcciones (TAC) del AST
-    lista_TAC = _generar_TAC_desde_AST(ast)
+    if lista_TAC is None:
+        lista_TAC = _generar_TAC_desde_AST(ast)
     # Convertir TAC a Static Single Assignment (SSA)
-    lista_SSA = _convertir_TAC_a_SSA(lista_TAC)
+    if lista_SSA is None:
+        lista_SSA = _convertir_TAC_a_SSA(lista_TAC)
 
     # Guardar las instrucciones TAC y SSA en archivos de texto
     with open("codigo_tac.txt", "w", encoding="utf-8") as file_tac:
@@ -1,20 +1,38 @@
 # generador_nasm.py
-def generar_codigo_maquina(lista_tac):
+import shutil
+import tempfile
+
+_OP_TOKENS = {"+", "-", "*", "/", "&&", "||", "==", "!=", ">", "<", ">=", "<=", "!"}
+
+# Líneas del código generado que se juntan antes de pasarlas al archivo temporal (modo en flujo)
+_LINEAS_POR_ESCRITURA = 4096
+
+# Tamaño hasta el que el código (.text) del modo en flujo se guarda en memoria antes de pasar a disco
+TAMANO_EN_MEMORIA = 1 << 22
+
+# Final de la función main (retorno al SO)
+_FINAL_MAIN = ("    mov eax, 0", "    pop ebp", "    ret")
+
+
+class _SeccionDatos:
     """
-    Convierte una lista de instrucciones TAC optimizadas en código ensamblador NASM de 32 bits.
-    Genera un archivo "codigo.asm" con la sección de datos (.data/.bss) y código (.text).
+    Variables, temporales y cadenas que usan las instrucciones TAC registradas: con ellas
+    se arma la cabecera del archivo (.data, .bss y el comienzo de _main).
     """
-    asm_lines = []
-    data_lines = []
-    string_consts = {}
-    temp_vars = set()
-    op_tokens = {"+", "-", "*", "/", "&&", "||", "==", "!=", ">", "<", ">=", "<=", "!"}
-    # 1. Preparar secciones de datos (.data) y .bss para variables
-    variables = {}
-    for instr in lista_tac:
+
+    def __init__(self):
+        self.variables = {}
+        self.string_consts = {}
+        self.data_lines = []
+        self.usa_fmt_int = False
+
+    def registrar(self, instr):
+        """Registra las variables y cadenas de la instrucción TAC 'instr'."""
+        if instr.startswith("PRINT ") and not instr.split()[1].startswith('"'):
+            self.usa_fmt_int = True
         instr = instr.strip()
         if not instr:
-            continue
+            return
         # Si es declaración, registrar la variable y su tipo
         if instr.startswith("DECL"):
             # Formato: "DECL TIPO nombre"
@@ -22,232 +40,286 @@ def generar_codigo_maquina(lista_tac):
             if len(parts) >= 3:
                 tipo_var = parts[1]
                 nombre = parts[2]
-                variables[nombre] = tipo_var
+                self.variables[nombre] = tipo_var
         # Si es asignación u operación TAC, identificar nombres de variables/temporales involucrados
         if "=" in instr:
             izq, der = instr.split("=", 1)
             var_dest = izq.strip()
-            if var_dest and var_dest not in variables:
-                variables[var_dest] = "INT"  # Asumimos INT por defecto
+            if var_dest and var_dest not in self.variables:
+                self.variables[var_dest] = "INT"  # Asumimos INT por defecto
             # Revisar tokens del lado derecho
             tokens = der.strip().replace(',', ' ').split()
             for token in tokens:
                 token = token.strip().strip(";")
-                if (not token) or (token in op_tokens) or token.lower() in {"true","false","goto","iffalse"}:
+                if (not token) or (token in _OP_TOKENS) or token.lower() in {"true","false","goto","iffalse"}:
                     continue  # ignorar operadores y palabras clave
                 if token.startswith("\"") and token.endswith("\""):
                     # Literal de cadena: asignar etiqueta en .data si no se ha hecho
-                    if token not in string_consts:
-                        label = f"str_{len(string_consts)+1}"
+                    if token not in self.string_consts:
+                        label = f"str_{len(self.string_consts)+1}"
                         contenido = token.strip("\"")
-                        string_consts[token] = label
-                        data_lines.append(f'{label} db "{contenido}", 0')
+                        self.string_consts[token] = label
+                        self.data_lines.append(f'{label} db "{contenido}", 0')
                 elif not token.isdigit() and not (token.startswith('-') and token[1:].isdigit()):
                     # Token es una variable temporal o identificador no numérico
-                    if token not in variables:
-                        variables[token] = "INT"
+                    if token not in self.variables:
+                        self.variables[token] = "INT"
 
         # --- NUEVO ---  soportar cadenas en instrucciones PRINT
         if instr.startswith("PRINT"):
             token = instr[5:].strip()          # lo que viene después de PRINT
             if token.startswith("\"") and token.endswith("\""):
-                if token not in string_consts:             # aún no registrada
-                    label = f"str_{len(string_consts)+1}"
+                if token not in self.string_consts:             # aún no registrada
+                    label = f"str_{len(self.string_consts)+1}"
                     contenido = token.strip("\"")
-                    string_consts[token] = label
-                    data_lines.append(f'{label} db "{contenido}", 0')
-
-    # Construir sección .data y .bss
-    usa_fmt_int = any(instr.startswith("PRINT ") and not instr.split()[1].startswith('"')
-                      for instr in lista_tac)
-    asm_lines.append("section .data")
-    asm_lines.extend(data_lines)
-    # --- NUEVO ---
-    if usa_fmt_int:
-        asm_lines.append('fmt_int db "%d", 10, 0')  # "%d\\n"
-    # ---------------
-    asm_lines.append("section .bss")
-
-    for nombre_var in variables:
-        if nombre_var.startswith("L"):
-            continue  # omitir etiquetas de salto como variables
-        asm_lines.append(f"{nombre_var} resd 1")  # reservar 4 bytes (un entero 32-bit)
-
-    asm_lines.append("extern _printf")
-    asm_lines.append("section .text")
-    asm_lines.append("global _main")
-    asm_lines.append("_main:")
-    asm_lines.append("    push ebp")
-    asm_lines.append("    mov ebp, esp")
-    # 2. Traducir cada instrucción TAC a instrucciones NASM equivalentes
-    for instr in lista_tac:
-        instr = instr.strip()
-        if not instr or instr.startswith("DECL"):
-            continue  # omitir declaraciones (ya manejadas en .bss)
-        if instr.endswith(":"):
-            # Etiqueta de salto (p.ej., L1:)
-            asm_lines.append(instr)
-            continue
-        if instr.startswith("goto"):
-            # Salto incondicional
-            _, etiqueta = instr.split()
-            asm_lines.append(f"    jmp {etiqueta}")
-            continue
-        if instr.startswith("ifFalse"):
-            # Salto condicional ifFalse X goto L -> jump si X es 0
-            parts = instr.split()
-            _, cond, _, etiqueta = parts
-            # Cargar condición en EAX
-            if cond.lower() == "true" or cond.lower() == "false":
-                valor = "1" if cond.lower() == "true" else "0"
-                asm_lines.append(f"    mov eax, {valor}")
-            elif cond.lstrip('-').isdigit():
-                asm_lines.append(f"    mov eax, {cond}")
-            else:
-                asm_lines.append(f"    mov eax, [{cond}]")
-            asm_lines.append("    cmp eax, 0")
-            asm_lines.append(f"    je {etiqueta}")
-            continue
+                    self.string_consts[token] = label
+                    self.data_lines.append(f'{label} db "{contenido}", 0')
 
-        # --- NUEVO ---  traducción de PRINT
-        if instr.startswith("PRINT"):
-            arg = instr[5:].strip()
-
-            if arg.startswith("\""):                  # imprimir cadena literal
-                label = string_consts[arg]            # etiqueta en .data
-                asm_lines.append(f"    push {label}") # push dirección de la cadena
-                asm_lines.append("    call _printf")
-                asm_lines.append("    add esp, 4")    # limpiar la pila
-            else:                                     # imprimir variable entera
-                asm_lines.append(f"    push dword [{arg}]")   # valor de la variable
-                asm_lines.append("    push fmt_int")          # formato "%d\\n"
-                asm_lines.append("    call _printf")
-                asm_lines.append("    add esp, 8")            # limpiar la pila
-            continue
-
-        # Procesar asignación u operación: formato "dest = expr"
+    def cabecera(self):
+        """Genera las líneas de .data, .bss y el comienzo de _main, con todo lo registrado."""
+        yield "section .data"
+        yield from self.data_lines
+        # --- NUEVO ---
+        if self.usa_fmt_int:
+            yield 'fmt_int db "%d", 10, 0'  # "%d\\n"
+        # ---------------
+        yield "section .bss"
 
-        if "=" in instr:
-            dest, expr = instr.split("=", 1)
-            dest = dest.strip()
-            expr = expr.strip().strip(";")
-            # Asignación de literal de cadena
-            if expr.startswith("\"") and expr.endswith("\""):
-                label = string_consts.get(expr)
-                if label:
-                    asm_lines.append(f"    mov dword [{dest}], {label}")
-                continue
-            # Asignación de booleano literal
-            if expr.lower() == "true" or expr.lower() == "false":
-                valor = "1" if expr.lower() == "true" else "0"
-                asm_lines.append(f"    mov dword [{dest}], {valor}")
-                continue
-            tokens = expr.split()
-            # Caso 1: asignación simple (dest = var/const)
-            if len(tokens) == 1:
-                t = tokens[0]
-                if t.lstrip('-').isdigit():
-                    asm_lines.append(f"    mov dword [{dest}], {t}")
+        for nombre_var in self.variables:
+            if nombre_var.startswith("L"):
+                continue  # omitir etiquetas de salto como variables
+            yield f"{nombre_var} resd 1"  # reservar 4 bytes (un entero 32-bit)
+
+        yield "extern _printf"
+        yield "section .text"
+        yield "global _main"
+        yield "_main:"
+        yield "    push ebp"
+        yield "    mov ebp, esp"
+
+
+def _traducir(instr, string_consts, asm_lines):
+    """Agrega a 'asm_lines' las instrucciones NASM equivalentes a la instrucción TAC 'instr'."""
+    instr = instr.strip()
+    if not instr or instr.startswith("DECL"):
+        return  # omitir declaraciones (ya manejadas en .bss)
+    if instr.endswith(":"):
+        # Etiqueta de salto (p.ej., L1:)
+        asm_lines.append(instr)
+        return
+    if instr.startswith("goto"):
+        # Salto incondicional
+        _, etiqueta = instr.split()
+        asm_lines.append(f"    jmp {etiqueta}")
+        return
+    if instr.startswith("ifFalse"):
+        # Salto condicional ifFalse X goto L -> jump si X es 0
+        parts = instr.split()
+        _, cond, _, etiqueta = parts
+        # Cargar condición en EAX
+        if cond.lower() == "true" or cond.lower() == "false":
+            valor = "1" if cond.lower() == "true" else "0"
+            asm_lines.append(f"    mov eax, {valor}")
+        elif cond.lstrip('-').isdigit():
+            asm_lines.append(f"    mov eax, {cond}")
+        else:
+            asm_lines.append(f"    mov eax, [{cond}]")
+        asm_lines.append("    cmp eax, 0")
+        asm_lines.append(f"    je {etiqueta}")
+        return
+
+    # --- NUEVO ---  traducción de PRINT
+    if instr.startswith("PRINT"):
+        arg = instr[5:].strip()
+
+        if arg.startswith("\""):                  # imprimir cadena literal
+            label = string_consts[arg]            # etiqueta en .data
+            asm_lines.append(f"    push {label}") # push dirección de la cadena
+            asm_lines.append("    call _printf")
+            asm_lines.append("    add esp, 4")    # limpiar la pila
+        else:                                     # imprimir variable entera
+            asm_lines.append(f"    push dword [{arg}]")   # valor de la variable
+            asm_lines.append("    push fmt_int")          # formato "%d\\n"
+            asm_lines.append("    call _printf")
+            asm_lines.append("    add esp, 8")            # limpiar la pila
+        return
+
+    # Procesar asignación u operación: formato "dest = expr"
+
+    if "=" in instr:
+        dest, expr = instr.split("=", 1)
+        dest = dest.strip()
+        expr = expr.strip().strip(";")
+        # Asignación de literal de cadena
+        if expr.startswith("\"") and expr.endswith("\""):
+            label = string_consts.get(expr)
+            if label:
+                asm_lines.append(f"    mov dword [{dest}], {label}")
+            return
+        # Asignación de booleano literal
+        if expr.lower() == "true" or expr.lower() == "false":
+            valor = "1" if expr.lower() == "true" else "0"
+            asm_lines.append(f"    mov dword [{dest}], {valor}")
+            return
+        tokens = expr.split()
+        # Caso 1: asignación simple (dest = var/const)
+        if len(tokens) == 1:
+            t = tokens[0]
+            if t.lstrip('-').isdigit():
+                asm_lines.append(f"    mov dword [{dest}], {t}")
+            else:
+                asm_lines.append(f"    mov eax, [{t}]")
+                asm_lines.append(f"    mov dword [{dest}], eax")
+            return
+        # Caso 2: operación unaria (¡solo soportamos '!' lógico)
+        if tokens[0] == "!":
+            opnd = tokens[1]
+            if opnd.lstrip('-').isdigit():
+                asm_lines.append(f"    mov eax, {opnd}")
+            else:
+                asm_lines.append(f"    mov eax, [{opnd}]")
+            asm_lines.append("    cmp eax, 0")
+            asm_lines.append("    mov eax, 0")
+            asm_lines.append("    sete al")  # AL=1 si opnd era 0, sino AL=0
+            asm_lines.append(f"    mov dword [{dest}], eax")
+            return
+        # Caso 3: operación binaria o comparación (forma: A op B)
+        if len(tokens) == 3:
+            A, op, B = tokens
+            # Cargar A en EAX
+            if A.lstrip('-').isdigit():
+                asm_lines.append(f"    mov eax, {A}")
+            else:
+                asm_lines.append(f"    mov eax, [{A}]")
+            # Seleccionar instrucción según el operador
+            if op == "+":
+                if B.lstrip('-').isdigit():
+                    asm_lines.append(f"    add eax, {B}")
+                else:
+                    asm_lines.append(f"    add eax, [{B}]")
+                asm_lines.append(f"    mov dword [{dest}], eax")
+            elif op == "-":
+                if B.lstrip('-').isdigit():
+                    asm_lines.append(f"    sub eax, {B}")
+                else:
+                    asm_lines.append(f"    sub eax, [{B}]")
+                asm_lines.append(f"    mov dword [{dest}], eax")
+            elif op == "*":
+                if B.lstrip('-').isdigit():
+                    asm_lines.append(f"    imul eax, {B}")
                 else:
-                    asm_lines.append(f"    mov eax, [{t}]")
-                    asm_lines.append(f"    mov dword [{dest}], eax")
-                continue
-            # Caso 2: operación unaria (¡solo soportamos '!' lógico)
-            if tokens[0] == "!":
-                opnd = tokens[1]
-                if opnd.lstrip('-').isdigit():
-                    asm_lines.append(f"    mov eax, {opnd}")
+                    asm_lines.append(f"    imul eax, [{B}]")
+                asm_lines.append(f"    mov dword [{dest}], eax")
+            elif op == "/":
+                asm_lines.append("    cdq")  # extender signo (EDX:EAX para idiv)
+                if B.lstrip('-').isdigit():
+                    asm_lines.append(f"    mov ebx, {B}")
                 else:
-                    asm_lines.append(f"    mov eax, [{opnd}]")
+                    asm_lines.append(f"    mov ebx, [{B}]")
+                asm_lines.append("    idiv ebx")
+                asm_lines.append(f"    mov dword [{dest}], eax")
+            elif op in ("&&", "||"):
+                # AND/OR lógicos: convertir A y B a 0/1 y combinar
                 asm_lines.append("    cmp eax, 0")
                 asm_lines.append("    mov eax, 0")
-                asm_lines.append("    sete al")  # AL=1 si opnd era 0, sino AL=0
+                asm_lines.append("    setne al")  # EAX = 1 si A != 0
+                if B.lstrip('-').isdigit():
+                    asm_lines.append(f"    mov ebx, {B}")
+                else:
+                    asm_lines.append(f"    mov ebx, [{B}]")
+                asm_lines.append("    cmp ebx, 0")
+                asm_lines.append("    mov ebx, 0")
+                asm_lines.append("    setne bl")  # EBX = 1 si B != 0
+                if op == "&&":
+                    asm_lines.append("    and eax, ebx")
+                else:
+                    asm_lines.append("    or eax, ebx")
                 asm_lines.append(f"    mov dword [{dest}], eax")
-                continue
-            # Caso 3: operación binaria o comparación (forma: A op B)
-            if len(tokens) == 3:
-                A, op, B = tokens
-                # Cargar A en EAX
-                if A.lstrip('-').isdigit():
-                    asm_lines.append(f"    mov eax, {A}")
+            elif op in ("==", "!=", ">", "<", ">=", "<="):
+                # Comparaciones: usar CMP y saltos condicionales para setear resultado 0/1
+                if B.lstrip('-').isdigit():
+                    asm_lines.append(f"    cmp eax, {B}")
                 else:
-                    asm_lines.append(f"    mov eax, [{A}]")
-                # Seleccionar instrucción según el operador
-                if op == "+":
-                    if B.lstrip('-').isdigit():
-                        asm_lines.append(f"    add eax, {B}")
-                    else:
-                        asm_lines.append(f"    add eax, [{B}]")
-                    asm_lines.append(f"    mov dword [{dest}], eax")
-                elif op == "-":
-                    if B.lstrip('-').isdigit():
-                        asm_lines.append(f"    sub eax, {B}")
-                    else:
-                        asm_lines.append(f"    sub eax, [{B}]")
-                    asm_lines.append(f"    mov dword [{dest}], eax")
-                elif op == "*":
-                    if B.lstrip('-').isdigit():
-                        asm_lines.append(f"    imul eax, {B}")
-                    else:
-                        asm_lines.append(f"    imul eax, [{B}]")
-                    asm_lines.append(f"    mov dword [{dest}], eax")
-                elif op == "/":
-                    asm_lines.append("    cdq")  # extender signo (EDX:EAX para idiv)
-                    if B.lstrip('-').isdigit():
-                        asm_lines.append(f"    mov ebx, {B}")
-                    else:
-                        asm_lines.append(f"    mov ebx, [{B}]")
-                    asm_lines.append("    idiv ebx")
-                    asm_lines.append(f"    mov dword [{dest}], eax")
-                elif op in ("&&", "||"):
-                    # AND/OR lógicos: convertir A y B a 0/1 y combinar
-                    asm_lines.append("    cmp eax, 0")
-                    asm_lines.append("    mov eax, 0")
-                    asm_lines.append("    setne al")  # EAX = 1 si A != 0
-                    if B.lstrip('-').isdigit():
-                        asm_lines.append(f"    mov ebx, {B}")
-                    else:
-                        asm_lines.append(f"    mov ebx, [{B}]")
-                    asm_lines.append("    cmp ebx, 0")
-                    asm_lines.append("    mov ebx, 0")
-                    asm_lines.append("    setne bl")  # EBX = 1 si B != 0
-                    if op == "&&":
-                        asm_lines.append("    and eax, ebx")
-                    else:
-                        asm_lines.append("    or eax, ebx")
-                    asm_lines.append(f"    mov dword [{dest}], eax")
-                elif op in ("==", "!=", ">", "<", ">=", "<="):
-                    # Comparaciones: usar CMP y saltos condicionales para setear resultado 0/1
-                    if B.lstrip('-').isdigit():
-                        asm_lines.append(f"    cmp eax, {B}")
-                    else:
-                        asm_lines.append(f"    cmp eax, [{B}]")
-                    asm_lines.append("    mov eax, 0")
-                    if op == "==":
-                        asm_lines.append("    sete al")
-                    elif op == "!=":
-                        asm_lines.append("    setne al")
-                    elif op == ">":
-                        asm_lines.append("    setg al")
-                    elif op == "<":
-                        asm_lines.append("    setl al")
-                    elif op == ">=":
-                        asm_lines.append("    setge al")
-                    elif op == "<=":
-                        asm_lines.append("    setle al")
-                    asm_lines.append(f"    mov dword [{dest}], eax")
+                    asm_lines.append(f"    cmp eax, [{B}]")
+                asm_lines.append("    mov eax, 0")
+                if op == "==":
+                    asm_lines.append("    sete al")
+                elif op == "!=":
+                    asm_lines.append("    setne al")
+                elif op == ">":
+                    asm_lines.append("    setg al")
+                elif op == "<":
+                    asm_lines.append("    setl al")
+                elif op == ">=":
+                    asm_lines.append("    setge al")
+                elif op == "<=":
+                    asm_lines.append("    setle al")
+                asm_lines.append(f"    mov dword [{dest}], eax")
+            else:
+                # Operador no reconocido (fallback a mov)
+                if B.lstrip('-').isdigit():
+                    asm_lines.append(f"    mov dword [{dest}], {B}")
                 else:
-                    # Operador no reconocido (fallback a mov)
-                    if B.lstrip('-').isdigit():
-                        asm_lines.append(f"    mov dword [{dest}], {B}")
-                    else:
-                        asm_lines.append(f"    mov dword [{dest}], [{B}]")
+                    asm_lines.append(f"    mov dword [{dest}], [{B}]")
+
+
+def generar_codigo_maquina(lista_tac, ruta_asm="codigo.asm"):
+    """
+    Convierte una lista de instrucciones TAC optimizadas en código ensamblador NASM de 32 bits.
+    Genera un archivo 'ruta_asm' (por defecto "codigo.asm") con la sección de datos (.data/.bss)
+    y código (.text). Si 'ruta_asm' es None no se escribe ningún archivo.
+    """
+    # 1. Preparar secciones de datos (.data) y .bss para variables
+    datos = _SeccionDatos()
+    for instr in lista_tac:
+        datos.registrar(instr)
+    asm_lines = list(datos.cabecera())
+    # 2. Traducir cada instrucción TAC a instrucciones NASM equivalentes
+    for instr in lista_tac:
+        _traducir(instr, datos.string_consts, asm_lines)
     # 3. Finalizar función main (retorno al SO)
-    asm_lines.append("    mov eax, 0")
-    asm_lines.append("    pop ebp")
-    asm_lines.append("    ret")
+    asm_lines.extend(_FINAL_MAIN)
     # Guardar el código ensamblador en archivo
-    with open("codigo.asm", "w") as f:
+    if ruta_asm is not None:
+        escribir_asm(asm_lines, ruta_asm)
+    return asm_lines  # opcionalmente retornamos la lista de líneas ASM
+
+
+def escribir_codigo_maquina_en_flujo(instrucciones, salida):
+    """
+    Como generar_codigo_maquina, pero recorre 'instrucciones' (cualquier iterable, por
+    ejemplo optimizador.optimizar_tac_en_flujo) una sola vez y escribe el ensamblador en el
+    archivo de texto abierto 'salida' sin armar la lista de líneas: cada instrucción se
+    registra y se traduce apenas llega. La cabecera (.data/.bss) depende de todas las
+    variables, así que el código (.text) se guarda en un archivo temporal (en memoria hasta
+    TAMANO_EN_MEMORIA) y se copia a 'salida' después de la cabecera. El resultado es
+    idéntico al de generar_codigo_maquina. Retorna la cantidad de líneas escritas.
+    """
+    datos = _SeccionDatos()
+    pendientes = []
+    lineas_codigo = 0
+    with tempfile.SpooledTemporaryFile(max_size=TAMANO_EN_MEMORIA, mode="w+", encoding="utf-8") as codigo:
+        for instr in instrucciones:
+            datos.registrar(instr)
+            _traducir(instr, datos.string_consts, pendientes)
+            if len(pendientes) >= _LINEAS_POR_ESCRITURA:
+                lineas_codigo += len(pendientes)
+                codigo.writelines(line + "\n" for line in pendientes)
+                pendientes.clear()
+        pendientes.extend(_FINAL_MAIN)
+        lineas_codigo += len(pendientes)
+        codigo.writelines(line + "\n" for line in pendientes)
+        codigo.seek(0)
+        lineas_cabecera = 0
+        for line in datos.cabecera():
+            salida.write(line + "\n")
+            lineas_cabecera += 1
+        shutil.copyfileobj(codigo, salida)
+    return lineas_cabecera + lineas_codigo
+
+
+def escribir_asm(asm_lines, ruta_asm="codigo.asm"):
+    """Escribe las líneas de ensamblador 'asm_lines' en el archivo 'ruta_asm'."""
+    with open(ruta_asm, "w") as f:
         for line in asm_lines:
             f.write(line + "\n")
-    return asm_lines  # opcionalmente retornamos la lista de líneas ASM
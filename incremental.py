@@ -0,0 +1,356 @@
+# incremental.py
+"""
+Análisis léxico y sintáctico incremental para el editor.
+
+AnalisisIncremental conserva, de la versión anterior del texto, los tokens y el AST de cada
+sentencia de primer nivel. Ante una edición:
+
+1. Se ubica el tramo modificado comparando el texto nuevo con el anterior (prefijo y sufijo
+   comunes, comparados por bloques).
+2. Se vuelve a leer y analizar solo el tramo de las sentencias de primer nivel que tocan la
+   edición, con sintactico_descendente.analizar_fragmento. Si el tramo no cierra (la última
+   sentencia queda incompleta o un token cruza el final del tramo) se amplía hacia adelante;
+   si falla en su primer token (un 'else' que ahora pertenece al 'if' anterior) se amplía
+   hacia atrás.
+3. Las sentencias del tramo reemplazan a las anteriores; el resto del programa no se toca.
+
+Los errores son los de un análisis completo del texto, sin importar el orden de las
+ediciones: todos los errores léxicos y luego solo el primer error de sintaxis (el análisis
+completo se detiene ahí; una entrada con error que quedó de una edición anterior, más
+adelante en el texto, no se informa).
+
+Así el costo de actualizar después de una edición pequeña es proporcional al tramo
+reanalizado y no al tamaño del archivo. El AST resultante es el mismo que el de un análisis
+completo (compilador.parsear); ver benchmarks/incremental.py.
+
+Las posiciones de inicio de las sentencias se guardan con un "hueco", como en los editores:
+antes del hueco son absolutas y desde el hueco se cuentan desde el final del texto, de modo
+que una edición no obliga a desplazar las posiciones de todas las sentencias siguientes.
+"""
+import copy
+
+import ast_nodos
+import lexico
+from contexto import registrar_diagnosticos
+from sintactico import p_error
+from sintactico_descendente import analizar_fragmento, FIN
+
+
+class _Ubicacion:
+    """
+    Línea y columna de una posición contando saltos de línea con str.count: sin índice
+    previo, para no recorrer todo el texto en cada edición solo por un mensaje de error.
+    """
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data
+
+    def linea(self, pos):
+        return self.data.count('\n', 0, pos) + 1
+
+    def ubicacion(self, pos):
+        return self.linea(pos), pos - self.data.rfind('\n', 0, pos)
+
+
+class _Tramo:
+    """
+    Lexer acotado a [inicio, fin) de un texto, para analizar_fragmento. Registra los tokens
+    leídos, los mensajes de error léxico (con la posición del token anterior) y si algún
+    token cruza 'fin' (desborde).
+    """
+
+    def __init__(self, motor_lexer, texto, inicio, fin):
+        self.lexer = lexico.nuevo_lexer(motor_lexer)
+        self.lexer.input(texto)
+        self.lexer.lexpos = inicio
+        self.lexer.indice_lineas = _Ubicacion(texto)
+        self.inicio = inicio
+        self.fin = fin
+        self.diagnosticos = []
+        self.tokens = []
+        self.mensajes = []
+        self.desborde = False
+        self.cerrado = False
+
+    def token(self):
+        if self.cerrado:
+            return None
+        antes = len(self.diagnosticos)
+        tok = self.lexer.token()
+        if len(self.diagnosticos) != antes:
+            posicion = self.tokens[-1].lexpos if self.tokens else self.inicio
+            self.mensajes.append((posicion, self.diagnosticos[antes:]))
+        if tok is None or tok.lexpos >= self.fin:
+            self.cerrado = True
+            return None
+        if self.lexer.lexpos > self.fin:
+            self.desborde = self.cerrado = True
+            return None
+        self.tokens.append(tok)
+        return tok
+
+    def analizar(self):
+        """Analiza el tramo: define sentencias, posiciones y error (ver analizar_fragmento)."""
+        # Los diagnósticos se registran (sin imprimir) para asociar cada error léxico a su posición
+        with registrar_diagnosticos(self.diagnosticos, imprimir=False):
+            try:
+                self.sentencias, self.posiciones, self.error = analizar_fragmento(self)
+                self.mensaje_error = None
+            except RecursionError:
+                self.sentencias, self.posiciones, self.error = [], [], True
+                self.mensaje_error = "Error sintáctico: anidamiento demasiado profundo"
+            # Leer el resto del tramo: sus tokens y errores léxicos también son parte del resultado
+            while self.token() is not None:
+                pass
+        return self
+
+    def lexicos(self):
+        """Mensajes de los errores léxicos del tramo."""
+        return [linea for _, texto in self.mensajes for linea in texto]
+
+    def sintaxis(self):
+        """Mensajes del error de sintaxis del tramo (lista vacía si no lo hubo)."""
+        if self.mensaje_error is not None:
+            return [self.mensaje_error]
+        if self.error is None:
+            return []
+        with registrar_diagnosticos([], imprimir=False) as mensajes:
+            p_error(None if self.error is FIN else self.error)
+        return mensajes
+
+
+def _prefijo_comun(a, b):
+    """Largo del prefijo común de 'a' y 'b', comparando bloques cada vez más grandes."""
+    n = min(len(a), len(b))
+    p, bloque = 0, 4096
+    while p < n:
+        q = min(p + bloque, n)
+        if a[p:q] != b[p:q]:
+            # La primera diferencia está en [p, q): búsqueda binaria
+            while q - p > 1:
+                m = (p + q) // 2
+                if a[p:m] == b[p:m]:
+                    p = m
+                else:
+                    q = m
+            return p
+        p = q
+        bloque *= 2
+    return n
+
+
+def _sufijo_comun(a, b, limite):
+    """Largo del sufijo común de 'a' y 'b', sin pasar de 'limite' caracteres."""
+    la, lb = len(a), len(b)
+    s, bloque = 0, 4096
+    while s < limite:
+        t = min(s + bloque, limite)
+        if a[la - t:la - s] != b[lb - t:lb - s]:
+            while t - s > 1:
+                m = (s + t) // 2
+                if a[la - m:la - s] == b[lb - m:lb - s]:
+                    s = m
+                else:
+                    t = m
+            return s
+        s = t
+        bloque *= 2
+    return limite
+
+
+class AnalisisIncremental:
+    """
+    Front end incremental: actualizar(texto) retorna el AST del texto (o None si tiene
+    errores de sintaxis) reanalizando solo lo que cambió desde la llamada anterior.
+    'errores' contiene los mensajes léxicos y sintácticos de la última versión y tokens()
+    entrega sus tokens.
+
+    El programa se divide en entradas, normalmente una por sentencia de primer nivel; un
+    tramo con error de sintaxis se guarda como una sola entrada sin nodo. La entrada k
+    abarca el texto desde su inicio hasta el inicio de la siguiente (la primera, desde 0).
+    """
+
+    def __init__(self, motor_lexer=None):
+        self.motor_lexer = motor_lexer
+        self.texto = ''
+        self.ast = None
+        # Listas paralelas, una posición por entrada
+        self._inicios = []      # inicio de la entrada (ver _inicio: absoluto o desde el final)
+        self._nodos = []        # sentencia, o None si la entrada no tiene una
+        self._tokens = []       # tokens de la entrada, con lexpos relativo a su inicio
+        self._mensajes = []     # mensajes de error léxico de la entrada (lista, posiblemente vacía)
+        self._sintaxis = []     # mensajes del error de sintaxis de la entrada (vacía si no es fallida)
+        self._fallidas = []     # True si la entrada es un tramo con error de sintaxis
+        self._hueco = 0
+        self._n_fallidas = 0
+        self._n_sin_nodo = 0
+        self._n_con_mensajes = 0
+
+    # --- Posiciones ---
+
+    def _inicio(self, k):
+        valor = self._inicios[k]
+        return valor if k < self._hueco else len(self.texto) - valor
+
+    def _inicio_region(self, k):
+        """Inicio del texto que abarca la entrada k (0 si k es la primera o no existe)."""
+        return self._inicio(k) if 0 < k < len(self._inicios) else 0
+
+    def _fin_region(self, k):
+        return self._inicio(k + 1) if k + 1 < len(self._inicios) else len(self.texto)
+
+    def _mover_hueco(self, hueco):
+        """Convierte las posiciones para que las entradas desde 'hueco' se cuenten desde el final."""
+        inicios, largo = self._inicios, len(self.texto)
+        for k in range(self._hueco, hueco):
+            inicios[k] = largo - inicios[k]
+        for k in range(hueco, self._hueco):
+            inicios[k] = largo - inicios[k]
+        self._hueco = hueco
+
+    def _entrada_en(self, pos):
+        """Índice de la entrada cuyo texto contiene la posición 'pos'."""
+        lo, hi = 0, len(self._inicios)
+        while hi - lo > 1:
+            m = (lo + hi) // 2
+            if self._inicio(m) <= pos:
+                lo = m
+            else:
+                hi = m
+        return lo
+
+    # --- Análisis ---
+
+    def actualizar(self, texto):
+        """Actualiza el análisis al nuevo contenido del editor y retorna el AST (o None)."""
+        anterior = self.texto
+        if texto == anterior and self._inicios:
+            return self.ast
+        p = _prefijo_comun(anterior, texto)
+        fin_anterior = len(anterior) - _sufijo_comun(anterior, texto, min(len(anterior), len(texto)) - p)
+        n = len(self._inicios)
+        i = self._entrada_en(p)
+        j = self._entrada_en(max(p, fin_anterior - 1)) if n else -1
+        # Las entradas posteriores a la edición quedan contadas desde el final: no cambian
+        self._mover_hueco(j + 1)
+        self.texto = texto
+        while i > 0 and self._fallidas[i - 1]:
+            i -= 1
+        i, j, tramo = self._reanalizar(i, j)
+        self._reemplazar(i, j, self._entradas(tramo))
+        if len(texto) != len(anterior) and self._n_con_mensajes:
+            self._actualizar_mensajes(self._hueco)
+        self.ast = self._programa()
+        return self.ast
+
+    def _reanalizar(self, i, j):
+        """Analiza las entradas i..j, ampliando el tramo hasta que el resultado no dependa de sus bordes."""
+        ultima = len(self._inicios) - 1
+        while True:
+            tramo = _Tramo(self.motor_lexer, self.texto, self._inicio_region(i), self._fin_region(j)).analizar()
+            ancho = max(1, j - i + 1)
+            if (tramo.desborde or tramo.error is FIN) and j < ultima:
+                j = min(ultima, j + ancho)
+            elif (i > 0 and tramo.error is not None and not tramo.sentencias
+                  and tramo.tokens and tramo.error is tramo.tokens[0]):
+                i = max(0, i - ancho)
+                while i > 0 and self._fallidas[i - 1]:
+                    i -= 1
+            else:
+                return i, j, tramo
+
+    def _entradas(self, tramo):
+        """
+        Entradas (inicio, nodo, tokens, mensajes léxicos, mensajes de sintaxis, fallida) que
+        resultan de un tramo analizado.
+        """
+        if tramo.error is not None:
+            return [(tramo.inicio, None, tramo.tokens, tramo.lexicos(), tramo.sintaxis(), True)]
+        posiciones = tramo.posiciones
+        if not posiciones:
+            mensajes = tramo.lexicos()
+            return [(tramo.inicio, None, tramo.tokens, mensajes, [], False)] if mensajes else []
+        # Repartir tokens y mensajes léxicos según la sentencia en cuyo texto están
+        limites = [tramo.inicio] + posiciones[1:] + [tramo.fin]
+        entradas = []
+        t = m = 0
+        tokens, mensajes = tramo.tokens, tramo.mensajes
+        for k, nodo in enumerate(tramo.sentencias):
+            fin = limites[k + 1]
+            desde = t
+            while t < len(tokens) and tokens[t].lexpos < fin:
+                t += 1
+            propios = []
+            while m < len(mensajes) and mensajes[m][0] < fin:
+                propios.extend(mensajes[m][1])
+                m += 1
+            entradas.append((limites[k], nodo, tokens[desde:t], propios, [], False))
+        return entradas
+
+    def _reemplazar(self, i, j, entradas):
+        """Reemplaza las entradas i..j (posiciones ya absolutas hasta j) por 'entradas'."""
+        viejas = range(i, j + 1)
+        self._n_fallidas += sum(e[5] for e in entradas) - sum(self._fallidas[k] for k in viejas)
+        self._n_sin_nodo += (sum(e[1] is None for e in entradas)
+                             - sum(self._nodos[k] is None for k in viejas))
+        self._n_con_mensajes += (sum(bool(e[3] or e[4]) for e in entradas)
+                                 - sum(bool(self._mensajes[k] or self._sintaxis[k]) for k in viejas))
+        for inicio, _, tokens, _, _, _ in entradas:
+            for tok in tokens:
+                tok.lexpos -= inicio
+        inicios, nodos, tokens, mensajes, sintaxis, fallidas = zip(*entradas) if entradas else ((),) * 6
+        self._inicios[i:j + 1] = inicios
+        self._nodos[i:j + 1] = nodos
+        self._tokens[i:j + 1] = tokens
+        self._mensajes[i:j + 1] = mensajes
+        self._sintaxis[i:j + 1] = sintaxis
+        self._fallidas[i:j + 1] = fallidas
+        self._hueco = i + len(entradas)
+
+    def _actualizar_mensajes(self, desde):
+        """Recalcula los mensajes de las entradas desde 'desde' (sus líneas y posiciones cambiaron)."""
+        for k in range(desde, len(self._inicios)):
+            if self._mensajes[k] or self._sintaxis[k]:
+                tramo = _Tramo(self.motor_lexer, self.texto, self._inicio_region(k), self._fin_region(k)).analizar()
+                self._mensajes[k] = tramo.lexicos()
+                self._sintaxis[k] = tramo.sintaxis()
+
+    def _programa(self):
+        if self._n_fallidas or self._n_sin_nodo == len(self._nodos):
+            return None
+        if self._n_sin_nodo:
+            return ast_nodos.Programa([nodo for nodo in self._nodos if nodo is not None])
+        return ast_nodos.Programa(list(self._nodos))
+
+    # --- Resultados ---
+
+    @property
+    def errores(self):
+        """
+        Mensajes de error de la versión actual del texto: los léxicos, en orden, y el primer
+        error de sintaxis (los de entradas fallidas posteriores no se informan, como en un
+        análisis completo, que se detiene en el primero).
+        """
+        errores = []
+        primera_fallida = []
+        if self._n_con_mensajes:
+            for mensajes, sintaxis in zip(self._mensajes, self._sintaxis):
+                errores.extend(mensajes)
+                if sintaxis and not primera_fallida:
+                    primera_fallida = sintaxis
+        errores.extend(primera_fallida)
+        if not self._n_fallidas and self._n_sin_nodo == len(self._nodos):
+            errores.append("Error en entrada")  # programa vacío, como p_error(None)
+        return errores
+
+    def tokens(self):
+        """Tokens del texto actual (copias con lexpos absoluto y línea/columna)."""
+        indice = lexico.IndiceLineas(self.texto)
+        for k, tokens in enumerate(self._tokens):
+            base = self._inicio(k)
+            for tok in tokens:
+                copia = copy.copy(tok)
+                copia.lexpos += base
+                copia.indice = indice
+                yield copia
@@ -1,6 +1,19 @@
+import time
+
+# Marca de tiempo para medir cuánto tarda el lexer en estar listo desde la importación
+_T_INICIO = time.perf_counter()
+
+import importlib.util
+import os
+import types
+from bisect import bisect_left
+
 import ply.lex as lex
 import ply.ctokens
 
+import cache_tablas
+from contexto import informar
+
 words_reserved = {
     'if': 'IF',
     'else': 'ELSE',
@@ -93,8 +106,165 @@ t_ignore = ' \t\n'
 
 # Manejo de errores
 def t_error(t):
-    print(f"Carácter ilegal: {t.value[0]} en la posición {t.lexpos}")
+    linea, columna = t.lexer.indice_lineas.ubicacion(t.lexpos)
+    informar(f"Carácter ilegal: {t.value[0]} en la posición {t.lexpos} (línea {linea}, columna {columna})")
     t.lexer.skip(1)
 
+
+class IndiceLineas:
+    """
+    Posiciones de los saltos de línea de una entrada, calculadas una sola vez (la primera
+    vez que se pide una línea, así que un análisis sin errores ni consultas de línea no
+    recorre la entrada). La línea y columna de cualquier posición se obtienen con una
+    búsqueda binaria, sin contar saltos de línea token por token.
+    """
+    __slots__ = ('data', '_saltos')
+
+    def __init__(self, data):
+        self.data = data
+        self._saltos = None
+
+    @property
+    def saltos(self):
+        if self._saltos is None:
+            data = self.data
+            saltos = []
+            i = data.find('\n')
+            while i != -1:
+                saltos.append(i)
+                i = data.find('\n', i + 1)
+            self._saltos = saltos
+        return self._saltos
+
+    def linea(self, pos):
+        """Número de línea (desde 1) de la posición 'pos'."""
+        return bisect_left(self.saltos, pos) + 1
+
+    def ubicacion(self, pos):
+        """Tupla (línea, columna), ambas desde 1, de la posición 'pos'."""
+        k = bisect_left(self.saltos, pos)
+        inicio_linea = self.saltos[k - 1] + 1 if k else 0
+        return k + 1, pos - inicio_linea + 1
+
+
+class Token(lex.LexToken):
+    """
+    LexToken cuya línea (lineno) y columna se calculan bajo demanda a partir de su lexpos
+    y del IndiceLineas de la entrada ('indice').
+    """
+
+    @property
+    def lineno(self):
+        return self.indice.linea(self.lexpos)
+
+    @lineno.setter
+    def lineno(self, valor):
+        pass  # La línea siempre se deriva de lexpos; se ignora el contador de PLY
+
+    @property
+    def columna(self):
+        return self.indice.ubicacion(self.lexpos)[1]
+
+
+class LexerUbicado(lex.Lexer):
+    """
+    Lexer de PLY que construye el IndiceLineas en input() y entrega objetos Token. lex.lex()
+    siempre crea un lex.Lexer, así que construir_lexer() pasa su estado a un LexerUbicado.
+    """
+
+    # Lexer.token de PLY con los globales de ply.lex, salvo LexToken: crea cada token como Token
+    _token_ply = types.FunctionType(lex.Lexer.token.__code__, dict(vars(lex), LexToken=Token), 'token')
+
+    def __init__(self, base=None):
+        lex.Lexer.__init__(self)
+        if base is not None:
+            self.__dict__.update(base.__dict__)
+        self.indice_lineas = IndiceLineas('')
+
+    def input(self, s):
+        lex.Lexer.input(self, s)
+        self.indice_lineas = IndiceLineas(s)
+
+    def token(self):
+        tok = self._token_ply()
+        if tok is not None:
+            tok.indice = self.indice_lineas
+        return tok
+
+
+class LexerGrabado:
+    """
+    Entrega tokens ya leídos (por ejemplo, con list(lexer)) con la interfaz token() que usan
+    los parsers. Permite medir el análisis sintáctico por separado del léxico.
+    """
+
+    def __init__(self, tokens):
+        self.siguiente = iter(tokens).__next__
+
+    def token(self):
+        try:
+            return self.siguiente()
+        except StopIteration:
+            return None
+
+
+def _firma_lexer():
+    """Hash de la definición léxica: tokens, palabras reservadas y reglas t_* en orden."""
+    reglas = []
+    for nombre, valor in globals().items():
+        if nombre.startswith('t_'):
+            reglas.append((nombre, valor.__doc__ if callable(valor) else valor))
+    return cache_tablas.firma(lex.__tabversion__, tokens, sorted(words_reserved.items()), reglas)
+
+
+def construir_lexer(forzar=False):
+    """
+    Construye el analizador léxico cargando la tabla precalculada de cache_tablas.DIR_TABLAS
+    (lextab_<hash>.py). Si no existe, o si 'forzar' es True, lo construye validando las
+    reglas con PLY y guarda la tabla para los próximos arranques.
+    """
+    firma = _firma_lexer()
+    ruta = cache_tablas.ruta_tabla('lextab', firma, '.py')
+    if not forzar and os.path.exists(ruta):
+        spec = importlib.util.spec_from_file_location(f'lextab_{firma}', ruta)
+        lextab = importlib.util.module_from_spec(spec)
+        try:
+            spec.loader.exec_module(lextab)
+            return LexerUbicado(lex.lex(optimize=True, lextab=lextab))
+        except Exception:
+            pass  # Tabla corrupta o de otra versión de PLY: reconstruir
+    nuevo_lexer = LexerUbicado(lex.lex())
+    if cache_tablas.preparar_directorio():
+        nombre_tmp = f'lextab_{firma}_{os.getpid()}'
+        try:
+            nuevo_lexer.writetab(nombre_tmp, cache_tablas.DIR_TABLAS)
+        except OSError:
+            return nuevo_lexer
+        cache_tablas.publicar(os.path.join(cache_tablas.DIR_TABLAS, nombre_tmp + '.py'), ruta, 'lextab')
+    return nuevo_lexer
+
+
 # Construir el analizador léxico
-lexer = lex.lex()
+lexer = construir_lexer()
+
+# Tiempo (en segundos) desde la importación hasta tener el lexer listo
+TIEMPO_CARGA = time.perf_counter() - _T_INICIO
+
+# Motores léxicos disponibles: 'ply' (ply.lex) o 'regex' (expresión maestra, ver lexico_regex.py).
+# El motor por defecto se puede elegir con la variable de entorno COMPILADOR_LEXER.
+MOTORES_LEXER = ('ply', 'regex')
+MOTOR_LEXER = os.environ.get('COMPILADOR_LEXER', 'ply')
+
+
+def nuevo_lexer(motor=None):
+    """
+    Retorna un lexer independiente (con su propio estado) del motor indicado,
+    o de MOTOR_LEXER si no se indica.
+    """
+    motor = motor or MOTOR_LEXER
+    if motor == 'regex':
+        from lexico_regex import LexerRegex
+        return LexerRegex()
+    if motor != 'ply':
+        raise ValueError(f"Motor léxico desconocido: {motor} (opciones: {', '.join(MOTORES_LEXER)})")
+    return lexer.clone()
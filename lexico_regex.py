@@ -0,0 +1,142 @@
+# lexico_regex.py
+"""
+Motor léxico alternativo a ply.lex para el mismo conjunto de tokens de lexico.py.
+
+Todas las reglas t_* se combinan en una única expresión regular precompilada con grupos
+con nombre (en el mismo orden de prioridad que usa PLY: primero las reglas definidas como
+función, en orden de definición, y luego las cadenas de mayor a menor longitud). Las palabras
+reservadas se resuelven con una búsqueda directa en words_reserved.
+
+LexerRegex expone la misma interfaz que usa el parser de PLY (input, token, iteración,
+clone, lineno, lexpos), así que puede pasarse a parser.parse(codigo, lexer=...).
+"""
+import re
+
+import lexico
+from contexto import informar
+from lexico import IndiceLineas, Token
+
+
+def _reglas_en_orden():
+    """Retorna [(nombre_token, regex)] en el orden de prioridad de PLY."""
+    funciones = []
+    cadenas = []
+    for nombre, valor in vars(lexico).items():
+        if not nombre.startswith('t_') or nombre in ('t_error', 't_ignore'):
+            continue
+        if callable(valor):
+            funciones.append((valor.__code__.co_firstlineno, nombre[2:], valor.__doc__))
+        else:
+            cadenas.append((nombre[2:], valor))
+    funciones.sort()
+    cadenas.sort(key=lambda regla: len(regla[1]), reverse=True)
+    return [(tipo, regex) for _, tipo, regex in funciones] + cadenas
+
+
+def _literal(regex):
+    """Si 'regex' solo reconoce un texto fijo (p.ej. el de t_INCREMENT), retorna ese texto; si no, None."""
+    if re.search(r'[.^$*+?{}\[\]|()]', re.sub(r'\\.', '', regex)):
+        return None
+    texto = re.sub(r'\\(.)', r'\1', regex)
+    return texto if re.fullmatch(regex, texto, re.VERBOSE) else None
+
+
+def _construir_expresion():
+    """
+    Construye la expresión maestra. Las reglas que reconocen un texto fijo (operadores y
+    signos de puntuación) se agrupan en un único grupo OPERADOR, en el mismo orden, y su tipo
+    se obtiene luego con un diccionario lexema -> tipo.
+    """
+    grupos = []
+    operadores = []
+    tipos_operador = {}
+    for tipo, regex in _reglas_en_orden():
+        texto = _literal(regex)
+        if texto is None:
+            grupos.append(f'(?P<{tipo}>{regex})')
+        elif texto not in tipos_operador:
+            operadores.append(regex)
+            tipos_operador[texto] = tipo
+    if operadores:
+        grupos.append('(?P<OPERADOR>' + '|'.join(operadores) + ')')
+    # Saltar los caracteres de t_ignore antes del token (re.VERBOSE igual que ply.lex)
+    ignorar = '[' + ''.join(re.escape(c) for c in lexico.t_ignore) + ']*'
+    return (re.compile(ignorar + '(?:' + '|'.join(grupos) + ')', re.VERBOSE),
+            re.compile(ignorar, re.VERBOSE),
+            tipos_operador)
+
+
+_MASTER_RE, _IGNORAR_RE, _TIPOS_OPERADOR = _construir_expresion()
+
+_RESERVADAS = lexico.words_reserved
+
+# Conversión del lexema al valor del token (equivalente a lo que hacen las funciones t_* de lexico)
+_CONVERSIONES = {
+    'FLOAT': float,
+    'NUMBER': int,
+    'STRING_LITERAL': lambda texto: texto[1:-1],
+}
+
+
+class LexerRegex:
+    """Lexer de una sola pasada basado en la expresión maestra _MASTER_RE."""
+
+    def __init__(self):
+        self.lexdata = ''
+        self.lexpos = 0
+        self.lexlen = 0
+        self.lineno = 1
+        self.indice_lineas = IndiceLineas('')
+
+    def input(self, data):
+        self.lexdata = data
+        self.lexpos = 0
+        self.lexlen = len(data)
+        self.indice_lineas = IndiceLineas(data)
+
+    def clone(self):
+        return LexerRegex()
+
+    def token(self):
+        """Retorna el siguiente token (lexico.Token) o None al final de la entrada."""
+        data = self.lexdata
+        pos = self.lexpos
+        n = self.lexlen
+        while pos < n:
+            m = _MASTER_RE.match(data, pos)
+            if m is None:
+                pos = _IGNORAR_RE.match(data, pos).end()
+                if pos >= n:
+                    break
+                # Mismo comportamiento que lexico.t_error: reportar y saltar un carácter
+                linea, columna = self.indice_lineas.ubicacion(pos)
+                informar(f"Carácter ilegal: {data[pos]} en la posición {pos} (línea {linea}, columna {columna})")
+                pos += 1
+                continue
+            tipo = m.lastgroup
+            inicio = m.start(tipo)
+            valor = m.group(tipo)
+            if tipo == 'OPERADOR':
+                tipo = _TIPOS_OPERADOR[valor]
+            elif tipo == 'ID':
+                tipo = _RESERVADAS.get(valor, 'ID')
+            elif tipo in _CONVERSIONES:
+                valor = _CONVERSIONES[tipo](valor)
+            tok = Token()
+            tok.type = tipo
+            tok.value = valor
+            tok.lexpos = inicio
+            tok.indice = self.indice_lineas
+            self.lexpos = m.end()
+            return tok
+        self.lexpos = pos
+        return None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        tok = self.token()
+        if tok is None:
+            raise StopIteration
+        return tok
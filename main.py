@@ -1,22 +1,42 @@
+import time
+
+# Marca de tiempo tomada antes de las importaciones, para medir el arranque (--medir-arranque)
+_T_INICIO = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk
 from tkinter import scrolledtext
 import tkinter.messagebox as msgbox
 
-import semantico
-from lexico import lexer
-from sintactico import parser
-import diagram as dg
-import generador_codigo as gc
+import sys
+from tareas import INTERVALO_GIL, Despachador
 
-import optimizador
-import generador_nasm
-import subprocess
+# El pipeline (sesion, compilador), graphviz (diagram), PIL (generador_codigo), asyncio
+# (ejecucion) y el perfil se importan en la función que los usa, la primera vez que se
+# usan: así la ventana aparece sin esperar a cargarlos (benchmarks/arranque.py lo comprueba)
 
 
 # Diccionario para la tabla de símbolos
 tabla_simbolos = {}
 
+# Resultados de cada fase para el código del editor: cada botón reanaliza solo lo editado
+# y reutiliza las fases que ya calculó otro botón (ver sesion.py). La crea analizar_codigo()
+sesion = None
+
+# Las fases, graphviz, nasm/gcc y el ejecutable corren en el hilo del despachador; la
+# sesión solo se usa desde ese hilo y los widgets solo desde el de la interfaz (ver tareas.py)
+despachador = Despachador()
+sys.setswitchinterval(INTERVALO_GIL)
+
+# Milisegundos entre entregas de resultados a la interfaz (unos 60 cuadros por segundo)
+INTERVALO_SONDEO = 16
+
+# Límites de "Compilar y Ejecutar": segundos de reloj de nasm, gcc y el programa, segundos
+# de CPU del programa (solo en sistemas POSIX) y bytes de salida de cada flujo que se muestran
+LIMITE_TIEMPO = 10
+LIMITE_CPU = 5
+LIMITE_SALIDA = 1 << 20
+
 
 def agregar_a_tabla(token, tipo, valor=None):
     """
@@ -25,6 +45,29 @@ def agregar_a_tabla(token, tipo, valor=None):
     tabla_simbolos[token] = {"tipo": tipo}
 
 
+def codigo_editor():
+    """Texto actual del editor (se lee en el hilo de la interfaz, antes de enviar el trabajo)."""
+    return editor.get("1.0", "end-1c")
+
+
+def analizar_codigo(codigo):
+    """
+    Retorna el AST de 'codigo' (None si tiene errores de sintaxis), reanalizando solo las
+    sentencias que cambiaron desde el último análisis. Los errores se muestran en la
+    consola, como al llamar al parser. Se ejecuta en el hilo del despachador; la primera
+    vez importa el pipeline y crea la sesión, que después usan las demás fases.
+    """
+    global sesion
+    if sesion is None:
+        import sesion as sesion_compilacion
+        sesion = sesion_compilacion.SesionCompilacion()
+    sesion.actualizar(codigo)
+    ast = sesion.ast()
+    for mensaje in sesion.errores_sintacticos:
+        print(mensaje)
+    return ast
+
+
 def limpiar_resultados():
     """
         limpiar toda la pantalla
@@ -44,48 +87,67 @@ def realizar_analisis_lexico():
     """
     Realiza el análisis léxico del código ingresado en el editor.
     """
-    codigo = editor.get("1.0", tk.END).strip()
-    lexer.input(codigo)
-    resultado_tokens.delete("1.0", tk.END)
-    tabla_simbolos.clear()
-    # Limpiar la tabla
-    for item in tree_tabla_simbolos.get_children():
-        tree_tabla_simbolos.delete(item)
-    resultado_tokens.insert(tk.END, "--- Tokens ---\n")
-    for token in lexer:
-        resultado_tokens.insert(tk.END, f"{token}\n")
-        agregar_a_tabla(token.value, token.type)
-    # Actualizar la tabla de símbolos
-    actualizar_tabla_simbolos()
+    codigo = codigo_editor()
+
+    def trabajo(tarea):
+        analizar_codigo(codigo)
+        return list(sesion.tokens())
+
+    def mostrar(tokens):
+        resultado_tokens.delete("1.0", tk.END)
+        tabla_simbolos.clear()
+        # Limpiar la tabla
+        for item in tree_tabla_simbolos.get_children():
+            tree_tabla_simbolos.delete(item)
+        resultado_tokens.insert(tk.END, "--- Tokens ---\n")
+        resultado_tokens.insert(tk.END, "".join(f"{token}\n" for token in tokens))
+        for token in tokens:
+            agregar_a_tabla(token.value, token.type)
+        # Actualizar la tabla de símbolos
+        actualizar_tabla_simbolos()
+
+    despachador.enviar("lexico", trabajo, mostrar)
 
 
 def realizar_analisis_sintactico():
-    codigo = editor.get("1.0", tk.END).strip()
     resultado_arbol.delete("1.0", tk.END)
     resultado_errores.delete("1.0", tk.END)  # limpiar el panel de errores al iniciar
-
-    try:
-        resultado = parser.parse(codigo)  # Generar AST a partir del código
-    except Exception as e:
-        # Si hay error sintáctico, se muestra en el área de árbol y se aborta
+    codigo = codigo_editor()
+
+    def trabajo(tarea):
+        resultado = analizar_codigo(codigo)  # Generar AST a partir del código
+        tarea.comprobar()
+        # Analizar semánticamente el AST y obtener lista de errores (si los hay)
+        tabla, errores_sem = sesion.semantica()
+        if errores_sem:
+            return tabla, errores_sem, None, None
+        tarea.comprobar()
+        import diagram as dg
+        # El texto y el diagrama del árbol también se arman en este hilo: en programas grandes tardan
+        return tabla, errores_sem, str(resultado), dg.dibujar_arbol_completo(resultado)
+
+    def mostrar(resultados):
+        tabla, errores_sem, texto_arbol, dot = resultados
+        tabla_simbolos.update({nombre: dict(datos) for nombre, datos in tabla.items()})
+        if errores_sem:
+            # Poblar el panel de errores con los mensajes
+            resultado_errores.insert(tk.END, "--- Errores Semánticos ---\n")
+            for err in errores_sem:
+                resultado_errores.insert(tk.END, err + "\n")
+            # No continuar con generación de árbol si hubo errores
+            return
+        # Si no hubo errores semánticos, mostrar el AST en texto
+        resultado_arbol.insert(tk.END, f"--- Árbol Sintáctico ---\n{texto_arbol}\n")
+        # Generar y mostrar visualmente el árbol sintáctico (graphviz lanza 'dot' y el visor)
+        despachador.enviar("diagrama", lambda tarea: dot.render("Arbol_Sintactico", format="png", view=True),
+                           lambda ruta: None,
+                           lambda e: msgbox.showerror("Árbol Sintáctico", f"No se pudo dibujar el árbol: {e}"))
+
+    def fallar(e):
+        # Si hay error sintáctico, se muestra en el área de árbol
         resultado_arbol.insert(tk.END, f"Error en análisis sintáctico: {e}")
-        return
 
-    # Analizar semánticamente el AST y obtener lista de errores (si los hay)
-    errores_sem = semantico.analizar_semantica(resultado, tabla_simbolos)
-    if errores_sem:
-        # Poblar el panel de errores con los mensajes
-        resultado_errores.insert(tk.END, "--- Errores Semánticos ---\n")
-        for err in errores_sem:
-            resultado_errores.insert(tk.END, err + "\n")
-        # No continuar con generación de árbol si hubo errores
-        return
-
-    # Si no hubo errores semánticos, mostrar el AST en texto
-    resultado_arbol.insert(tk.END, f"--- Árbol Sintáctico ---\n{resultado}\n")
-    # Generar y mostrar visualmente el árbol sintáctico
-    dot = dg.dibujar_arbol_completo(resultado)
-    dot.render("Arbol_Sintactico", format="png", view=True)
+    despachador.enviar("sintactico", trabajo, mostrar, fallar)
 
 
 
@@ -101,115 +163,237 @@ def realizar_generador_codigo_intermedio():
     Esta función se invoca cuando el usuario hace clic en el botón "Generar Código Intermedio".
     Llama al generador de código intermedio, que genera TAC y SSA, y muestra los resultados en una ventana emergente.
     """
-    codigo = editor.get("1.0", tk.END).strip()
     resultado_arbol.delete("1.0", tk.END)
     # Verificar si hay errores semánticos pendientes
     if resultado_errores.get("1.0", "end-1c").strip() != "":
         # Abortamos la generación de código lanzando una excepción controlada
         msgbox.showerror("Errores Semánticos", "Existen errores semánticos sin resolver.")
         return
-    try:
+    codigo = codigo_editor()
+
+    def trabajo(tarea):
         # Reutilizar el parser para obtener/validar el AST
-        resultado = parser.parse(codigo)
-        # Generar código intermedio solo si no hubo errores
-        gc.generar_codigo_intermedio(resultado)
-    except Exception as e:
+        resultado = analizar_codigo(codigo)
+        tarea.comprobar()
+        return resultado, sesion.tac(), sesion.ssa()
+
+    def mostrar(resultados):
+        try:
+            import generador_codigo as gc
+            # Generar código intermedio solo si no hubo errores (abre una ventana: hilo de la interfaz)
+            gc.generar_codigo_intermedio(*resultados)
+        except Exception as e:
+            fallar(e)
+
+    def fallar(e):
         resultado_arbol.insert(tk.END, f"Error al generar código intermedio: {e}\n")
 
+    despachador.enviar("intermedio", trabajo, mostrar, fallar)
+
 def realizar_optimizacion():
     """
     Cuando el usuario hace clic en "Optimizar Código".
     Genera el TAC optimizado y lo muestra en una ventana nueva.
     """
-    codigo_fuente = editor.get("1.0", tk.END).strip()
     # Verificar que no hayan errores semánticos pendientes antes de compilar
     if resultado_errores.get("1.0", "end-1c").strip() != "":
         msgbox.showerror("Errores presentes", "Por favor corregí los errores antes de optimizar.")
         return
-    try:
-        ast = parser.parse(codigo_fuente)
-    except Exception as e:
-        msgbox.showerror("Error de Sintaxis", f"No se pudo generar AST: {e}")
-        return
-    # Generar TAC y optimizarlo
-    lista_TAC = gc._generar_TAC_desde_AST(ast)
-    lista_opt = optimizador.optimizar_tac(lista_TAC)
-    # Mostrar TAC optimizado en una ventana emergente
-    ventana_opt = tk.Toplevel()
-    ventana_opt.title("Código TAC Optimizado")
-    text_opt = scrolledtext.ScrolledText(ventana_opt, width=80, height=20)
-    text_opt.pack(fill=tk.BOTH, expand=True)
-    text_opt.insert(tk.END, "--- Código Intermedio Optimizado ---\n")
-    for instr in lista_opt:
-        text_opt.insert(tk.END, instr + "\n")
-    # Guardar TAC optimizado a archivo (opcional)
-    with open("codigo_opt.txt", "w") as f:
-        for instr in lista_opt:
-            f.write(instr + "\n")
+    codigo = codigo_editor()
+
+    def trabajo(tarea):
+        analizar_codigo(codigo)
+        tarea.comprobar()
+        # TAC optimizado (la sesión reutiliza el TAC si ya se generó para este código)
+        lista_opt = sesion.tac_opt()
+        # Guardar TAC optimizado a archivo (opcional)
+        with open("codigo_opt.txt", "w") as f:
+            for instr in lista_opt:
+                f.write(instr + "\n")
+        return lista_opt
+
+    def mostrar(lista_opt):
+        # Mostrar TAC optimizado en una ventana emergente
+        ventana_opt = tk.Toplevel()
+        ventana_opt.title("Código TAC Optimizado")
+        text_opt = scrolledtext.ScrolledText(ventana_opt, width=80, height=20)
+        text_opt.pack(fill=tk.BOTH, expand=True)
+        text_opt.insert(tk.END, "--- Código Intermedio Optimizado ---\n")
+        text_opt.insert(tk.END, "".join(instr + "\n" for instr in lista_opt))
+
+    despachador.enviar("optimizacion", trabajo, mostrar,
+                       lambda e: msgbox.showerror("Error de Sintaxis", f"No se pudo generar AST: {e}"))
 
 def realizar_generar_codigo_maquina():
     """
     Cuando el usuario hace clic en "Generar Código de Máquina".
     Genera el archivo ensamblador NASM (.asm) a partir del código fuente.
     """
-    codigo_fuente = editor.get("1.0", tk.END).strip()
     if resultado_errores.get("1.0", "end-1c").strip() != "":
         msgbox.showerror("Errores presentes", "Corregí los errores antes de generar el ensamblador.")
         return
-    try:
-        ast = parser.parse(codigo_fuente)
-    except Exception as e:
-        msgbox.showerror("Error de Sintaxis", f"Parsing falló: {e}")
-        return
-    lista_TAC = gc._generar_TAC_desde_AST(ast)
-    lista_opt = optimizador.optimizar_tac(lista_TAC)
-    generador_nasm.generar_codigo_maquina(lista_opt)  # Esto crea el archivo codigo.asm
-    msgbox.showinfo("Código de Máquina", "Archivo 'codigo.asm' generado con éxito.")
+    codigo = codigo_editor()
+
+    def trabajo(tarea):
+        analizar_codigo(codigo)
+        tarea.comprobar()
+        import generador_nasm
+        generador_nasm.escribir_asm(sesion.asm())  # Esto crea el archivo codigo.asm
+
+    despachador.enviar("maquina", trabajo,
+                       lambda _: msgbox.showinfo("Código de Máquina", "Archivo 'codigo.asm' generado con éxito."),
+                       lambda e: msgbox.showerror("Error de Sintaxis", f"Parsing falló: {e}"))
 
 def realizar_compilar_ejecutable():
     """
     Cuando el usuario hace clic en "Compilar y Ejecutar .EXE".
-    Ensambla el código, linkea el ejecutable y lo ejecuta.
+    Ensambla el código, linkea el ejecutable y lo ejecuta, mostrando la salida de nasm, gcc
+    y el programa en "Salida del Programa" a medida que llega. Cada proceso se detiene al
+    superar LIMITE_TIEMPO (y el programa, LIMITE_CPU); con "Cancelar" se detiene enseguida.
     """
-    codigo_fuente = editor.get("1.0", tk.END).strip()
     if resultado_errores.get("1.0", "end-1c").strip() != "":
         msgbox.showerror("Errores presentes", "Hay errores semánticos; no se puede compilar.")
         return
+    codigo = codigo_editor()
+    resultado_salida.delete("1.0", tk.END)
+
+    async def compilar_y_ejecutar(tarea):
+        """Retorna (título, mensaje, es un error) para la ventana final."""
+        import ejecucion
+        etapas = [
+            # crear archivo .obj del programa
+            ("nasm", ["nasm",
+                      "-f",
+                      "win32",
+                      r"C:\Users\monje\PycharmProjects\p1-copiler\codigo.asm",
+                      "-o",
+                      r"C:\Users\monje\PycharmProjects\p1-copiler\codigo.obj"], None),
+            # crear el programa .exe
+            ("gcc", ["gcc",
+                     "-m32",
+                     r"C:\Users\monje\PycharmProjects\p1-copiler\codigo.obj",
+                     "-o",
+                     r"C:\Users\monje\PycharmProjects\p1-copiler\programa.exe"], None),
+            # Ejecutar el .exe resultante
+            ("programa", [r"C:\Users\monje\PycharmProjects\p1-copiler\programa.exe"], LIMITE_CPU),
+        ]
+        for etapa, args, limite_cpu in etapas:
+            tarea.avisar(f"--- {etapa} ---\n")
+            try:
+                resultado = await ejecucion.ejecutar(args, lambda texto, flujo: tarea.avisar(texto),
+                                                     LIMITE_TIEMPO, limite_cpu, LIMITE_SALIDA)
+            except OSError as e:
+                resultado = None
+                descripcion = str(e)
+            else:
+                descripcion = resultado.describir(LIMITE_TIEMPO, limite_cpu)
+                if resultado.truncada:
+                    tarea.avisar(f"[salida truncada a {LIMITE_SALIDA} bytes]\n")
+                tarea.avisar(f"[{descripcion}]\n")
+            if resultado is None or not resultado.exitoso:
+                if etapa == "programa":
+                    return "Error al ejecutar", f"No se pudo ejecutar el .exe: {descripcion}", True
+                return "Error de Compilación", f"Ocurrió un error al compilar ({etapa}): {descripcion}", True
+        return "Ejecución", f"El programa se ejecutó exitosamente ({descripcion}).", False
+
+    def trabajo(tarea):
+        analizar_codigo(codigo)
+        tarea.comprobar()
+        import generador_nasm
+        # Escribir el código ensamblador (TAC optimizado y ASM salen de la sesión)
+        generador_nasm.escribir_asm(sesion.asm())
+        return tarea.esperar(compilar_y_ejecutar(tarea))
+
+    def mostrar_salida(texto):
+        resultado_salida.insert(tk.END, texto)
+        resultado_salida.see(tk.END)
+
+    def mostrar(resultado):
+        titulo, mensaje, es_error = resultado
+        if es_error:
+            msgbox.showerror(titulo, mensaje)
+        else:
+            msgbox.showinfo(titulo, mensaje)
+
+    despachador.enviar("ejecutable", trabajo, mostrar,
+                       lambda e: msgbox.showerror("Error de Sintaxis", f"Parsing falló: {e}"),
+                       mostrar_salida)
+
+def realizar_perfil():
+    """
+    Cuando el usuario hace clic en "Perfil".
+    Compila el código del editor midiendo cada fase (tiempo, memoria pico y cantidades),
+    muestra el informe en una ventana nueva y lo guarda en 'perfil.json'.
+    """
+    codigo = codigo_editor()
+
+    def trabajo(tarea):
+        import compilador
+        from perfil import Perfil
+        perfil = Perfil()
+        resultado = compilador.compilar_codigo(codigo, perfil=perfil)
+        with open("perfil.json", "w", encoding="utf-8") as f:
+            f.write(perfil.a_json())
+        return perfil, resultado["errores"]
+
+    def mostrar(resultados):
+        perfil, errores = resultados
+        ventana_perfil = tk.Toplevel()
+        ventana_perfil.title("Perfil de Compilación")
+        text_perfil = scrolledtext.ScrolledText(ventana_perfil, width=100, height=15, font=("Consolas", 10))
+        text_perfil.pack(fill=tk.BOTH, expand=True)
+        text_perfil.insert(tk.END, perfil.tabla() + "\n")
+        for err in errores:
+            text_perfil.insert(tk.END, f"Error: {err}\n")
+
+    despachador.enviar("perfil", trabajo, mostrar)
+
+def cancelar_trabajos():
+    """
+    Cuando el usuario hace clic en "Cancelar".
+    Cancela los trabajos en curso (y detiene el programa en ejecución); sus resultados se descartan.
+    """
+    if "ejecutable" in despachador.cancelar():
+        resultado_salida.insert(tk.END, "[ejecución cancelada]\n")
+        resultado_salida.see(tk.END)
+
+def al_editar(evento):
+    """
+    Cada vez que cambia el texto del editor: los resultados de los trabajos en curso
+    corresponden a un código anterior, así que se cancelan y se descartan. El programa en
+    ejecución sigue corriendo (se detiene con "Cancelar").
+    """
+    if editor.edit_modified():
+        despachador.cancelar(excepto=("ejecutable",))
+        editor.edit_modified(False)
+
+def sondear_trabajos():
+    """
+    Entrega a la interfaz los resultados de los trabajos terminados y actualiza el estado.
+    Se reprograma con ventana.after, así que la ventana nunca espera a una compilación.
+    """
     try:
-        ast = parser.parse(codigo_fuente)
-    except Exception as e:
-        msgbox.showerror("Error de Sintaxis", f"Parsing falló: {e}")
-        return
-    # Generar TAC optimizado y código ensamblador
-    lista_TAC = gc._generar_TAC_desde_AST(ast)
-    lista_opt = optimizador.optimizar_tac(lista_TAC)
-    generador_nasm.generar_codigo_maquina(lista_opt)
-    # Llamar a NASM y GCC para producir el .exe
-    try:
-        # crear archivo .obj del programa
-        resultado1 = subprocess.run(["nasm",
-                                     "-f",
-                                     "win32",
-                                     r"C:\Users\monje\PycharmProjects\p1-copiler\codigo.asm",
-                                     "-o",
-                                     r"C:\Users\monje\PycharmProjects\p1-copiler\codigo.obj"],
-                                    check=True)
-        # crear el programa .exe
-        resultado2 = subprocess.run(["gcc",
-                                     "-m32",
-                                     r"C:\Users\monje\PycharmProjects\p1-copiler\codigo.obj",
-                                     "-o",
-                                     r"C:\Users\monje\PycharmProjects\p1-copiler\programa.exe"],
-                                    check=True)
-    except Exception as e:
-        msgbox.showerror("Error de Compilación", f"Ocurrió un error al compilar: {e}")
-        return
-    # Ejecutar el .exe resultante
-    try:
-        subprocess.run([r"C:\Users\monje\PycharmProjects\p1-copiler\programa.exe"], check=True)
-        msgbox.showinfo("Ejecución", "El programa se ejecutó exitosamente.")
-    except Exception as e:
-        msgbox.showerror("Error al ejecutar", f"No se pudo ejecutar el .exe: {e}")
+        despachador.sondear()
+    finally:
+        # Aunque una respuesta falle (Tk informa la excepción), la entrega sigue programada
+        etiqueta_estado.config(text="Trabajando..." if despachador.ocupado else "")
+        ventana.after(INTERVALO_SONDEO, sondear_trabajos)
+
+
+
+def precargar():
+    """
+    Una vez dibujada la ventana, importa el pipeline y crea la sesión en el hilo del
+    despachador, para que el primer botón no tenga que esperarlos.
+    """
+    despachador.enviar("precarga", lambda tarea: analizar_codigo(""), lambda ast: None)
+
+def informar_arranque():
+    """Con --medir-arranque: imprime el tiempo hasta el primer dibujado de la ventana y la cierra."""
+    ventana.update_idletasks()
+    print(f"Primer dibujado en {(time.perf_counter() - _T_INICIO) * 1000:.1f} ms", flush=True)
+    ventana.destroy()
+
 
 
 # Crear la ventana principal
@@ -234,6 +418,10 @@ frame_editor.pack(fill=tk.BOTH, expand=True)
 editor = tk.Text(frame_editor, height=25, width=60, bg="#1e1e1e", fg="#d4d4d4",
                  insertbackground="#d4d4d4", font=("Consolas", 12), undo=True, wrap="none")
 editor.pack(fill=tk.BOTH, expand=True)
+editor.bind("<<Modified>>", al_editar)
+# Teclas, clics y movimientos: la recolección del despachador espera a que la interfaz esté inactiva
+for secuencia in ("<Key>", "<Button>", "<Motion>", "<MouseWheel>"):
+    ventana.bind_all(secuencia, lambda evento: despachador.actividad(), add="+")
 
 # Nueva sección de Errores Semánticos
 tk.Label(frame_izquierdo, text="Errores Semánticos", bg="#1e1e1e", fg="#d4d4d4",
@@ -285,6 +473,16 @@ btn_exe = tk.Button(frame_botones, text="Compilar y Ejecutar .EXE", command=real
                     bg="#007acc", fg="white", font=("Consolas", 10))
 btn_exe.pack(side=tk.LEFT, padx=5)
 
+# perfil
+btn_perfil = tk.Button(frame_botones, text="Perfil", command=realizar_perfil,
+                       bg="#007acc", fg="white", font=("Consolas", 10))
+btn_perfil.pack(side=tk.LEFT, padx=5)
+
+# cancelar
+btn_cancelar = tk.Button(frame_botones, text="Cancelar", command=cancelar_trabajos,
+                         bg="#007acc", fg="white", font=("Consolas", 10))
+btn_cancelar.pack(side=tk.LEFT, padx=5)
+
 
 # btn_cls
 btn_sintactico = tk.Button(frame_botones, text="clear", command=limpiar_resultados,
@@ -296,6 +494,10 @@ btn_salir = tk.Button(frame_botones, text="Salir", command=ventana.quit, bg="#f1
                       font=("Consolas", 10))
 btn_salir.pack(side=tk.RIGHT, padx=5)
 
+# Estado de los trabajos en segundo plano
+etiqueta_estado = tk.Label(frame_botones, text="", bg="#1e1e1e", fg="#d4d4d4", font=("Consolas", 10))
+etiqueta_estado.pack(side=tk.RIGHT, padx=5)
+
 # Marco derecho (resultados y tabla de símbolos)
 frame_derecho = tk.Frame(frame_principal, bg="#1e1e1e")
 frame_derecho.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -311,6 +513,12 @@ tk.Label(frame_derecho, text="Resultado Árbol Sintáctico", bg="#1e1e1e", fg="#
 resultado_arbol = scrolledtext.ScrolledText(frame_derecho, height=8, bg="#252526", fg="#d4d4d4", font=("Consolas", 12))
 resultado_arbol.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
 
+# Área de resultados (salida del programa ejecutado)
+tk.Label(frame_derecho, text="Salida del Programa", bg="#1e1e1e", fg="#d4d4d4", font=("Consolas", 14)).pack(
+    anchor="w")
+resultado_salida = scrolledtext.ScrolledText(frame_derecho, height=8, bg="#252526", fg="#d4d4d4", font=("Consolas", 12))
+resultado_salida.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+
 # Tabla de símbolos
 tk.Label(frame_derecho, text="Tabla de Símbolos", bg="#1e1e1e", fg="#d4d4d4", font=("Consolas", 14)).pack(anchor="w")
 tree_tabla_simbolos = ttk.Treeview(frame_derecho, columns=("Símbolo", "Tipo"), show="headings", height=10)
@@ -325,5 +533,11 @@ style.configure("Treeview", background="#252526", foreground="#d4d4d4", fieldbac
                 font=("Consolas", 12))
 style.map("Treeview", background=[("selected", "#007acc")], foreground=[("selected", "white")])
 
-# Iniciar la ventana
+# Iniciar la ventana (y la entrega de resultados de los trabajos en segundo plano)
+ventana.after(INTERVALO_SONDEO, sondear_trabajos)
+if "--medir-arranque" in sys.argv:
+    ventana.after_idle(informar_arranque)
+ventana.after_idle(precargar)
 ventana.mainloop()
+# Al salir se terminan nasm, gcc o el programa si siguen corriendo; el hilo trabajador no retiene el proceso
+despachador.cancelar()
@@ -1,5 +1,8 @@
 # optimizador.py
-def optimizar_tac(lista_tac):
+from traza import tramo
+
+
+def optimizar_tac(lista_tac, ctx=None):
     """
     Aplica optimizaciones básicas a una lista de instrucciones TAC:
     - Elimina asignaciones redundantes (ej: x = x).
@@ -7,9 +10,37 @@ def optimizar_tac(lista_tac):
     - Simplifica saltos incondicionales innecesarios (goto a la siguiente línea).
     - Remueve etiquetas de salto no utilizadas.
     Devuelve una nueva lista optimizada de instrucciones TAC.
+    Si se indica un ContextoCompilacion 'ctx', el resultado también queda en ctx.tac_opt
+    y, si ctx.traza no es None, cada pasada se registra como un tramo de la traza.
     """
-    tac_opt = []
     # 1. Recorrer TAC original y optimizar localmente
+    with tramo(ctx, "plegado local", "optimizador"):
+        tac_opt = _optimizar_local(lista_tac)
+    # 2. Remover saltos goto redundantes que van a la siguiente instrucción
+    with tramo(ctx, "eliminar goto", "optimizador"):
+        tac_final = _eliminar_gotos(tac_opt)
+    # 3. Eliminar etiquetas no utilizadas
+    with tramo(ctx, "eliminar etiquetas", "optimizador"):
+        tac_final_2 = _eliminar_etiquetas(tac_final)
+    if ctx is not None:
+        ctx.tac_opt = tac_final_2
+    return tac_final_2
+
+
+def optimizar_tac_en_flujo(tramos_tac):
+    """
+    Generador con las mismas instrucciones que optimizar_tac, para el TAC entregado en
+    tramos (listas de instrucciones) por generador_codigo.generar_TAC_en_flujo. Cada tramo
+    es una sentencia de primer nivel: ningún salto sale de él, así que las tres pasadas se
+    aplican tramo por tramo y en memoria solo está el tramo actual.
+    """
+    for tramo_tac in tramos_tac:
+        yield from _eliminar_etiquetas(_eliminar_gotos(_optimizar_local(tramo_tac)))
+
+
+def _optimizar_local(lista_tac):
+    """Pasada 1: asignaciones redundantes, plegado de constantes y saltos con condición constante."""
+    tac_opt = []
     for instr in lista_tac:
         instr = instr.strip()
         if not instr:
@@ -99,7 +130,11 @@ def optimizar_tac(lista_tac):
                         # ifFalse false ... -> siempre salta, reemplazar por goto directo
                         instr = f"goto {etiqueta}"
         tac_opt.append(instr)
-    # 2. Remover saltos goto redundantes que van a la siguiente instrucción
+    return tac_opt
+
+
+def _eliminar_gotos(tac_opt):
+    """Pasada 2: elimina los goto cuyo destino es la instrucción siguiente."""
     i = 0
     tac_final = []
     while i < len(tac_opt):
@@ -112,7 +147,11 @@ def optimizar_tac(lista_tac):
                 continue  # saltar el goto
         tac_final.append(instr)
         i += 1
-    # 3. Eliminar etiquetas no utilizadas
+    return tac_final
+
+
+def _eliminar_etiquetas(tac_final):
+    """Pasada 3: elimina las etiquetas que no son destino de ningún salto."""
     usadas = set()
     for instr in tac_final:
         if instr.startswith("goto"):
@@ -0,0 +1,149 @@
+# perfil.py
+"""
+Perfil de compilación: tiempo, memoria máxima y cantidades de cada fase del pipeline.
+
+compilador.compilar_codigo(codigo, perfil=Perfil()) mide por separado:
+
+    lexico       tokens          (lexer completo antes del parser)
+    sintactico   nodos del AST   (parser sobre los tokens ya leídos)
+    semantico    símbolos        (analizar_semantica)
+    tac          instrucciones   (_generar_TAC_desde_AST)
+    ssa          instrucciones   (_convertir_TAC_a_SSA)
+    optimizador  instrucciones   (optimizar_tac)
+    nasm         líneas          (generar_codigo_maquina)
+
+La memoria es el pico de memoria asignada durante la fase (tracemalloc), medido desde su
+inicio. tracemalloc solo está activo dentro de cada fase, pero aun así las hace más lentas:
+con Perfil(memoria=False) solo se miden tiempos y cantidades.
+
+El informe se obtiene como tabla (tabla()) o JSON (a_json()): lo muestran
+'python compilador.py --perfil [tabla|json]' y el botón "Perfil" de main.py.
+"""
+import json
+import time
+import tracemalloc
+
+from ast_nodos import Nodo
+from ast_plano import Cursor
+
+FASES = ("lexico", "sintactico", "semantico", "tac", "ssa", "optimizador", "nasm")
+UNIDADES = {
+    "lexico": "tokens",
+    "sintactico": "nodos",
+    "semantico": "símbolos",
+    "tac": "instrucciones",
+    "ssa": "instrucciones",
+    "optimizador": "instrucciones",
+    "nasm": "líneas",
+}
+
+
+class Medicion:
+    """Resultado de medir una fase en una compilación."""
+    __slots__ = ('fase', 'segundos', 'memoria_pico', 'cantidad')
+
+    def __init__(self, fase, segundos=0.0, memoria_pico=None, cantidad=0):
+        self.fase = fase
+        self.segundos = segundos
+        self.memoria_pico = memoria_pico
+        self.cantidad = cantidad
+
+
+class Perfil:
+    """Mediciones de una o varias compilaciones (en un lote se suman por fase)."""
+
+    def __init__(self, memoria=True):
+        self.memoria = memoria
+        self.mediciones = []
+        self.compilaciones = 0
+
+    def medir(self, fase, funcion, *args, contar=len):
+        """
+        Ejecuta funcion(*args) midiendo tiempo y memoria; registra contar(resultado) como la
+        cantidad de la fase y retorna el resultado.
+        """
+        propio = False
+        if self.memoria:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                propio = True
+            base = tracemalloc.get_traced_memory()[0]
+        t0 = time.perf_counter()
+        try:
+            resultado = funcion(*args)
+        finally:
+            segundos = time.perf_counter() - t0
+            pico = None
+            if self.memoria:
+                pico = tracemalloc.get_traced_memory()[1] - base
+                if propio:
+                    tracemalloc.stop()
+        self.mediciones.append(Medicion(fase, segundos, pico, contar(resultado)))
+        return resultado
+
+    def agregar(self, mediciones):
+        """Suma mediciones hechas en otro proceso (ver compilador.compilar_lote)."""
+        self.mediciones.extend(mediciones)
+
+    def resumen(self):
+        """
+        Lista de Medicion, una por fase en el orden de FASES: tiempos y cantidades sumados,
+        memoria pico máxima entre todas las compilaciones.
+        """
+        por_fase = {}
+        for m in self.mediciones:
+            total = por_fase.get(m.fase)
+            if total is None:
+                total = por_fase[m.fase] = Medicion(m.fase)
+            total.segundos += m.segundos
+            total.cantidad += m.cantidad
+            if m.memoria_pico is not None:
+                total.memoria_pico = max(total.memoria_pico or 0, m.memoria_pico)
+        orden = {fase: i for i, fase in enumerate(FASES)}
+        return sorted(por_fase.values(), key=lambda m: orden.get(m.fase, len(FASES)))
+
+    def como_dict(self):
+        fases = self.resumen()
+        return {
+            "compilaciones": self.compilaciones,
+            "segundos_total": sum(m.segundos for m in fases),
+            "fases": [{"fase": m.fase, "segundos": m.segundos, "memoria_pico_bytes": m.memoria_pico,
+                       "cantidad": m.cantidad, "unidad": UNIDADES.get(m.fase, "")} for m in fases],
+        }
+
+    def a_json(self):
+        return json.dumps(self.como_dict(), indent=2, ensure_ascii=False)
+
+    def tabla(self):
+        """Informe de texto con una fila por fase."""
+        fases = self.resumen()
+        total = sum(m.segundos for m in fases) or 1.0
+        lineas = [f"{'fase':<12} {'ms':>10} {'%':>6} {'pico (KB)':>10} {'cantidad':>10} {'unidad':<14} {'por segundo':>12}"]
+        for m in fases:
+            pico = f"{m.memoria_pico / 1024:.1f}" if m.memoria_pico is not None else "-"
+            por_segundo = f"{m.cantidad / m.segundos:.0f}" if m.segundos > 0 else "-"
+            lineas.append(f"{m.fase:<12} {m.segundos * 1000:>10.2f} {m.segundos / total:>6.1%} {pico:>10} "
+                          f"{m.cantidad:>10} {UNIDADES.get(m.fase, ''):<14} {por_segundo:>12}")
+        lineas.append(f"{'total':<12} {sum(m.segundos for m in fases) * 1000:>10.2f} "
+                      f"({self.compilaciones} compilación(es))")
+        return "\n".join(lineas)
+
+
+def contar_nodos(ast):
+    """Cantidad de nodos de un AST de ast_nodos o de un ast_plano.Cursor (0 si es None)."""
+    if ast is None:
+        return 0
+    if isinstance(ast, Cursor):
+        return len(ast.arbol)
+    cuenta = 0
+    pila = [ast]
+    while pila:
+        valor = pila.pop()
+        if isinstance(valor, Nodo):
+            cuenta += 1
+            pila.extend(valor.hijos())
+        elif isinstance(valor, list):
+            pila.extend(valor)
+    return cuenta
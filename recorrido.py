@@ -0,0 +1,46 @@
+# recorrido.py
+"""
+Recorridos del AST sin recursión de Python.
+
+Los recorridos de semantico.py y generador_codigo.py están escritos como generadores:
+donde una función se llamaría a sí misma para un hijo (res = gen_expr(hijo)), en su lugar
+entrega la llamada (res = yield gen_expr(hijo)). ejecutar() corre la llamada raíz con una
+pila explícita de generadores: cada llamada entregada se apila, y cuando termina su valor
+de retorno se envía a la que la pidió. El orden de evaluación y los resultados son los de
+la versión recursiva, pero la pila de llamadas de Python no crece con la profundidad del
+árbol, así que miles de bloques anidados o una cadena larga de operaciones no alcanzan el
+límite de recursión (sys.getrecursionlimit()); solo la memoria limita la profundidad.
+
+Crear y terminar un generador cuesta más que una llamada, así que los casos sin hijos
+(literales, identificadores) conviene resolverlos en una función común que retorne el
+resultado directamente y solo retorne un generador para el resto: lo que se entrega con
+'yield' y no es un generador se toma como el resultado de la llamada.
+"""
+from types import GeneratorType
+
+
+def ejecutar(llamada):
+    """
+    Ejecuta el generador 'llamada' y retorna su valor de retorno. Cada generador que
+    entrega (otra llamada) se ejecuta de la misma forma y su resultado es el valor de la
+    expresión 'yield'; cualquier otro valor entregado vuelve tal cual. Las excepciones se
+    propagan como en una llamada normal.
+    """
+    if type(llamada) is not GeneratorType:
+        return llamada
+    pila = [llamada]
+    valor = None
+    while True:
+        try:
+            llamada = pila[-1].send(valor)
+        except StopIteration as fin:
+            pila.pop()
+            if not pila:
+                return fin.value
+            valor = fin.value
+        else:
+            if type(llamada) is GeneratorType:
+                pila.append(llamada)
+                valor = None
+            else:
+                valor = llamada
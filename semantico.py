@@ -1,26 +1,57 @@
 # semantico.py
 
-def analizar_semantica(arbol, tabla_simbolos):
+from types import GeneratorType
+
+from ast_nodos import Tipo, Nodo, Asignacion, Binaria, Literal, Variable
+from contexto import informar
+from recorrido import ejecutar
+from simbolos import TablaSimbolos
+
+# Nodos de expresión que evaluate_operators recorre con su pila explícita
+OPERATOR_TAGS = frozenset((Tipo.OPERACION, Tipo.COMPARACION, Tipo.NOT))
+# Marca de la pila de evaluate_operators: el operador de debajo ya tiene sus operandos evaluados
+COMBINE = object()
+
+
+def analizar_semantica(arbol, tabla_simbolos=None, ctx=None):
     """
     Recorre el árbol sintáctico 'arbol' y realiza análisis semántico.
     Actualiza la tabla de símbolos 'tabla_simbolos' con los tipos y valores de variables,
     y reporta cualquier error semántico encontrado directamente en consola.
+    'tabla_simbolos' tiene una entrada {"id", "tipo", "valor"?} por declaración: la primera
+    de cada nombre con el nombre como clave y las siguientes (variables que ocultan a otra o
+    que se redeclaran en otro bloque) como "nombre#id".
+    Si se indica un ContextoCompilacion 'ctx', se usan su tabla de símbolos y su lista de
+    errores, y los símbolos (simbolos.Simbolo) quedan en ctx.simbolos.
     """
-    # Pila de ámbitos (cada elemento es un diccionario de {nombre_var: tipo})
-    scope_stack = [ {} ]  # Comenzar con un ámbito global vacío
+    if ctx is not None:
+        tabla_simbolos = ctx.tabla_simbolos
+    elif tabla_simbolos is None:
+        tabla_simbolos = {}
+    # Ámbitos anidados: cada nombre tiene una pila de declaraciones (ver simbolos.py)
+    ambitos = TablaSimbolos()
+    if ctx is not None:
+        ctx.simbolos = ambitos.simbolos
     # Conjunto de nombres declarados en algún ámbito (para detectar uso fuera de alcance)
     declared_names = set()
     # Indicador de si se encontraron errores (opcional, para posibles usos futuros)
     errors_found = False
 
-    # Lista global para acumular los errores semánticos
-    errores_semanticos = []
+    # Lista para acumular los errores semánticos (la del contexto, si lo hay)
+    errores_semanticos = ctx.errores if ctx is not None else []
 
     def error(mensaje):
         """Acumula un mensaje de error semántico en la lista de errores."""
 
         errores_semanticos.append(mensaje)  # Añade el mensaje a la lista de errores
-        print(f"Error semántico: {mensaje}")  # Opcional: Mantener impresión en consola
+        informar(f"Error semántico: {mensaje}")  # Opcional: Mantener impresión en consola
+
+    def find_variable(name):
+        """
+        Busca la declaración visible de la variable 'name' (la del ámbito más interno).
+        Devuelve su simbolos.Simbolo, o None si no está declarada en ningún ámbito abierto.
+        """
+        return ambitos.buscar(name)
 
     def find_variable_type(name):
         """
@@ -28,10 +59,8 @@ def analizar_semantica(arbol, tabla_simbolos):
         Devuelve el tipo si la variable está declarada en el ámbito actual o en algún ámbito externo,
         o None si no está declarada en ninguno.
         """
-        for scope in reversed(scope_stack):
-            if name in scope:
-                return scope[name]
-        return None
+        simbolo = ambitos.buscar(name)
+        return simbolo.tipo if simbolo is not None else None
 
     def declare_variable(name, var_type, const_value=None):
         """
@@ -39,19 +68,17 @@ def analizar_semantica(arbol, tabla_simbolos):
         Si la variable ya existe en este mismo ámbito, reporta un error de redeclaración.
         Opcionalmente asigna un valor constante 'const_value' conocido.
         """
-        current_scope = scope_stack[-1]
-        if name in current_scope:
+        simbolo = ambitos.declarar(name, var_type)
+        if simbolo is None:
             # La variable ya fue declarada en este mismo ámbito
             error(f"La variable '{name}' ya fue declarada en este ámbito")
         else:
-            # Añadir la variable al ámbito actual
-            current_scope[name] = var_type
             declared_names.add(name)
-            # Actualizar la tabla de símbolos global con su tipo
-            tabla_simbolos[name] = {"tipo": var_type}
+            # Agregar su entrada a la tabla de símbolos (sin pisar otra declaración del mismo nombre)
+            tabla_simbolos[name if name not in tabla_simbolos else f"{name}#{simbolo.id}"] = simbolo.datos
             # Si hay un valor constante disponible, guardarlo en la tabla de símbolos
             if const_value is not None:
-                tabla_simbolos[name]["valor"] = const_value
+                simbolo.datos["valor"] = const_value
 
     def types_compatible(var_type, expr_type):
         """
@@ -68,19 +95,22 @@ def analizar_semantica(arbol, tabla_simbolos):
         Devuelve una tupla (expr_type, const_value), donde expr_type es el tipo deducido de la expresión
         (como string "INT", "FLOAT", "STRING", "BOOL"), y const_value es el valor constante si puede determinarse
         en tiempo de compilación (o None en caso contrario).
+        Los literales y las variables se resuelven aquí mismo; para el resto de los nodos
+        devuelve el generador de evaluate_operators o evaluate_compound, que se ejecuta con recorrido.ejecutar
+        (desde otro generador, con 'yield evaluate_expression(nodo)'), sin recursión de Python.
         """
         # Caso base: el nodo es un valor constante o identificador
-        if not isinstance(node, tuple):
-            # En el AST de nuestro parser, las expresiones siempre son tuplas.
+        if not isinstance(node, Nodo):
+            # En el AST de nuestro parser, las expresiones siempre son nodos.
             # Si no lo es, no se reconoce (retornar None para tipo).
             return (None, None)
 
-        tag = node[0]
+        tag = node.tipo
 
         # Literales numéricos (entero o flotante)
-        if tag == 'number':
+        if tag == Tipo.NUMERO:
             # El valor puede ser int o float en Python; determinamos el tipo base
-            value = node[1]
+            value = node.valor
             if isinstance(value, int):
                 return ("INT", value)   # Número entero
             elif isinstance(value, float):
@@ -90,19 +120,19 @@ def analizar_semantica(arbol, tabla_simbolos):
                 return (None, None)
 
         # Literal de cadena de texto
-        if tag == 'string':
-            value = node[1]
+        if tag == Tipo.CADENA:
+            value = node.valor
             return ("STRING", value)
 
         # Literal booleano true/false
-        if tag == 'bool_true':
+        if tag == Tipo.VERDADERO:
             return ("BOOL", True)
-        if tag == 'bool_false':
+        if tag == Tipo.FALSO:
             return ("BOOL", False)
 
         # Identificador (variable) usado en expresión
-        if tag == 'id':
-            name = node[1]
+        if tag == Tipo.ID:
+            name = node.nombre
             var_type = find_variable_type(name)
             if var_type is None:
                 # Variable no encontrada en ningún ámbito
@@ -116,133 +146,176 @@ def analizar_semantica(arbol, tabla_simbolos):
             # porque no hacemos propagación de constantes de variables (asumimos valor no determinado en compilación)
             return (var_type, None)
 
-        # Operaciones binarias aritméticas, lógicas (AND/OR) o de igualdad (==, !=)
-        if tag == 'operation':
-            op = node[1]    # operador, por ejemplo '+', '||', '==', etc.
-            left_node = node[2]
-            right_node = node[3]
-            # Evaluar subexpresiones izquierda y derecha
-            left_type, left_val = evaluate_expression(left_node)
-            right_type, right_val = evaluate_expression(right_node)
-            if left_type is None or right_type is None:
-                # Si alguna subexpresión tuvo error, abortar esta operación
-                return (None, None)
+        # Operaciones binarias, comparaciones y '!': se recorren con una pila explícita
+        if tag in OPERATOR_TAGS:
+            return evaluate_operators(node)
+        return evaluate_compound(node)
 
-            # Comprobar según el tipo de operador
-            if op in ['+', '-', '*', '/']:
-                # Ambos operandos deben ser numéricos (INT o FLOAT)
-                if not (left_type in ["INT", "FLOAT"] and right_type in ["INT", "FLOAT"]):
-                    error(f"Operador '{op}' aplicado a tipos incompatibles: {left_type} y {right_type}")
-                    return (None, None)
-                # Determinar tipo resultante: si cualquiera es FLOAT, resultado FLOAT; si ambos INT, resultado INT
-                result_type = "FLOAT" if (left_type == "FLOAT" or right_type == "FLOAT") else "INT"
-                # Para división, si ambos son INT mantendremos INT (división entera)
-                if op == '/' and result_type == "INT":
-                    # En muchos lenguajes, la división entera produce INT (truncando el resultado si es fraccionario)
-                    result_type = "INT"
-                # Calcular valor constante si ambos operandos son constantes
-                const_val = None
-                if left_val is not None and right_val is not None:
-                    # Realizar la operación con los valores constantes
-                    try:
-                        if op == '+':
-                            const_val = left_val + right_val
-                        elif op == '-':
-                            const_val = left_val - right_val
-                        elif op == '*':
-                            const_val = left_val * right_val
-                        elif op == '/':
-                            # Evitar división por cero
-                            if right_val != 0:
-                                const_val = left_val // right_val if result_type == "INT" else left_val / right_val
-                            else:
-                                const_val = None
-                    except Exception:
-                        const_val = None
-                return (result_type, const_val)
-
-            elif op in ['&&', '||']:
-                # Operadores lógicos AND, OR: ambos operandos deben ser booleanos
-                if left_type != "BOOL" or right_type != "BOOL":
-                    error(f"Operador lógico '{op}' requiere operandos booleanos (BOOL)")
-                    return (None, None)
-                result_type = "BOOL"
-                const_val = None
-                if left_val is not None and right_val is not None:
-                    # Calcular constante booleana
-                    if op == '&&':
-                        const_val = left_val and right_val
-                    elif op == '||':
-                        const_val = left_val or right_val
-                return (result_type, const_val)
-
-            elif op in ['==', '!=']:
-                # Operadores de igualdad/desigualdad: los operandos deben ser del mismo tipo básico
-                if left_type != right_type:
-                    # Permitimos comparación de INT vs FLOAT como numéricos compatibles
-                    both_numeric = left_type in ["INT", "FLOAT"] and right_type in ["INT", "FLOAT"]
-                    if not both_numeric:
-                        error(f"No se puede comparar {left_type} con {right_type} usando '{op}'")
-                        return (None, None)
-                # El resultado de == o != es booleano
-                result_type = "BOOL"
-                const_val = None
-                if left_val is not None and right_val is not None:
-                    const_val = (left_val == right_val) if op == '==' else (left_val != right_val)
-                return (result_type, const_val)
+    def binary_operation(op, left_type, left_val, right_type, right_val):
+        """
+        Tipo y valor constante de una operación binaria aritmética, lógica (AND/OR) o de
+        igualdad (==, !=) cuyos operandos ya se evaluaron.
+        """
+        if left_type is None or right_type is None:
+            # Si alguna subexpresión tuvo error, abortar esta operación
+            return (None, None)
 
-            else:
-                # Cualquier otro operador no contemplado explícitamente (por seguridad)
+        # Comprobar según el tipo de operador
+        if op in ['+', '-', '*', '/']:
+            # Ambos operandos deben ser numéricos (INT o FLOAT)
+            if not (left_type in ["INT", "FLOAT"] and right_type in ["INT", "FLOAT"]):
+                error(f"Operador '{op}' aplicado a tipos incompatibles: {left_type} y {right_type}")
                 return (None, None)
+            # Determinar tipo resultante: si cualquiera es FLOAT, resultado FLOAT; si ambos INT, resultado INT
+            result_type = "FLOAT" if (left_type == "FLOAT" or right_type == "FLOAT") else "INT"
+            # Para división, si ambos son INT mantendremos INT (división entera)
+            if op == '/' and result_type == "INT":
+                # En muchos lenguajes, la división entera produce INT (truncando el resultado si es fraccionario)
+                result_type = "INT"
+            # Calcular valor constante si ambos operandos son constantes
+            const_val = None
+            if left_val is not None and right_val is not None:
+                # Realizar la operación con los valores constantes
+                try:
+                    if op == '+':
+                        const_val = left_val + right_val
+                    elif op == '-':
+                        const_val = left_val - right_val
+                    elif op == '*':
+                        const_val = left_val * right_val
+                    elif op == '/':
+                        # Evitar división por cero
+                        if right_val != 0:
+                            const_val = left_val // right_val if result_type == "INT" else left_val / right_val
+                        else:
+                            const_val = None
+                except Exception:
+                    const_val = None
+            return (result_type, const_val)
 
-        # Operaciones de comparación (<, >, <=, >=)
-        if tag == 'comparison':
-            op = node[1]   # '<', '>', '<=', '>='
-            left_node = node[2]
-            right_node = node[3]
-            left_type, left_val = evaluate_expression(left_node)
-            right_type, right_val = evaluate_expression(right_node)
-            if left_type is None or right_type is None:
-                return (None, None)
-            # Exigir operandos numéricos para comparaciones
-            if not (left_type in ["INT", "FLOAT"] and right_type in ["INT", "FLOAT"]):
-                error(f"No se pueden comparar tipos {left_type} y {right_type} con '{op}'")
+        elif op in ['&&', '||']:
+            # Operadores lógicos AND, OR: ambos operandos deben ser booleanos
+            if left_type != "BOOL" or right_type != "BOOL":
+                error(f"Operador lógico '{op}' requiere operandos booleanos (BOOL)")
                 return (None, None)
-            # Resultado booleano
             result_type = "BOOL"
             const_val = None
             if left_val is not None and right_val is not None:
-                # Realizar comparación constante
-                if op == '<':
-                    const_val = left_val < right_val
-                elif op == '>':
-                    const_val = left_val > right_val
-                elif op == '<=':
-                    const_val = left_val <= right_val
-                elif op == '>=':
-                    const_val = left_val >= right_val
+                # Calcular constante booleana
+                if op == '&&':
+                    const_val = left_val and right_val
+                elif op == '||':
+                    const_val = left_val or right_val
             return (result_type, const_val)
 
-        # Operador unario lógico NOT
-        if tag == 'not':
-            expr_node = node[1]
-            expr_type, expr_val = evaluate_expression(expr_node)
-            if expr_type is None:
-                return (None, None)
-            if expr_type != "BOOL":
-                error("Operador '!' aplicado a un tipo no booleano")
-                return (None, None)
+        elif op in ['==', '!=']:
+            # Operadores de igualdad/desigualdad: los operandos deben ser del mismo tipo básico
+            if left_type != right_type:
+                # Permitimos comparación de INT vs FLOAT como numéricos compatibles
+                both_numeric = left_type in ["INT", "FLOAT"] and right_type in ["INT", "FLOAT"]
+                if not both_numeric:
+                    error(f"No se puede comparar {left_type} con {right_type} usando '{op}'")
+                    return (None, None)
+            # El resultado de == o != es booleano
             result_type = "BOOL"
             const_val = None
-            if expr_val is not None:
-                const_val = not expr_val
+            if left_val is not None and right_val is not None:
+                const_val = (left_val == right_val) if op == '==' else (left_val != right_val)
             return (result_type, const_val)
 
+        else:
+            # Cualquier otro operador no contemplado explícitamente (por seguridad)
+            return (None, None)
+
+    def comparison(op, left_type, left_val, right_type, right_val):
+        """Tipo y valor constante de una comparación (<, >, <=, >=) cuyos operandos ya se evaluaron."""
+        if left_type is None or right_type is None:
+            return (None, None)
+        # Exigir operandos numéricos para comparaciones
+        if not (left_type in ["INT", "FLOAT"] and right_type in ["INT", "FLOAT"]):
+            error(f"No se pueden comparar tipos {left_type} y {right_type} con '{op}'")
+            return (None, None)
+        # Resultado booleano
+        result_type = "BOOL"
+        const_val = None
+        if left_val is not None and right_val is not None:
+            # Realizar comparación constante
+            if op == '<':
+                const_val = left_val < right_val
+            elif op == '>':
+                const_val = left_val > right_val
+            elif op == '<=':
+                const_val = left_val <= right_val
+            elif op == '>=':
+                const_val = left_val >= right_val
+        return (result_type, const_val)
+
+    def logical_not(expr_type, expr_val):
+        """Tipo y valor constante del operador unario lógico NOT aplicado a un operando ya evaluado."""
+        if expr_type is None:
+            return (None, None)
+        if expr_type != "BOOL":
+            error("Operador '!' aplicado a un tipo no booleano")
+            return (None, None)
+        result_type = "BOOL"
+        const_val = None
+        if expr_val is not None:
+            const_val = not expr_val
+        return (result_type, const_val)
+
+    def evaluate_operators(node):
+        """
+        Generador de evaluate_expression para un árbol de operaciones (OPERACION, COMPARACION
+        y NOT). Lo recorre en postorden con una pila explícita, así que una cadena larga de
+        operaciones no crea un generador por nodo; las subexpresiones de otro tipo se piden
+        con 'yield'. El orden de evaluación (izquierda, derecha, operador) y los errores son
+        los de evaluar cada operación por separado.
+        """
+        # Nodos por visitar; un operador se apila seguido de COMBINE y de sus operandos, así
+        # que al sacar COMBINE sus operandos ya están evaluados en 'results'
+        pending = [node]
+        results = []  # tuplas (tipo, valor) de las subexpresiones evaluadas
+        pop, push, push_result = pending.pop, pending.append, results.append
+        while pending:
+            current = pop()
+            if current is COMBINE:
+                current = pop()
+                tag = current.tipo
+                if tag == Tipo.NOT:
+                    push_result(logical_not(*results.pop()))
+                else:
+                    right_type, right_val = results.pop()
+                    left_type, left_val = results.pop()
+                    combine = binary_operation if tag == Tipo.OPERACION else comparison
+                    push_result(combine(current.op, left_type, left_val, right_type, right_val))
+            elif isinstance(current, Nodo) and current.tipo in OPERATOR_TAGS:
+                push(current)
+                push(COMBINE)
+                if current.tipo == Tipo.NOT:
+                    push(current.expr)
+                else:
+                    push(current.der)
+                    push(current.izq)
+            else:
+                result = evaluate_expression(current)
+                if type(result) is GeneratorType:
+                    result = yield result
+                push_result(result)
+        return results[0]
+
+    def evaluate_compound(node):
+        """
+        Generador de evaluate_expression para el resto de los nodos con subexpresiones
+        (asignaciones, incrementos, ternario, listas): pide la evaluación de cada hijo con
+        'yield evaluate_expression(hijo)' y retorna la tupla (expr_type, const_value).
+        """
+        tag = node.tipo
+
         # Expresión de asignación (como parte de otra expresión): ID = expr
-        if tag == 'assignment':
+        if tag == Tipo.ASIGNACION_EXPR:
             # Asignación como expresión: actualiza la variable y devuelve su tipo/valor
-            var_name = node[1]
-            expr_node = node[2]
+            var_name = node.nombre
+            expr_node = node.valor
             # Verificar que la variable exista y obtener su tipo
             var_type = find_variable_type(var_name)
             if var_type is None:
@@ -252,7 +325,7 @@ def analizar_semantica(arbol, tabla_simbolos):
                     error(f"La variable '{var_name}' no ha sido declarada")
                 return (None, None)
             # Evaluar la expresión del lado derecho
-            expr_type, expr_val = evaluate_expression(expr_node)
+            expr_type, expr_val = yield evaluate_expression(expr_node)
             if expr_type is None:
                 # Hubo error en la expresión derecha
                 return (None, None)
@@ -261,19 +334,20 @@ def analizar_semantica(arbol, tabla_simbolos):
                 error(f"Incompatibilidad de tipos en asignación a '{var_name}': se esperaba {var_type} pero se obtuvo {expr_type}")
             else:
                 # Actualizar valor constante en la tabla si es conocido, o eliminarlo si deja de ser constante
+                datos = find_variable(var_name).datos
                 if expr_val is not None:
-                    tabla_simbolos[var_name]["valor"] = expr_val
+                    datos["valor"] = expr_val
                 else:
                     # Si se asigna algo no constante, remover cualquier valor previo conocido
-                    if "valor" in tabla_simbolos[var_name]:
-                        tabla_simbolos[var_name].pop("valor", None)
+                    if "valor" in datos:
+                        datos.pop("valor", None)
             # El tipo resultante de la expresión de asignación es el tipo de la variable (asignación produce ese valor)
             return (var_type, expr_val)
 
         # Expresión de incremento como parte de otra expresión (postfijo i++ o prefijo, según AST)
-        if tag == 'increment':
-            # Podría tener forma ('increment', var, '++') en caso de post-incremento
-            var_name = node[1]
+        if tag == Tipo.INCREMENTO:
+            # Post-incremento i++ usado como expresión
+            var_name = node.nombre
             var_type = find_variable_type(var_name)
             if var_type is None:
                 if var_name in declared_names:
@@ -287,23 +361,24 @@ def analizar_semantica(arbol, tabla_simbolos):
                 return (None, None)
             # Determinar valor constante antes del incremento
             const_val_before = None
-            if "valor" in tabla_simbolos.get(var_name, {}):
-                const_val_before = tabla_simbolos[var_name]["valor"]
+            datos = find_variable(var_name).datos
+            if "valor" in datos:
+                const_val_before = datos["valor"]
             # Actualizar valor de la variable sumándole 1 si se conoce constante
             if const_val_before is not None:
                 # Calcular nuevo valor constante y actualizar la tabla de símbolos
                 new_val = const_val_before + 1
-                tabla_simbolos[var_name]["valor"] = new_val
+                datos["valor"] = new_val
             else:
                 # Si no se conoce valor actual, eliminamos cualquier valor constante previo
-                if var_name in tabla_simbolos and "valor" in tabla_simbolos[var_name]:
-                    tabla_simbolos[var_name].pop("valor", None)
+                if "valor" in datos:
+                    datos.pop("valor", None)
             # El resultado de la expresión i++ es el valor de la variable *antes* del incremento
             return (var_type, const_val_before)
 
-        if tag == 'decrement':
-            # Similar a 'increment' pero restando 1
-            var_name = node[1]
+        if tag == Tipo.DECREMENTO:
+            # Similar a INCREMENTO pero restando 1
+            var_name = node.nombre
             var_type = find_variable_type(var_name)
             if var_type is None:
                 if var_name in declared_names:
@@ -315,20 +390,21 @@ def analizar_semantica(arbol, tabla_simbolos):
                 error(f"No se puede aplicar '--' a la variable '{var_name}' de tipo {var_type}")
                 return (None, None)
             const_val_before = None
-            if "valor" in tabla_simbolos.get(var_name, {}):
-                const_val_before = tabla_simbolos[var_name]["valor"]
+            datos = find_variable(var_name).datos
+            if "valor" in datos:
+                const_val_before = datos["valor"]
             if const_val_before is not None:
                 new_val = const_val_before - 1
-                tabla_simbolos[var_name]["valor"] = new_val
+                datos["valor"] = new_val
             else:
-                if var_name in tabla_simbolos and "valor" in tabla_simbolos[var_name]:
-                    tabla_simbolos[var_name].pop("valor", None)
+                if "valor" in datos:
+                    datos.pop("valor", None)
             return (var_type, const_val_before)
 
         # Expresión de incremento compuesto (i += N)
-        if tag == 'increment_by':
-            var_name = node[1]
-            increment_val = node[2]  # valor numérico a incrementar (constante entera según gramática)
+        if tag == Tipo.INCREMENTO_POR:
+            var_name = node.nombre
+            increment_val = node.cantidad  # valor numérico a incrementar (constante entera según gramática)
             var_type = find_variable_type(var_name)
             if var_type is None:
                 if var_name in declared_names:
@@ -346,8 +422,9 @@ def analizar_semantica(arbol, tabla_simbolos):
                 # Asignando float a int -> incompatibilidad
                 error(f"Incompatibilidad de tipos en '{var_name} += {increment_val}': {var_type} += {inc_type}")
             # Actualizar valor constante si aplicable
-            if "valor" in tabla_simbolos.get(var_name, {}):
-                current_val = tabla_simbolos[var_name]["valor"]
+            datos = find_variable(var_name).datos
+            if "valor" in datos:
+                current_val = datos["valor"]
             else:
                 current_val = None
             new_const = None
@@ -357,21 +434,22 @@ def analizar_semantica(arbol, tabla_simbolos):
                 except Exception:
                     new_const = None
             if new_const is not None:
-                tabla_simbolos[var_name]["valor"] = new_const
+                datos["valor"] = new_const
             else:
-                if var_name in tabla_simbolos and "valor" in tabla_simbolos[var_name]:
-                    tabla_simbolos[var_name].pop("valor", None)
+                if "valor" in datos:
+                    datos.pop("valor", None)
             # El resultado de la expresión (i += N) lo tomamos como el tipo de la variable después de asignar
             return (var_type, None if current_val is None else new_const)
 
         # Expresión de asignación de incremento (forma i = i + N)
-        if tag == 'increment_assign':
+        if tag == Tipo.INCREMENTO_ASIGNADO:
             # Esta forma se trata como una asignación normal: var_name = (expr)
-            var_name = node[1]
-            right_var = node[2]
-            increment_val = node[3]
+            var_name = node.nombre
+            right_var = node.origen
+            increment_val = node.cantidad
             # Construir nodo de expresión equivalente: right_var + increment_val
-            expr_node = ('operation', '+', ('id', right_var), ('number', increment_val))
+            expr_node = Binaria(Tipo.OPERACION, '+', Variable(Tipo.ID, right_var),
+                                Literal(Tipo.NUMERO, increment_val))
             # Ahora tratar como una asignación normal (esto actualizará la variable var_name)
             if var_name != right_var:
                 # Si los identificadores son distintos (caso general), asegurarse de que ambos existen
@@ -381,16 +459,16 @@ def analizar_semantica(arbol, tabla_simbolos):
                     else:
                         error(f"La variable '{right_var}' no ha sido declarada")
             # Reutilizar la lógica de assignment como expresión
-            return evaluate_expression(('assignment', var_name, expr_node))
+            return (yield evaluate_expression(Asignacion(Tipo.ASIGNACION_EXPR, var_name, expr_node)))
 
         # Operador ternario (condicional) ?:
-        if tag == 'ternary':
-            condition_node = node[1]
-            true_node = node[2]
-            false_node = node[3]
-            cond_type, cond_val = evaluate_expression(condition_node)
-            true_type, true_val = evaluate_expression(true_node)
-            false_type, false_val = evaluate_expression(false_node)
+        if tag == Tipo.TERNARIO:
+            condition_node = node.condicion
+            true_node = node.si_verdadero
+            false_node = node.si_falso
+            cond_type, cond_val = yield evaluate_expression(condition_node)
+            true_type, true_val = yield evaluate_expression(true_node)
+            false_type, false_val = yield evaluate_expression(false_node)
             if cond_type is None or true_type is None or false_type is None:
                 return (None, None)
             if cond_type != "BOOL":
@@ -416,12 +494,12 @@ def analizar_semantica(arbol, tabla_simbolos):
             return (result_type, const_val)
 
         # Lista (arreglo) literal
-        if tag == 'list':
-            elements = node[1]  # lista de expresiones
+        if tag == Tipo.LISTA:
+            elements = node.elementos  # lista de expresiones
             elem_type = None
             all_same_type = True
             for elem in elements:
-                t, v = evaluate_expression(elem)
+                t, v = yield evaluate_expression(elem)
                 if t is None:
                     # Si hay error en un elemento, detener
                     all_same_type = False
@@ -443,33 +521,34 @@ def analizar_semantica(arbol, tabla_simbolos):
         """
         Analiza semánticamente un nodo de tipo 'statement' del AST.
         Maneja declaraciones, asignaciones, estructuras de control y ámbitos.
+        Es un generador, como evaluate_expression (se ejecuta con recorrido.ejecutar).
         """
-        if not isinstance(node, tuple):
-            return  # En principio, cada sentencia debería ser una tupla etiquetada
+        if not isinstance(node, Nodo):
+            return  # En principio, cada sentencia debería ser un nodo del AST
 
-        tag = node[0]
+        tag = node.tipo
 
-        if tag in ('declaracion, =', 'declaracion_asignacion, ='):
+        if tag == Tipo.DECLARACION or tag == Tipo.DECLARACION_ASIGNACION:
             # Declaración de variable (posiblemente con asignación inicial)
             # Formatos posibles:
-            # ('declaracion, =', tipo, nombre)
-            # ('declaracion_asignacion, =', tipo, nombre, expr_inicial)
-            var_type_token = node[1]
-            var_name = node[2]
+            # DECLARACION (tipo_dato, nombre)
+            # DECLARACION_ASIGNACION (tipo_dato, nombre, valor inicial)
+            var_type_token = node.tipo_dato
+            var_name = node.nombre
             # Convertir el token de tipo al string del tipo (en mayúsculas)
             # El token puede venir como 'int' o 'INT'; unificar a formato "INT", "FLOAT", etc.
             var_type = str(var_type_token).upper()
-            if tag == 'declaracion, =' :
+            if tag == Tipo.DECLARACION:
                 # Declaración sin asignación inicial
                 declare_variable(var_name, var_type)
             else:
                 # Declaración con asignación inicial
-                init_expr = node[3]
+                init_expr = node.valor
                 # Primero, declarar la variable en el ámbito actual
                 declare_variable(var_name, var_type)
                 # Si la variable se declaró exitosamente, verificar la expresión de inicialización
                 # (Incluso si hay error en expr, la variable queda declarada para evitar cascada de errores)
-                expr_type, expr_val = evaluate_expression(init_expr)
+                expr_type, expr_val = yield evaluate_expression(init_expr)
                 if expr_type is None:
                     return
                 # Comprobar compatibilidad de tipos entre variable y expresión
@@ -477,16 +556,17 @@ def analizar_semantica(arbol, tabla_simbolos):
                     error(f"Incompatibilidad de tipos en inicialización de '{var_name}': {var_type} = {expr_type}")
                 else:
                     # Asignación inicial válida: guardar valor constante si aplica
+                    datos = find_variable(var_name).datos
                     if expr_val is not None:
-                        tabla_simbolos[var_name]["valor"] = expr_val
+                        datos["valor"] = expr_val
                     else:
                         # Si la expresión no es constante, asegurarse de no dejar valor previo
-                        tabla_simbolos[var_name].pop("valor", None)
+                        datos.pop("valor", None)
 
-        elif tag == 'assignment, =':
-            # Asignación de una variable existente: ('assignment, =', nombre, expr)
-            var_name = node[1]
-            expr_node = node[2]
+        elif tag == Tipo.ASIGNACION:
+            # Asignación de una variable existente: ASIGNACION (nombre, valor)
+            var_name = node.nombre
+            expr_node = node.valor
             # Verificar existencia y tipo de la variable
             var_type = find_variable_type(var_name)
             if var_type is None:
@@ -496,7 +576,7 @@ def analizar_semantica(arbol, tabla_simbolos):
                     error(f"La variable '{var_name}' no ha sido declarada")
                 return
             # Evaluar la expresión del lado derecho
-            expr_type, expr_val = evaluate_expression(expr_node)
+            expr_type, expr_val = yield evaluate_expression(expr_node)
             if expr_type is None:
                 return
             # Revisar compatibilidad de tipos
@@ -504,15 +584,16 @@ def analizar_semantica(arbol, tabla_simbolos):
                 error(f"Incompatibilidad de tipos en asignación a '{var_name}': se esperaba {var_type} pero se obtuvo {expr_type}")
             else:
                 # Actualizar valor constante si es conocido
+                datos = find_variable(var_name).datos
                 if expr_val is not None:
-                    tabla_simbolos[var_name]["valor"] = expr_val
+                    datos["valor"] = expr_val
                 else:
                     # Si se asigna un valor no constante, remover cualquier valor almacenado previamente
-                    tabla_simbolos[var_name].pop("valor", None)
+                    datos.pop("valor", None)
 
-        elif tag == 'increment_stmt':
+        elif tag == Tipo.INCREMENTO_STMT:
             # Sentencia de incremento (p.ej., i++;)
-            var_name = node[1]
+            var_name = node.nombre
             var_type = find_variable_type(var_name)
             if var_type is None:
                 if var_name in declared_names:
@@ -524,17 +605,18 @@ def analizar_semantica(arbol, tabla_simbolos):
                 error(f"No se puede aplicar '++' a la variable '{var_name}' de tipo {var_type}")
                 return
             # Si la variable tiene valor constante, incrementar en 1
-            if "valor" in tabla_simbolos.get(var_name, {}):
-                tabla_simbolos[var_name]["valor"] += 1
+            datos = find_variable(var_name).datos
+            if "valor" in datos:
+                datos["valor"] += 1
             else:
                 # Eliminar valor constante previo si existía, ya que ahora no se conoce
-                if var_name in tabla_simbolos and "valor" in tabla_simbolos[var_name]:
-                    tabla_simbolos[var_name].pop("valor", None)
+                if "valor" in datos:
+                    datos.pop("valor", None)
             # (La sentencia i++ no produce un valor utilizado, solo el efecto de lado sobre la variable)
 
-        elif tag == 'decrement_stmt':
+        elif tag == Tipo.DECREMENTO_STMT:
             # Sentencia de decremento (p.ej., i--;)
-            var_name = node[1]
+            var_name = node.nombre
             var_type = find_variable_type(var_name)
             if var_type is None:
                 if var_name in declared_names:
@@ -545,104 +627,106 @@ def analizar_semantica(arbol, tabla_simbolos):
             if var_type not in ["INT", "FLOAT"]:
                 error(f"No se puede aplicar '--' a la variable '{var_name}' de tipo {var_type}")
                 return
-            if "valor" in tabla_simbolos.get(var_name, {}):
-                tabla_simbolos[var_name]["valor"] -= 1
+            datos = find_variable(var_name).datos
+            if "valor" in datos:
+                datos["valor"] -= 1
             else:
-                if var_name in tabla_simbolos and "valor" in tabla_simbolos[var_name]:
-                    tabla_simbolos[var_name].pop("valor", None)
-
-        elif tag == 'if':
-            # Sentencia if sin else: ('if', condición, cuerpo)
-            condition_node = node[1]
-            body_node = node[2]
-            cond_type, cond_val = evaluate_expression(condition_node)
+                if "valor" in datos:
+                    datos.pop("valor", None)
+
+        elif tag == Tipo.SI:
+            # Sentencia if sin else: SI (condición, cuerpo)
+            condition_node = node.condicion
+            body_node = node.entonces
+            cond_type, cond_val = yield evaluate_expression(condition_node)
             if cond_type is not None and cond_type != "BOOL":
                 error("La condición del 'if' debe ser de tipo BOOL")
             # Analizar la sentencia del cuerpo (posiblemente un bloque o una sola sentencia)
-            analyze_statement(body_node)
-
-        elif tag == 'if-else':
-            # Sentencia if-else: ('if-else', condición, cuerpo_then, cuerpo_else)
-            condition_node = node[1]
-            then_node = node[2]
-            else_node = node[3]
-            cond_type, cond_val = evaluate_expression(condition_node)
+            yield analyze_statement(body_node)
+
+        elif tag == Tipo.SI_SINO:
+            # Sentencia if-else: SI_SINO (condición, cuerpo_then, cuerpo_else)
+            condition_node = node.condicion
+            then_node = node.entonces
+            else_node = node.sino
+            cond_type, cond_val = yield evaluate_expression(condition_node)
             if cond_type is not None and cond_type != "BOOL":
                 error("La condición del 'if-else' debe ser de tipo BOOL")
             # Analizar ambos bloques/cuerpos
-            analyze_statement(then_node)
-            analyze_statement(else_node)
-
-        elif tag == 'while':
-            # Bucle while: ('while', condición, cuerpo)
-            condition_node = node[1]
-            body_node = node[2]
-            cond_type, cond_val = evaluate_expression(condition_node)
+            yield analyze_statement(then_node)
+            yield analyze_statement(else_node)
+
+        elif tag == Tipo.MIENTRAS:
+            # Bucle while: MIENTRAS (condición, cuerpo)
+            condition_node = node.condicion
+            body_node = node.cuerpo
+            cond_type, cond_val = yield evaluate_expression(condition_node)
             if cond_type is not None and cond_type != "BOOL":
                 error("La condición del 'while' debe ser de tipo BOOL")
-            analyze_statement(body_node)
-
-        elif tag == 'for':
-            # Bucle for: ('for', init, condicion, expr_final, cuerpo)
-            init_node = node[1]
-            cond_node = node[2]
-            post_node = node[3]
-            body_node = node[4]
+            yield analyze_statement(body_node)
+
+        elif tag == Tipo.PARA:
+            # Bucle for: PARA (init, condicion, expr_final, cuerpo)
+            init_node = node.inicio
+            cond_node = node.condicion
+            post_node = node.actualizacion
+            body_node = node.cuerpo
             # Nuevo ámbito si la inicialización es una declaración (variable local del for)
-            if isinstance(init_node, tuple) and init_node[0] == 'declaration':
+            if isinstance(init_node, Nodo) and init_node.tipo == Tipo.DECLARACION_FOR:
                 # Push de nuevo ámbito para la variable del for
-                scope_stack.append({})
-                # El nodo 'declaration' en el AST del for está en formato ('declaration', tipo, nombre, valor_inicial)
-                var_type_token = init_node[1]
-                var_name = init_node[2]
-                init_value_node = init_node[3]
+                ambitos.abrir_ambito()
+                # El nodo DECLARACION_FOR del for tiene (tipo_dato, nombre, valor_inicial)
+                var_type_token = init_node.tipo_dato
+                var_name = init_node.nombre
+                init_value_node = init_node.valor
                 var_type = str(var_type_token).upper()
                 # Declarar variable del for en nuevo ámbito
                 declare_variable(var_name, var_type)
                 # Procesar inicialización (asignación inicial)
-                expr_type, expr_val = evaluate_expression(init_value_node)
+                expr_type, expr_val = yield evaluate_expression(init_value_node)
                 if expr_type is not None:
                     if not types_compatible(var_type, expr_type):
                         error(f"Incompatibilidad de tipos en inicialización de '{var_name}' en el for: se esperaba {var_type} pero se obtuvo {expr_type}")
                     else:
+                        datos = find_variable(var_name).datos
                         if expr_val is not None:
-                            tabla_simbolos[var_name]["valor"] = expr_val
+                            datos["valor"] = expr_val
                         else:
-                            tabla_simbolos[var_name].pop("valor", None)
+                            datos.pop("valor", None)
             else:
                 # La inicialización no es declaración (sino una asignación existente)
                 # No abrimos nuevo ámbito en este caso
                 if init_node is not None:
-                    analyze_statement(init_node)
+                    yield analyze_statement(init_node)
             # Verificar condición del for
             if cond_node is not None:
-                cond_type, cond_val = evaluate_expression(cond_node)
+                cond_type, cond_val = yield evaluate_expression(cond_node)
                 if cond_type is not None and cond_type != "BOOL":
                     error("La condición del 'for' debe ser de tipo BOOL")
             # Expresión final (ejecutada al final de cada iteración, típicamente incremento)
             if post_node is not None:
-                analyze_statement(post_node) if isinstance(post_node, tuple) else evaluate_expression(post_node)
+                yield analyze_statement(post_node) if isinstance(post_node, Nodo) else evaluate_expression(post_node)
             # Analizar el cuerpo del for
-            analyze_statement(body_node)
+            yield analyze_statement(body_node)
             # Salir del ámbito del for si se creó uno
-            if isinstance(init_node, tuple) and init_node[0] == 'declaration':
-                scope_stack.pop()
+            if isinstance(init_node, Nodo) and init_node.tipo == Tipo.DECLARACION_FOR:
+                ambitos.cerrar_ambito()
 
-        elif tag == 'block':
-            # Bloque de código: ('block', [lista_de_sentencias])
+        elif tag == Tipo.BLOQUE:
+            # Bloque de código: BLOQUE [lista_de_sentencias]
             # Abrir un nuevo ámbito para el bloque
-            scope_stack.append({})
+            ambitos.abrir_ambito()
             # Recorrer las sentencias dentro del bloque
-            statements_list = node[1]
+            statements_list = node.elementos
             for stmt in statements_list:
-                analyze_statement(stmt)
+                yield analyze_statement(stmt)
             # Cerrar el ámbito (los nombres declarados aquí quedan fuera de alcance)
-            scope_stack.pop()
+            ambitos.cerrar_ambito()
 
-        elif tag == 'expr':
+        elif tag == Tipo.EXPR:
             # Sentencia expresión: simplemente evaluar la expresión por sus efectos
-            expr_node = node[1]
-            evaluate_expression(expr_node)
+            expr_node = node.expr
+            yield evaluate_expression(expr_node)
 
         else:
             # Cualquier otro tipo de nodo de sentencia no manejado explícitamente
@@ -650,25 +734,25 @@ def analizar_semantica(arbol, tabla_simbolos):
             if isinstance(node, list):
                 # Lista de sentencias
                 for stmt in node:
-                    analyze_statement(stmt)
+                    yield analyze_statement(stmt)
             else:
                 # Podría ser una expresión solitaria
-                evaluate_expression(node)
+                yield evaluate_expression(node)
 
     # --- Inicio del análisis semántico ---
     if arbol is None:
         return errores_semanticos # Si no hay árbol (posible error sintáctico previo), no hacer nada
 
-    # El AST del programa se espera como ('program', [lista_de_sentencias])
-    if isinstance(arbol, tuple) and arbol[0] == 'program':
-        for stmt in arbol[1]:
-            analyze_statement(stmt)
+    # El AST del programa se espera como un nodo PROGRAMA con su lista de sentencias
+    if isinstance(arbol, Nodo) and arbol.tipo == Tipo.PROGRAMA:
+        for stmt in arbol.sentencias:
+            ejecutar(analyze_statement(stmt))
     else:
         # En caso de que el AST sea directamente una lista de sentencias u otra forma
         if isinstance(arbol, list):
             for stmt in arbol:
-                analyze_statement(stmt)
+                ejecutar(analyze_statement(stmt))
         else:
-            analyze_statement(arbol)
+            ejecutar(analyze_statement(arbol))
 
     return errores_semanticos
\ No newline at end of file
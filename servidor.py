@@ -0,0 +1,328 @@
+# servidor.py
+"""
+Servidor de compilación: un proceso de larga duración que mantiene cargados el lexer, el
+parser y la caché de artefactos, para que editores y scripts de compilación no paguen las
+importaciones ni la carga de tablas de PLY en cada programa.
+
+Protocolo: una solicitud JSON por línea y una respuesta JSON por línea, por entrada/salida
+estándar (por defecto) o por un socket Unix (--socket RUTA, una conexión por cliente).
+
+    {"id": 1, "codigo": "int x = 1; print(x);"}         compila el código
+    {"id": 2, "ruta": "programa.txt", "ast_plano": true}  compila un archivo
+    {"id": 3, "comando": "ping"}                          responde {"id": 3, "ok": true}
+    {"id": 4, "comando": "estado"}                        solicitudes atendidas, arranque, caché
+    {"id": 5, "comando": "cerrar"}                        termina el servidor
+
+Respuesta a una compilación:
+
+    {"id": 1, "ok": true, "errores": [...], "mensajes": [...], "tac": [...], "tac_opt": [...],
+     "asm": [...], "ms": 0.8}
+
+'mensajes' son los diagnósticos que imprimieron las fases (caracteres ilegales, errores
+sintácticos con su posición y errores semánticos), también si el resultado vino de la caché.
+Una solicitud mal formada se responde con "ok": false y "error". Las solicitudes se atienden
+en paralelo (un hilo por conexión en el socket, un grupo de -j hilos en la entrada
+estándar), cada una con su propio ContextoCompilacion, lexer y parser; por eso las
+respuestas de la entrada estándar pueden llegar en otro orden y se identifican por su "id".
+
+El pipeline es puro Python y los hilos se turnan el GIL: compilando en los hilos, la
+latencia crece con cada cliente simultáneo. Con -p N (por defecto, un proceso por núcleo)
+las compilaciones corren en un grupo de N procesos que ya tienen cargados el lexer, el
+parser y la caché, así que N solicitudes se compilan de verdad a la vez; los hilos solo
+leen, esperan y responden. Con -p 1 (o en una máquina de un núcleo) se compila en los
+propios hilos, sin el costo de enviar el resultado entre procesos, y las compilaciones
+simultáneas se atienden una tras otra.
+
+Uso:
+    python servidor.py [--socket RUTA] [-j 4] [-p PROCESOS] [--cache CARPETA | --sin-cache]
+"""
+import time
+
+# Marca de tiempo tomada antes de importar el pipeline, para informar el arranque
+_T_INICIO = time.perf_counter()
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import cache_artefactos
+import compilador
+
+
+class SalidaPorHilo:
+    """
+    Reemplazo de sys.stdout que, dentro de capturar(), guarda lo impreso por cada hilo en su
+    propia lista; fuera de capturar() escribe en 'destino'.
+    """
+
+    def __init__(self, destino):
+        self.destino = destino
+        self._local = threading.local()
+
+    def write(self, texto):
+        capturado = getattr(self._local, "capturado", None)
+        if capturado is None:
+            return self.destino.write(texto)
+        capturado.append(texto)
+        return len(texto)
+
+    def flush(self):
+        self.destino.flush()
+
+    @contextlib.contextmanager
+    def capturar(self):
+        """Retorna la lista de líneas que imprima el hilo actual dentro del bloque 'with'."""
+        capturado = []
+        self._local.capturado = capturado
+        try:
+            yield capturado
+        finally:
+            self._local.capturado = None
+
+
+# Caché de artefactos de cada proceso del grupo de compilación (ver _inicializar_proceso)
+_cache_proceso = None
+
+
+def _inicializar_proceso(carpeta_cache):
+    """Inicializador de cada proceso del grupo: abre la caché y deja cargados el lexer y el parser."""
+    global _cache_proceso
+    _cache_proceso = cache_artefactos.abrir(carpeta_cache) if carpeta_cache else None
+    compilador._inicializar_trabajador()
+
+
+def _compilar_resultado(codigo, ast_plano, cache):
+    """Resultado de compilar 'codigo' (de la caché, si se indica una)."""
+    if cache is not None:
+        return compilador.entrada_cache(codigo, ast_plano, cache)
+    return compilador.compilar_codigo(codigo, ast_plano=ast_plano)
+
+
+def _compilar_en_proceso(codigo, ast_plano):
+    """Compila en un proceso del grupo y retorna los campos de la respuesta."""
+    # El proceso compila una solicitud a la vez: aquí redirigir sys.stdout no afecta a otro hilo
+    with contextlib.redirect_stdout(io.StringIO()):
+        resultado = _compilar_resultado(codigo, ast_plano, _cache_proceso)
+    return {clave: resultado[clave] for clave in ("errores", "mensajes", "tac", "tac_opt", "asm")}
+
+
+class ServidorCompilacion:
+    """
+    Atiende solicitudes (diccionarios ya decodificados) con el pipeline cargado en este
+    proceso o, con procesos > 1, en un grupo de procesos ya cargados.
+    """
+
+    def __init__(self, carpeta_cache=None, procesos=1):
+        self.cache = cache_artefactos.abrir(carpeta_cache) if carpeta_cache else None
+        self.salida = None  # SalidaPorHilo instalada en sys.stdout (ver instalar_salida)
+        self.solicitudes = 0
+        self.procesos = procesos
+        self._cerrar = threading.Event()
+        self._lock = threading.Lock()
+        # Compilar un programa mínimo deja el lexer y el parser listos para la primera solicitud
+        compilador.compilar_codigo("int x = 0;")
+        self._grupo = None
+        if procesos > 1:
+            self._grupo = ProcessPoolExecutor(max_workers=procesos, initializer=_inicializar_proceso,
+                                              initargs=(carpeta_cache,))
+            # Enviar una compilación por proceso los arranca todos antes de la primera solicitud
+            list(self._grupo.map(_compilar_en_proceso, ["int x = 0;"] * procesos, [False] * procesos))
+        self.arranque = time.perf_counter() - _T_INICIO
+
+    def cerrar(self):
+        """Termina el grupo de procesos de compilación, si lo hay."""
+        if self._grupo is not None:
+            self._grupo.shutdown()
+
+    def instalar_salida(self, destino):
+        """Redirige sys.stdout a una SalidaPorHilo que escribe en 'destino' fuera de las solicitudes."""
+        self.salida = SalidaPorHilo(destino)
+        sys.stdout = self.salida
+
+    @property
+    def cerrado(self):
+        return self._cerrar.is_set()
+
+    def atender(self, solicitud):
+        """Respuesta (diccionario) a una solicitud; nunca lanza excepciones."""
+        respuesta = {"id": solicitud.get("id")} if isinstance(solicitud, dict) else {"id": None}
+        try:
+            respuesta.update(self._atender(solicitud))
+        except Exception as e:
+            respuesta.update(ok=False, error=f"{type(e).__name__}: {e}")
+        return respuesta
+
+    def _atender(self, solicitud):
+        if isinstance(solicitud, _SolicitudInvalida):
+            raise ValueError(solicitud["error"])
+        if not isinstance(solicitud, dict):
+            raise ValueError("la solicitud debe ser un objeto JSON")
+        comando = solicitud.get("comando", "compilar")
+        if comando == "ping":
+            return {"ok": True}
+        if comando == "estado":
+            return {"ok": True, "solicitudes": self.solicitudes, "arranque_ms": self.arranque * 1000,
+                    "procesos": self.procesos, "cache": self.cache.carpeta if self.cache is not None else None}
+        if comando == "cerrar":
+            self._cerrar.set()
+            return {"ok": True}
+        if comando != "compilar":
+            raise ValueError(f"comando desconocido: {comando!r}")
+        return self._compilar(solicitud)
+
+    def _compilar(self, solicitud):
+        t0 = time.perf_counter()
+        codigo = solicitud.get("codigo")
+        if codigo is None:
+            ruta = solicitud.get("ruta")
+            if ruta is None:
+                raise ValueError("falta 'codigo' o 'ruta'")
+            with open(ruta, encoding="utf-8") as f:
+                codigo = f.read()
+        ast_plano = bool(solicitud.get("ast_plano", False))
+        if self._grupo is not None:
+            resultado = self._grupo.submit(_compilar_en_proceso, codigo, ast_plano).result()
+        else:
+            # Lo que impriman las fases no debe mezclarse con las respuestas en la salida estándar
+            with self.salida.capturar() if self.salida is not None else contextlib.nullcontext():
+                resultado = _compilar_resultado(codigo, ast_plano, self.cache)
+        with self._lock:
+            self.solicitudes += 1
+        return {"ok": True, "errores": resultado["errores"], "mensajes": resultado["mensajes"],
+                "tac": resultado["tac"], "tac_opt": resultado["tac_opt"], "asm": resultado["asm"],
+                "ms": (time.perf_counter() - t0) * 1000}
+
+    def atender_linea(self, linea):
+        """Respuesta (texto JSON, sin salto de línea) a una solicitud en texto JSON."""
+        return json.dumps(self.atender(_decodificar(linea)), ensure_ascii=False)
+
+
+class _SolicitudInvalida(dict):
+    """Solicitud que no se pudo decodificar; atender() la responde con el error."""
+
+
+def _decodificar(linea):
+    try:
+        return json.loads(linea)
+    except ValueError as e:
+        return _SolicitudInvalida(error=f"JSON inválido: {e}")
+
+
+def servir_stdio(servidor, hilos=4, entrada=None, salida=None):
+    """Atiende las solicitudes de 'entrada' (sys.stdin) y escribe las respuestas en 'salida' (stdout)."""
+    entrada = entrada if entrada is not None else sys.stdin
+    salida = salida if salida is not None else sys.stdout
+    # Lo que impriman las fases fuera de una solicitud no debe mezclarse con las respuestas
+    servidor.instalar_salida(sys.stderr)
+    lock_salida = threading.Lock()
+
+    def responder(solicitud):
+        texto = json.dumps(servidor.atender(solicitud), ensure_ascii=False)
+        with lock_salida:
+            salida.write(texto + "\n")
+            salida.flush()
+
+    cierre = None
+    with ThreadPoolExecutor(max_workers=hilos) as pool:
+        for linea in entrada:
+            if not linea.strip():
+                continue
+            solicitud = _decodificar(linea)
+            if isinstance(solicitud, dict) and solicitud.get("comando") == "cerrar":
+                cierre = solicitud
+                break
+            pool.submit(responder, solicitud)
+    # Al salir del 'with' ya se respondieron las solicitudes pendientes
+    if cierre is not None:
+        responder(cierre)
+
+
+class _ManejadorConexion(socketserver.StreamRequestHandler):
+    """Atiende todas las solicitudes de una conexión, una por línea."""
+
+    def handle(self):
+        servidor = self.server.compilacion
+        for linea in self.rfile:
+            if not linea.strip():
+                continue
+            self.wfile.write((servidor.atender_linea(linea) + "\n").encode("utf-8"))
+            self.wfile.flush()
+            if servidor.cerrado:
+                # shutdown() espera a que termine serve_forever: se llama desde otro hilo
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+class _ServidorUnix(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def servir_socket(servidor, ruta):
+    """
+    Atiende conexiones en el socket Unix 'ruta' (un hilo por conexión) hasta el comando
+    'cerrar'. Solo el dueño del proceso puede conectarse (permisos 0600): las solicitudes
+    "ruta" leen cualquier archivo que el servidor pueda abrir.
+    """
+    if os.path.exists(ruta):
+        os.remove(ruta)  # socket de una ejecución anterior
+    servidor.instalar_salida(sys.stdout)
+    # Con la máscara 0177 el socket nace con permisos 0600, sin un instante accesible a otros
+    mascara = os.umask(0o177)
+    try:
+        servidor_unix = _ServidorUnix(ruta, _ManejadorConexion)
+    finally:
+        os.umask(mascara)
+    os.chmod(ruta, 0o600)
+    with servidor_unix:
+        servidor_unix.compilacion = servidor
+        try:
+            servidor_unix.serve_forever()
+        finally:
+            os.remove(ruta)
+
+
+def consultar(ruta, solicitud):
+    """Cliente mínimo: envía 'solicitud' (diccionario) al servidor en el socket 'ruta' y retorna la respuesta."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(ruta)
+        s.sendall((json.dumps(solicitud) + "\n").encode("utf-8"))
+        with s.makefile("rb") as f:
+            return json.loads(f.readline())
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Servidor de compilación (JSON por líneas)")
+    arg_parser.add_argument("--socket", default=None, metavar="RUTA",
+                            help="atender en un socket Unix en lugar de la entrada/salida estándar")
+    arg_parser.add_argument("-j", "--hilos", type=int, default=4,
+                            help="solicitudes atendidas a la vez por la entrada estándar")
+    arg_parser.add_argument("-p", "--procesos", type=int, default=0,
+                            help="procesos que compilan a la vez (0 = uno por núcleo; 1 = en los hilos del servidor)")
+    arg_parser.add_argument("--cache", default=cache_artefactos.DIR_CACHE, metavar="CARPETA",
+                            help="carpeta de la caché de artefactos (por defecto, $COMPILADOR_CACHE o cache_artefactos/)")
+    arg_parser.add_argument("--sin-cache", action="store_true",
+                            help="compilar cada solicitud sin leer ni escribir la caché de artefactos")
+    args = arg_parser.parse_args(argv)
+
+    procesos = args.procesos if args.procesos > 0 else (os.cpu_count() or 1)
+    servidor = ServidorCompilacion(None if args.sin_cache else args.cache, procesos)
+    print(f"Servidor listo en {servidor.arranque * 1000:.0f} ms ({procesos} procesos)", file=sys.stderr)
+    try:
+        if args.socket:
+            servir_socket(servidor, args.socket)
+        else:
+            servir_stdio(servidor, args.hilos)
+    finally:
+        servidor.cerrar()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
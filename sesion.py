@@ -0,0 +1,137 @@
+# sesion.py
+"""
+Sesión de compilación: guarda el resultado de cada fase del pipeline para el último código
+recibido y solo recalcula las fases cuya entrada cambió.
+
+    código -> tokens
+    código -> AST -> semántica (tabla de símbolos, errores)
+                  -> TAC -> SSA
+                         -> TAC optimizado -> ASM
+
+El código se identifica por su hash (huella). Cada fase siguiente compara su entrada con la
+que usó la última vez: si el código cambió pero el AST es igual (espacios, saltos de línea),
+no se repite la semántica ni la generación de TAC; si el TAC no cambió, tampoco la
+optimización ni el ensamblador. Las comparaciones son baratas porque el análisis
+incremental reutiliza los nodos de las sentencias que no cambiaron (la comparación de
+listas comienza por identidad).
+
+El AST sale del análisis incremental (parser descendente), que en un programa válido es
+idéntico al de PLY. Si el incremental no da un AST (error de sintaxis, o un anidamiento
+demasiado profundo para el parser descendente, que es recursivo) el código se vuelve a
+analizar completo con PLY, como compilador.py: los errores y el AST (PLY se recupera de
+algunos errores) son los de la línea de comandos, y un programa muy anidado compila igual.
+
+La usa main.py: recorrer los botones del pipeline sobre el mismo código no repite trabajo.
+"""
+import hashlib
+
+import lexico
+import sintactico
+import semantico
+import generador_codigo as gc
+import optimizador
+import generador_nasm
+from contexto import ContextoCompilacion, registrar_diagnosticos
+from incremental import AnalisisIncremental
+
+
+def huella(codigo):
+    """Hash (hex) del código fuente."""
+    return hashlib.sha256(codigo.encode("utf-8")).hexdigest()
+
+
+class SesionCompilacion:
+    """
+    Resultados de las fases para el código de la última llamada a actualizar(). Los valores
+    retornados se comparten entre llamadas: no deben modificarse.
+    'calculos' cuenta cuántas veces se calculó cada fase.
+    """
+
+    FASES = ("tokens", "ast", "semantica", "tac", "ssa", "tac_opt", "asm")
+
+    def __init__(self, frente=None):
+        self.frente = frente if frente is not None else AnalisisIncremental()
+        self.codigo = ""
+        self.huella = huella("")
+        self._resultados = {}    # fase -> (entrada, resultado)
+        self._errores = []       # errores léxicos y sintácticos del último AST calculado
+        self.calculos = dict.fromkeys(self.FASES, 0)
+
+    def actualizar(self, codigo):
+        """Registra el código actual. No calcula nada hasta que se pide una fase."""
+        if codigo != self.codigo:
+            self.codigo = codigo
+            self.huella = huella(codigo)
+
+    def _fase(self, nombre, entrada, calcular):
+        """Resultado de la fase 'nombre' para 'entrada', calculándolo solo si la entrada cambió."""
+        previo = self._resultados.get(nombre)
+        if previo is not None and (previo[0] is entrada or previo[0] == entrada):
+            return previo[1]
+        resultado = calcular(entrada)
+        self._resultados[nombre] = (entrada, resultado)
+        self.calculos[nombre] += 1
+        return resultado
+
+    # --- Fases ---
+
+    def tokens(self):
+        """Lista de tokens del código."""
+        self.ast()  # el análisis incremental es el que conserva los tokens
+        return self._fase("tokens", self.huella, lambda _: list(self.frente.tokens()))
+
+    def ast(self):
+        """AST del código, o None si tiene errores de sintaxis (ver errores_sintacticos)."""
+        return self._fase("ast", self.huella, self._analizar)
+
+    def _analizar(self, _):
+        """AST del análisis incremental o, si este no da uno, del análisis completo con PLY."""
+        ast = self.frente.actualizar(self.codigo)
+        self._errores = self.frente.errores
+        if ast is None:
+            self._errores = []
+            # Los errores se guardan (main.py los muestra) en lugar de imprimirse
+            with registrar_diagnosticos(self._errores, imprimir=False):
+                ast = sintactico.nuevo_parser("ply").parse(self.codigo,
+                                                           lexer=lexico.nuevo_lexer(self.frente.motor_lexer))
+        return ast
+
+    @property
+    def errores_sintacticos(self):
+        """Errores léxicos y sintácticos del código (tras calcular el AST)."""
+        self.ast()
+        return self._errores
+
+    def semantica(self):
+        """Tupla (tabla_simbolos, errores) del análisis semántico del AST."""
+        return self._fase("semantica", self.ast(), _analizar_semantica)
+
+    def tac(self):
+        """Instrucciones TAC del AST (lista vacía si no hay AST)."""
+        return self._fase("tac", self.ast(), _generar_tac)
+
+    def ssa(self):
+        return self._fase("ssa", self.tac(), gc._convertir_TAC_a_SSA)
+
+    def tac_opt(self):
+        return self._fase("tac_opt", self.tac(), optimizador.optimizar_tac)
+
+    def asm(self):
+        """Líneas de ensamblador NASM del TAC optimizado (no escribe ningún archivo)."""
+        return self._fase("asm", self.tac_opt(), _generar_asm)
+
+
+def _analizar_semantica(ast):
+    ctx = ContextoCompilacion()
+    semantico.analizar_semantica(ast, ctx=ctx)
+    return ctx.tabla_simbolos, ctx.errores
+
+
+def _generar_tac(ast):
+    if ast is None:
+        return []
+    return gc._generar_TAC_desde_AST(ast, ContextoCompilacion())
+
+
+def _generar_asm(tac_opt):
+    return generador_nasm.generar_codigo_maquina(tac_opt, ruta_asm=None)
@@ -0,0 +1,72 @@
+# simbolos.py
+"""
+Tabla de símbolos con ámbitos anidados para el análisis semántico (semantico.py).
+
+Cada nombre tiene una pila de enlaces: el último es la declaración visible (la del ámbito
+más interno), así que buscar un nombre cuesta O(1) sin importar la profundidad de
+anidamiento. Cada ámbito recuerda los nombres que declaró y cerrarlo quita esos enlaces,
+en O(k) para k declaraciones. Cada declaración es un Simbolo con un id único dentro de la
+compilación (1, 2, 3... en orden de declaración) para que las fases siguientes puedan
+referirse a símbolos en lugar de nombres.
+"""
+
+
+class Simbolo:
+    """Una declaración: nombre, tipo, nivel del ámbito donde se declaró y su entrada de la tabla."""
+
+    __slots__ = ("id", "nombre", "tipo", "nivel", "datos")
+
+    def __init__(self, id, nombre, tipo, nivel):
+        self.id = id
+        self.nombre = nombre
+        self.tipo = tipo
+        self.nivel = nivel
+        # Entrada pública {"id", "tipo", "valor"?}; el análisis guarda aquí el valor constante conocido
+        self.datos = {"id": id, "tipo": tipo}
+
+    def __repr__(self):
+        return f"Simbolo({self.id}, {self.nombre!r}, {self.tipo!r}, nivel={self.nivel})"
+
+
+class TablaSimbolos:
+    """Pila de ámbitos con una pila de enlaces por nombre."""
+
+    def __init__(self):
+        self._enlaces = {}  # nombre -> lista de Simbolo, el último es el visible
+        self._ambitos = [[]]  # por cada ámbito abierto, los nombres declarados en él (el primero es el global)
+        self.simbolos = []  # todas las declaraciones; el Simbolo con id N está en simbolos[N - 1]
+
+    @property
+    def nivel(self):
+        """Profundidad del ámbito actual (0 es el global)."""
+        return len(self._ambitos) - 1
+
+    def abrir_ambito(self):
+        self._ambitos.append([])
+
+    def cerrar_ambito(self):
+        """Cierra el ámbito actual: sus declaraciones dejan de ser visibles."""
+        for nombre in self._ambitos.pop():
+            pila = self._enlaces[nombre]
+            pila.pop()
+            if not pila:
+                del self._enlaces[nombre]
+
+    def buscar(self, nombre):
+        """Simbolo visible con 'nombre' (el del ámbito más interno), o None si no hay ninguno."""
+        pila = self._enlaces.get(nombre)
+        return pila[-1] if pila else None
+
+    def declarar(self, nombre, tipo):
+        """
+        Declara 'nombre' en el ámbito actual y retorna el nuevo Simbolo, o None si ya está
+        declarado en este mismo ámbito (una declaración de un ámbito externo se oculta).
+        """
+        visible = self.buscar(nombre)
+        if visible is not None and visible.nivel == self.nivel:
+            return None
+        simbolo = Simbolo(len(self.simbolos) + 1, nombre, tipo, self.nivel)
+        self.simbolos.append(simbolo)
+        self._enlaces.setdefault(nombre, []).append(simbolo)
+        self._ambitos[-1].append(nombre)
+        return simbolo
@@ -1,6 +1,22 @@
+import time
+
+# Marca de tiempo para medir cuánto tarda el parser en estar listo desde la importación
+_T_INICIO = time.perf_counter()
+
+import copy
+import os
+
 import ply.yacc as yacc
+
+import cache_tablas
+import ast_nodos
+from ast_nodos import Tipo
+from contexto import informar
 from lexico import tokens
 
+# Las acciones crean los nodos con p.parser.fabrica: el módulo ast_nodos (AST de objetos)
+# o un ast_plano.ArbolPlano (AST en arreglos, ver compilador.parsear_plano)
+
 # Precedencia de operadores actualizada
 precedence = (
     ('left', 'LOR'),          # Operador OR lógico
@@ -19,19 +35,21 @@ precedence = (
 # Reglas de gramática
 def p_program(p):
     '''program : statements'''
-    p[0] = ('program', p[1])
+    p[0] = p.parser.fabrica.Programa(p[1])
 
 def p_statements(p):
     '''statements : statements statement
                   | statement'''
     if len(p) == 3:
-        p[0] = p[1] + [p[2]]
+        # Acumular en la misma lista (p[1] + [p[2]] copiaría la lista en cada reducción: O(N²))
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
-        p[0] = [p[1]]
+        p[0] = p.parser.fabrica.secuencia(p[1])
 
 def p_statement_increment(p):
     'statement : ID INCREMENT SEMICOLON'
-    p[0] = ('increment_stmt', p[1])
+    p[0] = p.parser.fabrica.Variable(Tipo.INCREMENTO_STMT, p[1])
 
 def p_statement_declaration(p):
     '''statement : INT ID SEMICOLON
@@ -44,24 +62,25 @@ def p_statement_declaration(p):
                  | BOOL ID EQUALS TRUE SEMICOLON
                  | BOOL ID EQUALS FALSE SEMICOLON'''
     if len(p) == 4:  # Solo declaración
-        p[0] = ('declaracion, =', p[1], p[2])
+        p[0] = p.parser.fabrica.Declaracion(Tipo.DECLARACION, p[1], p[2])
     else:  # Declaración con asignación
-        p[0] = ('declaracion_asignacion, =', p[1], p[2], p[4])
+        p[0] = p.parser.fabrica.Declaracion(Tipo.DECLARACION_ASIGNACION, p[1], p[2], p[4])
 
 def p_statement_assignment(p):
     '''statement : ID EQUALS expression SEMICOLON
                  | ID EQUALS STRING_LITERAL SEMICOLON
                  | ID EQUALS TRUE SEMICOLON
                  | ID EQUALS FALSE SEMICOLON'''
-    p[0] = ('assignment, =', p[1], p[3])
+    p[0] = p.parser.fabrica.Asignacion(Tipo.ASIGNACION, p[1], p[3])
 
 def p_statement_for(p):
     '''statement : FOR LPAREN INT ID EQUALS NUMBER SEMICOLON expression SEMICOLON expression RPAREN statement
                 | FOR LPAREN ID EQUALS NUMBER SEMICOLON expression SEMICOLON expression RPAREN statement'''
+    nodos = p.parser.fabrica
     if len(p) == 13:  # Con declaración de variable (int i = 0;)
-        p[0] = ('for', ('declaration', p[3], p[4], p[6]), p[8], p[10], p[12])
+        p[0] = nodos.Para(nodos.Declaracion(Tipo.DECLARACION_FOR, p[3], p[4], nodos.crudo(p[6])), p[8], p[10], p[12])
     else:  # Sin declaración de variable (i = 0;)
-        p[0] = ('for', ('assignment', p[3], p[5]), p[7], p[9], p[11])
+        p[0] = nodos.Para(nodos.Asignacion(Tipo.ASIGNACION_EXPR, p[3], nodos.crudo(p[5])), p[7], p[9], p[11])
 
 # También necesitamos asegurarnos que expression pueda manejar incrementos
 def p_expression_increment(p):
@@ -69,31 +88,31 @@ def p_expression_increment(p):
                  | ID PLUS EQUALS NUMBER
                  | ID EQUALS ID PLUS NUMBER'''
     if len(p) == 4:  # i++
-        p[0] = ('increment', p[1])
+        p[0] = p.parser.fabrica.Variable(Tipo.INCREMENTO, p[1])
     elif len(p) == 5:  # i += 1
-        p[0] = ('increment_by', p[1], p[4])
+        p[0] = p.parser.fabrica.IncrementoPor(p[1], p[4])
     else:  # i = i + 1
-        p[0] = ('increment_assign', p[1], p[3], p[5])
+        p[0] = p.parser.fabrica.IncrementoAsignado(p[1], p[3], p[5])
 
 def p_statement_while(p):
     'statement : WHILE LPAREN expression RPAREN statement'
-    p[0] = ('while', p[3], p[5])
+    p[0] = p.parser.fabrica.Mientras(p[3], p[5])
 
 def p_statement_block(p):
     'statement : LBRACE statements RBRACE'
-    p[0] = ('block', p[2])
+    p[0] = p.parser.fabrica.Lista(Tipo.BLOQUE, p[2])
 
 def p_statement_if(p):
     '''statement : IF LPAREN expression RPAREN statement
                  | IF LPAREN expression RPAREN statement ELSE statement'''  
     if len(p) == 6:
-        p[0] = ('if', p[3], p[5])
+        p[0] = p.parser.fabrica.Si(p[3], p[5])
     else:
-        p[0] = ('if-else', p[3], p[5], p[7])
+        p[0] = p.parser.fabrica.Si(p[3], p[5], p[7])
 
 def p_statement_expression(p):
     'statement : expression SEMICOLON'
-    p[0] = ('expr', p[1])
+    p[0] = p.parser.fabrica.Expr(p[1])
 
 def p_expression_binop(p):
     '''expression : expression PLUS term
@@ -104,14 +123,14 @@ def p_expression_binop(p):
                   | expression LAND term
                   | expression EQ term
                   | expression NE term'''
-    p[0] = ('operation', p[2], p[1], p[3])
+    p[0] = p.parser.fabrica.Binaria(Tipo.OPERACION, p[2], p[1], p[3])
 
 def p_expression_comparison(p):
     '''expression : expression LT expression
                   | expression GT expression
                   | expression LE expression
                   | expression GE expression'''
-    p[0] = ('comparison', p[2], p[1], p[3])
+    p[0] = p.parser.fabrica.Binaria(Tipo.COMPARACION, p[2], p[1], p[3])
 
 def p_expression_term(p):
     'expression : term'
@@ -120,7 +139,7 @@ def p_expression_term(p):
 def p_term_binop(p):
     '''term : term TIMES factor
             | term DIVIDE factor'''
-    p[0] = ('operation', p[2], p[1], p[3])
+    p[0] = p.parser.fabrica.Binaria(Tipo.OPERACION, p[2], p[1], p[3])
 
 def p_term_factor(p):
     'term : factor'
@@ -129,24 +148,24 @@ def p_term_factor(p):
 def p_factor_num(p):
     '''factor : NUMBER
               | FLOAT'''
-    p[0] = ('number', p[1])
+    p[0] = p.parser.fabrica.Literal(Tipo.NUMERO, p[1])
 
 def p_factor_string(p):
     'factor : STRING_LITERAL'
-    p[0] = ('string', p[1])
+    p[0] = p.parser.fabrica.Literal(Tipo.CADENA, p[1])
 
 def p_factor_id(p):
     'factor : ID'
-    p[0] = ('id', p[1])
+    p[0] = p.parser.fabrica.Variable(Tipo.ID, p[1])
 
 def p_factor_true_false(p):
     '''factor : TRUE
               | FALSE'''
     # p.slice[1].type, trae la palabra true o false
     if p.slice[1].type == 'TRUE':
-        p[0] = ('bool_true', True)
+        p[0] = p.parser.fabrica.Literal(Tipo.VERDADERO, True)
     else:
-        p[0] = ('bool_false', False)
+        p[0] = p.parser.fabrica.Literal(Tipo.FALSO, False)
 
 def p_factor_expr(p):
     'factor : LPAREN expression RPAREN'
@@ -154,64 +173,148 @@ def p_factor_expr(p):
 
 def p_expression_equals(p):
     'expression : ID EQUALS expression'
-    p[0] = ('assignment', p[1], p[3])
+    p[0] = p.parser.fabrica.Asignacion(Tipo.ASIGNACION_EXPR, p[1], p[3])
 
 def p_expression_list(p):
     'expression : LBRACKET elements RBRACKET'
-    p[0] = ('list', p[2])
+    p[0] = p.parser.fabrica.Lista(Tipo.LISTA, p[2])
 
 def p_elements_multiple(p):
     'elements : elements COMMA expression'
-    p[0] = p[1] + [p[3]]
+    p[1].append(p[3])
+    p[0] = p[1]
 
 def p_elements_single(p):
     'elements : expression'
-    p[0] = [p[1]]
+    p[0] = p.parser.fabrica.secuencia(p[1])
 
 def p_elements_empty(p):
     'elements : '
-    p[0] = []
+    p[0] = p.parser.fabrica.secuencia()
 
 def p_error(p):
-    print("Error sintáctico en '%s'" % p.value if p else "Error en entrada")
+    if p is None:
+        informar("Error en entrada")
+    elif hasattr(p, 'columna'):
+        informar("Error sintáctico en '%s' (línea %d, columna %d)" % (p.value, p.lineno, p.columna))
+    else:
+        informar("Error sintáctico en '%s'" % p.value)
 
 def p_expression_logical_not(p):
     'expression : LNOT expression'
-    p[0] = ('not', p[2])
+    p[0] = p.parser.fabrica.Not(p[2])
 
 def p_expression_increment(p):
     'expression : ID INCREMENT'
-    p[0] = ('increment', p[1], '++')
+    p[0] = p.parser.fabrica.Variable(Tipo.INCREMENTO, p[1])
 
 def p_statement_increment(p):
     'statement : ID INCREMENT SEMICOLON'
-    p[0] = ('decrement_stmt', p[1])
+    p[0] = p.parser.fabrica.Variable(Tipo.DECREMENTO_STMT, p[1])
 
 
 def p_expression_decrement(p):
     'expression : ID DECREMENT'
-    p[0] = ('decrement', p[1], '--')  # Agregamos el símbolo para mayor claridad
+    p[0] = p.parser.fabrica.Variable(Tipo.DECREMENTO, p[1])
 
 def p_statement_decrement(p):
     'statement : ID DECREMENT SEMICOLON'
-    p[0] = ('decrement_stmt', p[1])  
+    p[0] = p.parser.fabrica.Variable(Tipo.DECREMENTO_STMT, p[1])  
   
 def p_expression_ternary(p):
     'expression : expression TERNARY expression COLON expression'
-    p[0] = ('ternary', p[1], p[3], p[5])
+    p[0] = p.parser.fabrica.Ternario(p[1], p[3], p[5])
 
 def p_statement_print(p):
     'statement : PRINT LPAREN args RPAREN SEMICOLON'
-    p[0] = ('print', p[3])   # Nodo AST: ('print', [expr1, expr2, ...])
+    p[0] = p.parser.fabrica.Lista(Tipo.IMPRIMIR, p[3])   # Nodo AST: print [expr1, expr2, ...]
 
 def p_args_multiple(p):
     'args : args COMMA expression'
-    p[0] = p[1] + [p[3]]
+    p[1].append(p[3])
+    p[0] = p[1]
 
 def p_args_single(p):
     'args : expression'
-    p[0] = [p[1]]
+    p[0] = p.parser.fabrica.secuencia(p[1])
+
+
+def _firma_gramatica():
+    """
+    Hash de la gramática: precedencia, tokens y las reglas p_* (nombre y producciones)
+    en el orden en que PLY las registra (por número de línea).
+    """
+    reglas = sorted(
+        (f.__code__.co_firstlineno, nombre, f.__doc__)
+        for nombre, f in globals().items()
+        if nombre.startswith('p_') and nombre != 'p_error' and callable(f)
+    )
+    return cache_tablas.firma(yacc.__tabversion__, precedence, tokens,
+                              [(nombre, doc) for _, nombre, doc in reglas])
+
+
+def construir_parser(forzar=False, debug=False):
+    """
+    Construye el analizador sintáctico cargando las tablas LALR precalculadas de
+    cache_tablas.DIR_TABLAS (parsetab_<hash>.pickle). Solo se regeneran si la gramática
+    cambió (o si 'forzar' es True). Nunca escribe parsetab.py ni parser.out, salvo
+    parser.out en modo 'debug' (ver la ejecución directa de este archivo).
+    Una tabla truncada o corrupta se regenera, y una tabla recién escrita solo se publica si
+    se puede volver a leer.
+    El parser crea el AST con la fábrica ast_nodos (atributo 'fabrica').
+    """
+    ruta = cache_tablas.ruta_tabla('parsetab', _firma_gramatica(), '.pickle')
+    if not forzar and os.path.exists(ruta):
+        try:
+            nuevo_parser = yacc.yacc(debug=False, write_tables=False, optimize=True, picklefile=ruta)
+            nuevo_parser.fabrica = ast_nodos
+            return nuevo_parser
+        except Exception:
+            pass  # Tabla corrupta o de otra versión de PLY: reconstruir
+    if not cache_tablas.preparar_directorio():
+        nuevo_parser = yacc.yacc(debug=False, write_tables=False)
+    else:
+        ruta_tmp = cache_tablas.ruta_temporal(ruta)
+        nuevo_parser = yacc.yacc(debug=debug, write_tables=False, picklefile=ruta_tmp,
+                                 outputdir=cache_tablas.DIR_TABLAS)
+        if os.path.exists(ruta_tmp):
+            try:
+                # yacc solo advierte si la escritura falla a medias: no publicar una tabla parcial
+                yacc.LRTable().read_pickle(ruta_tmp)
+            except Exception:
+                os.remove(ruta_tmp)
+            else:
+                cache_tablas.publicar(ruta_tmp, ruta, 'parsetab')
+    nuevo_parser.fabrica = ast_nodos
+    return nuevo_parser
 
 
 # Construir el analizador sintáctico
-parser = yacc.yacc()
+parser = construir_parser()
+
+# Tiempo (en segundos) desde la importación hasta tener el parser listo
+TIEMPO_CARGA = time.perf_counter() - _T_INICIO
+
+# Motores sintácticos disponibles: tablas LALR de PLY o descenso recursivo (sintactico_descendente)
+MOTORES_PARSER = ('ply', 'descendente')
+MOTOR_PARSER = os.environ.get('COMPILADOR_PARSER', 'ply')
+
+
+def nuevo_parser(motor=None):
+    """
+    Retorna un parser independiente (su estado de análisis y su 'fabrica' son propios) del
+    motor indicado, o de MOTOR_PARSER si no se indica.
+    """
+    motor = motor or MOTOR_PARSER
+    if motor == 'descendente':
+        from sintactico_descendente import ParserDescendente
+        return ParserDescendente()
+    if motor != 'ply':
+        raise ValueError(f"Motor sintáctico desconocido: {motor} (opciones: {', '.join(MOTORES_PARSER)})")
+    return copy.copy(parser)
+
+
+if __name__ == '__main__':
+    # Regenerar las tablas del parser (y parser.out con el detalle de estados) en cache_tablas.DIR_TABLAS
+    construir_parser(forzar=True, debug=True)
+    print(f"Tablas regeneradas en {cache_tablas.DIR_TABLAS}")
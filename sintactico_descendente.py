@@ -0,0 +1,368 @@
+# sintactico_descendente.py
+"""
+Motor sintáctico alternativo a ply.yacc: descenso recursivo para las sentencias y Pratt
+(precedencia por niveles) para las expresiones. Reconoce el mismo lenguaje que la gramática
+de sintactico.py y construye exactamente el mismo AST, con la misma fábrica (p.parser.fabrica
+en las acciones de PLY, aquí ParserDescendente.fabrica).
+
+Los niveles de precedencia salen de sintactico.precedence. Para producir el mismo árbol que
+las tablas LALR se reproducen también las decisiones con que PLY resuelve los conflictos de
+la gramática (ver parser.out al ejecutar sintactico.py):
+
+- LOR, LAND, EQ y NE solo admiten un 'term' a la derecha, así que se reducen en cuanto
+  termina ese término: a == b + c es (a == b) + c.
+- PLUS y MINUS seguidos de un 'term' se reducen también de inmediato (conflicto
+  reducción/reducción resuelto con 'expression -> expression PLUS term'); solo si el operando
+  derecho es otra expresión (!x, [..], x = .., x++, x--) se compara la precedencia.
+- 'ID = expression' y los dos últimos operandos del ternario abarcan toda la expresión
+  siguiente: esas reglas no tienen precedencia (su último terminal es EQUALS o COLON) y
+  PLY resuelve sus conflictos desplazando. a ? b : c + d es a ? b : (c + d).
+- 'x++;' y 'x--;' son sentencias de expresión: la regla 'ID INCREMENT' tiene precedencia y
+  PLY la reduce antes de desplazar SEMICOLON, así que 'statement : ID INCREMENT SEMICOLON'
+  nunca se usa.
+- En una sentencia, 'x = "texto";' y 'x = true;' guardan el valor crudo del token (regla
+  'ID EQUALS STRING_LITERAL SEMICOLON'), igual que con PLY.
+
+Ante un error de sintaxis se informa con sintactico.p_error (mismo mensaje) y parse()
+retorna None; a diferencia de PLY no se intenta recuperar el análisis. Por eso
+sesion.py (la interfaz gráfica) vuelve a analizar con PLY cuando no obtiene un AST.
+
+analizar_fragmento() analiza un tramo de sentencias de primer nivel sin informar errores;
+es la base del análisis incremental del editor (incremental.py).
+"""
+import ast_nodos
+import lexico
+from ast_nodos import Tipo
+from contexto import informar
+from sintactico import precedence, p_error
+
+# Nivel de precedencia (1 = el más bajo) y asociatividad de cada token, según sintactico.precedence
+_NIVELES = {token: (nivel, asociatividad == 'right')
+            for nivel, (asociatividad, *tokens) in enumerate(precedence, start=1)
+            for token in tokens}
+
+# Operadores binarios que pueden seguir a una 'expression'
+_OPERADOR_TERMINO = frozenset(('LOR', 'LAND', 'EQ', 'NE'))     # expression OP term
+_OPERADOR_SUMA = frozenset(('PLUS', 'MINUS'))                  # expression OP term | expression OP expression
+_OPERADOR_COMPARACION = frozenset(('LT', 'GT', 'LE', 'GE'))    # expression OP expression
+_BINARIOS = {tipo: _NIVELES[tipo] for tipo in
+             _OPERADOR_TERMINO | _OPERADOR_SUMA | _OPERADOR_COMPARACION | {'TERNARY'}}
+
+# Tokens con los que empieza un 'factor' (y por tanto un 'term')
+_INICIO_FACTOR = frozenset(('NUMBER', 'FLOAT', 'STRING_LITERAL', 'ID', 'TRUE', 'FALSE', 'LPAREN'))
+# Tokens con los que empieza una 'expression'
+_INICIO_EXPRESION = _INICIO_FACTOR | {'LNOT', 'LBRACKET'}
+# Tras un ID, estos tokens forman una expresión que no es un 'factor' (x = .., x++, x--)
+_TRAS_ID_EXPRESION = frozenset(('EQUALS', 'INCREMENT', 'DECREMENT'))
+_TIPOS_DECLARACION = frozenset(('INT', 'FLOAT', 'STRING', 'BOOL'))
+
+
+class _ErrorSintactico(Exception):
+    def __init__(self, tok):
+        self.tok = tok
+
+
+class _Fin:
+    """Token centinela de fin de entrada (p_error lo recibe como None)."""
+    type = '$end'
+    value = None
+
+
+FIN = _Fin()
+
+
+class ParserDescendente:
+    """
+    Parser de descenso recursivo con la interfaz que usa compilador.parsear:
+    atributo 'fabrica' y parse(codigo, lexer=...).
+    """
+
+    def __init__(self, fabrica=ast_nodos):
+        self.fabrica = fabrica
+
+    def parse(self, input=None, lexer=None):
+        """Analiza 'input' (o lo que ya tenga cargado 'lexer'). Retorna el AST o None si hay errores."""
+        if lexer is None:
+            lexer = lexico.nuevo_lexer()
+        if input is not None:
+            lexer.input(input)
+        analisis = _Analisis(lexer, self.fabrica)
+        try:
+            return analisis.programa()
+        except _ErrorSintactico as e:
+            p_error(None if e.tok is FIN else e.tok)
+        except RecursionError:
+            informar("Error sintáctico: anidamiento demasiado profundo")
+        return None
+
+
+def analizar_fragmento(lexer, fabrica=ast_nodos):
+    """
+    Analiza una secuencia de sentencias de primer nivel (posiblemente vacía) hasta el fin de
+    la entrada de 'lexer', sin informar errores. La usa incremental.AnalisisIncremental para
+    reanalizar solo un tramo del programa.
+    Retorna (sentencias, posiciones, error): las sentencias completas, el lexpos del primer
+    token de cada una y, si hubo un error de sintaxis, el token donde ocurrió (FIN si la
+    entrada terminó antes de completar una sentencia); si no hubo error, None.
+    """
+    analisis = _Analisis(lexer, fabrica)
+    sentencias = []
+    posiciones = []
+    try:
+        while analisis.tok is not FIN:
+            posiciones.append(analisis.tok.lexpos)
+            sentencias.append(analisis.sentencia())
+    except _ErrorSintactico as e:
+        del posiciones[len(sentencias):]
+        return sentencias, posiciones, e.tok
+    return sentencias, posiciones, None
+
+
+class _Analisis:
+    """Estado de un análisis: lexer, token actual y tokens leídos por adelantado."""
+
+    def __init__(self, lexer, fabrica):
+        self.lexer = lexer
+        self.f = fabrica
+        self.adelantados = []
+        self.tok = lexer.token() or FIN
+
+    # --- Tokens ---
+
+    def avanzar(self):
+        """Consume el token actual y lo retorna."""
+        tok = self.tok
+        if self.adelantados:
+            self.tok = self.adelantados.pop(0)
+        else:
+            self.tok = self.lexer.token() or FIN
+        return tok
+
+    def siguiente(self, k=1):
+        """Tipo del token k posiciones después del actual, sin consumir nada."""
+        while len(self.adelantados) < k:
+            self.adelantados.append(self.lexer.token() or FIN)
+        return self.adelantados[k - 1].type
+
+    def esperar(self, tipo):
+        """Consume un token de 'tipo' y retorna su valor; si el token actual es otro, error."""
+        if self.tok.type != tipo:
+            raise _ErrorSintactico(self.tok)
+        return self.avanzar().value
+
+    # --- Sentencias ---
+
+    def programa(self):
+        sentencias = self.sentencias('$end')
+        return self.f.Programa(sentencias)
+
+    def sentencias(self, cierre):
+        """statements: una o más sentencias hasta el token 'cierre' (que no se consume)."""
+        if self.tok.type == cierre:
+            raise _ErrorSintactico(self.tok)
+        lista = self.f.secuencia()
+        while self.tok.type != cierre:
+            lista.append(self.sentencia())
+        return lista
+
+    def sentencia(self):
+        f = self.f
+        tipo = self.tok.type
+        if tipo in _TIPOS_DECLARACION and (tipo != 'FLOAT' or self.siguiente() == 'ID'):
+            return self.declaracion()
+        if tipo == 'ID':
+            if self.siguiente() == 'EQUALS':
+                return self.asignacion()
+        elif tipo == 'FOR':
+            return self.para()
+        elif tipo == 'WHILE':
+            self.avanzar()
+            self.esperar('LPAREN')
+            condicion = self.expresion()
+            self.esperar('RPAREN')
+            return f.Mientras(condicion, self.sentencia())
+        elif tipo == 'IF':
+            self.avanzar()
+            self.esperar('LPAREN')
+            condicion = self.expresion()
+            self.esperar('RPAREN')
+            entonces = self.sentencia()
+            if self.tok.type == 'ELSE':
+                self.avanzar()
+                return f.Si(condicion, entonces, self.sentencia())
+            return f.Si(condicion, entonces)
+        elif tipo == 'LBRACE':
+            self.avanzar()
+            sentencias = self.sentencias('RBRACE')
+            self.avanzar()
+            return f.Lista(Tipo.BLOQUE, sentencias)
+        elif tipo == 'PRINT':
+            self.avanzar()
+            self.esperar('LPAREN')
+            argumentos = f.secuencia(self.expresion())
+            while self.tok.type == 'COMMA':
+                self.avanzar()
+                argumentos.append(self.expresion())
+            self.esperar('RPAREN')
+            self.esperar('SEMICOLON')
+            return f.Lista(Tipo.IMPRIMIR, argumentos)
+        if tipo not in _INICIO_EXPRESION:
+            raise _ErrorSintactico(self.tok)
+        expresion = self.expresion()
+        self.esperar('SEMICOLON')
+        return f.Expr(expresion)
+
+    def declaracion(self):
+        tipo_dato = self.tok.type
+        tipo_texto = self.avanzar().value
+        nombre = self.esperar('ID')
+        if self.tok.type == 'SEMICOLON':
+            self.avanzar()
+            return self.f.Declaracion(Tipo.DECLARACION, tipo_texto, nombre)
+        self.esperar('EQUALS')
+        if tipo_dato == 'STRING':
+            valor = self.esperar('STRING_LITERAL')
+        elif tipo_dato == 'BOOL':
+            if self.tok.type not in ('TRUE', 'FALSE'):
+                raise _ErrorSintactico(self.tok)
+            valor = self.avanzar().value
+        else:
+            valor = self.expresion()
+        self.esperar('SEMICOLON')
+        return self.f.Declaracion(Tipo.DECLARACION_ASIGNACION, tipo_texto, nombre, valor)
+
+    def asignacion(self):
+        """ID EQUALS (expression | STRING_LITERAL | TRUE | FALSE) SEMICOLON"""
+        nombre = self.avanzar().value
+        self.avanzar()
+        if self.tok.type in ('STRING_LITERAL', 'TRUE', 'FALSE') and self.siguiente() == 'SEMICOLON':
+            valor = self.avanzar().value
+        else:
+            valor = self.expresion()
+        self.esperar('SEMICOLON')
+        return self.f.Asignacion(Tipo.ASIGNACION, nombre, valor)
+
+    def para(self):
+        f = self.f
+        self.avanzar()
+        self.esperar('LPAREN')
+        if self.tok.type == 'INT':
+            tipo_texto = self.avanzar().value
+            nombre = self.esperar('ID')
+            self.esperar('EQUALS')
+            inicio = f.Declaracion(Tipo.DECLARACION_FOR, tipo_texto, nombre, f.crudo(self.esperar('NUMBER')))
+        else:
+            nombre = self.esperar('ID')
+            self.esperar('EQUALS')
+            inicio = f.Asignacion(Tipo.ASIGNACION_EXPR, nombre, f.crudo(self.esperar('NUMBER')))
+        self.esperar('SEMICOLON')
+        condicion = self.expresion()
+        self.esperar('SEMICOLON')
+        actualizacion = self.expresion()
+        self.esperar('RPAREN')
+        return f.Para(inicio, condicion, actualizacion, self.sentencia())
+
+    # --- Expresiones ---
+
+    def expresion(self, nivel=0):
+        """
+        expression cuyos operadores binarios tienen precedencia mayor que 'nivel'
+        (o igual, si son asociativos por la derecha). nivel=0 acepta cualquier operador.
+        """
+        f = self.f
+        izq = self.prefijo()
+        while True:
+            tipo = self.tok.type
+            operador = _BINARIOS.get(tipo)
+            if operador is None:
+                return izq
+            precedencia, derecha = operador
+            if precedencia < nivel or (precedencia == nivel and not derecha):
+                return izq
+            op = self.avanzar().value
+            if tipo in _OPERADOR_TERMINO:
+                izq = f.Binaria(Tipo.OPERACION, op, izq, self.termino())
+            elif tipo in _OPERADOR_SUMA:
+                if self.empieza_termino():
+                    der = self.termino()
+                else:
+                    der = self.expresion(precedencia)
+                izq = f.Binaria(Tipo.OPERACION, op, izq, der)
+            elif tipo in _OPERADOR_COMPARACION:
+                izq = f.Binaria(Tipo.COMPARACION, op, izq, self.expresion(precedencia))
+            else:  # TERNARY
+                si_verdadero = self.expresion()
+                self.esperar('COLON')
+                izq = f.Ternario(izq, si_verdadero, self.expresion())
+
+    def empieza_termino(self):
+        """True si lo que sigue se reduce como un 'term' (y no como otra 'expression')."""
+        tipo = self.tok.type
+        if tipo == 'ID':
+            return self.siguiente() not in _TRAS_ID_EXPRESION
+        return tipo in _INICIO_FACTOR
+
+    def prefijo(self):
+        """Expresiones que no empiezan con otra expresión: !e, [..], x = e, x++, x-- y 'term'."""
+        f = self.f
+        tipo = self.tok.type
+        if tipo == 'LNOT':
+            self.avanzar()
+            # LNOT tiene la mayor precedencia: ningún operador binario se agrega a su operando
+            return f.Not(self.prefijo())
+        if tipo == 'ID':
+            siguiente = self.siguiente()
+            if siguiente == 'EQUALS':
+                nombre = self.avanzar().value
+                self.avanzar()
+                return f.Asignacion(Tipo.ASIGNACION_EXPR, nombre, self.expresion())
+            if siguiente == 'INCREMENT':
+                nombre = self.avanzar().value
+                self.avanzar()
+                return f.Variable(Tipo.INCREMENTO, nombre)
+            if siguiente == 'DECREMENT':
+                nombre = self.avanzar().value
+                self.avanzar()
+                return f.Variable(Tipo.DECREMENTO, nombre)
+        elif tipo == 'LBRACKET':
+            self.avanzar()
+            elementos = f.secuencia()
+            if self.tok.type not in ('COMMA', 'RBRACKET'):
+                elementos.append(self.expresion())
+            # 'elements' puede empezar vacío: [, a] es [a]
+            while self.tok.type == 'COMMA':
+                self.avanzar()
+                elementos.append(self.expresion())
+            self.esperar('RBRACKET')
+            return f.Lista(Tipo.LISTA, elementos)
+        return self.termino()
+
+    def termino(self):
+        """term: factor ((TIMES | DIVIDE) factor)*, asociativo por la izquierda."""
+        izq = self.factor()
+        while self.tok.type in ('TIMES', 'DIVIDE'):
+            op = self.avanzar().value
+            izq = self.f.Binaria(Tipo.OPERACION, op, izq, self.factor())
+        return izq
+
+    def factor(self):
+        f = self.f
+        tipo = self.tok.type
+        if tipo == 'NUMBER' or tipo == 'FLOAT':
+            return f.Literal(Tipo.NUMERO, self.avanzar().value)
+        if tipo == 'ID':
+            return f.Variable(Tipo.ID, self.avanzar().value)
+        if tipo == 'STRING_LITERAL':
+            return f.Literal(Tipo.CADENA, self.avanzar().value)
+        if tipo == 'TRUE':
+            self.avanzar()
+            return f.Literal(Tipo.VERDADERO, True)
+        if tipo == 'FALSE':
+            self.avanzar()
+            return f.Literal(Tipo.FALSO, False)
+        if tipo == 'LPAREN':
+            self.avanzar()
+            expresion = self.expresion()
+            self.esperar('RPAREN')
+            return expresion
+        raise _ErrorSintactico(self.tok)
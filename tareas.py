@@ -0,0 +1,261 @@
+# tareas.py
+"""
+Ejecución de trabajos fuera del hilo de la interfaz (main.py).
+
+Un Despachador tiene un hilo trabajador que ejecuta los trabajos en orden. Los resultados
+vuelven al hilo de la interfaz por una cola que este vacía con sondear() (en main.py,
+cada 16 ms con ventana.after): tkinter no admite tocar widgets desde otro hilo, así que
+los trabajos solo calculan y las funciones de respuesta muestran.
+
+Cada trabajo se envía con una clave (por ejemplo, "lexico" o "ejecutable"). Enviar otro
+trabajo con la misma clave cancela el anterior, y cancelar() cancela los de las claves
+indicadas (todos si no se indica ninguna; main.py lo hace al editar el código). El
+resultado de un trabajo cancelado o reemplazado se descarta aunque ya esté calculado.
+La cancelación es cooperativa: el trabajo llama a Tarea.comprobar() entre etapas, los
+procesos externos lanzados con Tarea.ejecutar() se terminan en cuanto se cancela y las
+corrutinas que corren con Tarea.esperar() se cancelan (asyncio.CancelledError). Mientras
+corre, un trabajo puede mandar avances a la interfaz con Tarea.avisar() (por ejemplo, la
+salida de un programa a medida que llega).
+
+Mientras corre un trabajo se pausa el recolector cíclico (en todo el proceso: gc.disable no
+es por hilo, pero la pausa dura solo lo que el trabajo): con el AST de un programa grande en
+memoria, cada recolección recorre todos los objetos nuevos sin soltar el GIL (cientos de
+milisegundos) y congela la interfaz. Al terminar, lo que creó el trabajo pasa a la
+generación permanente (gc.freeze) para que la primera recolección, en cualquier hilo, no lo
+recorra de todos modos. Esos objetos se siguen liberando por conteo de referencias; los
+ciclos se recolectan cuando pasan ESPERA_RECOLECCION segundos sin trabajos y sin actividad
+en la interfaz: entonces el hilo trabajador los descongela (gc.unfreeze) y hace una
+recolección completa, con su pausa. Que no haya trabajos no basta (escribir en el editor no
+envía ninguno), así que main.py avisa cada tecla, clic o movimiento con actividad().
+
+Aun así, el hilo de la interfaz espera el GIL hasta el intervalo de cambio de hilo de
+Python (5 ms por defecto) en cada cuadro; main.py lo baja a INTERVALO_GIL para que los
+cuadros de 16 ms no se estiren a 21 ms, a cambio de un trabajo algo más lento.
+"""
+import gc
+import queue
+import threading
+import time
+
+# Intervalo de cambio de hilo (sys.setswitchinterval) recomendado mientras hay una interfaz
+INTERVALO_GIL = 0.001
+
+# Segundos sin trabajos ni actividad en la interfaz tras los que el hilo trabajador recolecta
+# lo que congelaron los trabajos
+ESPERA_RECOLECCION = 2.0
+
+
+class TareaCancelada(BaseException):
+    """
+    Se lanza dentro de un trabajo cancelado. Hereda de BaseException (como
+    asyncio.CancelledError) para que los 'except Exception' del trabajo no la atrapen.
+    """
+
+
+class Tarea:
+    """Un trabajo enviado al Despachador: permite cancelarlo y comprobar si fue cancelado."""
+
+    def __init__(self, clave):
+        self.clave = clave
+        self._cancelada = threading.Event()
+        self._al_cancelar = []  # funciones que detienen lo que el trabajo está esperando
+        self._avisar = None  # la pone el Despachador si el trabajo tiene al_avanzar
+        self._lock = threading.Lock()
+
+    @property
+    def cancelada(self):
+        return self._cancelada.is_set()
+
+    def cancelar(self):
+        """Marca la tarea como cancelada y detiene los procesos o corrutinas que esté esperando."""
+        with self._lock:
+            self._cancelada.set()
+            for detener in self._al_cancelar:
+                detener()
+
+    def avisar(self, valor):
+        """Entrega 'valor' a la función al_avanzar del trabajo, en el hilo de la interfaz."""
+        if self._avisar is not None:
+            self._avisar(valor)
+
+    def comprobar(self):
+        """Lanza TareaCancelada si la tarea fue cancelada; se llama entre etapas del trabajo."""
+        if self._cancelada.is_set():
+            raise TareaCancelada(self.clave)
+
+    def ejecutar(self, args, **kwargs):
+        """
+        Como subprocess.run(args, check=True, **kwargs), pero el proceso se termina si la
+        tarea se cancela mientras corre (y entonces lanza TareaCancelada).
+        """
+        import subprocess  # main.py importa este módulo al arrancar: se carga al usarse
+        with self._lock:
+            self.comprobar()
+            proceso = subprocess.Popen(args, **kwargs)
+            self._al_cancelar.append(proceso.kill)
+        try:
+            salida, errores = proceso.communicate()
+        finally:
+            with self._lock:
+                self._al_cancelar.remove(proceso.kill)
+        self.comprobar()
+        if proceso.returncode:
+            raise subprocess.CalledProcessError(proceso.returncode, args, salida, errores)
+        return subprocess.CompletedProcess(args, proceso.returncode, salida, errores)
+
+    def esperar(self, corrutina):
+        """
+        Ejecuta 'corrutina' con asyncio.run y retorna su resultado. Si la tarea se cancela
+        mientras corre, la corrutina recibe asyncio.CancelledError y se lanza TareaCancelada.
+        """
+        import asyncio  # como subprocess en ejecutar()
+
+        async def principal():
+            actual = asyncio.current_task()
+            bucle = asyncio.get_running_loop()
+
+            def detener():
+                bucle.call_soon_threadsafe(actual.cancel)
+
+            with self._lock:
+                if self._cancelada.is_set():
+                    corrutina.close()
+                    raise TareaCancelada(self.clave)
+                self._al_cancelar.append(detener)
+            try:
+                return await corrutina
+            finally:
+                with self._lock:
+                    self._al_cancelar.remove(detener)
+
+        try:
+            return asyncio.run(principal())
+        except asyncio.CancelledError:
+            raise TareaCancelada(self.clave) from None
+
+
+class Despachador:
+    """Ejecuta trabajos en un hilo trabajador y entrega sus resultados al hilo que llama a sondear()."""
+
+    def __init__(self, espera_recoleccion=ESPERA_RECOLECCION):
+        self.espera_recoleccion = espera_recoleccion
+        self._ultima_actividad = time.monotonic()  # último trabajo terminado o aviso de actividad()
+        self._pendientes = queue.Queue()  # (tarea, trabajo, al_terminar, al_fallar) o None para terminar
+        self._resultados = queue.Queue()  # (tarea, función de respuesta, valor, es el resultado final)
+        self._vigentes = {}  # clave -> Tarea cuyo resultado todavía se espera
+        self._lock = threading.Lock()
+        self._hilo = threading.Thread(target=self._trabajar, name="despachador", daemon=True)
+        self._hilo.start()
+
+    def enviar(self, clave, trabajo, al_terminar, al_fallar=None, al_avanzar=None):
+        """
+        Ejecuta trabajo(tarea) en el hilo trabajador y luego, en el hilo de sondear(),
+        al_terminar(resultado) o al_fallar(excepción) si el trabajo lanzó una (sin
+        al_fallar, la excepción se relanza en sondear()). Cada tarea.avisar(valor) del
+        trabajo llega antes a al_avanzar(valor). Cancela el trabajo anterior con la misma
+        clave. Retorna la Tarea.
+        """
+        tarea = Tarea(clave)
+        if al_avanzar is not None:
+            tarea._avisar = lambda valor: self._resultados.put((tarea, al_avanzar, valor, False))
+        with self._lock:
+            anterior = self._vigentes.get(clave)
+            if anterior is not None:
+                anterior.cancelar()
+            self._vigentes[clave] = tarea
+        self._pendientes.put((tarea, trabajo, al_terminar, al_fallar))
+        return tarea
+
+    def cancelar(self, *claves, excepto=()):
+        """
+        Cancela los trabajos vigentes de las claves indicadas (de todas menos 'excepto', sin
+        claves). Retorna la lista de claves cuyos trabajos se cancelaron.
+        """
+        canceladas = []
+        with self._lock:
+            for clave in claves or [clave for clave in self._vigentes if clave not in excepto]:
+                tarea = self._vigentes.pop(clave, None)
+                if tarea is not None:
+                    tarea.cancelar()
+                    canceladas.append(clave)
+        return canceladas
+
+    def actividad(self):
+        """
+        Avisa que la interfaz está en uso (main.py lo llama con cada tecla, clic o movimiento):
+        la recolección de lo congelado espera a que pase espera_recoleccion sin actividad.
+        """
+        self._ultima_actividad = time.monotonic()
+
+    @property
+    def ocupado(self):
+        """True si hay trabajos cuyo resultado todavía no se entregó."""
+        return bool(self._vigentes)
+
+    def _vigente(self, tarea):
+        return self._vigentes.get(tarea.clave) is tarea and not tarea.cancelada
+
+    def _trabajar(self):
+        congelados = False  # algún trabajo congeló objetos desde la última recolección
+        while True:
+            espera = None
+            if congelados:
+                espera = self._ultima_actividad + self.espera_recoleccion - time.monotonic()
+                if espera <= 0:
+                    # Sin trabajos ni actividad en la interfaz: recolectar los ciclos que hayan
+                    # quedado en la generación permanente
+                    gc.unfreeze()
+                    gc.collect()
+                    congelados = False
+                    continue
+            try:
+                elemento = self._pendientes.get(timeout=espera)
+            except queue.Empty:
+                continue
+            if elemento is None:
+                return
+            tarea, trabajo, al_terminar, al_fallar = elemento
+            if not self._vigente(tarea):
+                continue  # reemplazado o cancelado antes de empezar
+            gc.disable()
+            try:
+                valor = trabajo(tarea)
+                respuesta = al_terminar
+            except TareaCancelada:
+                continue
+            except Exception as e:
+                valor, respuesta = e, al_fallar
+            finally:
+                gc.freeze()
+                gc.enable()
+                congelados = True
+                self._ultima_actividad = time.monotonic()
+            self._resultados.put((tarea, respuesta, valor, True))
+
+    def sondear(self):
+        """
+        Entrega los resultados listos (se llama desde el hilo de la interfaz). Los de
+        trabajos cancelados o reemplazados se descartan. Retorna cuántos se entregaron.
+        """
+        entregados = 0
+        while True:
+            try:
+                tarea, respuesta, valor, final = self._resultados.get_nowait()
+            except queue.Empty:
+                return entregados
+            with self._lock:
+                if not self._vigente(tarea):
+                    continue
+                if final:
+                    del self._vigentes[tarea.clave]
+            entregados += 1
+            if respuesta is not None:
+                respuesta(valor)
+            elif isinstance(valor, Exception):
+                raise valor
+
+    def cerrar(self):
+        """Cancela los trabajos vigentes y termina el hilo trabajador."""
+        self.cancelar()
+        self._pendientes.put(None)
+        self._hilo.join()
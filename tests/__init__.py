@@ -0,0 +1,2 @@
+# tests: pruebas automáticas (guardas de complejidad, paridad de motores, anidamiento profundo).
+# Se ejecutan desde la raíz del proyecto: python -m unittest discover -s tests -t .  (o python -m pytest tests)
@@ -0,0 +1,115 @@
+# tests/test_guardas.py
+"""
+Las comprobaciones de benchmarks/ como pruebas para CI, con semillas fijas y tamaños chicos
+(los scripts de benchmarks/ siguen sirviendo para medir con los tamaños grandes):
+
+- escalado: cada fase del compilador y parser.parse crecen linealmente al duplicar la
+  entrada (benchmarks.escalado y benchmarks.escalado_parser);
+- paridad: los motores 'ply' y 'descendente' dan el mismo AST; la sesión de la interfaz
+  gráfica da los mismos resultados y errores que el compilador; el análisis incremental
+  da los mismos AST y errores que un análisis nuevo (benchmarks.parser, benchmarks.sesion
+  y benchmarks.incremental);
+- profundidad: programas más anidados que sys.getrecursionlimit() compilan sin
+  RecursionError, también con el AST plano y por la sesión (benchmarks.profundidad).
+
+Uso (desde la raíz del proyecto):
+    python -m unittest discover -s tests -t .
+    python -m pytest tests
+"""
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+from benchmarks import escalado, escalado_parser, incremental, parser, profundidad, sesion
+
+SEMILLA = 0
+PASOS = 3                   # tamaños de cada guarda de complejidad (cada uno el doble)
+HOLGURA = 0.5               # exceso sobre el exponente lineal; un cuadrático (N^2) igual falla
+MINIMO_MS = 5.0             # fases más rápidas que esto no se comprueban: su tiempo es ruido
+INICIAL_PARSER = 4000       # sentencias del programa más chico de benchmarks.escalado_parser
+FACTOR_PARSER = 2.6         # cociente máximo al duplicar (lineal = 2)
+ALEATORIOS = 300            # programas aleatorios de la paridad de motores
+EDICIONES = 100             # ediciones al azar de la paridad del análisis incremental
+PROFUNDIDAD = 3000          # niveles de anidamiento, por encima del límite de recursión
+COMPARAR = 1500             # niveles de las comparaciones con el AST plano y la sesión
+
+
+def _sin_salida(funcion, *args):
+    """Resultado de funcion(*args) y lo que imprimió (se muestra si la prueba falla)."""
+    salida = io.StringIO()
+    with contextlib.redirect_stdout(salida):
+        resultado = funcion(*args)
+    return resultado, salida.getvalue()
+
+
+class Escalado(unittest.TestCase):
+
+    def test_exponente(self):
+        tamanos = [1000, 2000, 4000]
+        self.assertAlmostEqual(escalado.exponente(tamanos, [n * 1e-6 for n in tamanos]), 1.0)
+        self.assertAlmostEqual(escalado.exponente(tamanos, [n * n * 1e-9 for n in tamanos]), 2.0)
+
+    def test_fases(self):
+        for nombre, (generador, inicial) in escalado.CASOS.items():
+            with self.subTest(caso=nombre):
+                fallas, salida = _sin_salida(escalado.comprobar, nombre, generador, inicial,
+                                             PASOS, HOLGURA, MINIMO_MS)
+                self.assertEqual(fallas, [], salida)
+
+    def test_parser(self):
+        for nombre, generador in (("sentencias", escalado_parser.programa_sentencias),
+                                  ("argumentos", escalado_parser.programa_argumentos)):
+            with self.subTest(caso=nombre):
+                args = (nombre, generador, INICIAL_PARSER, PASOS, FACTOR_PARSER)
+                ok, salida = _sin_salida(escalado_parser.comprobar, *args)
+                if not ok:
+                    # Puede ser ruido de la máquina: se mide otra vez antes de darlo por fallado
+                    ok, salida = _sin_salida(escalado_parser.comprobar, *args)
+                self.assertTrue(ok, salida)
+
+
+class Paridad(unittest.TestCase):
+
+    def test_motores(self):
+        with open(os.path.join(parser._RAIZ, "test.txt"), encoding="utf-8") as f:
+            corpus = [f.read()] + parser._CASOS + parser.programas_aleatorios(ALEATORIOS, SEMILLA)
+        diferencias, validos = parser.comprobar_paridad(corpus)
+        self.assertEqual(diferencias, [])
+        self.assertGreater(validos, len(parser._CASOS))
+
+    def test_sesion(self):
+        problemas, _ = _sin_salida(sesion.comprobar, parser._BLOQUE * 3)
+        self.assertEqual(problemas, [])
+
+    def test_incremental(self):
+        self.assertEqual(incremental.diferencias_al_azar(EDICIONES, SEMILLA), 0)
+
+
+class Profundidad(unittest.TestCase):
+
+    def setUp(self):
+        self.assertGreater(PROFUNDIDAD, sys.getrecursionlimit())
+        self.problemas = []
+
+    def test_compilacion(self):
+        for ast_plano in (False, True):
+            _, salida = _sin_salida(profundidad.comprobar_profundidad, self.problemas, PROFUNDIDAD, ast_plano)
+            self.assertEqual(self.problemas, [], salida)
+
+    def test_errores(self):
+        _sin_salida(profundidad.comprobar_errores, self.problemas, PROFUNDIDAD)
+        self.assertEqual(self.problemas, [])
+
+    def test_ast_plano(self):
+        _sin_salida(profundidad.comprobar_plano, self.problemas, COMPARAR)
+        self.assertEqual(self.problemas, [])
+
+    def test_sesion(self):
+        _sin_salida(profundidad.comprobar_sesion, self.problemas, COMPARAR)
+        self.assertEqual(self.problemas, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+# traza.py
+"""
+Traza de la compilación en formato Chrome Trace Event (JSON que abren chrome://tracing y
+https://ui.perfetto.dev).
+
+Cada tramo es un evento completo ("ph": "X") con inicio y duración en microsegundos,
+el pid del proceso y el hilo que lo registró:
+
+    archivo   un archivo compilado por compilador.compilar_archivo (uno por archivo y proceso)
+    fase      lexico+sintactico, semantico, tac, optimizador, nasm (compilador.compilar_codigo;
+              con perfil.Perfil, lexico y sintactico por separado y también ssa)
+    optimizador  cada pasada de optimizador.optimizar_tac: plegado local, eliminar goto,
+                 eliminar etiquetas
+
+La traza viaja en ContextoCompilacion.traza (None = no se registra nada). Los procesos
+trabajadores de compilador.compilar_lote devuelven sus eventos y el proceso principal los
+junta: como time.perf_counter usa un reloj monotónico común, los tramos de todos los
+procesos quedan en la misma línea de tiempo.
+
+Uso: python compilador.py *.txt -j 4 --traza traza.json
+"""
+import contextlib
+import json
+import os
+import threading
+import time
+
+_NULO = contextlib.nullcontext()
+
+
+def _ahora():
+    """Instante actual en microsegundos."""
+    return time.perf_counter_ns() / 1000
+
+
+class Traza:
+    """Eventos de traza registrados en este proceso (más los que se agreguen de otros)."""
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.eventos = []
+
+    @contextlib.contextmanager
+    def tramo(self, nombre, categoria="fase", **args):
+        """Registra como un tramo el tiempo que tarda el bloque 'with'; 'args' se adjuntan al evento."""
+        inicio = _ahora()
+        try:
+            yield
+        finally:
+            evento = {"name": nombre, "cat": categoria, "ph": "X", "ts": inicio, "dur": _ahora() - inicio,
+                      "pid": self.pid, "tid": threading.get_native_id()}
+            if args:
+                evento["args"] = args
+            self.eventos.append(evento)
+
+    def agregar(self, eventos):
+        """Agrega eventos registrados en otro proceso (ver compilador.compilar_lote)."""
+        self.eventos.extend(eventos)
+
+    def nombrar_procesos(self):
+        """
+        Agrega los nombres con que el visor muestra cada proceso: 'compilador' para este y
+        'trabajador N' para los demás, en el orden en que aparecen sus eventos.
+        """
+        pids = []
+        for evento in self.eventos:
+            if evento["ph"] != "M" and evento["pid"] not in pids:
+                pids.append(evento["pid"])
+        otros = 0
+        for pid in pids:
+            if pid == self.pid:
+                nombre = "compilador"
+            else:
+                otros += 1
+                nombre = f"trabajador {otros}"
+            self.eventos.append({"name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+                                 "args": {"name": nombre}})
+
+    def a_json(self):
+        return json.dumps({"traceEvents": self.eventos, "displayTimeUnit": "ms"}, ensure_ascii=False)
+
+    def escribir(self, ruta):
+        with open(ruta, "w", encoding="utf-8") as f:
+            f.write(self.a_json())
+
+
+def tramo(ctx, nombre, categoria="fase", **args):
+    """
+    Tramo 'nombre' en la traza del ContextoCompilacion 'ctx', o un contexto que no hace nada
+    si 'ctx' es None o no tiene traza.
+    """
+    traza = ctx.traza if ctx is not None else None
+    if traza is None:
+        return _NULO
+    return traza.tramo(nombre, categoria, **args)
@@ -0,0 +1,139 @@
+# vigilancia.py
+"""
+Modo vigilancia: observa una carpeta de fuentes y, cuando un archivo cambia, recompila solo
+ese archivo (con la caché de artefactos) y reescribe su TAC, TAC optimizado y .asm.
+
+Los cambios se detectan por sondeo (os.scandir cada 'intervalo' segundos comparando fecha
+de modificación, tamaño e inodo), sin servicios ni dependencias externas. Una ráfaga de
+guardados se agrupa: se compila cuando pasan 'espera' segundos sin cambios nuevos, una vez
+por archivo. Los artefactos que escribe el propio compilador (<nombre>_tac.txt,
+<nombre>_opt.txt) no se consideran fuentes.
+
+Uso:
+    python vigilancia.py carpeta [-o carpeta_salida] [--patron *.txt] [--intervalo 0.25]
+                         [--espera 0.1] [--ast-plano] [--cache CARPETA | --sin-cache]
+"""
+import argparse
+import fnmatch
+import os
+import sys
+import threading
+import time
+
+import cache_artefactos
+import compilador
+
+_SUFIJOS_ARTEFACTOS = ("_tac.txt", "_opt.txt")
+
+
+class Vigilante:
+    """Detecta fuentes nuevas, modificadas y borradas en 'carpeta' (recursivamente)."""
+
+    def __init__(self, carpeta, patron="*.txt"):
+        self.carpeta = carpeta
+        self.patron = patron
+        self.firmas = {}  # ruta -> (mtime_ns, tamaño, inodo) del último escaneo
+
+    def _es_fuente(self, nombre):
+        return fnmatch.fnmatch(nombre, self.patron) and not nombre.endswith(_SUFIJOS_ARTEFACTOS)
+
+    def escanear(self):
+        """Diccionario ruta -> firma de todos los fuentes de la carpeta."""
+        firmas = {}
+        pendientes = [self.carpeta]
+        while pendientes:
+            try:
+                entradas = os.scandir(pendientes.pop())
+            except OSError:
+                continue  # carpeta borrada mientras se recorría
+            with entradas:
+                for entrada in entradas:
+                    try:
+                        if entrada.is_dir(follow_symlinks=False):
+                            if not entrada.name.startswith("."):
+                                pendientes.append(entrada.path)
+                        elif self._es_fuente(entrada.name):
+                            info = entrada.stat()
+                            firmas[entrada.path] = (info.st_mtime_ns, info.st_size, info.st_ino)
+                    except OSError:
+                        continue  # archivo borrado mientras se recorría
+        return firmas
+
+    def cambios(self):
+        """Tupla (cambiados, borrados): rutas nuevas o modificadas y rutas que ya no existen."""
+        firmas = self.escanear()
+        cambiados = [ruta for ruta, firma in firmas.items() if self.firmas.get(ruta) != firma]
+        borrados = [ruta for ruta in self.firmas if ruta not in firmas]
+        self.firmas = firmas
+        return cambiados, borrados
+
+
+def vigilar(carpeta, carpeta_salida=None, patron="*.txt", intervalo=0.25, espera=0.1, cache=None,
+            ast_plano=False, al_compilar=None, detener=None):
+    """
+    Compila todos los fuentes de 'carpeta' y luego recompila cada uno cuando cambia, hasta que
+    se active el threading.Event 'detener' (o para siempre). En 'carpeta_salida' los artefactos
+    conservan la subcarpeta de cada fuente dentro de 'carpeta'. Después de cada archivo llama
+    a al_compilar(ruta, errores, segundos) si se indica.
+    """
+    detener = detener if detener is not None else threading.Event()
+    vigilante = Vigilante(carpeta, patron)
+    pendientes, _ = vigilante.cambios()  # al empezar, todos los fuentes
+    ultimo_cambio = 0.0
+    while True:
+        if pendientes and time.monotonic() - ultimo_cambio >= espera:
+            for ruta in sorted(pendientes):
+                t0 = time.perf_counter()
+                try:
+                    errores = compilador.compilar_archivo(ruta, carpeta_salida, ast_plano, cache, raiz=carpeta)
+                except OSError as e:
+                    errores = [f"No se pudo compilar: {e}"]  # borrado o renombrado entre medio
+                if al_compilar is not None:
+                    al_compilar(ruta, errores, time.perf_counter() - t0)
+            pendientes = set()
+        if detener.wait(intervalo):
+            return
+        cambiados, _ = vigilante.cambios()
+        if cambiados:
+            pendientes = set(pendientes) | set(cambiados)
+            ultimo_cambio = time.monotonic()
+
+
+def _informar(ruta, errores, segundos):
+    estado = "ERROR" if errores else "ok"
+    print(f"[{time.strftime('%H:%M:%S')}] {ruta}: {estado} ({segundos * 1000:.1f} ms)", flush=True)
+    for err in errores:
+        print(f"    {err}", flush=True)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Recompila los fuentes de una carpeta cuando cambian")
+    arg_parser.add_argument("carpeta", help="carpeta de fuentes a vigilar (incluye subcarpetas)")
+    arg_parser.add_argument("-o", "--salida", default=None,
+                            help="carpeta donde escribir los artefactos (por defecto, junto a cada fuente)")
+    arg_parser.add_argument("--patron", default="*.txt", help="patrón de los nombres de fuentes")
+    arg_parser.add_argument("--intervalo", type=float, default=0.25, help="segundos entre sondeos")
+    arg_parser.add_argument("--espera", type=float, default=0.1,
+                            help="segundos sin cambios antes de compilar una ráfaga de guardados")
+    arg_parser.add_argument("--ast-plano", action="store_true",
+                            help="guardar el AST en arreglos (menos memoria en programas muy grandes)")
+    arg_parser.add_argument("--cache", default=cache_artefactos.DIR_CACHE, metavar="CARPETA",
+                            help="carpeta de la caché de artefactos (por defecto, $COMPILADOR_CACHE o cache_artefactos/)")
+    arg_parser.add_argument("--sin-cache", action="store_true",
+                            help="compilar sin leer ni escribir la caché de artefactos")
+    args = arg_parser.parse_args(argv)
+
+    if args.salida:
+        os.makedirs(args.salida, exist_ok=True)
+    cache = None if args.sin_cache else cache_artefactos.abrir(args.cache)
+    print(f"Vigilando {args.carpeta} (Ctrl+C para salir)", flush=True)
+    try:
+        vigilar(args.carpeta, args.salida, args.patron, args.intervalo, args.espera, cache, args.ast_plano,
+                _informar)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())